@@ -56,6 +56,7 @@ setup(
         "game_assets": ["images/**/*", "sounds/**/*"],
     },
     install_requires=["pygame"],
+    extras_require={"numpy": ["numpy"]},
     project_urls={
         "Source Code": "https://github.com/KhadaAke/Alien-Onslaught",
     },
@@ -15,6 +15,9 @@ Contact: quality_xqs@yahoo.com
 
 """
 
+import os
+import sys
+
 import pygame
 
 from src.game_logic.game_settings import Settings
@@ -22,7 +25,13 @@ from src.game_logic.game_stats import GameStats
 from src.game_logic.collision_detection import CollisionManager
 from src.game_logic.input_handling import PlayerInput
 from src.game_logic.gameplay_handler import GameplayHandler
+from src.game_logic.projectile_arrays import create_projectile_arrays
 
+from src.utils.animation_constants import prefetch_frames
+from src.utils.display_updater import display_updater
+from src.utils.frame_pacer import frame_pacer
+from src.utils.game_clock import FixedTimestep, game_clock
+from src.utils.game_random import rng
 from src.utils.game_utils import (
     resize_image,
     play_sound,
@@ -30,10 +39,16 @@ from src.utils.game_utils import (
 )
 
 from src.ui.scoreboards import ScoreBoard
+from src.ui.confirm_dialog import ConfirmDialog
 
+from src.managers.asset_manager import assets
 from src.managers.powers_manager import PowerEffectsManager
+from src.managers.profiler_manager import FrameProfiler
+from src.managers.pool_manager import PoolManager, PooledGroup
+from src.managers.frame_watchdog import FrameWatchdog
+from src.managers.replay_manager import ReplayRecorder
 from src.managers.asteroids_manager import AsteroidsManager
-from src.managers.sounds_manager import SoundManager
+from src.managers.sounds_manager import SoundManager, NullSoundManager
 from src.managers.game_over_manager import EndGameManager
 from src.managers.alien_managers.alien_bullets_manager import AlienBulletsManager
 from src.managers.alien_managers.aliens_manager import AliensManager
@@ -53,16 +68,39 @@ class AlienOnslaught:
     MENU_RUNNING = True
     GAME_RUNNING = True
 
-    def __init__(self, singleplayer=False):
-        """Initialize the game, and create game resources."""
+    def __init__(
+        self,
+        singleplayer=False,
+        headless=False,
+        record_replays=False,
+        dirty_rects=False,
+    ):
+        """Initialize the game, and create game resources.
+        In headless mode the game runs without a window and without sound,
+        and it is advanced one tick at a time with 'step'.
+        With 'record_replays' every new game is recorded as a replay.
+        With 'dirty_rects' only the changed parts of the static screens
+        are updated on the display.
+        """
+        self.headless = headless
+        self.record_replays = record_replays
+        display_updater.dirty_rects = dirty_rects
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
         self.start_time = pygame.time.get_ticks()
         self.singleplayer = singleplayer
-        self.clock = pygame.time.Clock()
+        self.timestep = FixedTimestep()
         self.settings = Settings()
         self.screen = pygame.display.set_mode(
             (self.settings.screen_width, self.settings.screen_height), pygame.RESIZABLE
         )
+        # Images loaded before the display existed are converted now.
+        assets.convert_all()
+        self.settings.update_images()
+        prefetch_frames(self.settings.game_modes.game_mode)
+
         self.bg_img = resize_image(self.settings.bg_img, self.screen.get_size())
         self.bg_img_rect = self.bg_img.get_rect()
         self.reset_bg = self.bg_img.copy()
@@ -72,6 +110,7 @@ class AlienOnslaught:
         self.fourth_bg = resize_image(self.settings.fourth_bg, self.screen.get_size())
 
         self.ui_options = self.settings.ui_options
+        self.ticks = 0
         self.ships = []
         self.music_muted = False
         self.sfx_muted = False
@@ -79,8 +118,11 @@ class AlienOnslaught:
         self._initialize_sprite_groups()
         self.initialize_managers()
 
-        self.pause_time = 0
         self.game_loaded = False
+        # The seed and the starting tick of the next game, set to replay
+        # a recorded game. By default they are picked when the game starts.
+        self.next_seed = None
+        self.next_start_tick = None
 
         pygame.display.set_icon(self.settings.game_icon)
         pygame.display.set_caption("Alien Onslaught")
@@ -114,16 +156,28 @@ class AlienOnslaught:
 
     def _initialize_sprite_groups(self):
         """Create sprite groups for the game."""
-        self.thunderbird_bullets = pygame.sprite.Group()
-        self.phoenix_bullets = pygame.sprite.Group()
-        self.thunderbird_missiles = pygame.sprite.Group()
-        self.phoenix_missiles = pygame.sprite.Group()
+        # The short-lived sprites are reused from the pools
+        # after they are removed from their groups.
+        self.sprite_pools = PoolManager()
+        self.thunderbird_bullets = PooledGroup(self.sprite_pools)
+        self.phoenix_bullets = PooledGroup(self.sprite_pools)
+        self.thunderbird_missiles = PooledGroup(self.sprite_pools)
+        self.phoenix_missiles = PooledGroup(self.sprite_pools)
         self.thunderbird_laser = pygame.sprite.Group()
         self.phoenix_laser = pygame.sprite.Group()
         self.alien_bullet = pygame.sprite.Group()
-        self.powers = pygame.sprite.Group()
+        self.powers = PooledGroup(self.sprite_pools)
         self.aliens = pygame.sprite.Group()
-        self.asteroids = pygame.sprite.Group()
+        self.asteroids = PooledGroup(self.sprite_pools)
+
+        # The bullet groups are drawn in batches and, when NumPy is
+        # installed, moved and collided as arrays.
+        self.projectile_groups = (
+            self.thunderbird_bullets,
+            self.phoenix_bullets,
+            self.alien_bullet,
+        )
+        self.projectile_arrays = create_projectile_arrays(self, self.projectile_groups)
 
         self.sprite_groups = [
             self.powers,
@@ -150,7 +204,9 @@ class AlienOnslaught:
 
     def initialize_managers(self):
         """Initialize the managers and handlers required."""
-        self.sound_manager = SoundManager(self)
+        self.sound_manager = (
+            NullSoundManager(self) if self.headless else SoundManager(self)
+        )
         self.buttons_manager = GameButtonsManager(
             self, self.screen, self.ui_options, self.settings.game_modes
         )
@@ -175,26 +231,35 @@ class AlienOnslaught:
         self.game_over_manager = EndGameManager(
             self, self.settings, self.stats, self.screen
         )
+        self.confirm_dialog = ConfirmDialog(self.screen)
         self.save_load_manager = SaveLoadSystem(self, "save", "save_data")
         self.high_score_manager = HighScoreManager(self)
+        self.profiler = FrameProfiler(self)
+        self.frame_watchdog = FrameWatchdog(self, self.profiler)
+        self.replay_recorder = ReplayRecorder(self, self.record_replays)
 
     def run_menu(self):
         """Run the main menu."""
         self.sound_manager.load_sounds("menu_sounds")
+        # The gameplay sounds are decoded while the player is in the menu.
+        self.sound_manager.preload_sounds("gameplay_sounds")
         play_music(self.sound_manager.menu_music, "menu")
         self.sound_manager.check_music_volume()
         self.sound_manager.check_sfx_volume()
         while self.MENU_RUNNING:
+            self.sound_manager.update_loading()
             self.handle_menu_events()
             self.screen_manager.update_window_mode()
             self.screen_manager.draw_menu_objects(self.bg_img, self.bg_img_rect)
             self.sound_manager.check_muted_state()
             self.screen_manager.draw_cursor()
-            pygame.display.flip()
+            display_updater.update()
+            frame_pacer.wait(self.sound_manager.draw_muted_message)
 
     def handle_menu_events(self):
         """Handles events for the main menu."""
         for event in pygame.event.get():
+            display_updater.check_event(event)
             if event.type == pygame.QUIT:
                 self.buttons_manager.handle_quit_event()
             elif event.type == pygame.KEYDOWN:
@@ -264,32 +329,78 @@ class AlienOnslaught:
         self.sound_manager.check_sfx_volume()
         self.run_game()
 
-    def _update_background(self, i):
+    def start_headless_game(self):
+        """Start a new game without the menus and without running the game loop.
+        The game is then advanced by calling 'step'.
+        """
+        if self.singleplayer:
+            self._set_singleplayer_variables()
+        else:
+            self._set_multiplayer_variables()
+        self.ui_options.paused = False
+        self.settings.disable_ui_flags()
+        self._reset_game()
+        self.ticks = 0
+
+    def step(self, actions=None):
+        """Advance the game logic by one tick, without rendering or waiting.
+        'actions' maps the ship names to their ShipActions for this tick.
+        Returns False once the game is over.
+        """
+        if not self.stats.game_active:
+            return False
+
+        if actions:
+            self.player_input.apply_actions(
+                actions,
+                self.weapons_manager.fire_missile,
+                self.weapons_manager.fire_laser,
+            )
+        self._handle_game_logic()
+        self.ships_manager.update_ship_alive_states()
+        self.profiler.end_frame()
+        self.ticks += 1
+
+        if self.game_over_manager.is_game_over():
+            self.stats.game_active = False
+        return self.stats.game_active
+
+    def _update_background(self, i, ticks=1):
         """Updates the background image of the game and scrolls it downwards
-        to create the effect of movement"""
+        to create the effect of movement, one pixel for each tick."""
+        if ticks:
+            # The whole screen moves with the background.
+            display_updater.update_all()
         self._handle_background_change()
         self.screen.blit(self.bg_img, [0, i])
         self.screen.blit(self.bg_img, [0, i - self.settings.screen_height])
         if i >= self.settings.screen_height:
             i = 0
-        i += 1
+        i += ticks
 
         return i
 
     def run_game(self):
-        """Run the main game loop."""
+        """Run the main game loop. The game logic runs at a fixed tick rate,
+        as many ticks as the time since the last frame asks for, while the
+        frames are drawn at up to the target frame rate.
+        """
         i = 0
         self.sound_manager.check_music_volume()
         self.sound_manager.check_sfx_volume()
+        self.frame_watchdog.start()
+        self.timestep.reset()
         while self.GAME_RUNNING:
+            self.frame_watchdog.start_frame()
             self.check_events()
             self.game_over_manager.check_game_over()
             self.screen_manager.update_window_mode()
 
             if self.stats.game_active:
                 if not self.ui_options.paused:
-                    i = self._update_background(i)
-                    self._handle_game_logic()
+                    ticks = self.timestep.advance()
+                    i = self._update_background(i, ticks)
+                    self._run_game_ticks(ticks)
 
                 self.sound_manager.check_muted_state()
                 self._update_screen()
@@ -299,11 +410,30 @@ class AlienOnslaught:
                 self.game_over_manager.check_game_over()
                 self.sound_manager.check_muted_state()
                 self._update_screen()
+                self.timestep.reset()
+
+            self.frame_watchdog.end_frame(self.profiler.end_frame())
+            # The game menu and the game over screen sleep until an event,
+            # like the main menu.
+            frame_pacer.wait(
+                animating=self.stats.game_active
+                or self.sound_manager.draw_muted_message,
+                fps=self.settings.target_fps,
+            )
 
-            self.clock.tick(60)
+    def _run_game_ticks(self, ticks):
+        """Run the game logic for the given number of ticks,
+        stopping early if the game ends.
+        """
+        for _ in range(ticks):
+            if not self.stats.game_active:
+                break
+            self._handle_game_logic()
 
     def _handle_game_logic(self):
         """Call the functions that are handling the game logic."""
+        game_clock.tick()
+        self.collision_handler.refresh_spatial_hash()
         self.apply_game_mode_behaviors()
         self.gameplay_manager.handle_level_progression()
 
@@ -315,7 +445,6 @@ class AlienOnslaught:
             self.powers_manager.weapon_power_up,
         )
         self.powers_manager.manage_power_downs()
-        self.powers_manager.display_powers_effect()
 
         self.gameplay_manager.create_normal_level_bullets(
             self.alien_bullets_manager.create_alien_bullets
@@ -326,17 +455,19 @@ class AlienOnslaught:
         )
         self.player_input.handle_ship_firing(self.weapons_manager.fire_bullet)
         self.weapons_manager.update_projectiles()
+        # The projectile arrays are synced now, so the removed sprites can be reused.
+        self.sprite_pools.recycle()
         self.collision_handler.check_bullet_alien_collisions()
         self.collision_handler.check_missile_alien_collisions()
         self.collision_handler.check_laser_alien_collisions()
         self.aliens_manager.update_aliens()
+        self.collision_handler.refresh_spatial_hash(self.aliens)
         self.collision_handler.check_alien_ship_collisions(
             self.ships_manager.thunderbird_ship_hit, self.ships_manager.phoenix_ship_hit
         )
 
         self.ships_manager.update_ship_state()
         self.weapons_manager.update_laser_status()
-        self.weapons_manager.check_laser_availability()
 
         self.collision_handler.handle_shielded_ship_collisions(
             self.ships, self.aliens, self.alien_bullet, self.asteroids
@@ -345,6 +476,9 @@ class AlienOnslaught:
     def check_events(self):
         """Respond to keyboard, mouse and videoresize events."""
         for event in pygame.event.get():
+            display_updater.check_event(event)
+            if self.confirm_dialog.handle_event(event):
+                continue
             if event.type == pygame.QUIT:
                 self.buttons_manager.handle_quit_event()
             elif event.type == pygame.KEYDOWN:
@@ -363,6 +497,10 @@ class AlienOnslaught:
                     self.sound_manager.toggle_mute_music("game")
                 elif event.key == pygame.K_F2:
                     self.sound_manager.toggle_mute_sfx()
+                elif event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                elif event.key == pygame.K_F4:
+                    self.frame_watchdog.dump()
             elif event.type == pygame.KEYUP:
                 if self.stats.game_active:
                     self.player_input.check_keyup_events(event)
@@ -410,15 +548,16 @@ class AlienOnslaught:
             self.bg_img = self.fourth_bg if self.stats.level > 25 else self.bg_img
 
     def _check_for_pause(self):
-        """Check if the game is paused and update pause time."""
+        """Check if the game is paused and wait for it to be resumed.
+        The game clock doesn't advance while the game is paused, and the
+        loop sleeps until the player does something.
+        """
         if self.ui_options.paused:
-            pause_start_time = pygame.time.get_ticks()
+            self.frame_watchdog.skip_frame()
             while self.ui_options.paused:
                 self.check_events()
-                if not self.ui_options.paused:
-                    pause_end_time = pygame.time.get_ticks()
-                    self.pause_time += pause_end_time - pause_start_time
-                    break
+                frame_pacer.wait()
+            self.timestep.reset()
 
     def apply_game_mode_behaviors(self):
         """Applies the game behaviors for the currently selected game mode."""
@@ -460,6 +599,8 @@ class AlienOnslaught:
 
     def _reset_game(self):
         """Start a new game."""
+        self._start_game_run()
+
         # Clear the screen of remaining entities
         self.gameplay_manager.reset_game_objects()
 
@@ -503,11 +644,24 @@ class AlienOnslaught:
         if self.singleplayer:
             self.phoenix_ship.state.alive = False
 
+    def _start_game_run(self):
+        """Seed the random numbers and move the game clock ahead for the new
+        game, and start recording its replay.
+        """
+        rng.seed(self.next_seed)
+        start_tick = game_clock.start_game(self.next_start_tick)
+        self.next_seed = self.next_start_tick = None
+        if self.game_loaded:
+            self.replay_recorder.finish()
+        else:
+            self.replay_recorder.start(rng.seed_value, start_tick)
+
     def check_game_loaded(self):
         """Check the state of the game load and
         perform appropriate actions accordingly.
         """
         if self.game_loaded:
+            self.save_load_manager.rebase_alien_timers()
             self.save_load_manager.update_alien_states()
             self.save_load_manager.update_player_ship_states()
             self.save_load_manager.update_player_weapon()
@@ -518,10 +672,19 @@ class AlienOnslaught:
 
     def reset_timed_variables(self):
         """Resets timer-related variables for managing game events."""
-        self.gameplay_manager.last_level_time = pygame.time.get_ticks()
+        self.gameplay_manager.last_level_time = game_clock.get_ticks()
         self.powers_manager.last_power_up_time = 0
         self.asteroids_manager.last_asteroid_time = 0
 
+    def _draw_game_messages(self):
+        """Draw the messages of the picked powers, the laser state and the
+        saved game. They are drawn with every frame, including the frames
+        without ticks.
+        """
+        self.powers_manager.display_powers_effect()
+        self.weapons_manager.check_laser_availability()
+        self.save_load_manager.update()
+
     def _draw_game_objects(self):
         """Draw game objects and the score on screen."""
         if self.singleplayer:
@@ -536,14 +699,20 @@ class AlienOnslaught:
                 ship.blitme()
 
         for group in sprite_groups:
-            for sprite in group.sprites():
-                sprite.draw()
+            if group in self.projectile_groups:
+                self.screen.blits(
+                    [(sprite.image, sprite.rect) for sprite in group], doreturn=False
+                )
+            else:
+                for sprite in group.sprites():
+                    sprite.draw()
 
         self.score_board.show_score()
 
     def _update_screen(self):
         """Update images on the screen"""
         if self.stats.game_active:
+            self._draw_game_messages()
             self._draw_game_objects()
 
             if self.ui_options.paused:
@@ -552,28 +721,25 @@ class AlienOnslaught:
         else:
             self._update_game_screen_components()
 
-        pygame.display.flip()
+        self.profiler.draw()
+        display_updater.update((self.stats.game_active, self.ui_options.paused))
 
     def _update_game_screen_components(self):
-        """Update and draw various components on the screen."""
-        self.buttons_manager.draw_buttons()
-
-        if self.ui_options.show_difficulty:
-            self.buttons_manager.draw_difficulty_buttons()
-
-        if self.ui_options.show_high_scores:
-            self.screen_manager.display_high_scores_on_screen()
-            self.buttons_manager.delete_scores.draw_button()
-
-        if self.ui_options.show_game_modes:
-            self.buttons_manager.draw_game_mode_buttons()
-
-        if self.ui_options.ship_selection:
-            self.ship_selection.draw()
-
+        """Draw the game menu, with the panels and the dialog opened from it,
+        and the cursor.
+        """
+        self.screen_manager.draw_game_menu()
+        self.confirm_dialog.draw()
         self.screen_manager.draw_cursor()
 
 
 if __name__ == "__main__":
-    start = AlienOnslaught()
-    start.run_menu()
+    start = AlienOnslaught(
+        record_replays="--record-replays" in sys.argv,
+        dirty_rects="--dirty-rects" in sys.argv,
+    )
+    try:
+        start.run_menu()
+    finally:
+        # The game exits with sys.exit, save the replay of the last game.
+        start.replay_recorder.finish()
@@ -8,11 +8,7 @@ Classes:
 - Immune: Manages the immune animation for the aliens.
 """
 
-from src.utils.animation_constants import (
-    destroy_frames,
-    missile_ex_frames,
-    alien_immune_frames,
-)
+from src.utils.animation_constants import get_frames
 
 
 class DestroyAnim:
@@ -23,7 +19,7 @@ class DestroyAnim:
         self.image = None
         self.screen = entity.screen
 
-        self.destroy_frames = destroy_frames
+        self.destroy_frames = get_frames("destroy_frames")
         self.current_destroy_frame = 0
         self.destroy_image = self.destroy_frames[self.current_destroy_frame]
         self.destroy_rect = self.destroy_image.get_rect()
@@ -50,12 +46,15 @@ class MissileEx:
         self.missile = missile
         self.screen = missile.screen
 
-        self.ex_frames = missile_ex_frames
+        self.ex_frames = get_frames("missile_ex_frames")
+        self.frame_update_rate = 5
+        self.reset()
+
+    def reset(self):
+        """Restart the explosion, used when the missile is reused."""
         self.current_frame = 0
         self.ex_image = self.ex_frames[self.current_frame]
         self.ex_rect = self.ex_frames[0].get_rect(center=self.missile.rect.center)
-
-        self.frame_update_rate = 5
         self.frame_counter = 0
 
     def update_animation(self):
@@ -80,7 +79,7 @@ class Immune:
         self.screen = alien.screen
         self.boss = False
 
-        self.immune_frames = alien_immune_frames
+        self.immune_frames = get_frames("alien_immune_frames")
         self.current_immune_frame = 0
         self.immune_image = self.immune_frames[self.current_immune_frame]
         self.immune_rect = self.immune_image.get_rect()
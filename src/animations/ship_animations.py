@@ -6,15 +6,7 @@ updating, and rendering ship animations.
 
 from src.utils.game_utils import scale_image
 
-from src.utils.animation_constants import (
-    ship_images,
-    warp_frames,
-    shield_frames,
-    immune_frames,
-    immune_frames_cosmic,
-    explosion_frames,
-    empower_frames,
-)
+from src.utils.animation_constants import get_frames
 
 
 class Animations:
@@ -25,29 +17,29 @@ class Animations:
         self.settings = settings
         self.image = None
 
-        self.ship_images = ship_images
+        self.ship_images = get_frames("ship_images")
 
-        self.warp_frames = warp_frames
+        self.warp_frames = get_frames("warp_frames")
         self.warp_index = 0
         self.warp_delay = 5
         self.warp_counter = 0
 
-        self.shield_frames = shield_frames
+        self.shield_frames = get_frames("shield_frames")
         self.current_shield_frame = 0
         self.shield_image = self.shield_frames[self.current_shield_frame]
         self.shield_rect = self.shield_image.get_rect()
 
-        self.immune_frames = immune_frames_cosmic if self.settings.game_modes.cosmic_conflict else immune_frames
+        self.immune_frames = self._get_immune_frames()
         self.current_immune_frame = 0
         self.immune_image = self.immune_frames[self.current_immune_frame]
         self.immune_rect = self.immune_image.get_rect()
 
-        self.explosion_frames = explosion_frames
+        self.explosion_frames = get_frames("explosion_frames")
         self.current_explosion_frame = 0
         self.explosion_image = self.explosion_frames[self.current_explosion_frame]
         self.explosion_rect = self.explosion_image.get_rect()
 
-        self.empower_frames = empower_frames
+        self.empower_frames = get_frames("empower_frames")
         self.empower_timer = 0
         self.empower_delay = 2
         self.current_empower_frame = 0
@@ -88,23 +80,29 @@ class Animations:
         self.empower_image = self.empower_frames[self.current_empower_frame]
         self.empower_rect = self.empower_image.get_rect()
 
+    def _get_immune_frames(self):
+        """Return the immune frames for the current game mode."""
+        if self.settings.game_modes.cosmic_conflict:
+            return get_frames("immune_frames_cosmic")
+        return get_frames("immune_frames")
+
     def reset_size(self):
         """Reset all animations frames and ship images to their original size."""
-        self.ship_images = ship_images
+        self.ship_images = get_frames("ship_images")
 
-        self.immune_frames = immune_frames_cosmic if self.settings.game_modes.cosmic_conflict else immune_frames
+        self.immune_frames = self._get_immune_frames()
         self.immune_image = self.immune_frames[self.current_immune_frame]
         self.immune_rect = self.immune_image.get_rect()
 
-        self.explosion_frames = explosion_frames
+        self.explosion_frames = get_frames("explosion_frames")
         self.explosion_image = self.explosion_frames[self.current_explosion_frame]
         self.explosion_rect = self.explosion_image.get_rect()
 
-        self.empower_frames = empower_frames
+        self.empower_frames = get_frames("empower_frames")
         self.empower_image = self.empower_frames[self.current_empower_frame]
         self.empower_rect = self.empower_image.get_rect()
 
-        self.shield_frames = shield_frames
+        self.shield_frames = get_frames("shield_frames")
         self.shield_image = self.shield_frames[self.current_immune_frame]
         self.shield_rect = self.shield_image.get_rect()
 
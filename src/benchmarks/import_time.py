@@ -0,0 +1,74 @@
+"""
+The 'import_time' module measures how long it takes to import the game,
+and how long it takes to load all the animation frames that used to be
+loaded when the 'animation_constants' module was imported.
+
+Run it from the project root with: python -m src.benchmarks.import_time
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Code executed in a fresh interpreter, so the import is not cached.
+MEASURE_CODE = """
+import time
+start = time.perf_counter()
+import src.alien_onslaught
+import_time = time.perf_counter() - start
+
+from src.utils.animation_constants import ANIMATION_FRAMES, get_frames
+from src.utils.constants import BOSS_RUSH, ALIEN_BULLETS_IMG, BOSS_BULLETS_IMG
+from src.managers.asset_manager import assets
+
+start = time.perf_counter()
+for name in ANIMATION_FRAMES:
+    get_frames(name)
+for images in (BOSS_RUSH, ALIEN_BULLETS_IMG, BOSS_BULLETS_IMG):
+    assets.get_images(images)
+frames_time = time.perf_counter() - start
+print(import_time, frames_time)
+"""
+
+
+def measure_once():
+    """Return the import time and the frames loading time of a fresh interpreter."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_CODE],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+    import_time, frames_time = output.split()[-2:]
+    return float(import_time), float(frames_time)
+
+
+def run_benchmark(runs):
+    """Measure the import time the given number of times and print the medians."""
+    results = [measure_once() for _ in range(runs)]
+    import_time = statistics.median(result[0] for result in results)
+    frames_time = statistics.median(result[1] for result in results)
+
+    print(f"Import time of src.alien_onslaught: {import_time * 1000:.1f} ms")
+    print(f"Loading all the animation frames:   {frames_time * 1000:.1f} ms")
+    print(
+        "Startup before the lazy frames (import + frames): "
+        f"{(import_time + frames_time) * 1000:.1f} ms"
+    )
+
+
+def main():
+    """Parse the command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="number of runs")
+    args = parser.parse_args()
+    run_benchmark(args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+The 'replay_benchmark' module plays recorded replays in a headless game, as
+fast as the game logic can run, timing every subsystem with the game's
+FrameProfiler. A replay plays exactly the same game every time, so it can be
+used to reproduce a slowdown and to compare the results of different runs.
+
+Record replays by starting the game with: python -m src.alien_onslaught --record-replays
+Run it from the project root with: python -m src.benchmarks.replay_benchmark REPLAY [REPLAY ...]
+"""
+
+import argparse
+import json
+import os
+import platform
+import time
+from collections import defaultdict
+
+import pygame
+
+from src.alien_onslaught import AlienOnslaught
+from src.benchmarks.stress_scenarios import BENCHMARK_SUBSYSTEMS, summarize
+from src.managers.replay_manager import get_game_result, load_replay, play_replay
+
+# The replays are played without drawing.
+REPLAY_SUBSYSTEMS = tuple(
+    subsystem for subsystem in BENCHMARK_SUBSYSTEMS if subsystem not in ("hud", "draw")
+)
+
+
+def run_replay(path):
+    """Play the replay and return the per-tick times of each subsystem."""
+    replay = load_replay(path)
+    game = AlienOnslaught(headless=True)
+    game.profiler.start()
+
+    subsystem_samples = defaultdict(list)
+    frame_samples = []
+
+    def collect_times(game):
+        frame_times = game.profiler.last_frame
+        for subsystem in REPLAY_SUBSYSTEMS:
+            subsystem_samples[subsystem].append(frame_times.get(subsystem, 0.0))
+        frame_samples.append(sum(frame_times.values()))
+
+    start = time.perf_counter()
+    ticks = play_replay(game, replay, on_tick=collect_times)
+    elapsed = time.perf_counter() - start
+
+    result = get_game_result(game)
+    return {
+        "seed": replay["seed"],
+        "ticks": ticks,
+        "seconds": round(elapsed, 3),
+        "ticks_per_second": round(ticks / elapsed, 1) if elapsed else 0.0,
+        "reproduced": result == replay["result"],
+        "result": result,
+        "frame_ms": summarize(frame_samples or [0.0]),
+        "subsystems_ms": {
+            subsystem: summarize(samples)
+            for subsystem, samples in subsystem_samples.items()
+        },
+        "pools": game.sprite_pools.get_stats(),
+    }
+
+
+def run_benchmark(paths, output):
+    """Play the replays, print a summary and write the JSON results."""
+    results = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "replays": {},
+    }
+    for path in paths:
+        result = run_replay(path)
+        results["replays"][os.path.basename(path)] = result
+
+        print(
+            f"{os.path.basename(path)}: {result['ticks']} ticks in "
+            f"{result['seconds']:.2f} s, {result['frame_ms']['mean']:.2f} ms per tick"
+        )
+        if not result["reproduced"]:
+            print("    the replay did not reproduce the recorded game")
+        for subsystem, stats in result["subsystems_ms"].items():
+            print(
+                f"    {subsystem:<20}{stats['mean']:>8.3f} ms (p95 {stats['p95']:.3f})"
+            )
+
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=4)
+    print(f"Results written to {output}")
+    return results
+
+
+def main():
+    """Parse the command line arguments and play the replays."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("replays", nargs="+", help="paths of the replay files")
+    parser.add_argument(
+        "--output", default="replay_results.json", help="path of the JSON results"
+    )
+    args = parser.parse_args()
+    run_benchmark(args.replays, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+"""
+The 'stress_scenarios' module measures how the game logic and the drawing
+scale with the number of entities on screen. Each scenario fills a headless
+game with entities and runs a number of frames, timing every subsystem
+with the game's FrameProfiler. The results are printed and written as JSON, so different runs
+can be compared.
+
+Run it from the project root with: python -m src.benchmarks.stress_scenarios
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable
+
+import pygame
+
+from src.alien_onslaught import AlienOnslaught
+from src.entities.alien_entities.alien_bullets import BossBullet
+from src.entities.alien_entities.aliens import Alien, BossAlien
+from src.entities.asteroid import Asteroid
+from src.entities.projectiles.missile import Missile
+from src.entities.projectiles.player_bullets import Firebird, Thunderbolt
+from src.utils.constants import GAME_CONSTANTS
+from src.utils.game_clock import game_clock
+
+# The subsystems reported by the benchmark, the others are not used
+# by the scenarios.
+BENCHMARK_SUBSYSTEMS = (
+    "collisions",
+    "update_aliens",
+    "update_projectiles",
+    "alien_bullets",
+    "asteroids",
+    "powers",
+    "hud",
+    "gameplay",
+    "firing",
+    "ships",
+    "other_logic",
+    "draw",
+)
+
+# Extra hit points given to the ships, so they stay alive during the scenarios.
+SHIP_HP = 99
+
+
+@dataclass
+class Scenario:
+    """A stress scenario: the game mode to play and the function that
+    fills the game with entities before every frame.
+    """
+
+    name: str
+    description: str
+    game_mode: str
+    populate: Callable
+
+
+def _place_sprite(sprite, rng, screen_rect, top=0.0, bottom=1.0):
+    """Move the sprite to a random position in the given part of the screen."""
+    sprite.rect.x = rng.randint(0, max(0, screen_rect.width - sprite.rect.width))
+    sprite.rect.y = rng.randint(
+        int(screen_rect.height * top),
+        max(0, int(screen_rect.height * bottom) - sprite.rect.height),
+    )
+    sprite.x_pos = float(sprite.rect.x)
+    sprite.y_pos = float(sprite.rect.y)
+
+
+def _fill_aliens(game, rng, count):
+    """Add aliens in the upper part of the screen, up to the given count."""
+    screen_rect = game.screen.get_rect()
+    while len(game.aliens) < count:
+        alien = Alien(game.aliens_manager)
+        _place_sprite(alien, rng, screen_rect, bottom=0.6)
+        game.aliens.add(alien)
+
+
+def _fill_player_bullets(game, rng, count):
+    """Add bullets for both players across the screen, up to the given count."""
+    screen_rect = game.screen.get_rect()
+    groups = (
+        (game.thunderbird_bullets, Thunderbolt, game.thunderbird_ship),
+        (game.phoenix_bullets, Firebird, game.phoenix_ship),
+    )
+    for bullets, bullet_class, ship in groups:
+        while len(bullets) < count // 2:
+            bullet = game.sprite_pools.acquire(bullet_class, game.weapons_manager, ship)
+            _place_sprite(bullet, rng, screen_rect, top=0.1)
+            bullets.add(bullet)
+
+
+def _keep_ships_alive(game):
+    """Restore the ships health, so the scenario keeps running."""
+    game.stats.thunderbird_hp = SHIP_HP
+    game.stats.phoenix_hp = SHIP_HP
+    for ship in game.ships:
+        ship.state.alive = True
+
+
+def populate_fleet_and_bullets(game, rng):
+    """500 aliens and 300 player bullets."""
+    _keep_ships_alive(game)
+    _fill_aliens(game, rng, 500)
+    _fill_player_bullets(game, rng, 300)
+
+
+def populate_boss_fight(game, rng):
+    """A boss at the last Boss Rush level, with the screen full of boss bullets."""
+    _keep_ships_alive(game)
+    game.stats.level = 14
+    bosses = [alien for alien in game.aliens if isinstance(alien, BossAlien)]
+    if not bosses:
+        game.gameplay_manager.handle_boss_stats()
+        game.aliens_manager.create_boss_alien()
+        bosses = [alien for alien in game.aliens if isinstance(alien, BossAlien)]
+    boss = bosses[0]
+    # Keep the boss alive, the scenario is about the bullets.
+    boss.hit_count = 0
+
+    screen_rect = game.screen.get_rect()
+    while len(game.alien_bullet) < 200:
+        bullet = BossBullet(game.alien_bullets_manager, boss)
+        _place_sprite(bullet, rng, screen_rect, top=0.2)
+        game.alien_bullet.add(bullet)
+    _fill_player_bullets(game, rng, 60)
+
+
+def populate_meteor_madness(game, rng):
+    """Meteor Madness at the maximum asteroid frequency and speed, with as
+    many asteroids as the game keeps on screen at that frequency, running
+    at 60 frames per second.
+    """
+    _keep_ships_alive(game)
+    settings = game.settings
+    settings.asteroid_freq = GAME_CONSTANTS["MAX_AS_FREQ"]
+    settings.asteroid_speed = GAME_CONSTANTS["MAX_AS_SPEED"]
+    # Avoid the level change, which empties the asteroids group.
+    game.gameplay_manager.last_level_time = game_clock.get_ticks()
+
+    frames_on_screen = settings.screen_height / settings.asteroid_speed
+    frames_between_asteroids = settings.asteroid_freq / 1000 * 60
+    count = math.ceil(frames_on_screen / frames_between_asteroids)
+    screen_rect = game.screen.get_rect()
+    while len(game.asteroids) < count:
+        asteroid = game.sprite_pools.acquire(Asteroid, game.asteroids_manager)
+        _place_sprite(asteroid, rng, screen_rect, top=-0.1)
+        game.asteroids.add(asteroid)
+    _fill_player_bullets(game, rng, 60)
+
+
+def populate_missile_explosions(game, rng):
+    """A full fleet with missiles exploding over it."""
+    _keep_ships_alive(game)
+    rows = 6
+    _fill_aliens(game, rng, GAME_CONSTANTS["MAX_ALIEN_NUM"] * rows)
+
+    screen_rect = game.screen.get_rect()
+    groups = (
+        (game.thunderbird_missiles, game.thunderbird_ship),
+        (game.phoenix_missiles, game.phoenix_ship),
+    )
+    for missiles, ship in groups:
+        while len(missiles) < 10:
+            missile = game.sprite_pools.acquire(Missile, game.weapons_manager, ship)
+            _place_sprite(missile, rng, screen_rect, bottom=0.6)
+            missile.explode()
+            missiles.add(missile)
+
+
+SCENARIOS = [
+    Scenario(
+        "fleet_and_bullets",
+        "500 aliens and 300 player bullets",
+        "normal",
+        populate_fleet_and_bullets,
+    ),
+    Scenario(
+        "boss_fight",
+        "Boss Rush boss with 200 boss bullets",
+        "boss_rush",
+        populate_boss_fight,
+    ),
+    Scenario(
+        "meteor_madness",
+        "Meteor Madness at the maximum asteroid frequency",
+        "meteor_madness",
+        populate_meteor_madness,
+    ),
+    Scenario(
+        "missile_explosions",
+        "20 missiles exploding over a full fleet",
+        "normal",
+        populate_missile_explosions,
+    ),
+]
+
+GAME_MODE_BUTTONS = {
+    "normal": "handle_normal_button",
+    "boss_rush": "handle_boss_rush_button",
+    "meteor_madness": "handle_meteor_madness_button",
+}
+
+
+def create_game(game_mode, seed=None):
+    """Create a headless multiplayer game in the given game mode,
+    seeded with the given seed.
+    """
+    game = AlienOnslaught(singleplayer=False, headless=True)
+    getattr(game.buttons_manager, GAME_MODE_BUTTONS[game_mode])()
+    game.next_seed = seed
+    game.start_headless_game()
+    game.aliens.empty()
+    return game
+
+
+def summarize(samples):
+    """Return the mean, median, 95th percentile and max of the samples."""
+    ordered = sorted(samples)
+    return {
+        "mean": round(statistics.fmean(ordered), 4),
+        "median": round(statistics.median(ordered), 4),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+        "max": round(ordered[-1], 4),
+    }
+
+
+def run_scenario(scenario, frames, warmup=30, seed=0):
+    """Run the scenario and return the per-frame times of each subsystem."""
+    rng = random.Random(seed)
+    game = create_game(scenario.game_mode, seed)
+    game.profiler.start()
+
+    subsystem_samples = defaultdict(list)
+    frame_samples = []
+    entity_counts = defaultdict(int)
+    for frame in range(warmup + frames):
+        scenario.populate(game, rng)
+        game._handle_game_logic()
+        game._draw_game_messages()
+        game._draw_game_objects()
+        frame_times = game.profiler.end_frame()
+        if frame < warmup:
+            continue
+
+        for subsystem in BENCHMARK_SUBSYSTEMS:
+            subsystem_samples[subsystem].append(frame_times.get(subsystem, 0.0))
+        frame_samples.append(sum(frame_times.values()))
+        for name, count in game.profiler.get_entity_counts().items():
+            entity_counts[name] += count
+
+    return {
+        "description": scenario.description,
+        "game_mode": scenario.game_mode,
+        "frames": frames,
+        "frame_ms": summarize(frame_samples),
+        "subsystems_ms": {
+            subsystem: summarize(samples)
+            for subsystem, samples in subsystem_samples.items()
+        },
+        "mean_entities": {
+            name: round(count / frames, 1) for name, count in entity_counts.items()
+        },
+        "pools": game.sprite_pools.get_stats(),
+    }
+
+
+def run_benchmark(scenario_names, frames, output):
+    """Run the selected scenarios, print a summary and write the JSON results."""
+    results = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "scenarios": {},
+    }
+    for scenario in SCENARIOS:
+        if scenario_names and scenario.name not in scenario_names:
+            continue
+        result = run_scenario(scenario, frames)
+        results["scenarios"][scenario.name] = result
+
+        print(f"{scenario.name}: {result['frame_ms']['mean']:.2f} ms per frame")
+        for subsystem, stats in result["subsystems_ms"].items():
+            print(
+                f"    {subsystem:<20}{stats['mean']:>8.3f} ms (p95 {stats['p95']:.3f})"
+            )
+
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=4)
+    print(f"Results written to {output}")
+    return results
+
+
+def main():
+    """Parse the command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="scenario to run, can be repeated (default: all)",
+    )
+    parser.add_argument("--frames", type=int, default=300, help="frames per scenario")
+    parser.add_argument(
+        "--output", default="benchmark_results.json", help="path of the JSON results"
+    )
+    args = parser.parse_args()
+    run_benchmark(args.scenario, args.frames, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,38 +6,32 @@ Classes:
     - 'BossBullet': A class to manage bullets fired by the boss aliens.
 """
 
-import random
-
 import pygame
 from pygame.sprite import Sprite
 
-from src.utils.constants import LEVEL_PREFIX, ALIEN_BULLETS_IMG
-from src.utils.game_utils import (
-    load_alien_bullets,
-    load_boss_bullets,
-    load_single_image,
-)
+from src.utils.constants import LEVEL_PREFIX, ALIEN_BULLETS_IMG, BOSS_BULLETS_IMG
+from src.utils.game_random import rng
+from src.managers.asset_manager import assets
 from src.entities.alien_entities.aliens import BossAlien
 
 
 class AlienBullet(Sprite):
     """A class that manages bullets for the aliens."""
 
-    bullet_images = load_alien_bullets()
-
     def __init__(self, game):
         super().__init__()
         self.screen = game.screen
         self.settings = game.settings
+        self.bullet_images = assets.get_images(ALIEN_BULLETS_IMG)
         level_prefix = LEVEL_PREFIX.get(game.stats.level // 4 + 1, "Alien7")
         bullet_name = f"alien_bullet{level_prefix[-1]}"
-        self.image = load_single_image(ALIEN_BULLETS_IMG[bullet_name])
+        self.image = self.bullet_images[bullet_name]
         self.rect = self.image.get_rect()
         self._choose_random_alien(game)
 
     def _choose_random_alien(self, game):
         """Choose a random alien as the source of the bullet."""
-        random_alien = random.choice(game.aliens.sprites())
+        random_alien = rng.choice(game.aliens.sprites())
         self.rect.centerx = random_alien.rect.centerx
         self.rect.bottom = random_alien.rect.bottom
         self.y_pos = float(self.rect.y)
@@ -66,13 +60,12 @@ class AlienBullet(Sprite):
 class BossBullet(Sprite):
     """A class that manages bullets for the boss alien."""
 
-    bullet_images = load_boss_bullets()
-
     def __init__(self, game, alien):
         """Initialize a new bullet for an alien."""
         super().__init__()
         self.screen = game.screen
         self.settings = game.settings
+        self.bullet_images = assets.get_images(BOSS_BULLETS_IMG)
         self.alien = alien
         self.image = self.bullet_images["boss_bullet2"]
         self.rect = self.image.get_rect()
@@ -85,7 +78,7 @@ class BossBullet(Sprite):
         self.rect.center = alien.rect.center
         self.rect.bottom = alien.rect.bottom
         self.y_pos = float(self.rect.y)
-        self.x_vel = random.uniform(-4, 4)
+        self.x_vel = rng.uniform(-4, 4)
 
     def _update_image(self, game):
         """Change the bullet image for specific bosses."""
@@ -7,14 +7,13 @@ Classes:
     - 'BossAlien': Class used to create bosses.
 """
 
-import time
-import random
-
-
 from pygame.sprite import Sprite
 from src.animations.entities_animations import DestroyAnim, Immune
 from src.managers.alien_managers.aliens_behaviors import AlienMovement, AlienAnimation
-from src.utils.game_utils import load_boss_images
+from src.managers.asset_manager import assets
+from src.utils.constants import BOSS_RUSH
+from src.utils.game_clock import game_clock
+from src.utils.game_random import rng
 
 
 class Alien(Sprite):
@@ -54,7 +53,7 @@ class Alien(Sprite):
         self.rect.x = (
             self.baby_location
             if self.is_baby
-            else random.randint(0, self.settings.screen_width - self.rect.width)
+            else rng.randint(0, self.settings.screen_width - self.rect.width)
         )
         self.rect.y = self.rect.height
         self.x_pos = float(self.rect.x)
@@ -73,7 +72,7 @@ class Alien(Sprite):
         """Updates the position, animation, and state of the alien."""
         if (
             self.frozen_state
-            and time.time() - self.frozen_start_time > self.settings.frozen_time
+            and game_clock.time() - self.frozen_start_time > self.settings.frozen_time
         ):
             self.frozen_state = False
 
@@ -95,7 +94,8 @@ class Alien(Sprite):
 
         if (
             self.immune_state
-            and time.time() - self.immune_start_time > self.settings.alien_immune_time
+            and game_clock.time() - self.immune_start_time
+            > self.settings.alien_immune_time
         ):
             self.immune_state = False
 
@@ -106,13 +106,13 @@ class Alien(Sprite):
         self.destroy.draw_animation()
 
         if not self.game_modes.last_bullet and (
-            not self.is_baby and random.random() <= 0.1
+            not self.is_baby and rng.random() <= 0.1
         ):
             self.split_alien()
 
     def split_alien(self):
         """Splits the alien into multiple smaller (baby) aliens."""
-        num_splits = random.randint(1, 4)
+        num_splits = rng.randint(1, 4)
         for _ in range(num_splits):
             baby_alien = Alien(self, baby_location=self.rect.x, is_baby=True)
             baby_alien.rect.y = self.rect.y
@@ -123,12 +123,12 @@ class Alien(Sprite):
         """Set the alien's immune state to True."""
         self.immune_state = True
         self.immune.immune_rect.center = self.rect.center
-        self.immune_start_time = time.time()
+        self.immune_start_time = game_clock.time()
 
     def freeze(self):
         """Set's the alien's frozen state to True."""
         self.frozen_state = True
-        self.frozen_start_time = time.time()
+        self.frozen_start_time = game_clock.time()
 
     def draw(self):
         """Draw the alien on screen."""
@@ -138,8 +138,6 @@ class Alien(Sprite):
 class BossAlien(Sprite):
     """A class that represents bosses."""
 
-    boss_images = load_boss_images()
-
     def __init__(self, game):
         """Initializes the BossAlien object and creates instances of AlienMovement
         and DestroyAnim classes to manage the movement and destruction animation.
@@ -147,6 +145,7 @@ class BossAlien(Sprite):
         super().__init__()
         self.screen = game.screen
         self.settings = game.settings
+        self.boss_images = assets.get_images(BOSS_RUSH)
         self.image = self.boss_images["boss2"]
         self._update_image(game)
 
@@ -181,7 +180,7 @@ class BossAlien(Sprite):
         """Update position and movement."""
         if (
             self.frozen_state
-            and time.time() - self.frozen_start_time > self.settings.frozen_time
+            and game_clock.time() - self.frozen_start_time > self.settings.frozen_time
         ):
             self.frozen_state = False
 
@@ -207,7 +206,7 @@ class BossAlien(Sprite):
     def freeze(self):
         """Set's the alien's frozen state to True."""
         self.frozen_state = True
-        self.frozen_start_time = time.time()
+        self.frozen_start_time = game_clock.time()
 
     def upgrade(self):
         """Increase boss HP."""
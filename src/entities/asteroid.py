@@ -1,9 +1,8 @@
 """The 'asteroid' module contains the Asteroid class used to create asteroid instances."""
 
-import random
-
 from pygame.sprite import Sprite
-from src.utils.animation_constants import asteroid_frames
+from src.utils.animation_constants import get_frames
+from src.utils.game_random import rng
 
 
 class Asteroid(Sprite):
@@ -11,11 +10,17 @@ class Asteroid(Sprite):
 
     def __init__(self, game):
         super().__init__()
+        self.reset(game)
+
+    def reset(self, game):
+        """Set the asteroid to its initial state. Also used to reuse
+        an asteroid from the sprite pool.
+        """
         self.screen = game.screen
         self.settings = game.settings
         self.speed = self.settings.asteroid_speed
 
-        self.frames = asteroid_frames
+        self.frames = get_frames("asteroid_frames")
         self.current_frame = 0
         self.image = self.frames[self.current_frame]
 
@@ -24,7 +29,7 @@ class Asteroid(Sprite):
     def _initialize_position(self):
         """Set the initial position of the asteroid."""
         self.rect = self.frames[0].get_rect()
-        self.rect.x = random.randint(0, self.settings.screen_width - self.rect.width)
+        self.rect.x = rng.randint(0, self.settings.screen_width - self.rect.width)
         self.rect.y = 0
         self.y_pos = float(self.rect.y)
 
@@ -5,7 +5,7 @@ to display a heart image on the screen that represents the player HP.
 
 from pygame.sprite import Sprite
 from src.utils.constants import OTHER
-from src.utils.game_utils import load_single_image
+from src.managers.asset_manager import assets
 
 
 class Heart(Sprite):
@@ -17,7 +17,7 @@ class Heart(Sprite):
         self.settings = game.settings
 
         self.screen_rect = game.screen.get_rect()
-        self.image = load_single_image(OTHER["heart"])
+        self.image = assets.get_image(OTHER["heart"])
         self.rect = self.image.get_rect(topleft=(0, 0))
 
     def blitme(self):
@@ -4,15 +4,15 @@ player ships.
 """
 
 import os
-import time
 
-import pygame
 from pygame.sprite import Sprite
 
 from src.animations.ship_animations import Animations
+from src.managers.asset_manager import assets
 from src.utils.game_utils import BASE_PATH
 from src.utils.constants import SHIPS, ship_image_paths
 from src.utils.game_dataclasses import ShipStates
+from src.utils.game_clock import game_clock
 
 
 class Ship(Sprite):
@@ -32,7 +32,7 @@ class Ship(Sprite):
         self.missiles_num = missiles
         self.aliens_killed = self.settings.required_kill_count
         self.remaining_bullets = 17 if self.game.singleplayer else 9
-        self.image = pygame.image.load(self.image_path)
+        self.image = assets.get_image(self.image_path)
 
         self.rect = self.image.get_rect()
         self.cosmic_conflict_pos = conflict_pos
@@ -88,14 +88,14 @@ class Ship(Sprite):
         """Updates the ship state."""
         if (
             self.state.immune
-            and pygame.time.get_ticks() - self.immune_start_time
+            and game_clock.get_ticks() - self.immune_start_time
             > self.settings.immune_time
         ):
             self.state.immune = False
 
         if (
             self.state.scaled
-            and time.time() - self.small_ship_time > self.settings.scaled_time
+            and game_clock.time() - self.small_ship_time > self.settings.scaled_time
         ):
             self.reset_ship_size()
 
@@ -193,14 +193,18 @@ class Ship(Sprite):
         self.anims.explosion_rect.center = self.rect.center
 
     def start_warp(self):
-        """Sets the warping state to True."""
+        """Sets the warping state to True and plays
+        the warp animation from its first frame.
+        """
         self.state.warping = True
+        self.anims.warp_index = 0
+        self.anims.warp_counter = 0
 
     def set_immune(self):
         """Sets the immuen state to True."""
         self.state.immune = True
         self.anims.immune_rect.center = self.rect.center
-        self.immune_start_time = pygame.time.get_ticks()
+        self.immune_start_time = game_clock.get_ticks()
 
     def empower(self):
         """Sets the empowered state to True."""
@@ -229,12 +233,12 @@ class Ship(Sprite):
         self.image_path = os.path.join(
             BASE_PATH, ship_image_paths.get(self.ship_name, SHIPS[f"{ship_type}1"])
         )
-        self.image = pygame.image.load(self.image_path)
+        self.image = assets.get_image(self.image_path)
 
         self.rect = self.image.get_rect()
 
         self.state.scaled = False
-        self.small_ship_time = time.time()
+        self.small_ship_time = game_clock.time()
         self.scale_counter = 0
 
     def reset_ship_state(self):
@@ -244,6 +248,11 @@ class Ship(Sprite):
         self.state.scaled_weapon = False
         self.state.shielded = False
         self.state.immune = False
+        self.state.exploding = False
+        self.state.empowered = False
+        self.anims.current_explosion_frame = 0
+        self.anims.current_empower_frame = 0
+        self.anims.empower_timer = 0
         self.ship_selected = False
 
         self.aliens_killed = self.settings.required_kill_count
@@ -1,10 +1,9 @@
 """The 'powers' module contains the Power class used to create power instances."""
 
-import random
-
 from pygame.sprite import Sprite
 from src.utils.constants import POWERS, GAME_CONSTANTS, WEAPON_BOXES
-from src.utils.game_utils import load_single_image
+from src.utils.game_random import rng
+from src.managers.asset_manager import assets
 
 
 class Power(Sprite):
@@ -16,10 +15,16 @@ class Power(Sprite):
 
     def __init__(self, game):
         super().__init__()
+        self.reset(game)
+
+    def reset(self, game):
+        """Set the power to a random position, as a plain power. Also
+        used to reuse a power from the sprite pool.
+        """
         self.game = game
 
-        self.image = load_single_image(POWERS["power"])
-        self.health_image = load_single_image(POWERS["health"])
+        self.image = assets.get_image(POWERS["power"])
+        self.health_image = assets.get_image(POWERS["health"])
         self.speed = GAME_CONSTANTS["POWER_SPEED"]
         self.last_power_time = 0
         self._initialize_position()
@@ -31,9 +36,7 @@ class Power(Sprite):
     def _initialize_position(self):
         """Set the initial position of the power."""
         self.rect = self.image.get_rect()
-        self.rect.x = random.randint(
-            0, self.game.settings.screen_width - self.rect.width
-        )
+        self.rect.x = rng.randint(0, self.game.settings.screen_width - self.rect.width)
         self.rect.y = 0
         self.y_pos = float(self.rect.y)
 
@@ -45,8 +48,8 @@ class Power(Sprite):
     def make_weapon_power_up(self):
         """Change the power up to a random weapon power up."""
         self.weapon = True
-        random_box = random.choice(list(WEAPON_BOXES.keys()))
-        self.image = load_single_image(WEAPON_BOXES[random_box])
+        random_box = rng.choice(list(WEAPON_BOXES.keys()))
+        self.image = assets.get_image(WEAPON_BOXES[random_box])
         self.weapon_name = random_box
 
     def update(self):
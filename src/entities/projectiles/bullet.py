@@ -7,9 +7,15 @@ from pygame.sprite import Sprite
 class Bullet(Sprite):
     """A base class used to create bullets."""
 
-    def __init__(self, game, image_path, ship, speed):
-        """Create a bullet object at the ship's current position"""
+    def __init__(self, *args, **kwargs):
+        """Create a bullet object, with the arguments of 'reset'."""
         super().__init__()
+        self.reset(*args, **kwargs)
+
+    def reset(self, game, image_path, ship, speed):
+        """Place the bullet at the ship's current position. Also used to
+        reuse a bullet from the sprite pool.
+        """
         self.game = game
         self.speed = speed
         self.ship = ship
@@ -3,11 +3,11 @@ The "laser" module contains the Laser class that represents the laser weapon
 in the game.
 """
 
-import time
 import pygame
 
 from pygame.sprite import Sprite
-from src.utils.animation_constants import laser_frames
+from src.utils.animation_constants import get_frames
+from src.utils.game_clock import game_clock
 
 
 class Laser(Sprite):
@@ -19,7 +19,7 @@ class Laser(Sprite):
         self.ship = ship
 
         self.settings = game.settings
-        self.frames = laser_frames
+        self.frames = get_frames("laser_frames")
         self.current_frame = 0
         self.rect = self.frames[0].get_rect()
         self.set_laser_frames()
@@ -29,7 +29,7 @@ class Laser(Sprite):
         self.frame_counter = 0
 
         self.duration = 1
-        self.start_time = time.time()
+        self.start_time = game_clock.time()
 
     def update(self):
         self.frame_counter += 1
@@ -38,7 +38,10 @@ class Laser(Sprite):
             self.set_laser_frames()
             self.frame_counter = 0
 
-        if time.time() - self.start_time >= self.duration or self.ship.state.exploding:
+        if (
+            game_clock.time() - self.start_time >= self.duration
+            or self.ship.state.exploding
+        ):
             self.kill()
 
         self._check_position_cosmic_conflict()
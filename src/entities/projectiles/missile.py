@@ -3,11 +3,16 @@ The "missile" module contains the Missile class used to create
 missile instances.
 """
 
+from itertools import count
+
 import pygame
 from pygame.sprite import Sprite
 
 from src.animations.entities_animations import MissileEx
-from src.utils.animation_constants import missile_frames
+from src.utils.animation_constants import get_frames
+
+# Each launch of a missile gets a new id, also when a pooled missile is reused.
+launch_ids = count()
 
 
 class Missile(Sprite):
@@ -18,13 +23,20 @@ class Missile(Sprite):
 
     def __init__(self, game, ship):
         super().__init__()
+        self.destroy_anim = None
+        self.reset(game, ship)
+
+    def reset(self, game, ship):
+        """Place the missile at the ship's current position. Also used to
+        reuse a missile from the sprite pool.
+        """
         self.game = game
         self.ship = ship
         self.settings = game.settings
         self.screen = self.game.screen
 
         self.destroy_delay = 50
-        self.frames = missile_frames
+        self.frames = get_frames("missile_frames")
         self.current_frame = 0
         self.set_missile_frames()
         self.rect = self.frames[0].get_rect()
@@ -36,8 +48,12 @@ class Missile(Sprite):
         self.frame_update_rate = 5
         self.frame_counter = 0
 
-        self.destroy_anim = MissileEx(self)
+        if self.destroy_anim is None:
+            self.destroy_anim = MissileEx(self)
+        else:
+            self.destroy_anim.reset()
         self.is_destroyed = False
+        self.launch_id = next(launch_ids)
 
     def update(self):
         """Update the missile's position and animation."""
@@ -10,8 +10,8 @@ from src.entities.projectiles.bullet import Bullet
 class Thunderbolt(Bullet):
     """A class to create bullets for Thunderbird ship."""
 
-    def __init__(self, manager, ship, scaled=False):
-        super().__init__(
+    def reset(self, manager, ship, scaled=False):
+        super().reset(
             manager,
             manager.weapons["thunderbird"]["weapon"],
             ship,
@@ -26,8 +26,8 @@ class Thunderbolt(Bullet):
 class Firebird(Bullet):
     """A class to create bullets for Phoenix ship."""
 
-    def __init__(self, manager, ship, scaled=False):
-        super().__init__(
+    def reset(self, manager, ship, scaled=False):
+        super().reset(
             manager,
             manager.weapons["phoenix"]["weapon"],
             ship,
@@ -3,14 +3,19 @@ The 'collision_detection' module contains the CollisionManager class
 that handles the collisions in the game.
 """
 
-import time
 import pygame
 
 from src.entities.projectiles.missile import Missile
 from src.entities.alien_entities.aliens import BossAlien
+from src.game_logic.spatial_hash import SpatialHash
 
-from src.utils.constants import ALIENS_HP_MAP
+from src.utils.constants import (
+    ALIENS_HP_MAP,
+    SPATIAL_HASH_CELL_SIZE,
+    SPATIAL_HASH_MIN_SPRITES,
+)
 from src.utils.game_utils import play_sound, get_colliding_sprites
+from src.utils.game_clock import game_clock
 
 
 class CollisionManager:
@@ -27,6 +32,64 @@ class CollisionManager:
 
         self.handled_collisions = {}
 
+        self.spatial_hashes = {}
+        self.fresh_spatial_hashes = set()
+
+    def refresh_spatial_hash(self, sprites=None):
+        """Mark the spatial hash of the given group (or of all groups) as stale,
+        so it gets rebuilt on its next query. Called once per frame and after
+        the sprites of a group have moved.
+        """
+        if sprites is None:
+            self.fresh_spatial_hashes.clear()
+        else:
+            self.fresh_spatial_hashes.discard(id(sprites))
+
+    def _get_nearby_sprites(self, sprites, rect):
+        """Return the sprites from the group that are near the given rect.
+        Small groups are returned as they are, since checking them by brute
+        force is cheaper than maintaining a spatial hash for them.
+        """
+        if len(sprites) < SPATIAL_HASH_MIN_SPRITES:
+            return sprites
+
+        key = id(sprites)
+        spatial_hash = self.spatial_hashes.get(key)
+        if spatial_hash is None:
+            spatial_hash = self.spatial_hashes[key] = SpatialHash(
+                SPATIAL_HASH_CELL_SIZE
+            )
+        if key not in self.fresh_spatial_hashes:
+            spatial_hash.rebuild(sprites)
+            self.fresh_spatial_hashes.add(key)
+
+        return [sprite for sprite in spatial_hash.query(rect) if sprite in sprites]
+
+    def _groupcollide(self, projectiles, sprites, kill_projectiles):
+        """Return a dict mapping each projectile to the sprites it collides with,
+        same as pygame.sprite.groupcollide but using the spatial hash,
+        or the projectile arrays for the bullets when they are available.
+        """
+        arrays = self.game.projectile_arrays.get(projectiles)
+        if arrays and arrays.active():
+            collisions = arrays.collide(sprites.sprites())
+            if kill_projectiles:
+                for projectile in collisions:
+                    projectile.kill()
+            return collisions
+
+        collisions = {}
+        for projectile in projectiles.sprites():
+            if hits := pygame.sprite.spritecollide(
+                projectile,
+                self._get_nearby_sprites(sprites, projectile.rect),
+                False,
+            ):
+                collisions[projectile] = hits
+                if kill_projectiles:
+                    projectile.kill()
+        return collisions
+
     def handle_shielded_ship_collisions(self, ships, aliens, bullets, asteroids):
         """Destroy aliens, bullets, or asteroids colliding with ship shields."""
         for ship in ships:
@@ -36,7 +99,7 @@ class CollisionManager:
 
     def _handle_alien_collisions_with_shielded_ship(self, ship, aliens):
         """Handle collisions between aliens and ship shields."""
-        for alien in aliens:
+        for alien in self._get_nearby_sprites(aliens, ship.anims.shield_rect):
             if ship.state.shielded and ship.anims.shield_rect.colliderect(alien.rect):
                 if not isinstance(alien, BossAlien):
                     self._destroy_alien_and_play_sound(alien)
@@ -44,13 +107,13 @@ class CollisionManager:
 
     def _handle_bullet_collisions_with_shielded_ship(self, ship, bullets):
         """Handle collisions between bullets and ship shields."""
-        for bullet in bullets:
+        for bullet in self._get_nearby_sprites(bullets, ship.anims.shield_rect):
             if ship.state.shielded and ship.anims.shield_rect.colliderect(bullet.rect):
                 self._resolve_shield_collision(bullet, "alien_exploding", ship)
 
     def _handle_asteroid_collisions_with_shielded_ship(self, ship, asteroids):
         """Handle collisions between asteroids and ship shields."""
-        for asteroid in asteroids:
+        for asteroid in self._get_nearby_sprites(asteroids, ship.anims.shield_rect):
             if ship.state.shielded and ship.anims.shield_rect.colliderect(asteroid):
                 self._resolve_shield_collision(asteroid, "asteroid_exploding", ship)
 
@@ -84,7 +147,9 @@ class CollisionManager:
         self, ship, thunder_hit_method, phoenix_hit_method
     ):
         """Handle collision between ship and asteroids."""
-        if collision := pygame.sprite.spritecollideany(ship, self.game.asteroids):
+        if collision := pygame.sprite.spritecollideany(
+            ship, self._get_nearby_sprites(self.game.asteroids, ship.rect)
+        ):
             hit_method = (
                 thunder_hit_method
                 if ship is self.thunderbird_ship
@@ -107,7 +172,9 @@ class CollisionManager:
 
     def _handle_projectile_asteroid_collision(self, sprite):
         """Handle collision between projectile and asteroids."""
-        if collision := pygame.sprite.spritecollideany(sprite, self.game.asteroids):
+        if collision := pygame.sprite.spritecollideany(
+            sprite, self._get_nearby_sprites(self.game.asteroids, sprite.rect)
+        ):
             collision.kill()
             play_sound(self.game.sound_manager.game_sounds, "asteroid_exploding")
             if isinstance(sprite, Missile):
@@ -134,7 +201,9 @@ class CollisionManager:
         if not ship.state.alive:
             return
 
-        if collision := pygame.sprite.spritecollideany(ship, self.game.powers):
+        if collision := pygame.sprite.spritecollideany(
+            ship, self._get_nearby_sprites(self.game.powers, ship.rect)
+        ):
             self._activate_power(
                 player,
                 ship,
@@ -169,11 +238,11 @@ class CollisionManager:
 
     def check_bullet_alien_collisions(self):
         """Respond to player bullet-alien collisions."""
-        thunderbird_ship_collisions = pygame.sprite.groupcollide(
-            self.game.thunderbird_bullets, self.game.aliens, True, False
+        thunderbird_ship_collisions = self._groupcollide(
+            self.game.thunderbird_bullets, self.game.aliens, True
         )
-        phoenix_ship_collisions = pygame.sprite.groupcollide(
-            self.game.phoenix_bullets, self.game.aliens, True, False
+        phoenix_ship_collisions = self._groupcollide(
+            self.game.phoenix_bullets, self.game.aliens, True
         )
 
         # Thunderbird collisions
@@ -189,8 +258,7 @@ class CollisionManager:
         else:
             self.stats.thunderbird_score += score_increment
         hit_function()
-        self.score_board.render_scores()
-        self.score_board.update_high_score()
+        self.score_board.update_scores()
 
     def _resolve_collision_cosmic_conflict(
         self, ship, hit_function, sprite_group, score_increment
@@ -232,7 +300,9 @@ class CollisionManager:
         """
         for ship in self.game.ships:
             if (
-                pygame.sprite.spritecollideany(ship, self.game.aliens)
+                pygame.sprite.spritecollideany(
+                    ship, self._get_nearby_sprites(self.game.aliens, ship.rect)
+                )
                 and not ship.state.immune
             ):
                 if ship is self.thunderbird_ship:
@@ -254,19 +324,18 @@ class CollisionManager:
         if not self.game.singleplayer:
             self.stats.phoenix_score = max(self.stats.phoenix_score - 100, 0)
         self.stats.thunderbird_score = max(self.stats.thunderbird_score - 100, 0)
-        self.score_board.render_scores()
-        self.score_board.update_high_score()
+        self.score_board.update_scores()
 
     def check_missile_alien_collisions(self):
         """Respond to missiles-alien collisions."""
         # Collisions with Thunderbird missiles
-        thunderbird_missile_collisions = pygame.sprite.groupcollide(
-            self.game.thunderbird_missiles, self.game.aliens, False, False
+        thunderbird_missile_collisions = self._groupcollide(
+            self.game.thunderbird_missiles, self.game.aliens, False
         )
 
         # Collisions with Phoenix missiles
-        phoenix_missile_collisions = pygame.sprite.groupcollide(
-            self.game.phoenix_missiles, self.game.aliens, False, False
+        phoenix_missile_collisions = self._groupcollide(
+            self.game.phoenix_missiles, self.game.aliens, False
         )
 
         # Handle Thunderbird missile collisions
@@ -291,9 +360,7 @@ class CollisionManager:
         }
 
         for laser, player in laser_collisions.items():
-            collided_aliens = pygame.sprite.groupcollide(
-                laser, self.game.aliens, False, False
-            )
+            collided_aliens = self._groupcollide(laser, self.game.aliens, False)
 
             for aliens in collided_aliens.values():
                 for alien in aliens:
@@ -304,7 +371,7 @@ class CollisionManager:
 
     def _handle_boss_collisions_with_laser(self, alien, player):
         """Handle collision between player's laser and a boss alien."""
-        current_time = time.time()
+        current_time = game_clock.time()
         if current_time - alien.last_hit_time >= 0.2:
             alien.hit_count += 1
             alien.last_hit_time = current_time
@@ -344,9 +411,14 @@ class CollisionManager:
     def _handle_ship_alien_bullet_collision(self, ship, hit_method):
         """Handle collision between ship and alien bullet."""
         if ship.state.alive and not ship.state.immune:
-            if collision := pygame.sprite.spritecollideany(
-                ship, self.game.alien_bullet
-            ):
+            arrays = self.game.projectile_arrays.get(self.game.alien_bullet)
+            if arrays and arrays.active():
+                collision = arrays.collide_any(ship.rect)
+            else:
+                collision = pygame.sprite.spritecollideany(
+                    ship, self._get_nearby_sprites(self.game.alien_bullet, ship.rect)
+                )
+            if collision:
                 self._process_ship_bullet_collision(ship, hit_method, collision)
 
     def _process_ship_bullet_collision(self, ship, hit_method, collision):
@@ -373,8 +445,7 @@ class CollisionManager:
         else:
             self.stats.phoenix_score += self.settings.boss_points
 
-        self.score_board.render_scores()
-        self.score_board.update_high_score()
+        self.score_board.update_scores()
 
     def _handle_alien_hits(self, player_ship_collisions, player):
         """Handles what happens with the score and the aliens after they have been hit."""
@@ -404,12 +475,16 @@ class CollisionManager:
                 self.stats.phoenix_score += self.settings.alien_points
                 self.phoenix_ship.aliens_killed += 1
 
+        aliens_num = len(self.game.aliens)
         alien.destroy_alien()
         play_sound(self.game.sound_manager.game_sounds, "alien_exploding")
         self.game.aliens.remove(alien)
 
-        self.score_board.render_scores()
-        self.score_board.update_high_score()
+        # The alien split into babies, they must be added to the spatial hash.
+        if len(self.game.aliens) >= aliens_num:
+            self.refresh_spatial_hash(self.game.aliens)
+
+        self.score_board.update_scores()
 
     def _check_missile_ex_collision(self, aliens, player, missile):
         """Check collisions between aliens and missile explosion."""
@@ -419,16 +494,31 @@ class CollisionManager:
 
     def _handle_missile_explosion_collision(self, aliens, player, missile, ex_rect):
         """Handle collision between missile explosion and aliens."""
-        for alien in aliens:
+        for alien in self._get_missile_explosion_candidates(aliens, ex_rect):
             if isinstance(alien, BossAlien):
                 self._hande_missile_explosion_with_bosses(alien, player, missile)
             elif ex_rect.colliderect(alien.rect):
                 self._update_stats(alien, player)
 
+    def _get_missile_explosion_candidates(self, aliens, ex_rect):
+        """Return the aliens that can be hit by the missile explosion.
+        Bosses are always hit by the explosion, no matter where they are.
+        """
+        nearby_aliens = self._get_nearby_sprites(aliens, ex_rect)
+        bosses = [
+            alien
+            for alien in aliens
+            if isinstance(alien, BossAlien) and alien not in nearby_aliens
+        ]
+        return bosses + list(nearby_aliens)
+
     def _hande_missile_explosion_with_bosses(self, alien, player, missile):
-        """Handle collision between missile explosion and bosses."""
-        if (missile, alien) not in self.handled_collisions:
+        """Handle collision between missile explosion and bosses. Each launch
+        of a missile hits a boss once, a missile reused from the sprite pool
+        is a new launch.
+        """
+        if (missile.launch_id, alien) not in self.handled_collisions:
             play_sound(self.game.sound_manager.game_sounds, "missile")
             alien.hit_count += 5
             self._handle_boss_alien_collision(alien, player)
-            self.handled_collisions[(missile, alien)] = True
+            self.handled_collisions[(missile.launch_id, alien)] = True
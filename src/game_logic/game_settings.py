@@ -9,8 +9,9 @@ from src.utils.constants import (
     BACKGROUNDS,
     GAME_CONSTANTS,
     OTHER,
+    TARGET_FPS,
 )
-from src.utils.game_utils import load_images
+from src.managers.asset_manager import assets
 from src.utils.game_dataclasses import GameModes, UIOptions
 
 
@@ -42,11 +43,25 @@ class Settings:
         """Initialize screen settings."""
         self.screen_width = 1260
         self.screen_height = 700
+        self.target_fps = TARGET_FPS
 
     def _init_images(self):
         """Initialize images for the game."""
-        self.bg_images = load_images(BACKGROUNDS)
-        self.misc_images = load_images(OTHER)
+        self.bg_images = assets.get_images(BACKGROUNDS, alpha=False)
+        self.misc_images = assets.get_images(OTHER)
+        self.update_images()
+
+        self.game_end_rect = self.game_end_img.get_rect()
+        self.game_title_rect = self.game_title.get_rect()
+        self.game_title_rect.y = -270
+        self.cursor_rect = self.cursor_img.get_rect()
+        self.load_game_rect = self.load_game_img.get_rect()
+        self.save_game_rect = self.save_game_img.get_rect()
+
+    def update_images(self):
+        """Set the image attributes from the loaded images. Called again after
+        the images are converted to the display pixel format.
+        """
         # Background Images
         self.bg_img = self.bg_images["space"]
         self.second_bg = self.bg_images["space2"]
@@ -54,22 +69,14 @@ class Settings:
         self.fourth_bg = self.bg_images["space4"]
         # Game over and pause images
         self.game_end_img = self.misc_images["gameover"]
-        self.game_end_rect = self.game_end_img.get_rect()
         self.pause = self.misc_images["pause"]
         # Game title and cursor images
         self.game_title = self.misc_images["game_title"]
-        self.game_title_rect = self.game_title.get_rect()
-        self.game_title_rect.y = -270
         self.cursor_img = self.misc_images["cursor"]
-        self.cursor_rect = self.cursor_img.get_rect()
         self.game_icon = self.misc_images["game_icon"]
-
         # Load and Save game title images
         self.load_game_img = self.misc_images["load_game"]
-        self.load_game_rect = self.load_game_img.get_rect()
-
         self.save_game_img = self.misc_images["save_game"]
-        self.save_game_rect = self.save_game_img.get_rect()
 
     def _init_game_settings(self):
         """This method initializes the settings
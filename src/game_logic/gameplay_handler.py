@@ -3,9 +3,6 @@
 which manages the game modes and behavior for every game mode in the game.
 """
 
-import time
-import pygame
-
 from src.utils.constants import (
     DIFFICULTIES,
     GAME_CONSTANTS,
@@ -15,6 +12,7 @@ from src.utils.constants import (
     AVAILABLE_BULLETS_MAP,
     AVAILABLE_BULLETS_MAP_SINGLE,
 )
+from src.utils.game_clock import game_clock
 
 
 class GameplayHandler:
@@ -225,7 +223,7 @@ class GameplayHandler:
         update_asteroids()
         collision_handler(thunderbird_hit, phoenix_hit)
 
-        current_time = pygame.time.get_ticks() - self.game.pause_time
+        current_time = game_clock.get_ticks()
         if current_time > self.last_level_time + self.level_time:
             self.last_level_time = current_time
             self._prepare_asteroids_level()
@@ -324,7 +322,7 @@ class GameplayHandler:
 
         asteroid_handler(force_creation=True)
 
-        current_time = time.time()
+        current_time = game_clock.time()
         if current_time - self.last_increase_time >= 90:  # seconds
             self.settings.alien_speed += 0.1
             self.settings.alien_bullet_speed += 0.1
@@ -336,7 +334,7 @@ class GameplayHandler:
         """
         asteroid_handler(force_creation=True)
 
-        current_time = time.time()
+        current_time = game_clock.time()
         if current_time - self.last_decrease_time >= 90:  # seconds
             self.settings.thunderbird_ship_speed = max(
                 2.0, self.settings.thunderbird_ship_speed - 0.2
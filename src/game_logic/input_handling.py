@@ -9,8 +9,29 @@ import pygame
 from src.entities.projectiles.missile import Missile
 from src.entities.projectiles.laser import Laser
 from src.entities.projectiles.player_bullets import Firebird, Thunderbolt
+from src.utils.game_clock import game_clock
 from src.utils.game_utils import play_sound, play_music
 
+# The keys that control the ships, which are recorded in the replays.
+SHIP_CONTROL_KEYS = frozenset(
+    (
+        pygame.K_SPACE,
+        pygame.K_a,
+        pygame.K_d,
+        pygame.K_w,
+        pygame.K_s,
+        pygame.K_x,
+        pygame.K_c,
+        pygame.K_RETURN,
+        pygame.K_LEFT,
+        pygame.K_RIGHT,
+        pygame.K_UP,
+        pygame.K_DOWN,
+        pygame.K_RCTRL,
+        pygame.K_RSHIFT,
+    )
+)
+
 
 class PlayerInput:
     """Class for handling player input events in a game."""
@@ -66,6 +87,7 @@ class PlayerInput:
 
             # If the game is not paused, check for player keypresses
             case _ if not self.ui_options.paused:
+                self._record_key(event.key, True)
                 self._handle_thunderbird_controls(
                     event, fire_missile_method, fire_laser_method
                 )
@@ -78,6 +100,7 @@ class PlayerInput:
 
     def check_keyup_events(self, event):
         """Respond to keys being released."""
+        self._record_key(event.key, False)
         # Thunderbird controls
         if self.thunderbird.state.alive:
             match event.key:
@@ -111,9 +134,14 @@ class PlayerInput:
                 case pygame.K_RSHIFT:
                     self.phoenix.laser_fired = False
 
+    def _record_key(self, key, pressed):
+        """Pass the ship control keys to the replay recorder."""
+        if key in SHIP_CONTROL_KEYS:
+            self.game.replay_recorder.record_key(key, pressed)
+
     def handle_ship_firing(self, fire_bullet_method):
         """Handles the ship firing."""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         ships = {
             "thunderbird": (
                 self.thunderbird,
@@ -205,6 +233,39 @@ class PlayerInput:
                 )
                 self.phoenix.laser_fired = True
 
+    def apply_actions(self, actions, fire_missile_method, fire_laser_method):
+        """Apply the actions of each player, given as a dict that maps the
+        ship name ('thunderbird' or 'phoenix') to a ShipActions instance.
+        """
+        ships = {
+            "thunderbird": (
+                self.thunderbird,
+                self.game.thunderbird_missiles,
+                self.game.thunderbird_laser,
+            ),
+            "phoenix": (
+                self.phoenix,
+                self.game.phoenix_missiles,
+                self.game.phoenix_laser,
+            ),
+        }
+        for ship_name, ship_actions in actions.items():
+            ship, missiles, laser = ships[ship_name]
+            if not ship.state.alive or ship.state.warping or ship.state.exploding:
+                continue
+
+            ship.moving_flags["left"] = ship_actions.left
+            ship.moving_flags["right"] = ship_actions.right
+            ship.moving_flags["up"] = ship_actions.up
+            ship.moving_flags["down"] = ship_actions.down
+            ship.state.firing = ship_actions.firing
+
+            if ship_actions.missile:
+                fire_missile_method(missiles, ship, missile_class=Missile)
+            if ship_actions.laser:
+                fire_laser_method(laser, ship, laser_class=Laser)
+            ship.laser_fired = ship_actions.laser
+
     def reset_ship_flags(self):
         """Reset movement flags and firing state for the ships."""
         self.thunderbird.moving_flags["right"] = False
@@ -0,0 +1,278 @@
+"""
+The 'projectile_arrays' module contains the ProjectileArrays class that moves,
+culls and collides the player and alien bullets with NumPy arrays, instead of
+updating each bullet sprite on its own.
+
+NumPy is optional. Without it 'create_projectile_arrays' returns no arrays and
+the bullet groups are updated sprite by sprite, as before.
+"""
+
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from src.entities.alien_entities.alien_bullets import BossBullet
+from src.entities.projectiles.bullet import Bullet
+from src.utils.constants import PROJECTILE_ARRAYS_MIN_SPRITES
+
+NUMPY_AVAILABLE = np is not None
+
+# The kinds of projectiles, which decide how they move.
+PLAYER_BULLET = 0
+ALIEN_BULLET = 1
+
+
+def create_projectile_arrays(game, groups):
+    """Return a dict mapping each group to its ProjectileArrays,
+    or an empty dict when NumPy is not available.
+    """
+    if not NUMPY_AVAILABLE:
+        return {}
+    return {group: ProjectileArrays(game, group) for group in groups}
+
+
+class ProjectileArrays:
+    """Keeps the state of a bullet group as a structure of arrays: the float
+    positions, the rect of each bullet, the speed, the direction of its owner
+    and the kind of bullet.
+
+    The sprites stay in the group, so the rest of the game sees them as usual.
+    The arrays are synced with the group when bullets are added or removed,
+    and the new positions are written back to the sprites after each move.
+    """
+
+    def __init__(self, game, group):
+        self.game = game
+        self.settings = game.settings
+        self.group = group
+        self.sprites = []
+        self.indexes = {}
+        self.player = np.empty(0, dtype=bool)
+        self.player_sprites = []
+        self.alien_sprites = []
+        self._set_arrays(
+            np.empty(0),
+            np.empty(0),
+            np.empty((0, 4), dtype=np.int64),
+            np.empty(0),
+            np.empty(0, dtype=np.int8),
+            np.empty(0, dtype=np.int8),
+            np.empty(0, dtype=np.int64),
+        )
+
+    def _set_arrays(self, x_pos, y_pos, rects, speed, direction, kind, x_step):
+        """Store the arrays of the projectiles."""
+        self.x_pos = x_pos
+        self.y_pos = y_pos
+        self.rects = rects
+        self.speed = speed
+        self.direction = direction
+        self.kind = kind
+        self.x_step = x_step
+
+    def sync(self):
+        """Update the arrays after bullets were added to or removed from the group.
+        The state of the bullets that were already in the arrays is kept.
+        """
+        sprites = self.group.sprites()
+        if sprites == self.sprites:
+            return
+
+        old_indexes = np.fromiter(
+            map(self.indexes.get, sprites, repeat(-1)), np.int64, len(sprites)
+        )
+        known = old_indexes >= 0
+        kept = old_indexes[known]
+        new_sprites = [sprites[i] for i in np.flatnonzero(~known)]
+
+        x_pos = np.empty(len(sprites))
+        y_pos = np.empty(len(sprites))
+        rects = np.empty((len(sprites), 4), dtype=np.int64)
+        speed = np.empty(len(sprites))
+        direction = np.empty(len(sprites), dtype=np.int8)
+        kind = np.empty(len(sprites), dtype=np.int8)
+        x_step = np.empty(len(sprites), dtype=np.int64)
+
+        x_pos[known] = self.x_pos[kept]
+        y_pos[known] = self.y_pos[kept]
+        rects[known] = self.rects[kept]
+        speed[known] = self.speed[kept]
+        direction[known] = self.direction[kept]
+        kind[known] = self.kind[kept]
+        x_step[known] = self.x_step[kept]
+
+        if new_sprites:
+            new = ~known
+            (
+                x_pos[new],
+                y_pos[new],
+                speed[new],
+                direction[new],
+                kind[new],
+                x_step[new],
+                rects[new],
+            ) = zip(*(self._read_sprite(sprite) for sprite in new_sprites))
+
+        self.sprites = sprites
+        self.indexes = dict(zip(sprites, range(len(sprites))))
+        self._set_arrays(x_pos, y_pos, rects, speed, direction, kind, x_step)
+        self.player = kind == PLAYER_BULLET
+        if self.player.all() or not self.player.any():
+            # The groups usually hold a single kind of bullets.
+            self.player_sprites = sprites if self.player.any() else []
+            self.alien_sprites = [] if self.player.any() else sprites
+        else:
+            self.player_sprites = [sprites[i] for i in np.flatnonzero(self.player)]
+            self.alien_sprites = [sprites[i] for i in np.flatnonzero(~self.player)]
+
+    def _read_sprite(self, sprite):
+        """Return the state of a bullet sprite that was added to the group."""
+        rect = tuple(sprite.rect)
+        if isinstance(sprite, Bullet):
+            direction = 1 if sprite.ship == self.game.thunderbird_ship else -1
+            return (
+                sprite.x_pos,
+                sprite.y_pos,
+                sprite.speed,
+                direction,
+                PLAYER_BULLET,
+                0,
+                rect,
+            )
+        x_step = round(sprite.x_vel) if isinstance(sprite, BossBullet) else 0
+        return (0.0, sprite.y_pos, 0.0, 0, ALIEN_BULLET, x_step, rect)
+
+    def active(self):
+        """Return True if the group is large enough for the arrays to be
+        faster than updating the sprites one by one. Otherwise the arrays
+        are dropped, so they are read again from the sprites later.
+        """
+        if len(self.group) >= PROJECTILE_ARRAYS_MIN_SPRITES:
+            return True
+        self.sprites = []
+        self.indexes = {}
+        return False
+
+    def move(self):
+        """Move all the bullets, same as calling 'update' on each of them,
+        and write the new positions back to the sprites. Only the values
+        that change are written back.
+        """
+        self.sync()
+        player = self.player
+        if self.player_sprites:
+            if self.settings.game_modes.cosmic_conflict:
+                # The bullets fly sideways, towards the other player.
+                self.x_pos[player] += self.speed[player] * self.direction[player]
+                self.rects[player, 0] = np.trunc(self.x_pos[player])
+                for sprite, x_pos, x in zip(
+                    self.player_sprites,
+                    self.x_pos[player].tolist(),
+                    self.rects[player, 0].tolist(),
+                ):
+                    sprite.x_pos = x_pos
+                    sprite.rect.x = x
+            else:
+                self.y_pos[player] -= self.speed[player]
+                self.rects[player, 1] = np.trunc(self.y_pos[player])
+                self._write_y_positions(self.player_sprites, player)
+
+        if self.alien_sprites:
+            alien = ~player
+            self.y_pos[alien] += self.settings.alien_bullet_speed
+            # A float assigned to a rect is rounded half away from zero.
+            self.rects[alien, 1] = np.copysign(
+                np.floor(np.abs(self.y_pos[alien]) + 0.5), self.y_pos[alien]
+            )
+            if self.x_step.any():
+                # The boss bullets also move sideways.
+                self.rects[:, 0] += self.x_step
+                for sprite, y_pos, topleft in zip(
+                    self.alien_sprites,
+                    self.y_pos[alien].tolist(),
+                    self.rects[alien, :2].tolist(),
+                ):
+                    sprite.y_pos = y_pos
+                    sprite.rect.topleft = topleft
+            else:
+                self._write_y_positions(self.alien_sprites, alien)
+
+    def _write_y_positions(self, sprites, mask):
+        """Write the vertical positions of the masked bullets to the sprites."""
+        for sprite, y_pos, y in zip(
+            sprites, self.y_pos[mask].tolist(), self.rects[mask, 1].tolist()
+        ):
+            sprite.y_pos = y_pos
+            sprite.rect.y = y
+
+    def remove_outside(self, rect):
+        """Remove the bullets that don't collide with the rect,
+        for example the ones that went off screen.
+        """
+        self.sync()
+        self._remove(~self._collide_mask(*rect))
+
+    def remove_below(self, bottom):
+        """Remove the bullets whose top is below the given y position."""
+        self.sync()
+        self._remove(self.rects[:, 1] > bottom)
+
+    def _remove(self, mask):
+        """Remove the bullets selected by the mask from the group."""
+        if mask.any():
+            self.group.remove(*[self.sprites[i] for i in np.flatnonzero(mask)])
+            self.sync()
+
+    def _collide_mask(self, x, y, width, height):
+        """Return a mask of the bullets that collide with the given rect,
+        with the same rules as pygame.Rect.colliderect.
+        """
+        if width <= 0 or height <= 0:
+            return np.zeros(len(self.sprites), dtype=bool)
+        left, top, widths, heights = self.rects.T
+        return (
+            (widths > 0)
+            & (heights > 0)
+            & (left < x + width)
+            & (left + widths > x)
+            & (top < y + height)
+            & (top + heights > y)
+        )
+
+    def collide_any(self, rect):
+        """Return the first bullet that collides with the rect, or None."""
+        self.sync()
+        hits = np.flatnonzero(self._collide_mask(*rect))
+        return self.sprites[hits[0]] if hits.size else None
+
+    def collide(self, sprites):
+        """Return a dict mapping each bullet to the sprites it collides with,
+        in the order of the given sprites, same as pygame.sprite.groupcollide.
+        """
+        self.sync()
+        if not self.sprites or not sprites:
+            return {}
+
+        targets = np.array([tuple(sprite.rect) for sprite in sprites], dtype=np.int64)
+        target_x, target_y, target_w, target_h = (
+            column[np.newaxis, :] for column in targets.T
+        )
+        x, y, width, height = (column[:, np.newaxis] for column in self.rects.T)
+        hits = (
+            (width > 0)
+            & (height > 0)
+            & (target_w > 0)
+            & (target_h > 0)
+            & (x < target_x + target_w)
+            & (x + width > target_x)
+            & (y < target_y + target_h)
+            & (y + height > target_y)
+        )
+
+        collisions = {}
+        for i in np.flatnonzero(hits.any(axis=1)):
+            collisions[self.sprites[i]] = [sprites[j] for j in np.flatnonzero(hits[i])]
+        return collisions
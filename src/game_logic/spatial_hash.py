@@ -0,0 +1,57 @@
+"""
+The 'spatial_hash' module contains the SpatialHash class, a uniform grid
+used as a broadphase for the collision checks in the game.
+"""
+
+
+class SpatialHash:
+    """A uniform grid that buckets sprites by the cells their rects overlap,
+    so that collision queries only look at the sprites near a given rect.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.order = {}
+
+    def clear(self):
+        """Remove all sprites from the grid."""
+        self.cells.clear()
+        self.order.clear()
+
+    def rebuild(self, sprites):
+        """Clear the grid and insert all the given sprites."""
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def insert(self, sprite):
+        """Insert a sprite in every cell that its rect overlaps."""
+        if sprite in self.order:
+            return
+        self.order[sprite] = len(self.order)
+        for cell in self._get_cells(sprite.rect):
+            self.cells.setdefault(cell, []).append(sprite)
+
+    def query(self, rect):
+        """Return the sprites that share at least one cell with the given rect.
+        The sprites are returned in the order they were inserted, so the
+        results match a brute force check over the original group.
+        """
+        found = set()
+        for cell in self._get_cells(rect):
+            found.update(self.cells.get(cell, ()))
+        return sorted(found, key=self.order.__getitem__)
+
+    def _get_cells(self, rect):
+        """Return the (column, row) keys of the cells covered by the rect."""
+        size = self.cell_size
+        first_col = rect.left // size
+        last_col = max(rect.right - 1, rect.left) // size
+        first_row = rect.top // size
+        last_row = max(rect.bottom - 1, rect.top) // size
+        return [
+            (col, row)
+            for col in range(first_col, last_col + 1)
+            for row in range(first_row, last_row + 1)
+        ]
@@ -3,11 +3,10 @@ The 'alien_bullets_manager' module contains the AlienBulletsManager class used f
 managing bullets fired by aliens and bosses in the game.
 """
 
-import random
-import pygame
-
 from src.entities.alien_entities.alien_bullets import AlienBullet, BossBullet
 from src.entities.alien_entities.aliens import BossAlien
+from src.utils.game_clock import game_clock
+from src.utils.game_random import rng
 
 
 class AlienBulletsManager:
@@ -33,6 +32,8 @@ class AlienBulletsManager:
         if isinstance(alien, BossAlien):
             bullet = BossBullet(self, alien)
         else:
+            # The alien may be off screen, where its rect is not kept up to date.
+            self.game.aliens_manager.sync_alien_sprites([alien])
             bullet = AlienBullet(self)
 
         bullet.rect.centerx = alien.rect.centerx
@@ -50,11 +51,11 @@ class AlienBulletsManager:
         - alien_int: The interval of time (in milliseconds) that
           must pass since a specific alien last fired a bullet.
         """
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         # check if enough time has passed since any alien fired a bullet
         if current_time - self.last_alien_bullet_time >= bullet_int:
             self.last_alien_bullet_time = current_time
-            aliens = random.sample(
+            aliens = rng.sample(
                 self.aliens.sprites(), k=min(num_bullets, len(self.aliens.sprites()))
             )
             # create bullets from randomly selected aliens
@@ -69,6 +70,12 @@ class AlienBulletsManager:
 
     def update_alien_bullets(self):
         """Update alien bullets and remove bullets that went off screen."""
+        arrays = self.game.projectile_arrays.get(self.alien_bullet)
+        if arrays and arrays.active():
+            arrays.move()
+            arrays.remove_below(self.settings.screen_height)
+            return
+
         self.alien_bullet.update()
         for bullet in self.alien_bullet.copy():
             if bullet.rect.y > self.settings.screen_height:
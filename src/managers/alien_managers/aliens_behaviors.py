@@ -8,11 +8,11 @@ Classes:
 """
 
 import math
-import random
-import pygame
 
 from src.utils.constants import LEVEL_PREFIX
-from src.utils.game_utils import load_alien_images
+from src.utils.game_clock import game_clock
+from src.utils.game_random import rng
+from src.managers.asset_manager import assets
 
 
 class AlienMovement:
@@ -25,33 +25,33 @@ class AlienMovement:
         self.settings = game.settings
 
         self.direction = self.settings.alien_direction
-        self.last_direction_change = pygame.time.get_ticks()
+        self.last_direction_change = game_clock.get_ticks()
         self.direction_change_delay = 0
 
         self.sins = {
-            "time_offset": random.uniform(0, 2 * math.pi),
-            "amplitude": random.randint(1, 2),
-            "frequency": random.uniform(0.001, 0.005),
+            "time_offset": rng.uniform(0, 2 * math.pi),
+            "amplitude": rng.randint(1, 2),
+            "frequency": rng.uniform(0.001, 0.005),
         }
 
     def update_horizontal_position(self):
         """Update the horizontal position of the alien and
         create random movement.
         """
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if now - self.last_direction_change > self.direction_change_delay:
             # Check if alien is not near the edge of the screen
             if not self.alien.check_edges():
                 self.direction *= -1
             self.last_direction_change = now
             # how often the direction changes
-            self.direction_change_delay = random.randint(5000, 15000)  # miliseconds
+            self.direction_change_delay = rng.randint(5000, 15000)  # miliseconds
 
     def update_vertical_position(self):
         """Update the vertical position of the alien and
         create random movement.
         """
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         current_time = now + self.sins["time_offset"]
         self.alien.rect.y = round(
             self.alien.rect.y
@@ -75,23 +75,14 @@ class AlienAnimation:
         self.frame_counter = 0
         self.current_frame = 0
 
-        self.frames = {}
-
-        level_prefix = LEVEL_PREFIX.get(game.stats.level // 4 + 1, "Alien7")
-        if level_prefix not in self.frames:
-            self.frames[level_prefix] = load_alien_images(level_prefix)
-
-        self.frames = self.frames[level_prefix]
+        self.level_prefix = LEVEL_PREFIX.get(game.stats.level // 4 + 1, "Alien7")
+        self.frames = assets.get_alien_frames(self.level_prefix, self.scale)
         self.image = self.frames[self.current_frame]
 
     def _update_scale(self):
-        """Scale the alien frames."""
-        scaled_w = int(self.image.get_width() * self.scale)
-        scaled_h = int(self.image.get_height() * self.scale)
-        self.image = pygame.transform.scale(self.image, (scaled_w, scaled_h))
-        self.frames = [
-            pygame.transform.scale(frame, (scaled_w, scaled_h)) for frame in self.frames
-        ]
+        """Scale the alien frames, using the frames shared by all aliens."""
+        self.frames = assets.get_alien_frames(self.level_prefix, self.scale)
+        self.image = self.frames[self.current_frame]
 
     def update_animation(self):
         """Update alien animation."""
@@ -4,6 +4,7 @@ the creation and update of aliens and bosses in the game.
 """
 
 from src.entities.alien_entities.aliens import Alien, BossAlien
+from src.managers.alien_managers.fleet_controller import create_fleet_controller
 
 
 class AliensManager:
@@ -17,6 +18,7 @@ class AliensManager:
         self.settings = settings
         self.screen = screen
         self.stats = game.stats
+        self.fleet = create_fleet_controller(self)
 
     def create_fleet(self, rows):
         """Create the fleet of aliens."""
@@ -39,9 +41,20 @@ class AliensManager:
 
     def update_aliens(self):
         """Update the positions of all aliens in the fleet."""
+        if self.fleet and self.fleet.active():
+            self.fleet.update()
+            return
+
         self._check_fleet_edges()
         self.aliens.update()
 
+    def sync_alien_sprites(self, sprites=None):
+        """Bring the given alien sprites, or all of them, up to date with the
+        fleet controller. Only the aliens near the screen are updated every frame.
+        """
+        if self.fleet:
+            self.fleet.flush(sprites)
+
     def _check_fleet_edges(self):
         """Check if any aliens have reached an edge and respond appropriately."""
         for alien in self.aliens.sprites():
@@ -0,0 +1,362 @@
+"""
+The 'fleet_controller' module contains the FleetController class that moves
+and animates the whole alien fleet with NumPy arrays, instead of updating
+each alien sprite on its own.
+
+NumPy is optional. Without it 'create_fleet_controller' returns None and the
+aliens are updated sprite by sprite, as before.
+"""
+
+from itertools import repeat
+from operator import attrgetter
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from src.entities.alien_entities.aliens import BossAlien
+from src.utils.constants import FLEET_ARRAYS_MIN_ALIENS, FLEET_VISIBLE_MARGIN
+from src.utils.game_clock import game_clock
+from src.utils.game_random import rng
+
+NUMPY_AVAILABLE = np is not None
+
+get_frozen_state = attrgetter("frozen_state")
+get_immune_state = attrgetter("immune_state")
+
+
+def create_fleet_controller(manager):
+    """Return the FleetController of the aliens manager,
+    or None when NumPy is not available.
+    """
+    if not NUMPY_AVAILABLE:
+        return None
+    return FleetController(manager)
+
+
+def _round_half_away(values):
+    """Round the values the way a float assigned to a rect is rounded."""
+    return np.copysign(np.floor(np.abs(values) + 0.5), values)
+
+
+class FleetController:
+    """Keeps the state of the alien fleet as a structure of arrays: the
+    positions, the sine movement, the direction and its change deadlines,
+    and the animation frame of each alien.
+
+    Each frame does the same as the edge checks of the AliensManager and
+    'Alien.update' for every alien, in a few array operations. The rects
+    and images are written back only for the aliens on screen, or near it,
+    the other sprites are brought up to date by 'flush'.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.settings = manager.settings
+        self.group = manager.aliens
+        self.sprites = []
+        self.indexes = {}
+        self.frames = []
+        self.has_boss = False
+        self._set_arrays(
+            np.empty(0),
+            np.empty((0, 4), dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+            np.empty((0, 3)),
+            np.empty((0, 2), dtype=np.int64),
+            np.empty((0, 4), dtype=np.int64),
+            np.empty(0, dtype=bool),
+        )
+
+    def _set_arrays(self, x_pos, rects, direction, sins, deadlines, frames, written):
+        """Store the arrays of the fleet."""
+        self.x_pos = x_pos
+        self.rects = rects
+        self.direction = direction
+        # The time offset, amplitude and frequency of the vertical movement.
+        self.sins = sins
+        # The time of the last direction change and the delay until the next.
+        self.deadlines = deadlines
+        # The frame counter, current frame, frame count and update rate.
+        self.animation = frames
+        # The aliens whose rects were written back on the last frame.
+        self.written = written
+
+    def sync(self):
+        """Update the arrays after aliens were added to or removed from the group.
+        The state of the aliens that were already in the arrays is kept.
+        """
+        sprites = self.group.sprites()
+        if sprites == self.sprites:
+            return
+
+        old_indexes = np.fromiter(
+            map(self.indexes.get, sprites, repeat(-1)), np.int64, len(sprites)
+        )
+        known = old_indexes >= 0
+        kept = old_indexes[known]
+        new = ~known
+        new_sprites = [sprites[i] for i in np.flatnonzero(new)]
+        if any(isinstance(sprite, BossAlien) for sprite in new_sprites):
+            # The bosses move on their own, so the arrays are not used.
+            self._drop()
+            self.has_boss = True
+            return
+        self.has_boss = False
+
+        x_pos = np.empty(len(sprites))
+        rects = np.empty((len(sprites), 4), dtype=np.int64)
+        direction = np.empty(len(sprites), dtype=np.int64)
+        sins = np.empty((len(sprites), 3))
+        deadlines = np.empty((len(sprites), 2), dtype=np.int64)
+        frames = np.empty((len(sprites), 4), dtype=np.int64)
+        written = np.zeros(len(sprites), dtype=bool)
+
+        x_pos[known] = self.x_pos[kept]
+        rects[known] = self.rects[kept]
+        direction[known] = self.direction[kept]
+        sins[known] = self.sins[kept]
+        deadlines[known] = self.deadlines[kept]
+        frames[known] = self.animation[kept]
+        written[known] = self.written[kept]
+        frame_lists = [None] * len(sprites)
+        for i, j in zip(np.flatnonzero(known).tolist(), kept.tolist()):
+            frame_lists[i] = self.frames[j]
+
+        for i, sprite in zip(np.flatnonzero(new).tolist(), new_sprites):
+            (
+                x_pos[i],
+                rects[i],
+                direction[i],
+                sins[i],
+                deadlines[i],
+                frames[i],
+            ) = self._read_sprite(sprite)
+            frame_lists[i] = sprite.animation.frames
+
+        self.sprites = sprites
+        self.indexes = dict(zip(sprites, range(len(sprites))))
+        self.frames = frame_lists
+        self._set_arrays(x_pos, rects, direction, sins, deadlines, frames, written)
+
+    @staticmethod
+    def _read_sprite(sprite):
+        """Return the state of an alien sprite that was added to the group."""
+        motion = sprite.motion
+        animation = sprite.animation
+        return (
+            sprite.x_pos,
+            tuple(sprite.rect),
+            motion.direction,
+            (
+                motion.sins["time_offset"],
+                motion.sins["amplitude"],
+                motion.sins["frequency"],
+            ),
+            (motion.last_direction_change, motion.direction_change_delay),
+            (
+                animation.frame_counter,
+                animation.current_frame,
+                len(animation.frames),
+                animation.frame_update_rate,
+            ),
+        )
+
+    def active(self):
+        """Return True if the fleet is large enough for the arrays to be
+        faster than updating the aliens one by one, and has no boss.
+        Otherwise the state is written back to the sprites and the arrays
+        are dropped, so they are read again from the sprites later.
+        """
+        if len(self.group) >= FLEET_ARRAYS_MIN_ALIENS:
+            self.sync()
+            if not self.has_boss:
+                return True
+        else:
+            self._drop()
+        return False
+
+    def _drop(self):
+        """Write the state back to the sprites and forget them."""
+        if self.sprites:
+            self.flush()
+        self.sprites = []
+        self.indexes = {}
+        self.frames = []
+
+    def update(self):
+        """Move and animate the fleet, same as checking the fleet edges and
+        calling 'update' on each alien.
+        """
+        self.sync()
+        if not self.sprites:
+            return
+
+        screen_rect = self.manager.screen.get_rect()
+        self._check_fleet_edges(screen_rect)
+
+        moving = ~self._update_frozen_states()
+        if moving.any():
+            now = game_clock.get_ticks()
+            self._move(moving)
+            advanced = self._update_animation(moving)
+            self._update_vertical_position(moving, now)
+            self._update_horizontal_position(moving, now, screen_rect)
+        else:
+            advanced = moving
+
+        self._write_visible(screen_rect, advanced)
+        if moving.any():
+            self._update_immune_states(moving)
+
+    def _at_edges(self, screen_rect, mask=slice(None)):
+        """Return a mask of the aliens at the left or right edge of the screen."""
+        x = self.rects[mask, 0]
+        return (x + self.rects[mask, 2] >= screen_rect.right) | (x <= 0)
+
+    def _check_fleet_edges(self, screen_rect):
+        """Turn the aliens at the side edges and move down the ones at the top."""
+        at_edges = self._at_edges(screen_rect)
+        self.direction[at_edges] *= -1
+        at_top = ~at_edges & (self.rects[:, 1] <= screen_rect.top)
+        if at_top.any():
+            self.rects[at_top, 1] = _round_half_away(
+                self.rects[at_top, 1] + self.settings.alien_speed
+            )
+
+    def _update_frozen_states(self):
+        """Unfreeze the aliens whose frozen time is over.
+        Returns a mask of the aliens that are still frozen.
+        """
+        frozen = np.fromiter(
+            map(get_frozen_state, self.sprites), bool, len(self.sprites)
+        )
+        if frozen.any():
+            current_time = game_clock.time()
+            for i in np.flatnonzero(frozen).tolist():
+                sprite = self.sprites[i]
+                if current_time - sprite.frozen_start_time > self.settings.frozen_time:
+                    sprite.frozen_state = False
+                    frozen[i] = False
+        return frozen
+
+    def _move(self, moving):
+        """Move the aliens sideways, in their direction."""
+        self.x_pos[moving] += self.settings.alien_speed * self.direction[moving]
+        self.rects[moving, 0] = np.round(self.x_pos[moving])
+
+    def _update_animation(self, moving):
+        """Advance the frame counters. Returns a mask of the aliens
+        that changed their frame.
+        """
+        counters, current, counts, rates = self.animation.T
+        counters[moving] += 1
+        advanced = moving & (counters % rates == 0)
+        current[advanced] = (current[advanced] + 1) % counts[advanced]
+        counters[advanced] = 0
+        return advanced
+
+    def _update_vertical_position(self, moving, now):
+        """Move the aliens up and down along their sine waves."""
+        offsets, amplitudes, frequencies = self.sins[moving].T
+        self.rects[moving, 1] = np.round(
+            self.rects[moving, 1]
+            + amplitudes * np.sin(frequencies * (now + offsets))
+            + 0.1
+        )
+
+    def _update_horizontal_position(self, moving, now, screen_rect):
+        """Turn the aliens whose direction change deadline passed,
+        unless they are at an edge, and pick their next deadline.
+        """
+        last_change, delay = self.deadlines.T
+        due = np.flatnonzero(moving & (now - last_change > delay))
+        if not due.size:
+            return
+
+        at_edges = self._at_edges(screen_rect, due)
+        self.direction[due[~at_edges]] *= -1
+        last_change[due] = now
+        # The delays are picked in the order of the sprites,
+        # so the random numbers are the same as for the sprites.
+        delay[due] = [rng.randint(5000, 15000) for _ in range(due.size)]
+
+    def _write_visible(self, screen_rect, advanced):
+        """Write the rects and images of the aliens near the screen, and of
+        the ones that just left it, so no sprite is left with a rect that
+        looks visible but isn't.
+        """
+        area = screen_rect.inflate(2 * FLEET_VISIBLE_MARGIN, 2 * FLEET_VISIBLE_MARGIN)
+        x, y, width, height = self.rects.T
+        visible = (
+            (x < area.right)
+            & (x + width > area.left)
+            & (y < area.bottom)
+            & (y + height > area.top)
+        )
+        write = visible | self.written
+        indexes = np.flatnonzero(write)
+        new_images = (advanced | ~self.written)[indexes].tolist()
+        current = self.animation[indexes, 1].tolist()
+        for i, topleft, frame, new_image in zip(
+            indexes.tolist(), self.rects[indexes, :2].tolist(), current, new_images
+        ):
+            sprite = self.sprites[i]
+            sprite.rect.topleft = topleft
+            if new_image:
+                sprite.image = self.frames[i][frame]
+        self.written = visible
+
+    def _update_immune_states(self, moving):
+        """Animate the immune aliens and end the immune state
+        when its time is over.
+        """
+        immune = np.fromiter(
+            map(get_immune_state, self.sprites), bool, len(self.sprites)
+        )
+        immune &= moving
+        if not immune.any():
+            return
+
+        current_time = game_clock.time()
+        for i in np.flatnonzero(immune).tolist():
+            sprite = self.sprites[i]
+            sprite.rect.topleft = self.rects[i, :2].tolist()
+            sprite.immune.draw_immune_anim()
+            sprite.immune.update_immune_anim()
+            if (
+                current_time - sprite.immune_start_time
+                > self.settings.alien_immune_time
+            ):
+                sprite.immune_state = False
+
+    def flush(self, sprites=None):
+        """Write the whole state of the given aliens, or of the
+        whole fleet, back to the sprites.
+        """
+        if sprites is None:
+            sprites = self.sprites
+        for sprite in sprites:
+            i = self.indexes.get(sprite)
+            if i is None:
+                continue
+            x_pos, rect, direction, deadlines, animation = (
+                self.x_pos[i].item(),
+                self.rects[i, :2].tolist(),
+                self.direction[i].item(),
+                self.deadlines[i].tolist(),
+                self.animation[i].tolist(),
+            )
+            sprite.x_pos = x_pos
+            sprite.rect.topleft = rect
+            sprite.motion.direction = direction
+            (
+                sprite.motion.last_direction_change,
+                sprite.motion.direction_change_delay,
+            ) = deadlines
+            sprite.animation.frame_counter, sprite.animation.current_frame = animation[
+                :2
+            ]
+            sprite.animation.image = self.frames[i][animation[1]]
+            sprite.image = sprite.animation.image
@@ -0,0 +1,166 @@
+"""
+The 'asset_manager' module contains the AssetManager class that loads the
+game images only once and converts them to the pixel format of the display.
+
+The module also creates the 'assets' instance which is shared by the whole game.
+"""
+
+import os
+import threading
+
+import pygame
+
+from src.utils.game_utils import BASE_PATH, load_alien_images
+
+
+class AssetManager:
+    """A class that loads, caches and converts the images used in the game.
+    Images loaded before the display exists are converted by 'convert_all',
+    once the display is created. Frames can also be loaded ahead of time on
+    a background thread with 'prefetch'.
+    """
+
+    def __init__(self):
+        self.images = {}
+        self.image_sets = {}
+        self.frames = {}
+        self.alien_frames = {}
+
+    def get_image(self, relative_path, alpha=True):
+        """Return the image from the given path, relative to the BASE_PATH.
+        Opaque images like the backgrounds should be requested with alpha=False.
+        """
+        key = (relative_path, alpha)
+        if key not in self.images:
+            image = pygame.image.load(os.path.join(BASE_PATH, relative_path))
+            # setdefault keeps the first image if a prefetch loaded it meanwhile.
+            return self.images.setdefault(key, self.convert_image(image, alpha))
+        return self.images[key]
+
+    def get_images(self, image_dict, alpha=True):
+        """Return a dict of images from a dict of the form:
+        key: image name
+        value: path to image location
+        The returned dict is shared, so it must not be modified.
+        """
+        key = (tuple(image_dict.items()), alpha)
+        if key not in self.image_sets:
+            image_set = {
+                name: self.get_image(path, alpha) for name, path in image_dict.items()
+            }
+            return self.image_sets.setdefault(key, image_set)
+        return self.image_sets[key]
+
+    def get_frames(self, filename_pattern, num_frames, start=0, rotate=None):
+        """Return a list of animation frames, same as 'load_frames'.
+        The returned list is shared, so it must not be modified.
+        """
+        key = (filename_pattern, num_frames, start, rotate)
+        if key not in self.frames:
+            frames = []
+            for i in range(start, start + num_frames):
+                image = self.get_image(filename_pattern.format(i))
+                if rotate is not None:
+                    image = pygame.transform.rotate(image, rotate)
+                frames.append(image)
+            return self.frames.setdefault(key, frames)
+        return self.frames[key]
+
+    def prefetch(self, frame_specs):
+        """Load the given frames on a background thread, so they are ready
+        before they are needed. Each spec holds the 'get_frames' arguments.
+        Returns the started thread, or None if there is no display yet,
+        since the frames could not be converted.
+        """
+        if not self.display_ready():
+            return None
+
+        specs = [spec for spec in frame_specs if spec not in self.frames]
+        thread = threading.Thread(
+            target=self._load_frame_specs, args=(specs,), daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _load_frame_specs(self, frame_specs):
+        """Load the frames for each of the given specs."""
+        for spec in frame_specs:
+            self.get_frames(*spec)
+
+    def get_alien_frames(self, alien_prefix, scale=1.0):
+        """Return the frames for the given alien prefix and scale.
+        The frames are loaded and scaled only the first time they are requested
+        and then shared by all the aliens, so the list must not be modified.
+        """
+        key = (alien_prefix, scale)
+        if key not in self.alien_frames:
+            if scale == 1.0:
+                frames = [
+                    self.convert_image(frame)
+                    for frame in load_alien_images(alien_prefix)
+                ]
+            else:
+                base_frames = self.get_alien_frames(alien_prefix)
+                scaled_size = (
+                    int(base_frames[0].get_width() * scale),
+                    int(base_frames[0].get_height() * scale),
+                )
+                frames = [
+                    pygame.transform.scale(frame, scaled_size) for frame in base_frames
+                ]
+            return self.alien_frames.setdefault(key, frames)
+        return self.alien_frames[key]
+
+    def convert_all(self):
+        """Convert all the images loaded so far to the display pixel format.
+        The shared dicts and frame lists are updated in place, so the
+        objects holding them get the converted images.
+        """
+        if not self.display_ready():
+            return
+
+        converted = {}
+        for (path, alpha), image in list(self.images.items()):
+            self.images[(path, alpha)] = self.convert_image(image, alpha)
+            converted[id(image)] = self.images[(path, alpha)]
+
+        for (image_items, alpha), image_set in list(self.image_sets.items()):
+            for name, path in image_items:
+                image_set[name] = self.images[(path, alpha)]
+
+        for frames in [*self.frames.values(), *self.alien_frames.values()]:
+            frames[:] = [
+                (
+                    converted[id(frame)]
+                    if id(frame) in converted
+                    else self.convert_image(frame)
+                )
+                for frame in frames
+            ]
+
+    def clear(self):
+        """Remove all the cached images."""
+        self.images.clear()
+        self.image_sets.clear()
+        self.frames.clear()
+        self.alien_frames.clear()
+
+    @staticmethod
+    def display_ready():
+        """Return True if the display mode is set, so images can be converted."""
+        return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+    def convert_image(self, image, alpha=True):
+        """Return the image converted to the display pixel format, using
+        convert_alpha for sprites and convert for opaque images. The image is
+        returned as it is when there is no display yet.
+        """
+        if not self.display_ready():
+            return image
+        try:
+            return image.convert_alpha() if alpha else image.convert()
+        except pygame.error:
+            return image
+
+
+assets = AssetManager()
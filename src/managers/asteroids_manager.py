@@ -2,10 +2,9 @@
 The 'asteroids_manager' module contains the AsteroidsManager class that manages
 the update and creation of asteroids."""
 
-import random
-import pygame
-
 from src.entities.asteroid import Asteroid
+from src.utils.game_clock import game_clock
+from src.utils.game_random import rng
 
 
 class AsteroidsManager:
@@ -18,30 +17,35 @@ class AsteroidsManager:
         self.screen = game.screen
         self.settings = game.settings
         self.last_asteroid_time = 0
+        self.default_frequency = 0
 
-    def create_asteroids(self, frequency=random.randint(4000, 10000)):
+    def create_asteroids(self, frequency=None):
         """Creates multiple asteroids at random intervals.
         The frequency of asteroid creation is determined by the frequency
-        argument, which defaults to a random integer between 4000 and 10000 milliseconds.
+        argument, which defaults to a random integer between 4000 and 10000 milliseconds,
+        picked once for each game.
         """
         if self.last_asteroid_time == 0:
-            self.last_asteroid_time = pygame.time.get_ticks()
+            self.last_asteroid_time = game_clock.get_ticks()
+            self.default_frequency = rng.randint(4000, 10000)
+        if frequency is None:
+            frequency = self.default_frequency
 
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         if current_time - self.last_asteroid_time >= frequency:
             self.last_asteroid_time = current_time
             # Create an asteroid at a random location, at the top of the screen.
-            asteroid = Asteroid(self)
-            asteroid.rect.x = random.randint(
+            asteroid = self.game.sprite_pools.acquire(Asteroid, self)
+            asteroid.rect.x = rng.randint(
                 0, self.settings.screen_width - asteroid.rect.width
             )
-            asteroid.rect.y = random.randint(-100, -40)
+            asteroid.rect.y = rng.randint(-100, -40)
             self.game.asteroids.add(asteroid)
 
     def update_asteroids(self):
         """Update asteroids and remove asteroids that went off screen."""
         self.game.asteroids.update()
-        for asteroid in self.game.asteroids.copy():
+        for asteroid in self.game.asteroids.sprites():
             if asteroid.rect.y > self.settings.screen_height:
                 self.game.asteroids.remove(asteroid)
 
@@ -0,0 +1,172 @@
+"""
+The 'frame_watchdog' module contains the FrameWatchdog class that detects
+the frames of the game loop that take longer than the frame budget, and
+records what the game was doing when they happened.
+"""
+
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+
+from src.utils.constants import (
+    FRAME_SPIKE_BUDGET_MS,
+    FRAME_SPIKE_LOG_SIZE,
+    FRAME_SPIKE_LOG_FILE,
+)
+
+
+class FrameWatchdog:
+    """Detects the frames that exceed the frame budget. For every spike it
+    records the slowest subsystem from the profiler, the game state and a
+    stack of the main thread, sampled by a background thread while the
+    frame was still running. The spikes are kept in a ring buffer.
+
+    The sampler thread is woken by the start of each frame and sleeps until
+    the frame's budget has passed, so it blocks while no frame is running,
+    like in the menus.
+    """
+
+    def __init__(
+        self,
+        game,
+        profiler,
+        budget_ms=FRAME_SPIKE_BUDGET_MS,
+        log_size=FRAME_SPIKE_LOG_SIZE,
+    ):
+        self.game = game
+        self.profiler = profiler
+        self.budget_ms = budget_ms
+        self.spikes = deque(maxlen=log_size)
+
+        self.frame_start = None
+        self.sampled_stack = None
+        self.main_thread_id = threading.get_ident()
+        self.sampler_thread = None
+        self.frame_started = threading.Event()
+
+    def start(self):
+        """Start the profiler and the thread that samples the stack of long frames."""
+        self.profiler.keep_running = True
+        self.profiler.start()
+        if self.sampler_thread is None:
+            self.main_thread_id = threading.get_ident()
+            self.sampler_thread = threading.Thread(
+                target=self._sample_long_frames, daemon=True
+            )
+            self.sampler_thread.start()
+
+    def _sample_long_frames(self):
+        """Capture the main thread stack once per frame, when the
+        frame runs longer than the budget.
+        """
+        while True:
+            self.frame_started.wait()
+            self.frame_started.clear()
+            frame_start = self.frame_start
+            if frame_start is None:
+                continue
+
+            frame_end = frame_start + self.budget_ms / 1000
+            time.sleep(max(0.0, frame_end - time.perf_counter()))
+            if self.frame_start == frame_start:
+                # The stack is stored with the frame it belongs to, so a late
+                # sample is never attributed to the next frame.
+                self.sampled_stack = (frame_start, self.sample_stack())
+
+    def sample_stack(self):
+        """Return the formatted stack of the main thread."""
+        frame = sys._current_frames().get(self.main_thread_id)
+        if frame is None:
+            return None
+        return "".join(traceback.format_stack(frame))
+
+    def start_frame(self):
+        """Mark the start of a frame, waking the sampler thread."""
+        self.frame_start = time.perf_counter()
+        self.frame_started.set()
+
+    def skip_frame(self):
+        """Ignore the current frame, used when the game waits on purpose,
+        for example while it's paused.
+        """
+        self.frame_start = None
+
+    def end_frame(self, subsystem_times):
+        """Mark the end of a frame, recording it if it exceeded the budget.
+        'subsystem_times' are the frame times returned by the profiler.
+        Returns the recorded spike or None.
+        """
+        if self.frame_start is None:
+            return None
+
+        frame_start, self.frame_start = self.frame_start, None
+        frame_ms = (time.perf_counter() - frame_start) * 1000
+        if frame_ms <= self.budget_ms:
+            return None
+
+        sampled = self.sampled_stack
+        stack = sampled[1] if sampled and sampled[0] == frame_start else None
+
+        spike = {
+            "time": datetime.now().isoformat(timespec="milliseconds"),
+            "frame_ms": round(frame_ms, 3),
+            "culprit": max(subsystem_times, key=subsystem_times.get, default=None),
+            "subsystems_ms": {
+                name: round(elapsed, 3)
+                for name, elapsed in sorted(
+                    subsystem_times.items(), key=lambda item: item[1], reverse=True
+                )
+            },
+            "state": self.get_game_state(),
+            "stack": stack,
+        }
+        self.spikes.append(spike)
+        return spike
+
+    def get_game_state(self):
+        """Return the level, the game mode and the size of the sprite groups."""
+        return {
+            "level": self.game.stats.level,
+            "game_mode": self.game.settings.game_modes.game_mode,
+            "singleplayer": self.game.singleplayer,
+            "entities": self.profiler.get_entity_counts(),
+        }
+
+    def dump(self, filename=FRAME_SPIKE_LOG_FILE):
+        """Append the recorded spikes to the log file and clear the buffer.
+        Returns the number of spikes written.
+        """
+        spikes = list(self.spikes)
+        if not spikes:
+            return 0
+
+        with open(filename, "a", encoding="utf-8") as log_file:
+            for spike in spikes:
+                log_file.write(self._format_spike(spike))
+        self.spikes.clear()
+        return len(spikes)
+
+    @staticmethod
+    def _format_spike(spike):
+        """Return the spike as text for the log file."""
+        state = spike["state"]
+        lines = [
+            f"[{spike['time']}] frame took {spike['frame_ms']:.2f} ms, "
+            f"culprit: {spike['culprit']}",
+            f"  level {state['level']}, mode {state['game_mode']}, "
+            f"singleplayer {state['singleplayer']}",
+            "  entities: "
+            + ", ".join(f"{name}={count}" for name, count in state["entities"].items()),
+            "  subsystems: "
+            + ", ".join(
+                f"{name}={elapsed:.3f} ms"
+                for name, elapsed in spike["subsystems_ms"].items()
+            ),
+        ]
+        if spike["stack"]:
+            lines.append("  sampled stack:")
+            lines.extend(f"    {line}" for line in spike["stack"].splitlines())
+        return "\n".join(lines) + "\n\n"
@@ -36,6 +36,24 @@ class EndGameManager:
             self.ending_music = "game_over"
             self._display_endgame("gameover")
 
+    def is_game_over(self):
+        """Return True if the game reached one of its endings, without
+        displaying the end game screen. Used by the headless mode.
+        """
+        ships_alive = [
+            self.game.thunderbird_ship.state.alive,
+            self.game.phoenix_ship.state.alive,
+        ]
+        if self.settings.game_modes.cosmic_conflict and not all(ships_alive):
+            return True
+        if (
+            self.settings.game_modes.boss_rush
+            and self.stats.level == 15
+            and not self.game.aliens
+        ):
+            return True
+        return not any(ships_alive)
+
     def _display_game_over(self):
         """Display the end game image on screen play the game over sound
         and save the high score for the active game mode."""
@@ -72,6 +90,7 @@ class EndGameManager:
 
     def _display_endgame(self, image_name):
         self.stats.game_active = False
+        self.game.replay_recorder.finish()
         self.settings.game_end_img = self.settings.misc_images[image_name]
         self._display_game_over()
 
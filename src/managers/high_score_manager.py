@@ -3,14 +3,16 @@ The 'high_score_manager' module contains the HighScoreManager class
 that is used to manage the saving and deletion of the high scores.
 """
 
-import json
-
 from src.utils.constants import SINGLE_PLAYER_FILE, MULTI_PLAYER_FILE
 from src.utils.game_utils import display_message, get_player_name
+from src.utils.high_score_store import high_score_store
 
 
 class HighScoreManager:
-    """A class that manages the saving and deletion of the high scores."""
+    """A class that manages the saving and deletion of the high scores.
+    The scores are kept by the high score store, which writes them to the
+    high score file of the single player or the multiplayer games.
+    """
 
     def __init__(self, game):
         self.game = game
@@ -21,18 +23,10 @@ class HighScoreManager:
         )
 
     def save_high_score(self, score_key):
-        """Save the high score to a JSON file."""
+        """Ask the player for a name and save the high score."""
         filename = self.high_scores_file
         if self.stats.high_score <= 0:
             return
-        try:
-            with open(filename, "r", encoding="utf-8") as score_file:
-                high_scores = json.load(score_file)
-        except json.JSONDecodeError:
-            high_scores = {"high_scores": []}
-
-        scores = high_scores.get(score_key, [])
-        new_score = self.stats.high_score
 
         while True:
             player_name = get_player_name(
@@ -49,47 +43,18 @@ class HighScoreManager:
             if player_name == "":
                 player_name = "Player"
 
-            for i, score in enumerate(scores):
-                if score["name"] == player_name:
-                    message = (
-                        f"A high score with the name '{player_name}' already exists."
-                    )
-                    display_message(self.screen, message, 2)
-                    break
-            else:
-                break
-
-        new_entry = {"name": player_name, "score": new_score}
-
-        # Check if new score matches an existing score
-        for i, score in enumerate(scores):
-            if score["score"] == new_score:
-                scores[i] = new_entry
+            if not high_score_store.has_name(filename, score_key, player_name):
                 break
-        else:
-            scores.append(new_entry)
-
-        # Sort scores by score value in descending order
-        scores = sorted(scores, key=lambda x: x["score"], reverse=True)[:10]
-        high_scores[score_key] = scores
+            message = f"A high score with the name '{player_name}' already exists."
+            display_message(self.screen, message, 2)
 
-        with open(filename, "w", encoding="utf-8") as score_file:
-            json.dump(high_scores, score_file)
+        high_score_store.insert(filename, score_key, player_name, self.stats.high_score)
+        self.game.screen_manager.invalidate_menu_layers()
 
     def delete_high_scores(self, score_key):
         """Delete the high scores for a specified score key."""
-        filename = self.high_scores_file
-        try:
-            with open(filename, "r", encoding="utf-8") as score_file:
-                high_scores = json.load(score_file)
-        except json.JSONDecodeError:
-            high_scores = {"high_scores": []}
-
-        if score_key in high_scores:
-            del high_scores[score_key]
-
-        with open(filename, "w", encoding="utf-8") as score_file:
-            json.dump(high_scores, score_file)
+        high_score_store.delete(self.high_scores_file, score_key)
+        self.game.screen_manager.invalidate_menu_layers()
 
     def update_high_score_filename(self):
         """Update highscore filename based on the game."""
@@ -7,6 +7,7 @@ import pygame
 
 from src.utils.constants import THUNDER_SHIP_DESCRIPTIONS, PHOENIX_SHIP_DESCRIPTIONS
 from src.utils.game_utils import play_sound, display_description
+from src.utils.text_cache import text_cache
 
 
 class ShipSelection:
@@ -21,7 +22,7 @@ class ShipSelection:
         self.thunderbird_ship = self.game.thunderbird_ship
         self.phoenix_ship = self.game.phoenix_ship
 
-        self.font = pygame.font.SysFont("verdana", 26)
+        self.font = text_cache.get_font("verdana", 26)
         self.clickable_regions = []
 
         self.ship_selection_functions = {
@@ -69,38 +70,48 @@ class ShipSelection:
             ),
         }
 
-    def draw(self):
-        """Draw the ship images and text on screen."""
+    def draw(self, surface=None):
+        """Draw the ship images and text on the surface, the screen by default.
+        The description of the hovered ship is drawn by 'draw_descriptions'.
+        """
+        if surface is None:
+            surface = self.screen
         screen_width = self.screen.get_width()
         self.clickable_regions = []
 
-        self.draw_ships_and_text(1, 25, screen_width * 0.05)
+        self.draw_ships_and_text(1, 25, screen_width * 0.05, surface)
 
         if not self.game.singleplayer:
-            self.draw_ships_and_text(2, 25, screen_width * 0.3)
+            self.draw_ships_and_text(2, 25, screen_width * 0.3, surface)
 
-    def draw_ships_and_text(self, ship_type, y_offset, x_position):
+    def draw_descriptions(self):
+        """Draw the description of the ship hovered over by the cursor."""
+        for ship_rect, ship_type, index in self.clickable_regions:
+            self.display_ship_description(ship_rect, ship_type, index)
+
+    def draw_ships_and_text(self, ship_type, y_offset, x_position, surface=None):
         """Draw ship type text and ships for a given player."""
-        self.draw_ship_type_text(ship_type, y_offset, x_position)
-        self.draw_ships(ship_type, y_offset, x_position)
+        self.draw_ship_type_text(ship_type, y_offset, x_position, surface)
+        self.draw_ships(ship_type, y_offset, x_position, surface)
 
-    def draw_ship_type_text(self, ship_type, y_position, x_position):
-        """Draw the ship type text on the screen."""
+    def draw_ship_type_text(self, ship_type, y_position, x_position, surface=None):
+        """Draw the ship type text on the surface, the screen by default."""
+        if surface is None:
+            surface = self.screen
         ship_type_text = "Thunderbird" if ship_type == 1 else "Phoenix"
         text_surface = self.font.render(ship_type_text, True, (255, 255, 255))
-        self.screen.blit(text_surface, (x_position, y_position))
+        surface.blit(text_surface, (x_position, y_position))
 
-    def draw_ships(self, ship_type, y_position, x_position):
-        """Draws the ship images on the screen."""
+    def draw_ships(self, ship_type, y_position, x_position, surface=None):
+        """Draws the ship images on the surface, the screen by default."""
         ship_images = self.get_ship_images(ship_type)
         image_width = ship_images[0].get_width()
         spacing = 15
 
         for i, ship_image in enumerate(ship_images):
             x_pos = x_position + (i * (image_width + spacing))
-            ship_rect = self.position_ship(ship_image, x_pos, y_position + 50)
+            ship_rect = self.position_ship(ship_image, x_pos, y_position + 50, surface)
             self.register_clickable_region(ship_rect, ship_type, i)
-            self.display_ship_description(ship_rect, ship_type, i)
 
     def get_ship_images(self, ship_type):
         """Get ship images based on the ship type."""
@@ -108,10 +119,12 @@ class ShipSelection:
         end_index = ship_type * 3
         return self.ship_images[start_index:end_index]
 
-    def position_ship(self, ship_image, x_pos, y_pos):
-        """Position a ship image and return its rect."""
+    def position_ship(self, ship_image, x_pos, y_pos, surface=None):
+        """Position a ship image, draw it and return its rect."""
+        if surface is None:
+            surface = self.screen
         ship_rect = ship_image.get_rect(topleft=(x_pos, y_pos))
-        self.screen.blit(ship_image, ship_rect)
+        surface.blit(ship_image, ship_rect)
         return ship_rect
 
     def register_clickable_region(self, ship_rect, ship_type, index):
@@ -3,11 +3,10 @@ The weapons_manager module contains the WeaponsManager class that manages
 the creation and behavior of player weapons available in the game.
 """
 
-import time
-import pygame
-
 from src.utils.constants import WEAPONS
-from src.utils.game_utils import play_sound, display_custom_message, load_single_image
+from src.utils.game_clock import game_clock
+from src.utils.game_utils import play_sound, display_custom_message
+from src.managers.asset_manager import assets
 
 
 class WeaponsManager:
@@ -27,11 +26,11 @@ class WeaponsManager:
 
         self.weapons = {
             "thunderbird": {
-                "weapon": load_single_image(WEAPONS["thunderbolt"]),
+                "weapon": assets.get_image(WEAPONS["thunderbolt"]),
                 "current": "thunderbolt",
             },
             "phoenix": {
-                "weapon": load_single_image(WEAPONS["firebird"]),
+                "weapon": assets.get_image(WEAPONS["firebird"]),
                 "current": "firebird",
             },
         }
@@ -61,7 +60,7 @@ class WeaponsManager:
             ):
                 self.game.powers_manager.increase_bullet_count(player)
             else:
-                weapon["weapon"] = load_single_image(WEAPONS[weapon_name])
+                weapon["weapon"] = assets.get_image(WEAPONS[weapon_name])
                 weapon["current"] = weapon_name
 
     def reset_weapons(self):
@@ -69,7 +68,7 @@ class WeaponsManager:
         for player, weapon_info in self.weapons.items():
             default_weapon = "thunderbolt" if player == "thunderbird" else "firebird"
             weapon_info["current"] = default_weapon
-            weapon_info["weapon"] = load_single_image(WEAPONS[default_weapon])
+            weapon_info["weapon"] = assets.get_image(WEAPONS[default_weapon])
 
     def update_projectiles(self):
         """Update position of projectiles and get rid of projectiles that went of screen."""
@@ -78,11 +77,18 @@ class WeaponsManager:
         else:
             all_projectiles = self.multiplayer_projectiles
 
+        screen_rect = self.screen.get_rect()
         for projectiles in all_projectiles:
+            arrays = self.game.projectile_arrays.get(projectiles)
+            if arrays and arrays.active():
+                arrays.move()
+                arrays.remove_outside(screen_rect)
+                continue
+
             projectiles.update()
 
-            for projectile in projectiles.copy():
-                if not self.screen.get_rect().colliderect(projectile.rect):
+            for projectile in projectiles.sprites():
+                if not screen_rect.colliderect(projectile.rect):
                     projectiles.remove(projectile)
 
     def fire_bullet(self, bullets, bullets_allowed, bullet_class, num_bullets, ship):
@@ -93,11 +99,12 @@ class WeaponsManager:
 
         bullet_fired = False
         if len(bullets) < bullets_allowed:
+            acquire = self.game.sprite_pools.acquire
             new_bullets = [
                 (
-                    bullet_class(self, ship, scaled=True)
+                    acquire(bullet_class, self, ship, scaled=True)
                     if ship.state.scaled_weapon
-                    else bullet_class(self, ship)
+                    else acquire(bullet_class, self, ship)
                 )
                 for _ in range(num_bullets)
             ]
@@ -108,7 +115,7 @@ class WeaponsManager:
                 new_bullet.rect.centery = ship.rect.centery + offset
                 if self.game_modes.last_bullet:
                     ship.remaining_bullets -= 1
-                    self.game.score_board.render_bullets_num()
+                    self.game.score_board.mark_dirty("bullets")
                 bullet_fired = True
 
         if bullet_fired:
@@ -117,11 +124,11 @@ class WeaponsManager:
     def fire_missile(self, missiles, ship, missile_class):
         """Fire a missile from the given ship and update the missiles number."""
         if ship.missiles_num > 0:
-            new_missile = missile_class(self, ship)
+            new_missile = self.game.sprite_pools.acquire(missile_class, self, ship)
             play_sound(self.sound_manager.game_sounds, "missile_launch")
             missiles.add(new_missile)
             ship.missiles_num -= 1
-            self.game.score_board.render_missiles_num(ship)
+            self.game.score_board.mark_dirty("missiles")
 
     def fire_laser(self, lasers, ship, laser_class):
         """Fire a laser from the ship."""
@@ -154,7 +161,7 @@ class WeaponsManager:
 
     def update_normal_laser_status(self):
         """Check the status of the normal laser."""
-        current_time = time.time()
+        current_time = game_clock.time()
 
         for ship in self.game.ships:
             if ship.aliens_killed >= self.settings.required_kill_count:
@@ -174,14 +181,10 @@ class WeaponsManager:
 
     def _timed_laser(self, lasers, ship, laser_class):
         """Fire a laser from the ship based on a timed interval."""
-        if (
-            time.time() - (self.game.pause_time / 1000) - ship.last_laser_time
-            >= self.settings.laser_cooldown
-        ):
+        if game_clock.time() - ship.last_laser_time >= self.settings.laser_cooldown:
             new_laser = laser_class(self, ship)
             lasers.add(new_laser)
-            ship.last_laser_time = time.time()
-            self.game.pause_time = 0
+            ship.last_laser_time = game_clock.time()
             ship.laser_ready = False
             play_sound(self.sound_manager.game_sounds, "fire_laser")
         else:
@@ -190,7 +193,7 @@ class WeaponsManager:
 
     def update_timed_laser_status(self):
         """Check the status of the timed laser."""
-        current_time = time.time()
+        current_time = game_clock.time()
         for ship in self.game.ships:
             if ship.state.alive:
                 time_since_last_ready = current_time - ship.last_laser_usage
@@ -226,7 +229,7 @@ class WeaponsManager:
                 else:
                     display_custom_message(self.screen, "Not Ready!", ship)
 
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         if self.draw_laser_message and current_time > self.display_time + 1500:
             self.draw_laser_message = False
             self.display_time = current_time
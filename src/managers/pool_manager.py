@@ -0,0 +1,98 @@
+"""
+The 'pool_manager' module contains the PoolManager class that keeps the
+short-lived sprites of the game (bullets, missiles, asteroids and powers)
+for reuse, and the PooledGroup class, a sprite group that gives its sprites
+back to the pools when they are removed from it.
+"""
+
+from collections import defaultdict
+
+import pygame
+
+from src.utils.constants import SPRITE_POOL_MAX_SIZE
+
+
+class PoolManager:
+    """Keeps a pool of free sprites for each sprite class. A pooled class
+    must have a 'reset' method that takes the same arguments as the class
+    and brings a used sprite back to the state of a new one.
+
+    Removed sprites are not reused right away: they are 'pending' until
+    'recycle' is called, once the projectile arrays have been synced,
+    so a reused sprite is never mistaken for the one it was before.
+    """
+
+    def __init__(self, max_size=SPRITE_POOL_MAX_SIZE):
+        self.max_size = max_size
+        self.free = defaultdict(list)
+        self.pending = []
+        self.stats = defaultdict(lambda: {"created": 0, "reused": 0, "dropped": 0})
+
+    def acquire(self, sprite_class, *args, **kwargs):
+        """Return a free sprite of the class reset with the given
+        arguments, or a new sprite if the pool is empty.
+        """
+        free = self.free[sprite_class]
+        stats = self.stats[sprite_class]
+        if free:
+            sprite = free.pop()
+            sprite.reset(*args, **kwargs)
+            stats["reused"] += 1
+        else:
+            sprite = sprite_class(*args, **kwargs)
+            stats["created"] += 1
+        return sprite
+
+    def release(self, sprite):
+        """Mark a removed sprite as free to be reused after the next recycle."""
+        self.pending.append(sprite)
+
+    def recycle(self):
+        """Move the released sprites to the pools of their classes.
+        Sprites that were added back to a group meanwhile are skipped, and
+        sprites beyond the size of a pool are left to the garbage collector.
+        """
+        for sprite in self.pending:
+            if sprite.alive():
+                continue
+            free = self.free[type(sprite)]
+            if len(free) < self.max_size:
+                free.append(sprite)
+            else:
+                self.stats[type(sprite)]["dropped"] += 1
+        self.pending.clear()
+
+    def clear(self):
+        """Drop all the free and pending sprites."""
+        self.free.clear()
+        self.pending.clear()
+
+    def get_stats(self):
+        """Return the number of free, created, reused and dropped sprites
+        of each pooled class.
+        """
+        return {
+            sprite_class.__name__: {"free": len(self.free[sprite_class]), **stats}
+            for sprite_class, stats in self.stats.items()
+        }
+
+
+class PooledGroup(pygame.sprite.Group):
+    """A sprite group that releases its sprites to the pool manager when
+    they are removed, by 'kill', 'remove' or 'empty'.
+    """
+
+    def __init__(self, pools, *sprites):
+        self.pools = pools
+        super().__init__(*sprites)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.pools.release(sprite)
+
+    def copy(self):
+        """Return a plain group with the same sprites. A pooled copy would
+        release the sprites when they are removed from it, while they are
+        still in this group.
+        """
+        return pygame.sprite.Group(self.sprites())
@@ -3,12 +3,11 @@ The 'powers_managers' module contains the PowerEffectsManager class for managing
 and update of the power-ups and penalties in the game.
 """
 
-import time
-import random
-
 from src.entities.powers import Power
 from src.utils.constants import POWER_DOWN_ATTRIBUTES, PLAYER_HEALTH_ATTRS
 from src.utils.game_utils import play_sound, display_custom_message
+from src.utils.game_clock import game_clock
+from src.utils.game_random import rng
 
 
 class PowerEffectsManager:
@@ -61,28 +60,27 @@ class PowerEffectsManager:
     def create_powers(self):
         """Creates power-ups or penalties at random intervals and locations."""
         if self.last_power_up_time == 0:
-            self.last_power_up_time = time.time()
+            self.last_power_up_time = game_clock.time()
 
-        current_time = time.time()
+        current_time = game_clock.time()
         time_elapsed = current_time - self.last_power_up_time
 
-        if time_elapsed >= random.randint(15, 20):
+        if time_elapsed >= rng.randint(15, 20):
             self.last_power_up_time = current_time
             self.create_power_up_or_penalty()
 
     def create_power_up_or_penalty(self):
         """Creates a power-up or penalty at a random location."""
-        if random.randint(0, 4) == 0:
-            power = Power(self)
-            if random.randint(0, 1) == 0:
+        special_power = rng.randint(0, 4) == 0
+        power = self.game.sprite_pools.acquire(Power, self)
+        if special_power:
+            if rng.randint(0, 1) == 0:
                 power.make_health_power_up()
             else:
                 power.make_weapon_power_up()
-        else:
-            power = Power(self)
 
-        power.rect.x = random.randint(0, self.settings.screen_width - power.rect.width)
-        power.rect.y = random.randint(-100, -40)
+        power.rect.x = rng.randint(0, self.settings.screen_width - power.rect.width)
+        power.rect.y = rng.randint(-100, -40)
         self.game.powers.add(power)
 
     def update_power_choices(self):
@@ -93,7 +91,7 @@ class PowerEffectsManager:
     def apply_powerup_or_penalty(self, player):
         """Powers up or applies a penalty on the specified player"""
         # Randomly select one of the powers and activate it.
-        effect_choice = random.choice(self.powerup_choices + self.penalty_choices)
+        effect_choice = rng.choice(self.powerup_choices + self.penalty_choices)
         self._check_power_name(effect_choice, player)
         effect_choice(player)
         self._play_power_sound(
@@ -115,7 +113,7 @@ class PowerEffectsManager:
     def update_powers(self):
         """Update powers and remove the ones that went off screen."""
         self.game.powers.update()
-        for power in self.game.powers.copy():
+        for power in self.game.powers.sprites():
             if power.rect.y > self.settings.screen_height:
                 self.game.powers.remove(power)
 
@@ -128,7 +126,7 @@ class PowerEffectsManager:
 
     def display_powers_effect(self):
         """Display what power was picked up by the player."""
-        current_time = time.time()
+        current_time = game_clock.time()
         for ship in self.game.ships:
             if ship.display_power and not ship.state.exploding:
                 self.display_power_message(ship, current_time)
@@ -176,19 +174,19 @@ class PowerEffectsManager:
         """Trigger the reverse key state on the specified player."""
         ship = getattr(self, f"{player}_ship")
         ship.state.reverse = True
-        ship.last_reverse_power_down_time = time.time()
+        ship.last_reverse_power_down_time = game_clock.time()
 
     def decrease_bullet_size(self, player):
         """Trigger the scaled_weapon state on the specified player."""
         ship = getattr(self, f"{player}_ship")
         ship.state.scaled_weapon = True
-        ship.last_scaled_weapon_power_down_time = time.time()
+        ship.last_scaled_weapon_power_down_time = game_clock.time()
 
     def disarm_ship(self, player):
         """Trigger the disarm state on the specified player."""
         ship = getattr(self, f"{player}_ship")
         ship.state.disarmed = True
-        ship.last_disarmed_power_down_time = time.time()
+        ship.last_disarmed_power_down_time = game_clock.time()
 
     def alien_upgrade(self, _=None):
         """Select a random sample of aliens from the game's
@@ -196,9 +194,9 @@ class PowerEffectsManager:
         """
         aliens = self.game.aliens.sprites()
         if len(aliens) >= 12:
-            selected_aliens = random.sample(aliens, 12)
+            selected_aliens = rng.sample(aliens, 12)
         else:
-            selected_aliens = random.choices(aliens, k=len(aliens))
+            selected_aliens = rng.choices(aliens, k=len(aliens))
         for alien in selected_aliens:
             alien.upgrade()
 
@@ -226,8 +224,7 @@ class PowerEffectsManager:
         setattr(
             self.stats, f"{player}_score", getattr(self.stats, f"{player}_score") + 550
         )
-        self.score_board.render_scores()
-        self.score_board.update_high_score()
+        self.score_board.update_scores()
 
     def change_ship_size(self, player):
         """Make the specified player smaller (for a period of time)."""
@@ -299,7 +296,7 @@ class PowerEffectsManager:
 
     def manage_power_downs(self):
         """Set the power down states of the ship to False after a period of time."""
-        current_time = time.time() - (self.game.pause_time / 1000)
+        current_time = game_clock.time()
 
         for ship in self.game.ships:
             for attribute, last_power_down_time_attr in POWER_DOWN_ATTRIBUTES.items():
@@ -309,7 +306,6 @@ class PowerEffectsManager:
                 ):
                     setattr(ship.state, attribute, False)
                     setattr(ship, last_power_down_time_attr, None)
-                    self.game.pause_time = 0
 
     def get_powerup_choices(self):
         """Returns a list of power-up functions available in the game.
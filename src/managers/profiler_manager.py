@@ -0,0 +1,292 @@
+"""
+The 'profiler_manager' module contains the FrameProfiler class that times
+the subsystems of the game loop and draws the profiler overlay, which is
+toggled with the F3 key. The timings can also be read with 'get_report',
+which is used by the benchmarks and the headless mode, along with the
+entity counts and the sprite pool stats.
+"""
+
+import functools
+import time
+from collections import defaultdict, deque
+
+import pygame
+
+from src.utils.display_updater import display_updater
+from src.utils.frame_pacer import frame_pacer
+from src.utils.text_cache import text_cache
+
+# The methods timed for each subsystem, as (game attribute, method names).
+# An empty attribute means the method belongs to the game itself.
+SUBSYSTEMS = {
+    "events": ("", ("check_events",)),
+    "game_over": ("game_over_manager", ("check_game_over",)),
+    "background": ("", ("_update_background",)),
+    "collisions": (
+        "collision_handler",
+        (
+            "refresh_spatial_hash",
+            "check_powers_collisions",
+            "check_alien_bullets_collisions",
+            "check_bullet_alien_collisions",
+            "check_missile_alien_collisions",
+            "check_laser_alien_collisions",
+            "check_alien_ship_collisions",
+            "check_asteroids_collisions",
+            "check_cosmic_conflict_collisions",
+            "handle_shielded_ship_collisions",
+        ),
+    ),
+    "gameplay": (
+        "gameplay_manager",
+        ("handle_level_progression", "create_normal_level_bullets"),
+    ),
+    "update_aliens": ("aliens_manager", ("update_aliens",)),
+    "update_projectiles": (
+        "weapons_manager",
+        ("update_projectiles", "update_laser_status", "check_laser_availability"),
+    ),
+    "firing": ("player_input", ("handle_ship_firing",)),
+    "alien_bullets": (
+        "alien_bullets_manager",
+        ("create_alien_bullets", "update_alien_bullets"),
+    ),
+    "asteroids": ("asteroids_manager", ("create_asteroids", "update_asteroids")),
+    "powers": (
+        "powers_manager",
+        (
+            "create_powers",
+            "update_powers",
+            "manage_power_downs",
+            "display_powers_effect",
+        ),
+    ),
+    "ships": ("ships_manager", ("update_ship_state",)),
+    "hud": ("score_board", ("show_score",)),
+    "sound": ("sound_manager", ("check_muted_state",)),
+    "other_logic": ("", ("_handle_game_logic",)),
+    "draw": ("", ("_draw_game_objects",)),
+    "present": ("", ("_update_screen",)),
+}
+
+# The sprite groups counted by the profiler.
+SPRITE_GROUPS = (
+    "aliens",
+    "thunderbird_bullets",
+    "phoenix_bullets",
+    "thunderbird_missiles",
+    "phoenix_missiles",
+    "thunderbird_laser",
+    "phoenix_laser",
+    "alien_bullet",
+    "asteroids",
+    "powers",
+)
+
+
+class FrameProfiler:
+    """Times the subsystems of the game loop, one frame at a time.
+    The time of a nested timed call is counted only for the inner subsystem,
+    so the subsystems add up to the total frame time.
+    """
+
+    HISTORY_SIZE = 120
+    REFRESH_FRAMES = 15
+    FRAME_BUDGET_MS = 1000 / 60
+
+    def __init__(self, game):
+        self.game = game
+        self.running = False
+        self.keep_running = False
+        self.show_overlay = False
+        self.instrumented = False
+
+        self.frame_times = defaultdict(float)
+        self._child_times = []
+        self.last_frame = {}
+        self.frame_history = deque(maxlen=self.HISTORY_SIZE)
+        self.subsystem_history = deque(maxlen=self.HISTORY_SIZE)
+
+        self.font = None
+        self.text_surfaces = []
+        self.frames_since_refresh = 0
+
+    def wrap(self, subsystem, method):
+        """Return the method wrapped so its time is added to the subsystem."""
+
+        @functools.wraps(method)
+        def timed_method(*args, **kwargs):
+            if not self.running:
+                return method(*args, **kwargs)
+
+            self._child_times.append(0.0)
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                child_time = self._child_times.pop()
+                self.frame_times[subsystem] += elapsed - child_time
+                if self._child_times:
+                    self._child_times[-1] += elapsed
+
+        return timed_method
+
+    def instrument(self, obj, subsystem, method_names):
+        """Replace the given methods of the object with timed methods."""
+        for name in method_names:
+            setattr(obj, name, self.wrap(subsystem, getattr(obj, name)))
+
+    def instrument_game(self):
+        """Wrap the methods of the game and its managers listed in SUBSYSTEMS.
+        This is done only once, the first time the profiler is started.
+        """
+        if self.instrumented:
+            return
+        for subsystem, (attribute, method_names) in SUBSYSTEMS.items():
+            obj = getattr(self.game, attribute) if attribute else self.game
+            self.instrument(obj, subsystem, method_names)
+        self.instrumented = True
+
+    def start(self):
+        """Start timing the game loop."""
+        self.instrument_game()
+        if not self.running:
+            self.frame_times.clear()
+        self.running = True
+
+    def stop(self):
+        """Stop timing the game loop. Timed calls that are still running
+        finish normally, their times are cleared on the next start.
+        """
+        self.running = False
+
+    def toggle(self):
+        """Show or hide the overlay, timing the game loop while it's shown.
+        The timing continues after the overlay is hidden if 'keep_running'
+        is set, for example by the frame watchdog.
+        """
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay:
+            self.start()
+        elif not self.keep_running:
+            self.stop()
+
+    def end_frame(self):
+        """Store the times of the frame that ended and return them,
+        in milliseconds, by subsystem.
+        """
+        if not self.running:
+            return {}
+
+        self.last_frame = {
+            subsystem: elapsed * 1000 for subsystem, elapsed in self.frame_times.items()
+        }
+        self.frame_times.clear()
+        self.frame_history.append(sum(self.last_frame.values()))
+        self.subsystem_history.append(self.last_frame)
+        return self.last_frame
+
+    def get_entity_counts(self):
+        """Return the number of sprites in each sprite group."""
+        return {name: len(getattr(self.game, name)) for name in SPRITE_GROUPS}
+
+    def get_subsystem_averages(self):
+        """Return the average time of each subsystem over the stored frames."""
+        totals = defaultdict(float)
+        for frame in self.subsystem_history:
+            for subsystem, elapsed in frame.items():
+                totals[subsystem] += elapsed
+        frames = max(1, len(self.subsystem_history))
+        return {subsystem: total / frames for subsystem, total in totals.items()}
+
+    def get_report(self):
+        """Return the collected timings, the share of the time the game
+        loop waited between the frames, the entity counts and the pool stats.
+        """
+        history = list(self.frame_history)
+        return {
+            "frames": len(history),
+            "last_frame_ms": sum(self.last_frame.values()),
+            "average_frame_ms": sum(history) / len(history) if history else 0.0,
+            "max_frame_ms": max(history, default=0.0),
+            "subsystems_ms": self.get_subsystem_averages(),
+            "last_frame": dict(self.last_frame),
+            "idle_percent": frame_pacer.idle_percent,
+            "entities": self.get_entity_counts(),
+            "pools": self.game.sprite_pools.get_stats(),
+        }
+
+    def draw(self):
+        """Draw the overlay with the frame time graph, the average time of
+        each subsystem, the entity counts and the sprite pools.
+        """
+        if not self.show_overlay:
+            return
+
+        screen = self.game.screen
+        panel = pygame.Rect(10, 10, 280, 80)
+        graph = pygame.Surface(panel.size, pygame.SRCALPHA)
+        graph.fill((0, 0, 0, 170))
+        self._draw_frame_graph(graph)
+        screen.blit(graph, panel)
+
+        self.frames_since_refresh += 1
+        if not self.text_surfaces or self.frames_since_refresh >= self.REFRESH_FRAMES:
+            self.frames_since_refresh = 0
+            self.text_surfaces = self._render_lines()
+
+        y_pos = panel.bottom + 4
+        text_rects = []
+        for text_surface in self.text_surfaces:
+            text_rects.append(screen.blit(text_surface, (panel.x, y_pos)))
+            y_pos += text_surface.get_height()
+        display_updater.add("profiler", panel, *text_rects)
+
+    def _draw_frame_graph(self, surface):
+        """Draw a bar for each frame in the history, with a line at the frame budget."""
+        width, height = surface.get_size()
+        scale = height / (2 * self.FRAME_BUDGET_MS)
+        bar_width = width / self.HISTORY_SIZE
+        for index, frame_time in enumerate(self.frame_history):
+            bar_height = min(height, int(frame_time * scale))
+            color = (
+                (80, 220, 80) if frame_time <= self.FRAME_BUDGET_MS else (230, 60, 60)
+            )
+            pygame.draw.rect(
+                surface,
+                color,
+                (
+                    int(index * bar_width),
+                    height - bar_height,
+                    max(1, int(bar_width)),
+                    bar_height,
+                ),
+            )
+        budget_y = height - int(self.FRAME_BUDGET_MS * scale)
+        pygame.draw.line(surface, (255, 255, 255), (0, budget_y), (width, budget_y))
+
+    def _render_lines(self):
+        """Render the text lines of the overlay."""
+        if self.font is None:
+            self.font = text_cache.get_font("verdana", 12)
+
+        report = self.get_report()
+        lines = [
+            f"frame {report['last_frame_ms']:.2f} ms  "
+            f"avg {report['average_frame_ms']:.2f}  max {report['max_frame_ms']:.2f}  "
+            f"idle {report['idle_percent']:.0f}%"
+        ]
+        subsystems = sorted(
+            report["subsystems_ms"].items(), key=lambda item: item[1], reverse=True
+        )
+        lines.extend(f"{name}: {elapsed:.3f} ms" for name, elapsed in subsystems)
+        lines.extend(
+            f"{name}: {count}" for name, count in report["entities"].items() if count
+        )
+        lines.extend(
+            f"pool {name}: {stats['free']} free, {stats['created']} created, "
+            f"{stats['reused']} reused"
+            for name, stats in report["pools"].items()
+        )
+        return [self.font.render(line, True, "white", "black") for line in lines]
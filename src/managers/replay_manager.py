@@ -0,0 +1,184 @@
+"""
+The 'replay_manager' module contains the ReplayRecorder class that records
+the games as replays, and the functions that save, load and play them back.
+
+A replay holds the seed of the game, its starting tick on the game clock,
+the options picked in the menus and the ship control keys pressed and
+released before each tick. Played back in a headless game, it reproduces
+the recorded game tick by tick, as fast as the game logic can run.
+"""
+
+import gzip
+import json
+import os
+import time
+from collections import defaultdict
+from dataclasses import asdict
+
+import pygame
+
+from src.utils.constants import REPLAY_FOLDER, REPLAY_VERSION
+from src.utils.game_clock import game_clock
+from src.utils.game_utils import create_save_dir
+
+
+class ReplayRecorder:
+    """Records the new games as replays, when enabled. A recording starts
+    with each new game and is saved when the game ends, when the player
+    returns to the menu, quits, or starts another game.
+
+    Loaded games are not recorded, since they don't start from their seed.
+    """
+
+    def __init__(self, game, enabled=False, folder=REPLAY_FOLDER):
+        self.game = game
+        self.enabled = enabled
+        self.folder = folder
+        self.replay = None
+        self.start_tick = 0
+
+    def start(self, seed, start_tick):
+        """Save the previous recording and start recording a new game
+        with the given seed, which starts at the given tick.
+        """
+        self.finish()
+        if not self.enabled:
+            return
+        self.start_tick = start_tick
+        self.replay = {
+            "version": REPLAY_VERSION,
+            "seed": seed,
+            "start_tick": start_tick,
+            "ticks": 0,
+            "options": get_game_options(self.game),
+            "keys": [],
+            "result": None,
+        }
+
+    def record_key(self, key, pressed):
+        """Record a ship control key that was pressed or released.
+        The key is replayed before the next tick of the game logic.
+        """
+        if self.replay is not None:
+            tick = game_clock.ticks - self.start_tick
+            self.replay["keys"].append([tick, key, int(pressed)])
+
+    def finish(self):
+        """Save the current recording, if there is one.
+        Returns the path of the replay file, or None.
+        """
+        if self.replay is None:
+            return None
+        replay, self.replay = self.replay, None
+        replay["ticks"] = game_clock.ticks - self.start_tick
+        replay["result"] = get_game_result(self.game)
+        if not replay["ticks"]:
+            return None
+
+        create_save_dir(self.folder)
+        file_name = time.strftime(f"replay_%Y%m%d_%H%M%S_{replay['seed']}.replay")
+        path = os.path.join(self.folder, file_name)
+        save_replay(replay, path)
+        return path
+
+
+def get_game_options(game):
+    """Return the options picked in the menus that change how the game plays."""
+    settings = game.settings
+    return {
+        "singleplayer": game.singleplayer,
+        "game_modes": asdict(settings.game_modes),
+        "speedup_scale": settings.speedup_scale,
+        "max_alien_speed": settings.max_alien_speed,
+        "screen_size": [settings.screen_width, settings.screen_height],
+        "ships": [game.thunderbird_ship.ship_name, game.phoenix_ship.ship_name],
+    }
+
+
+def get_game_result(game):
+    """Return the level and the scores reached in the game, which are
+    compared after a replay to check that it played the same way.
+    """
+    stats = game.stats
+    return {
+        "level": stats.level,
+        "scores": [stats.thunderbird_score, stats.phoenix_score],
+    }
+
+
+def apply_game_options(game, options):
+    """Set the recorded options on the game, before the game starts."""
+    settings = game.settings
+    game.singleplayer = options["singleplayer"]
+    for name, value in options["game_modes"].items():
+        setattr(settings.game_modes, name, value)
+    settings.speedup_scale = options["speedup_scale"]
+    settings.max_alien_speed = options["max_alien_speed"]
+
+    screen_size = options["screen_size"]
+    if screen_size != [settings.screen_width, settings.screen_height]:
+        game.screen_manager.resize_screen(screen_size)
+
+    ship_selection = game.ship_selection
+    selections = {
+        ship_name: key
+        for key, (ship_name, _) in ship_selection.ship_selection_functions.items()
+    }
+    for ship_name in options["ships"]:
+        if ship_name in selections:
+            ship_selection.select_ship(*selections[ship_name])
+
+
+def save_replay(replay, path):
+    """Write the replay to a gzip compressed JSON file."""
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        json.dump(replay, file, separators=(",", ":"))
+
+
+def load_replay(path):
+    """Read a replay file. Raises ValueError if the replay was
+    recorded with a different version of the replay format.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        replay = json.load(file)
+    if replay.get("version") != REPLAY_VERSION:
+        raise ValueError(f"Unsupported replay version: {replay.get('version')}")
+    return replay
+
+
+def play_replay(game, replay, on_tick=None):
+    """Play the replay in a headless game, without waiting between ticks.
+    'on_tick' is called after every tick with the game, for example to
+    collect the profiler timings. Returns the number of ticks played.
+    """
+    apply_game_options(game, replay["options"])
+    game.next_seed = replay["seed"]
+    game.next_start_tick = replay["start_tick"]
+    game.start_headless_game()
+
+    keys = defaultdict(list)
+    for tick, key, pressed in replay["keys"]:
+        keys[tick].append((key, pressed))
+
+    player_input = game.player_input
+    for tick in range(replay["ticks"]):
+        for key, pressed in keys.get(tick, ()):
+            if pressed:
+                player_input.check_keydown_events(
+                    pygame.event.Event(pygame.KEYDOWN, key=key),
+                    game._reset_game,
+                    game.run_menu,
+                    game.game_over_manager.return_to_game_menu,
+                    game.weapons_manager.fire_missile,
+                    game.weapons_manager.fire_laser,
+                )
+            else:
+                player_input.check_keyup_events(
+                    pygame.event.Event(pygame.KEYUP, key=key)
+                )
+        active = game.step()
+        if on_tick:
+            on_tick(game)
+        if not active:
+            return tick + 1
+    return replay["ticks"]
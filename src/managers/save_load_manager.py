@@ -1,15 +1,24 @@
 """
 The save_load_manager module contains the SaveLoadSystem class that
-implements the functionality of saving and loading the game from a save file.
+implements the functionality of saving and loading the game from a save file,
+and the SaveSlotIndex class that keeps the summaries of the save files.
+
+The save files are gzip compressed JSON. The aliens are saved as their
+state only, their images are taken from the shared frame caches on load.
+Each save also has a summary of the game, with a small screenshot, which
+is kept in the slot index too. The files are written and read by the
+background worker.
 """
 
+import base64
 import datetime
-import pickle
+import gzip
+import io
+import json
 import os
 import sys
-
-import tkinter as tk
-from tkinter import messagebox
+import tempfile
+import zlib
 
 import pygame
 
@@ -17,6 +26,14 @@ from src.entities.alien_entities.aliens import Alien, BossAlien
 from src.utils.constants import (
     DATA_KEYS,
     ATTRIBUTE_MAPPING,
+    SAVE_VERSION,
+    SAVE_READ_CHUNK_SIZE,
+    SAVE_NOTICE_TIME,
+    SAVE_DATE_FORMAT,
+    SAVE_INDEX_FILE,
+    SAVE_INDEX_VERSION,
+    SAVE_THUMBNAIL_SIZE,
+    GAME_MODE_DISPLAY_NAMES,
     SLOT_HEIGHT,
     TEXT_PADDING_X,
     TEXT_PADDING_Y,
@@ -28,7 +45,15 @@ from src.utils.game_utils import (
     display_simple_message,
     play_sound,
     create_save_dir,
+    render_simple_text,
 )
+from src.managers.asset_manager import assets
+from src.utils.background_worker import background_worker
+from src.utils.display_updater import display_updater
+from src.utils.frame_pacer import frame_pacer
+from src.utils.game_clock import game_clock
+from src.utils.high_score_store import write_file_atomically
+from src.utils.text_cache import text_cache
 
 
 class SaveLoadSystem:
@@ -42,9 +67,22 @@ class SaveLoadSystem:
         self.menu_running = False
 
         self.data = {}
+        self.load_progress = 0.0
+        self.notice = None
         create_save_dir(self.save_folder)
-
-        self.font = pygame.font.SysFont("verdana", 22)
+        self.slot_index = SaveSlotIndex(self.save_folder, self.file_extension)
+
+        # The rendered save slots, with the index version and the
+        # screen center they were rendered for.
+        self.slot_surfaces = []
+        self.slot_rects = []
+        self.slot_surfaces_key = None
+        # The screenshot of the game being saved, and the decoded
+        # screenshots of the saves, by save file and date.
+        self.thumbnail = None
+        self.thumbnails = {}
+
+        self.font = text_cache.get_font("verdana", 22)
         self.text_color = (225, 225, 225)
 
         self.center_x = self.screen.get_width() // 2
@@ -147,6 +185,15 @@ class SaveLoadSystem:
         for data_name, data_value in data_names.items():
             self.get_data(data_name, data_value)
 
+        self.thumbnail = pygame.transform.smoothscale(self.screen, SAVE_THUMBNAIL_SIZE)
+
+    def rebase_alien_timers(self):
+        """Move the timers of the loaded aliens onto the game clock of the
+        new game. Called after the clock is moved ahead for the game.
+        """
+        for sprite in self.game.aliens:
+            rebase_sprite_timers(sprite)
+
     def update_alien_states(self):
         """Check the states of the aliens in the game and
         perform corresponding power actions.
@@ -189,54 +236,127 @@ class SaveLoadSystem:
         )
 
     def prepare_sprite_data_for_serialization(self):
-        """Prepare the sprite data for serialization."""
+        """Prepare the sprite data for serialization. Only the state of
+        the aliens is kept, their images are not saved.
+        """
         alien_sprites = self.data["aliens"]
+        self.game.aliens_manager.sync_alien_sprites(alien_sprites)
 
         return {
-            "alien_sprites": [
-                {
-                    "rect": sprite.rect,
-                    "size": sprite.image.get_size(),
-                    "image": pygame.image.tostring(sprite.image, "RGBA"),
-                    "is_baby": (
-                        False if isinstance(sprite, BossAlien) else sprite.is_baby
-                    ),
-                    "type": "boss" if isinstance(sprite, BossAlien) else "alien",
-                    "location": sprite.rect.x,
-                    "hit_count": sprite.hit_count,
-                    "last_bullet_time": sprite.last_bullet_time,
-                    "immune_state": (
-                        sprite.immune_state if isinstance(sprite, Alien) else None
-                    ),
-                    "frozen_state": sprite.frozen_state,
-                }
-                for sprite in alien_sprites
-            ],
+            "alien_sprites": [get_sprite_state(sprite) for sprite in alien_sprites],
         }
 
     def save_data(self, name, save_date):
-        """Saves the current game data to a file."""
+        """Saves the current game data to a file. The game data is copied
+        here, then it's compressed and written by the background worker,
+        and a message is shown when it's done. Returns the future of the write.
+        """
         file_path = os.path.join(self.save_folder, f"{name}.{self.file_extension}")
         sprite_data = self.prepare_sprite_data_for_serialization()
 
         game_data = {
+            "version": SAVE_VERSION,
             "sprite_data": sprite_data,
             **{key: self.data[key] for key in DATA_KEYS},
             "save_date": save_date,
         }
-        with open(file_path, "wb") as file:
-            pickle.dump(game_data, file)
+        game_data["summary"] = summary = get_save_summary(game_data)
+        self.show_notice("Saving...", "lightblue")
+
+        # The save is in the slot index while it's written, so the menus
+        # already see it, and the save is loaded after it's written.
+        save_file = os.path.basename(file_path)
+        previous_summary = self.slot_index.get(save_file)
+        self.slot_index.set(save_file, summary)
+        return background_worker.submit(
+            write_save_file_with_thumbnail,
+            game_data,
+            self.thumbnail,
+            file_path,
+            callback=lambda future: self._save_finished(
+                future, save_file, summary, previous_summary
+            ),
+        )
+
+    def _save_finished(self, future, save_file, summary, previous_summary):
+        """Show whether the game was saved, after the file was written. The
+        slot index gets the summary with the thumbnail, or the summary of the
+        previous save if the file could not be written. The index is left as
+        it is if the save was deleted or saved again meanwhile.
+        """
+        saved = future.exception() is None
+        if self.slot_index.get(save_file) is summary:
+            if saved:
+                self.slot_index.set(save_file, future.result())
+            elif previous_summary is None:
+                self.slot_index.remove(save_file)
+            else:
+                self.slot_index.set(save_file, previous_summary)
+
+        if saved:
+            self.show_notice("Game Saved!", "lightblue")
+        else:
+            self.show_notice("The game could not be saved!", "red")
 
     def load_data(self, name):
-        """Loads game data from a file and updates the game state."""
+        """Loads game data from a file and updates the game state.
+        The file is read by the background worker, while the loading screen
+        shows its progress. Returns False, leaving the game as it was, if the
+        save file is missing, corrupt or saved in another version of the
+        save format.
+        """
         file_path = os.path.join(self.save_folder, f"{name}.{self.file_extension}")
+        self.load_progress = 0.0
+        future = background_worker.submit(
+            read_save_file, file_path, self._set_load_progress
+        )
+        while not future.done():
+            pygame.event.pump()
+            self.game.loading_screen.update(int(self.load_progress * 90))
+            frame_pacer.wait(animating=True)
+
         try:
-            with open(file_path, "rb") as file:
-                loaded_data = pickle.load(file)
-                self.update_game_state_from_data(loaded_data)
-                self.restore_sprites_from_data(loaded_data)
-        except FileNotFoundError:
+            loaded_data = future.result()
+        except (OSError, EOFError, ValueError, zlib.error):
             play_sound(self.game.sound_manager.game_sounds, "empty_save")
+            return False
+
+        self.update_game_state_from_data(loaded_data)
+        self.restore_sprites_from_data(loaded_data)
+        return True
+
+    def _set_load_progress(self, progress):
+        """Set the part of the save file that was read, called by the worker."""
+        self.load_progress = progress
+
+    def show_notice(self, text, color):
+        """Show a message about the saved game for a short time,
+        without stopping the game.
+        """
+        message_surface, message_rect = render_simple_text(
+            text, self.font, color, self.screen.get_width() // 2, 600
+        )
+        self.notice = (
+            message_surface,
+            message_rect,
+            pygame.time.get_ticks() + SAVE_NOTICE_TIME,
+        )
+
+    def update(self):
+        """Call the callbacks of the finished saves and draw the message
+        about the saved game, if there is one.
+        """
+        background_worker.poll()
+        if self.notice is None:
+            return
+
+        message_surface, message_rect, end_time = self.notice
+        if pygame.time.get_ticks() > end_time:
+            self.notice = None
+            display_updater.add("save_notice", message_rect)
+            return
+        self.screen.blit(message_surface, message_rect)
+        display_updater.add("save_notice", message_rect)
 
     def restore_sprites_from_data(self, loaded_data):
         """Restores the game sprites based on the provided data."""
@@ -245,20 +365,10 @@ class SaveLoadSystem:
         alien_sprites.empty()
 
         for sprite_state in sprite_data.get("alien_sprites", []):
-            size = sprite_state["size"]
-
             sprite = self.create_alien_sprite(
                 sprite_state["type"], sprite_state, self.game
             )
-
-            sprite.size = size
-            sprite.rect = sprite_state["rect"]
-            sprite.image = pygame.image.fromstring(sprite_state["image"], size, "RGBA")
-            sprite.x_pos = sprite_state["location"]
-            sprite.frozen_state = sprite_state["frozen_state"]
-            sprite.immune_state = sprite_state["immune_state"]
-            sprite.last_bullet_time = sprite_state["last_bullet_time"]
-
+            set_sprite_state(sprite, sprite_state)
             alien_sprites.add(sprite)
 
     def create_alien_sprite(self, sprite_type, sprite_state, game):
@@ -266,7 +376,7 @@ class SaveLoadSystem:
         if sprite_type == "boss":
             sprite = BossAlien(game)
         elif sprite_type == "alien" and sprite_state["is_baby"]:
-            sprite = Alien(game, baby_location=sprite_state["location"], is_baby=True)
+            sprite = Alien(game, baby_location=sprite_state["rect"][0], is_baby=True)
             sprite.animation.change_scale(0.5)
         else:
             sprite = Alien(game)
@@ -294,17 +404,18 @@ class SaveLoadSystem:
         """Displays the save or the load menu, allowing the user
         to select and interact with available save slots.
         """
-        # Create the save directory and get the list of save files
         self.menu_running = True
-
-        save_files = self._get_save_files()
         slot_selected = 0
-        slot_rects = []
 
         while self.menu_running:
             # Handle events
             self.game.screen_manager.update_window_mode()
             for event in pygame.event.get():
+                if self.game.confirm_dialog.handle_event(event):
+                    if not self.menu_running:
+                        return
+                    continue
+
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -318,7 +429,8 @@ class SaveLoadSystem:
                         slot_selected = (slot_selected + 1) % 3
                     elif event.key == pygame.K_RETURN:
                         self._handle_save_slot_action(self.font, slot_selected, save)
-                        return
+                        if not self.game.confirm_dialog.active:
+                            return
                     elif event.key == pygame.K_ESCAPE:
                         play_sound(self.game.sound_manager.game_sounds, "keypress")
                         return
@@ -331,13 +443,14 @@ class SaveLoadSystem:
 
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     mouse_x, mouse_y = pygame.mouse.get_pos()
-                    for i, rect in enumerate(slot_rects):
+                    for i, rect in enumerate(self.slot_rects):
                         if rect.collidepoint(mouse_x, mouse_y):
                             slot_selected = i
                             self._handle_save_slot_action(
                                 self.font, slot_selected, save
                             )
-                            return
+                            if not self.game.confirm_dialog.active:
+                                return
 
                     if self.cancel_rect.collidepoint(mouse_x, mouse_y):
                         play_sound(self.game.sound_manager.game_sounds, "click")
@@ -345,11 +458,7 @@ class SaveLoadSystem:
 
                     if self.delete_rect.collidepoint(mouse_x, mouse_y):
                         play_sound(self.game.sound_manager.game_sounds, "click")
-                        if confirm := self._show_confirmation_popup():
-                            play_sound(self.game.sound_manager.game_sounds, "click")
-                            self._delete_all_save_files()
-                        else:
-                            play_sound(self.game.sound_manager.game_sounds, "click")
+                        self._show_confirmation_popup(self._confirm_delete)
                 elif event.type == pygame.VIDEORESIZE:
                     self.game.screen_manager.resize_screen(event.size)
                     self.game.screen_manager.update_buttons()
@@ -357,67 +466,112 @@ class SaveLoadSystem:
             # Render the display
             self.screen.blit(self.game.bg_img, [0, 0])
             self.display_screen_title(save)
-            self._draw_save_slots(
-                self.font,
-                self.text_color,
-                self.center_x,
-                save_files,
-                slot_selected,
-                slot_rects,
-            )
+            self._draw_save_slots(slot_selected)
             self.screen.blit(self.cancel_text, self.cancel_rect)
             self.screen.blit(self.delete_text, self.delete_rect)
+            self.game.confirm_dialog.draw()
             self.game.screen_manager.draw_cursor()
             pygame.display.flip()
+            # Keep drawing while the thumbnails are decoded, to show them.
+            background_worker.poll()
+            frame_pacer.wait(background_worker.busy)
 
     def _get_save_files(self):
-        """Get the list of save files from the specified save folder."""
-        file_list = os.listdir(self.save_folder)
-        return [
-            f
-            for f in file_list
-            if os.path.isfile(os.path.join(self.save_folder, f))
-            and f.endswith(self.file_extension)
-        ]
+        """Get the list of save files, from the save slot index."""
+        return self.slot_index.get_save_files()
 
-    def _get_save_status_text(self, slot_number, save_files):
+    def _get_save_status_text(self, slot_number):
         """Get the status text for the specified save slot number."""
-        save_file_name = f"save{slot_number}.save"
-        if save_file_name not in save_files:
+        summary = self.slot_index.get(f"save{slot_number}.{self.file_extension}")
+        if summary is None:
             return "Empty"
 
-        try:
-            save_file_path = os.path.join(self.save_folder, save_file_name)
-            save_date = os.path.getmtime(save_file_path)
-            save_date_str = datetime.datetime.fromtimestamp(save_date).strftime(
-                "%d %b %Y  %I:%M %p"
-            )
-            return f"Saved On: {save_date_str}"
-        except FileNotFoundError:
-            return "Empty"
+        save_date = datetime.datetime.strptime(summary["save_date"], SAVE_DATE_FORMAT)
+        status_text = f"Saved On: {save_date.strftime('%d %b %Y  %I:%M %p')}"
+        if "level" not in summary:
+            return status_text
 
-    def _draw_save_slots(
-        self, font, text_color, center_x, save_files, slot_selected, slot_rects
-    ):
-        """Display the save slots on the screen."""
+        game_mode = GAME_MODE_DISPLAY_NAMES.get(
+            summary["game_mode"], summary["game_mode"].upper()
+        )
+        scores = " / ".join(str(score) for score in summary["scores"] if score)
+        return f"{status_text} | Level {summary['level']} | {game_mode} | {scores or 0}"
+
+    def _render_save_slots(self):
+        """Render the texts of the save slots and set their rects.
+        The thumbnails of the saves that were not decoded yet are
+        decoded by the background worker.
+        """
+        self.slot_surfaces = []
+        thumbnail_keys = set()
         for i, slot_number in enumerate(range(1, 4)):
-            status_text = self._get_save_status_text(slot_number, save_files)
-            text = font.render(
-                f"Save File {slot_number}: {status_text}", True, text_color
+            status_text = self._get_save_status_text(slot_number)
+            text = self.font.render(
+                f"Save File {slot_number}: {status_text}", True, self.text_color
             )
-            text_rect = text.get_rect(center=(center_x, 300 + i * SLOT_HEIGHT))
-            slot_rects.append(text_rect)
+            text_rect = text.get_rect(center=(self.center_x, 300 + i * SLOT_HEIGHT))
+
+            save_file = f"save{slot_number}.{self.file_extension}"
+            summary = self.slot_index.get(save_file) or {}
+            thumbnail_key = None
+            if "thumbnail" in summary:
+                thumbnail_key = (save_file, summary["save_date"])
+                thumbnail_keys.add(thumbnail_key)
+                if thumbnail_key not in self.thumbnails:
+                    self._decode_thumbnail(thumbnail_key, summary["thumbnail"])
+            self.slot_surfaces.append((text, text_rect, thumbnail_key))
+
+        # Forget the thumbnails of the saves that were overwritten or deleted.
+        self.thumbnails = {
+            key: thumbnail
+            for key, thumbnail in self.thumbnails.items()
+            if key in thumbnail_keys
+        }
+        self.slot_rects = [text_rect for _, text_rect, _ in self.slot_surfaces]
+        self.slot_surfaces_key = (self.slot_index.version, self.center_x)
+
+    def _decode_thumbnail(self, thumbnail_key, thumbnail_data):
+        """Decode the thumbnail of a save on the background worker."""
+        self.thumbnails[thumbnail_key] = None
+
+        def thumbnail_decoded(future):
+            if future.exception() is None and thumbnail_key in self.thumbnails:
+                self.thumbnails[thumbnail_key] = assets.convert_image(
+                    future.result(), alpha=False
+                )
+
+        background_worker.submit(
+            decode_thumbnail, thumbnail_data, callback=thumbnail_decoded
+        )
 
+    def _draw_save_slots(self, slot_selected):
+        """Display the save slots on the screen, with the thumbnails that
+        were decoded. The slots are rendered again only after the saves
+        or the screen width change.
+        """
+        if self.slot_surfaces_key != (self.slot_index.version, self.center_x):
+            self._render_save_slots()
+
+        for i, (text, text_rect, thumbnail_key) in enumerate(self.slot_surfaces):
             self.screen.blit(text, text_rect)
 
-            rect = pygame.Rect(
-                text_rect.left - TEXT_PADDING_X,
-                text_rect.top - TEXT_PADDING_Y,
-                text_rect.width + 2 * TEXT_PADDING_X,
-                text_rect.height + 2 * TEXT_PADDING_Y,
-            )
+            thumbnail = self.thumbnails.get(thumbnail_key)
+            if thumbnail:
+                thumbnail_rect = thumbnail.get_rect(
+                    midright=(text_rect.left - 2 * TEXT_PADDING_X, text_rect.centery)
+                )
+                self.screen.blit(thumbnail, thumbnail_rect)
+                pygame.draw.rect(
+                    self.screen, self.text_color, thumbnail_rect.inflate(2, 2), 1
+                )
 
             if i == slot_selected:
+                rect = pygame.Rect(
+                    text_rect.left - TEXT_PADDING_X,
+                    text_rect.top - TEXT_PADDING_Y,
+                    text_rect.width + 2 * TEXT_PADDING_X,
+                    text_rect.height + 2 * TEXT_PADDING_Y,
+                )
                 pygame.draw.rect(self.screen, SELECTED_SLOT_COLOR, rect, BORDER_WIDTH)
 
     def _handle_save_slot_action(self, font, slot_selected, save):
@@ -431,58 +585,73 @@ class SaveLoadSystem:
         """Handle the action when saving the game."""
         save_files = self._get_save_files()
         if f"save{slot_selected + 1}.save" in save_files:
-            if confirm_overwrite := self._show_confirmation_popup(
-                delete_save_files=False
-            ):
-                self._save_game(font, slot_selected)
-            else:
-                play_sound(self.game.sound_manager.game_sounds, "click")
+            self._show_confirmation_popup(
+                lambda confirm: self._confirm_overwrite(confirm, font, slot_selected),
+                delete_save_files=False,
+            )
         else:
             self._save_game(font, slot_selected)
 
+    def _confirm_overwrite(self, confirm, font, slot_selected):
+        """Save the game over the save file if the overwrite was confirmed,
+        and leave the menu. Otherwise, the menu stays open.
+        """
+        if confirm:
+            self._save_game(font, slot_selected)
+            self.menu_running = False
+        else:
+            play_sound(self.game.sound_manager.game_sounds, "click")
+
     def _handle_load_action(self, font, slot_selected):
         """Handle the action when loading the game from a save file."""
         save_files = self._get_save_files()
         if f"save{slot_selected + 1}.save" in save_files:
-            play_sound(self.game.sound_manager.game_sounds, "load_game")
-            self.load_data(f"save{slot_selected + 1}")
-            self.game.game_loaded = True
-            display_simple_message(self.screen, "Game Loaded!", font, "lightblue", 1000)
+            if self.load_data(f"save{slot_selected + 1}"):
+                play_sound(self.game.sound_manager.game_sounds, "load_game")
+                self.game.game_loaded = True
+                display_simple_message(
+                    self.screen, "Game Loaded!", font, "lightblue", 1000
+                )
+            else:
+                display_simple_message(
+                    self.screen, "Incompatible save file", font, "red", 1000
+                )
         else:
             play_sound(self.game.sound_manager.game_sounds, "empty_save")
             display_simple_message(self.screen, "Empty save slot", font, "red", 500)
 
     def _save_game(self, font, slot_selected):
-        """Save the game state and display a message."""
+        """Save the game state, the message is shown while the game goes on."""
         play_sound(self.game.sound_manager.game_sounds, "click")
-        save_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        save_date = datetime.datetime.now().strftime(SAVE_DATE_FORMAT)
         self.save_data(f"save{slot_selected + 1}", save_date=save_date)
-        display_simple_message(self.screen, "Game Saved!", font, "lightblue", 1000)
 
     def _delete_all_save_files(self):
-        """Deletes all save files from the save folder."""
-        save_files = self._get_save_files()
-
-        for save_file in save_files:
-            save_file_path = os.path.join(self.save_folder, save_file)
-            os.remove(save_file_path)
+        """Deletes all save files from the save folder. The files are deleted
+        by the background worker, after the saves that are being written.
+        """
+        save_file_paths = [
+            os.path.join(self.save_folder, save_file)
+            for save_file in self._get_save_files()
+        ]
+        background_worker.submit(delete_files, save_file_paths)
+        self.slot_index.clear()
 
-    def _show_confirmation_popup(self, delete_save_files=True):
-        """Display a confirmation popup."""
-        root = tk.Tk()
-        root.withdraw()
+    def _confirm_delete(self, confirm):
+        """Delete all save files if the deletion was confirmed."""
+        play_sound(self.game.sound_manager.game_sounds, "click")
+        if confirm:
+            self._delete_all_save_files()
 
+    def _show_confirmation_popup(self, callback, delete_save_files=True):
+        """Open the confirmation dialog of the game, over the menu.
+        The callback is called with the answer.
+        """
         if delete_save_files:
-            user_response = messagebox.askyesno(
-                "Confirmation", "Delete all save files?"
-            )
+            question = "Delete all save files?"
         else:
-            user_response = messagebox.askyesno(
-                "Confirmation", "Overwrite this save file?"
-            )
-
-        root.destroy()
-        return user_response
+            question = "Overwrite this save file?"
+        self.game.confirm_dialog.open(question, callback)
 
     def update_rect_positions(self):
         """Update the positions of UI elements based on the current screen width."""
@@ -509,3 +678,273 @@ class SaveLoadSystem:
             self.screen.blit(
                 self.game.settings.load_game_img, self.game.settings.load_game_rect
             )
+
+
+class SaveSlotIndex:
+    """The summaries of the save files in the save folder, by file name:
+    when each game was saved, its level, game mode and score. They are
+    kept in an index file in the save folder, so the save menus don't
+    read the save files.
+
+    The save folder is read only when the index file is missing or can't be
+    read. The index changes when a game is saved and when the saves are
+    deleted, and 'version' increases with each change.
+    """
+
+    def __init__(self, save_folder, file_extension):
+        self.save_folder = save_folder
+        self.file_extension = file_extension
+        self.path = os.path.join(save_folder, SAVE_INDEX_FILE)
+        self.summaries = None
+        self.version = 0
+
+    def get_save_files(self):
+        """Return the names of the save files, sorted."""
+        return sorted(self._load())
+
+    def get(self, save_file):
+        """Return the summary of the save file, or None if there's no such save."""
+        return self._load().get(save_file)
+
+    def set(self, save_file, summary):
+        """Set the summary of a save file that is written."""
+        self._load()[save_file] = summary
+        self._changed()
+
+    def remove(self, save_file):
+        """Forget a save file that could not be written."""
+        self._load().pop(save_file, None)
+        self._changed()
+
+    def clear(self):
+        """Forget all the save files, after they were deleted."""
+        self.summaries = {}
+        self._changed()
+
+    def _changed(self):
+        """Write a copy of the index on the background worker, after
+        the save files that are being written.
+        """
+        self.version += 1
+        index = {"version": SAVE_INDEX_VERSION, "saves": dict(self.summaries)}
+        background_worker.submit(write_file_atomically, self.path, index)
+
+    def _load(self):
+        """Return the summaries, reading the index file the first time."""
+        if self.summaries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as index_file:
+                    index = json.load(index_file)
+                if index["version"] != SAVE_INDEX_VERSION:
+                    raise ValueError("Unsupported save index version")
+                self.summaries = dict(index["saves"])
+            except (OSError, ValueError, KeyError, TypeError):
+                self.summaries = self._read_save_folder()
+                self._changed()
+        return self.summaries
+
+    def _read_save_folder(self):
+        """Return the summaries of the save files in the save folder.
+        The save files that can't be loaded get only the date they
+        were last written.
+        """
+        summaries = {}
+        for save_file in os.listdir(self.save_folder):
+            save_path = os.path.join(self.save_folder, save_file)
+            if not save_file.endswith(self.file_extension) or not os.path.isfile(
+                save_path
+            ):
+                continue
+            try:
+                game_data = read_save_file(save_path)
+                summaries[save_file] = game_data.get("summary") or get_save_summary(
+                    game_data
+                )
+            except (OSError, EOFError, ValueError, KeyError, zlib.error):
+                modified = datetime.datetime.fromtimestamp(os.path.getmtime(save_path))
+                summaries[save_file] = {
+                    "save_date": modified.strftime(SAVE_DATE_FORMAT)
+                }
+        return summaries
+
+
+def delete_files(paths):
+    """Delete the files, the missing ones are skipped."""
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def get_save_summary(game_data):
+    """Return the summary of a saved game, shown in the save menus."""
+    return {
+        "save_date": game_data["save_date"],
+        "level": game_data["level"],
+        "game_mode": game_data["game_mode"],
+        "scores": [game_data["thunderbird_score"], game_data["phoenix_score"]],
+    }
+
+
+def encode_thumbnail(thumbnail):
+    """Return the thumbnail as a PNG image encoded in base64."""
+    png_file = io.BytesIO()
+    pygame.image.save(thumbnail, png_file, "thumbnail.png")
+    return base64.b64encode(png_file.getvalue()).decode("ascii")
+
+
+def decode_thumbnail(thumbnail_data):
+    """Return the thumbnail surface from the PNG image encoded in base64."""
+    return pygame.image.load(
+        io.BytesIO(base64.b64decode(thumbnail_data)), "thumbnail.png"
+    )
+
+
+def write_save_file_with_thumbnail(game_data, thumbnail, path):
+    """Add the thumbnail to the summary of the game and write the save file.
+    Returns the summary, with the thumbnail. The summary is copied, since
+    the slot index shows the summary without the thumbnail meanwhile.
+    """
+    summary = dict(game_data["summary"])
+    if thumbnail is not None:
+        summary["thumbnail"] = encode_thumbnail(thumbnail)
+    game_data["summary"] = summary
+    write_save_file(game_data, path)
+    return summary
+
+
+def get_sprite_state(sprite):
+    """Return the state of an alien or a boss, as saved in the save files.
+    The timers are saved relative to the game clock, which is moved ahead
+    for each game, and a bullet time of None means no bullet was fired.
+    """
+    ticks = game_clock.get_ticks()
+    seconds = game_clock.time()
+    motion = sprite.motion
+    state = {
+        "type": "boss" if isinstance(sprite, BossAlien) else "alien",
+        "rect": list(sprite.rect),
+        "x_pos": sprite.x_pos,
+        "hit_count": sprite.hit_count,
+        "last_bullet_time": (
+            sprite.last_bullet_time - ticks if sprite.last_bullet_time else None
+        ),
+        "frozen_state": sprite.frozen_state,
+        "frozen_start_time": sprite.frozen_start_time - seconds,
+        "direction": motion.direction,
+        "last_direction_change": motion.last_direction_change - ticks,
+        "direction_change_delay": motion.direction_change_delay,
+        "sins": dict(motion.sins),
+    }
+    if isinstance(sprite, BossAlien):
+        state["last_hit_time"] = sprite.last_hit_time - seconds
+    else:
+        animation = sprite.animation
+        state.update(
+            {
+                "is_baby": sprite.is_baby,
+                "immune_state": sprite.immune_state,
+                "immune_start_time": sprite.immune_start_time - seconds,
+                "level_prefix": animation.level_prefix,
+                "scale": animation.scale,
+                "frame_counter": animation.frame_counter,
+                "current_frame": animation.current_frame,
+            }
+        )
+    return state
+
+
+def set_sprite_state(sprite, state):
+    """Set the saved state on a newly created alien or boss. The alien
+    frames are taken from the frames shared by all the aliens. The timers
+    are left relative until 'rebase_sprite_timers' is called.
+    """
+    sprite.rect = pygame.Rect(state["rect"])
+    sprite.x_pos = state["x_pos"]
+    sprite.hit_count = state["hit_count"]
+    sprite.last_bullet_time = state["last_bullet_time"]
+    sprite.frozen_state = state["frozen_state"]
+    sprite.frozen_start_time = state["frozen_start_time"]
+
+    motion = sprite.motion
+    motion.direction = state["direction"]
+    motion.last_direction_change = state["last_direction_change"]
+    motion.direction_change_delay = state["direction_change_delay"]
+    motion.sins = dict(state["sins"])
+
+    if isinstance(sprite, BossAlien):
+        sprite.last_hit_time = state["last_hit_time"]
+        return
+
+    sprite.is_baby = state["is_baby"]
+    sprite.immune_state = state["immune_state"]
+    sprite.immune_start_time = state["immune_start_time"]
+
+    animation = sprite.animation
+    animation.level_prefix = state["level_prefix"]
+    animation.scale = state["scale"]
+    animation.frames = assets.get_alien_frames(animation.level_prefix, animation.scale)
+    animation.frame_counter = state["frame_counter"]
+    animation.current_frame = state["current_frame"] % len(animation.frames)
+    animation.image = animation.frames[animation.current_frame]
+    sprite.image = animation.image
+
+
+def rebase_sprite_timers(sprite):
+    """Make the relative timers set by 'set_sprite_state' absolute again,
+    on the current game clock.
+    """
+    ticks = game_clock.get_ticks()
+    seconds = game_clock.time()
+    if sprite.last_bullet_time is None:
+        sprite.last_bullet_time = 0
+    else:
+        sprite.last_bullet_time += ticks
+    sprite.frozen_start_time += seconds
+    sprite.motion.last_direction_change += ticks
+
+    if isinstance(sprite, BossAlien):
+        sprite.last_hit_time += seconds
+    else:
+        sprite.immune_start_time += seconds
+
+
+def write_save_file(game_data, path):
+    """Write the game data to a gzip compressed JSON save file. The data is
+    written to a temporary file next to it, which then replaces the save
+    file, so a crash while saving never leaves it half written.
+    """
+    data = json.dumps(game_data, separators=(",", ":")).encode("utf-8")
+    file_descriptor, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), prefix=".save_", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, "wb") as temp_file:
+            with gzip.GzipFile(fileobj=temp_file, mode="wb") as file:
+                file.write(data)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, path)
+    except OSError:
+        os.remove(temp_path)
+        raise
+
+
+def read_save_file(path, progress=None):
+    """Read a save file, decompressing it in chunks. 'progress' is called
+    with the part of the file read so far, from 0 to 1. Raises ValueError
+    if the game was saved in a different version of the save format.
+    """
+    chunks = []
+    with open(path, "rb") as raw_file, gzip.GzipFile(fileobj=raw_file) as file:
+        size = os.fstat(raw_file.fileno()).st_size or 1
+        while chunk := file.read(SAVE_READ_CHUNK_SIZE):
+            chunks.append(chunk)
+            if progress:
+                progress(min(raw_file.tell() / size, 1.0))
+
+    game_data = json.loads(b"".join(chunks))
+    if not isinstance(game_data, dict) or game_data.get("version") != SAVE_VERSION:
+        raise ValueError("Unsupported save file version")
+    return game_data
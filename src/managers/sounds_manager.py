@@ -1,11 +1,15 @@
 """
 The 'sounds_manager' module contains the `SoundManager` class which manages
 different sounds in the game. Additionally, it handles the loading of sound
-files for usage throughout the game.
+files for usage throughout the game. The `NullSoundManager` class is used
+instead when the game runs in headless mode.
 """
 
+from functools import partial
+
 import pygame
 
+from src.utils.background_worker import BackgroundWorker
 from src.utils.constants import (
     LEVEL_SOUNDS,
     MENU_SOUNDS,
@@ -14,10 +18,11 @@ from src.utils.constants import (
     BOSS_RUSH_MUSIC,
     ENDLESS_SOUNDTRACK,
     METEOR_MADNESS_MUSIC,
+    SOUND_LOADER_THREADS,
 )
+from src.utils.frame_pacer import frame_pacer
 from src.utils.game_utils import (
-    load_sound_files,
-    set_sounds_volume,
+    load_sound_file,
     set_music_volume,
     load_music_files,
     play_music,
@@ -29,6 +34,10 @@ from src.utils.game_utils import (
 class SoundManager:
     """This class is responsible for loading and playing various
     sound effects and music.
+
+    The sound files are decoded on background threads. The sounds are added
+    to their dict as they are decoded, so the sounds that are not loaded yet
+    are skipped by 'play_sound'.
     """
 
     def __init__(self, game):
@@ -51,38 +60,107 @@ class SoundManager:
         self.draw_muted_message = False
         self.display_muted_time = 0
 
+        self.loader = BackgroundWorker(max_workers=SOUND_LOADER_THREADS)
+        # The names of the sounds still decoding, for each group of sounds
+        # whose loading has started.
+        self.loading_sounds = {}
+
     def load_sounds(self, sounds_to_load):
         """Load necessary sound files."""
         if sounds_to_load == "gameplay_sounds":
             self._load_gameplay_sounds()
             self._set_multiple_music_volume(0.3)
-            self._prepare_gameplay_sounds_volume()
         elif sounds_to_load == "menu_sounds":
             self.load_menu_sounds()
             set_music_volume(self.menu_music, 0.8)
-            set_sounds_volume(self.menu_sounds, 0.7)
+
+    def preload_sounds(self, sounds_to_load):
+        """Start decoding the sound files of the group on the background
+        threads, without waiting for them. Each group is loaded once.
+        """
+        if sounds_to_load in self.loading_sounds:
+            return
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+
+        sound_files = self._get_sound_files(sounds_to_load)
+        self.loading_sounds[sounds_to_load] = set(sound_files)
+        for name, sound_path in sound_files.items():
+            self.loader.submit(
+                load_sound_file,
+                sound_path,
+                callback=partial(self._sound_loaded, sounds_to_load, name),
+            )
+
+    @staticmethod
+    def _get_sound_files(sounds_to_load):
+        """Return the sound files of the group, by sound name."""
+        return MENU_SOUNDS if sounds_to_load == "menu_sounds" else GAME_SOUNDS
+
+    def _sound_loaded(self, sounds_to_load, name, future):
+        """Add the decoded sound to its dict, with its volume. A sound that
+        could not be loaded is left out, so it's never played.
+        """
+        self.loading_sounds[sounds_to_load].discard(name)
+        if future.exception() is not None:
+            return
+
+        sound = future.result()
+        sound.set_volume(self._get_sound_volume(sounds_to_load, name))
+        if sounds_to_load == "menu_sounds":
+            self.menu_sounds[name] = sound
+        else:
+            self.game_sounds[name] = sound
+
+    def _get_sound_volume(self, sounds_to_load, name):
+        """Return the volume a sound starts with when it's loaded."""
+        if self.game.sfx_muted:
+            return 0.0
+        if sounds_to_load == "menu_sounds":
+            return 0.7
+        return {"bullet": 0.1, "alien_exploding": 0.5}.get(name, 1.0)
+
+    def update_loading(self):
+        """Add the sounds decoded since the last update."""
+        self.loader.poll()
+
+    def _wait_for_sounds(self, sounds_to_load):
+        """Wait until the sounds of the group are decoded, showing how many
+        are done on the loading screen.
+        """
+        self.update_loading()
+        loading = self.loading_sounds[sounds_to_load]
+        if not loading:
+            return
+
+        sounds_count = len(self._get_sound_files(sounds_to_load))
+        while loading:
+            pygame.event.pump()
+            self.loading_screen.update(
+                100 * (sounds_count - len(loading)) // sounds_count
+            )
+            frame_pacer.wait(animating=True)
+            self.update_loading()
+        self.loading_screen.update(100)
 
     def _load_gameplay_sounds(self):
-        """Load the sound files for the level-specific music and game sounds
-        while displaying the loading screen.
+        """Load the sound files for the level-specific music and game sounds,
+        displaying the loading screen while the sounds are still decoding.
         """
-        while not (self.level_music and self.game_sounds):
-            self.loading_screen.update(25)
-            self.level_music = load_music_files(LEVEL_SOUNDS)
-            self.boss_rush_levels = load_music_files(BOSS_RUSH_MUSIC)
-            self.endless_music = load_music_files(ENDLESS_SOUNDTRACK)
-            self.meteor_music = load_music_files(METEOR_MADNESS_MUSIC)
-            self.loading_screen.update(75)
-            self.game_sounds = load_sound_files(GAME_SOUNDS)
-            self.loading_screen.update(100)
+        self.level_music = load_music_files(LEVEL_SOUNDS)
+        self.boss_rush_levels = load_music_files(BOSS_RUSH_MUSIC)
+        self.endless_music = load_music_files(ENDLESS_SOUNDTRACK)
+        self.meteor_music = load_music_files(METEOR_MADNESS_MUSIC)
+        self.preload_sounds("gameplay_sounds")
+        self._wait_for_sounds("gameplay_sounds")
 
     def load_menu_sounds(self):
-        """Load the sound files for the menu while displaying the loading screen."""
-        while not (self.menu_sounds and self.menu_music):
-            self.loading_screen.update(25)
-            self.menu_sounds = load_sound_files(MENU_SOUNDS)
-            self.menu_music = load_music_files(MENU_MUSIC)
-            self.loading_screen.update(100)
+        """Load the sound files for the menu, displaying the loading screen
+        while the sounds are still decoding.
+        """
+        self.menu_music = load_music_files(MENU_MUSIC)
+        self.preload_sounds("menu_sounds")
+        self._wait_for_sounds("menu_sounds")
 
     def _set_level_music(self):
         """Determine the appropriate music dictionary
@@ -111,11 +189,6 @@ class SoundManager:
                     self.current_sound = sound_name
                 return
 
-    def _prepare_gameplay_sounds_volume(self):
-        """Prepare the volume for specific sounds."""
-        self.game_sounds["bullet"].set_volume(0.1)
-        self.game_sounds["alien_exploding"].set_volume(0.5)
-
     def _get_music_dicts(self):
         """Retrieve the dictionaries containing the loaded music files."""
         return {
@@ -215,3 +288,24 @@ class SoundManager:
 
         if not self.draw_muted_message:
             self.display_muted_time = current_time
+
+
+class NullSoundManager(SoundManager):
+    """A sound manager that loads and plays nothing, used when the game
+    runs in headless mode without an audio device.
+    """
+
+    def load_sounds(self, sounds_to_load):
+        """Sounds are never loaded, so play_sound skips them."""
+
+    def preload_sounds(self, sounds_to_load):
+        """Sounds are never loaded, so play_sound skips them."""
+
+    def prepare_level_music(self):
+        """There is no music to play."""
+
+    def check_music_volume(self):
+        """There is no music to mute."""
+
+    def check_muted_state(self):
+        """There is no muted message to display."""
@@ -15,6 +15,7 @@ from src.utils.constants import (
     GAME_MODES_DESCRIPTIONS,
 )
 from src.utils.game_utils import load_button_imgs, play_sound
+from src.utils.animation_constants import prefetch_frames
 
 
 class GameButtonsManager:
@@ -201,21 +202,22 @@ class GameButtonsManager:
             if collision_rect.collidepoint(pygame.mouse.get_pos()):
                 button.show_button_info()
 
-    def draw_difficulty_buttons(self):
-        """Draw difficulty buttons on screen."""
+    def draw_difficulty_buttons(self, surface=None):
+        """Draw difficulty buttons on the surface, the screen by default."""
         for button in self.difficulty_buttons:
-            button.draw_button()
+            button.draw_button(surface)
 
-    def draw_game_mode_buttons(self):
-        """Draw game mode buttons on screen."""
+    def draw_game_mode_buttons(self, surface=None):
+        """Draw game mode buttons on the surface, the screen by default.
+        The description of the hovered button is drawn by 'display_description'.
+        """
         for button in self.game_mode_buttons:
-            button.draw_button()
-        self.display_description()
+            button.draw_button(surface)
 
-    def draw_buttons(self):
-        """Draw game menu buttons on screen."""
+    def draw_buttons(self, surface=None):
+        """Draw game menu buttons on the surface, the screen by default."""
         for button in self.game_buttons:
-            button.draw_button()
+            button.draw_button(surface)
 
     def handle_buttons_visibility(self):
         """Handle the visibility of buttons based on the current ui options."""
@@ -235,7 +237,7 @@ class GameButtonsManager:
 
     def handle_quit_button(self):
         """Play the quit sound effect and quit the game."""
-        self.game.sound_manager.game_sounds["quit_effect"].play()
+        play_sound(self.game.sound_manager.game_sounds, "quit_effect")
         pygame.time.delay(800)
         pygame.quit()
         sys.exit()
@@ -305,6 +307,7 @@ class GameButtonsManager:
         self._set_game_mode_settings(game_mode_setting)
         self.gm_options.game_mode = selected_game_mode
         self.ui_options.show_game_modes = False
+        prefetch_frames(selected_game_mode)
 
     def handle_difficulty_button(self, speedup_scale, max_alien_speed):
         """Set the game difficulty (speed-up scale)."""
@@ -322,7 +325,17 @@ class GameButtonsManager:
         self.ui_options.show_difficulty = not self.ui_options.show_difficulty
 
     def handle_delete_button(self):
-        """Delete all high scores for the current game mode."""
+        """Ask to delete all high scores for the current game mode."""
+        self.game.confirm_dialog.open(
+            "Delete the high scores of this game mode?", self._confirm_delete
+        )
+
+    def _confirm_delete(self, confirm):
+        """Delete all high scores for the current game mode, if the deletion
+        was confirmed, and close the high scores.
+        """
+        if not confirm:
+            return
         game_mode = self.game.settings.game_modes.game_mode or "normal"
         high_score_key = GAME_MODE_SCORE_KEYS.get(game_mode, "high_scores")
         self.game.high_score_manager.delete_high_scores(high_score_key)
@@ -5,6 +5,8 @@ that manages the loading screen.
 
 import pygame
 
+from src.utils.text_cache import text_cache
+
 
 class LoadingScreen:
     """Manages the loading screen for the game,
@@ -17,8 +19,8 @@ class LoadingScreen:
         self.load_bar_width = 400
         self.load_bar_height = 25
         self.load_percent = 0
-        self.font = pygame.font.Font(None, 30)
-        self.text = self.font.render("Loading...", True, (255, 255, 255))
+        self.font = text_cache.get_font(None, 30)
+        self.text = text_cache.render(self.font, "Loading...", (255, 255, 255))
 
     def update(self, progress):
         """Update progress of the loading bar."""
@@ -8,17 +8,22 @@ import pygame
 
 from src.utils.game_utils import (
     display_controls,
-    load_single_image,
     display_high_scores,
     resize_image,
 )
+from src.managers.asset_manager import assets
 from src.utils.constants import GAME_MODE_SCORE_KEYS, GAME_MODE_DISPLAY_NAMES
+from src.utils.display_updater import display_updater
 
 
 class ScreenManager:
     """Updates the position of game objects after resizing the screen,
     manages the custom cursor and creates the images and positions
     for the controls displayed on the game menu.
+
+    The static parts of the menus are composed once in layers, which are
+    composed again only when the screen, the opened panels or the data
+    shown on them change.
     """
 
     def __init__(
@@ -29,10 +34,15 @@ class ScreenManager:
         self.score_board = score_board
         self.buttons = buttons_manager
         self.screen = screen
-        self.player_controls = load_single_image("buttons/player_controls.png")
+        self.player_controls = assets.get_image("buttons/player_controls.png")
         self.screen_flag = pygame.RESIZABLE
         self.full_screen = False
         self.singleplayer = singleplayer
+        self.menu_layer = None
+        self.menu_layer_key = None
+        self.game_menu_layer = None
+        self.game_menu_layer_pos = (0, 0)
+        self.game_menu_layer_key = None
         self._initialize_cursor()
         self.create_controls()
 
@@ -117,20 +127,29 @@ class ScreenManager:
         self.score_board.render_high_score()
         self.score_board.create_health()
         self.score_board.render_bullets_num()
+        self.invalidate_menu_layers()
+
+    def invalidate_menu_layers(self):
+        """Compose the menu layers again before they are drawn next, after
+        the buttons moved or the data shown on the menus changed."""
+        self.menu_layer_key = None
+        self.game_menu_layer_key = None
 
     def _initialize_cursor(self):
         """Set the normal cursor invisible and initialize the custom cursor."""
         pygame.mouse.set_visible(False)
-        cursor_width, cursor_height = self.screen.get_size()
+        # The cursor image is drawn 5 pixels right and 10 pixels down of the cursor rect.
+        cursor_width, cursor_height = self.settings.cursor_img.get_size()
         self.cursor_surface = pygame.Surface(
-            (cursor_width, cursor_height), pygame.SRCALPHA
+            (cursor_width + 5, cursor_height + 10), pygame.SRCALPHA
         )
+        self.cursor_surface.blit(self.settings.cursor_img, (5, 10))
 
     def draw_cursor(self):
         """Draw the custom in the location of the normal cursor."""
         self.settings.cursor_rect.center = pygame.mouse.get_pos()
-        self.cursor_surface.blit(self.settings.cursor_img, (5, 10))
-        self.screen.blit(self.cursor_surface, self.settings.cursor_rect)
+        cursor_rect = self.screen.blit(self.cursor_surface, self.settings.cursor_rect)
+        display_updater.add("cursor", cursor_rect)
 
     def create_controls(self):
         """This method creates the images and positions
@@ -150,33 +169,96 @@ class ScreenManager:
             self.game_controls_text,
             self.game_controls_text_rects,
         ) = display_controls(self.player_controls, self.screen)
+        self.invalidate_menu_layers()
 
     def draw_menu_objects(self, bg_img, bg_img_rect):
-        """Draw the buttons, game title and controls on the menu screen"""
-        self.screen.blit(bg_img, bg_img_rect)
-        self.screen.blit(self.p1_controls_img, self.p1_controls_img_rect)
-        self.screen.blit(self.p2_controls_img, self.p2_controls_img_rect)
-        self.screen.blit(self.game_controls_img, self.game_controls_img_rect)
-        self.screen.blit(self.settings.game_title, self.settings.game_title_rect)
-        self.buttons.single.draw_button()
-        self.buttons.multi.draw_button()
-        self.buttons.menu_quit.draw_button()
-
-        for i, surface in enumerate(self.p1_controls_text):
-            self.screen.blit(surface, self.p1_controls_text_rects[i])
-
-        for i, surface in enumerate(self.p2_controls_text):
-            self.screen.blit(surface, self.p2_controls_text_rects[i])
-
-        for i, surface in enumerate(self.game_controls_text):
-            self.screen.blit(surface, self.game_controls_text_rects[i])
-
-    def display_high_scores_on_screen(self):
-        """Display the high scores for the current game mode active"""
+        """Draw the background, buttons, game title and controls on the menu
+        screen, from the menu layer."""
+        key = (self.screen.get_size(), bg_img, tuple(bg_img_rect))
+        if key != self.menu_layer_key:
+            self.menu_layer = pygame.Surface(self.screen.get_size())
+            self._draw_menu_layer(self.menu_layer, bg_img, bg_img_rect)
+            self.menu_layer_key = key
+        self.screen.blit(self.menu_layer, (0, 0))
+
+    def _draw_menu_layer(self, surface, bg_img, bg_img_rect):
+        """Draw the background, buttons, game title and controls on the surface."""
+        surface.blit(bg_img, bg_img_rect)
+        surface.blit(self.p1_controls_img, self.p1_controls_img_rect)
+        surface.blit(self.p2_controls_img, self.p2_controls_img_rect)
+        surface.blit(self.game_controls_img, self.game_controls_img_rect)
+        surface.blit(self.settings.game_title, self.settings.game_title_rect)
+        self.buttons.single.draw_button(surface)
+        self.buttons.multi.draw_button(surface)
+        self.buttons.menu_quit.draw_button(surface)
+
+        for i, text_surface in enumerate(self.p1_controls_text):
+            surface.blit(text_surface, self.p1_controls_text_rects[i])
+
+        for i, text_surface in enumerate(self.p2_controls_text):
+            surface.blit(text_surface, self.p2_controls_text_rects[i])
+
+        for i, text_surface in enumerate(self.game_controls_text):
+            surface.blit(text_surface, self.game_controls_text_rects[i])
+
+    def draw_game_menu(self):
+        """Draw the game menu buttons and the opened panels from the game
+        menu layer, then the descriptions of the hovered buttons and ships.
+        The layer is transparent, so the background and the end game image
+        drawn before it stay visible."""
+        ui_options = self.game.ui_options
+        key = (
+            self.screen.get_size(),
+            ui_options.show_difficulty,
+            ui_options.show_high_scores,
+            ui_options.show_game_modes,
+            ui_options.ship_selection,
+            self.game.singleplayer,
+            self.settings.game_modes.game_mode,
+        )
+        if key != self.game_menu_layer_key:
+            self._compose_game_menu_layer()
+            self.game_menu_layer_key = key
+        self.screen.blit(self.game_menu_layer, self.game_menu_layer_pos)
+
+        if ui_options.show_game_modes:
+            self.buttons.display_description()
+        if ui_options.ship_selection:
+            self.game.ship_selection.draw_descriptions()
+
+    def _compose_game_menu_layer(self):
+        """Draw the game menu buttons and the opened panels on a transparent
+        layer, cropped to the area they cover."""
+        ui_options = self.game.ui_options
+        layer = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        self.buttons.draw_buttons(layer)
+
+        if ui_options.show_difficulty:
+            self.buttons.draw_difficulty_buttons(layer)
+
+        if ui_options.show_high_scores:
+            self.display_high_scores_on_screen(layer)
+            self.buttons.delete_scores.draw_button(layer)
+
+        if ui_options.show_game_modes:
+            self.buttons.draw_game_mode_buttons(layer)
+
+        if ui_options.ship_selection:
+            self.game.ship_selection.draw(layer)
+
+        bounding_rect = layer.get_bounding_rect()
+        self.game_menu_layer = layer.subsurface(bounding_rect).copy()
+        self.game_menu_layer_pos = bounding_rect.topleft
+
+    def display_high_scores_on_screen(self, surface=None):
+        """Display the high scores for the current game mode active
+        on the surface, the screen by default."""
+        if surface is None:
+            surface = self.screen
         game_mode = self.settings.game_modes.game_mode or "normal"
         high_score_key = GAME_MODE_SCORE_KEYS[game_mode]
         game_mode_name = GAME_MODE_DISPLAY_NAMES.get(game_mode, game_mode.replace("_", " ").upper())
-        display_high_scores(self, self.screen, high_score_key, game_mode_name)
+        display_high_scores(self, surface, high_score_key, game_mode_name)
 
     def display_pause(self):
         """Display the pause screen."""
@@ -42,9 +42,11 @@ class Button:
             self.rect.topleft = args
         self.rect.move_ip(x, y)
 
-    def draw_button(self):
-        """Draws the button."""
-        self.screen.blit(self.image, self.rect)
+    def draw_button(self, surface=None):
+        """Draws the button on the surface, the screen by default."""
+        if surface is None:
+            surface = self.screen
+        surface.blit(self.image, self.rect)
 
     def show_button_info(self):
         """Display the information about the button on the screen.
@@ -0,0 +1,157 @@
+"""
+The 'confirm_dialog' module provides the ConfirmDialog class, the yes or no
+question that is asked before the saved games or the high scores are deleted
+or overwritten.
+"""
+
+import pygame
+
+from src.utils.constants import (
+    BORDER_WIDTH,
+    DIALOG_BG_COLOR,
+    DIALOG_OVERLAY_COLOR,
+    DIALOG_PADDING,
+    SELECTED_SLOT_COLOR,
+    TEXT_PADDING_X,
+    TEXT_PADDING_Y,
+)
+from src.utils.display_updater import display_updater
+from src.utils.text_cache import text_cache
+
+
+class ConfirmDialog:
+    """A yes or no question drawn over the screen, in the loop of the screen
+    that opened it. While the dialog is open, that loop passes its events to
+    'handle_event' and draws the dialog over everything but the cursor with
+    'draw'. The answer is passed to the callback given to 'open'.
+
+    The dialog is answered with the mouse, with the arrows and Enter, or with
+    the Y and N keys. Escape answers no, which is also selected at first.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.font = text_cache.get_font("verdana", 22)
+        self.text_color = (225, 225, 225)
+
+        self.question = None
+        self.callback = None
+        self.yes_selected = False
+
+        self.layout_size = None
+        self.overlay = None
+        self.panel_rect = pygame.Rect(0, 0, 0, 0)
+        self.question_rect = pygame.Rect(0, 0, 0, 0)
+        self.yes_rect = pygame.Rect(0, 0, 0, 0)
+        self.no_rect = pygame.Rect(0, 0, 0, 0)
+
+    @property
+    def active(self):
+        """True while the dialog is open."""
+        return self.question is not None
+
+    def open(self, question, callback):
+        """Ask the question. The callback is called with True or False
+        when the dialog is answered.
+        """
+        self.question = question
+        self.callback = callback
+        self.yes_selected = False
+        self.layout_size = None
+        display_updater.update_all()
+
+    def handle_event(self, event):
+        """Answer the dialog with the event. Returns True if the event was
+        used by the dialog, so the screen behind it must ignore it. Quitting
+        and resizing the window are left to the screen.
+        """
+        if not self.active or event.type in (pygame.QUIT, pygame.VIDEORESIZE):
+            return False
+
+        if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_a, pygame.K_d):
+                self.yes_selected = not self.yes_selected
+            elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+                self._answer(self.yes_selected)
+            elif event.key == pygame.K_y:
+                self._answer(True)
+            elif event.key in (pygame.K_n, pygame.K_ESCAPE):
+                self._answer(False)
+        elif event.type == pygame.MOUSEMOTION:
+            if self.yes_rect.collidepoint(event.pos):
+                self.yes_selected = True
+            elif self.no_rect.collidepoint(event.pos):
+                self.yes_selected = False
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.yes_rect.collidepoint(event.pos):
+                self._answer(True)
+            elif self.no_rect.collidepoint(event.pos):
+                self._answer(False)
+        return True
+
+    def _answer(self, answer):
+        """Close the dialog and pass the answer to the callback."""
+        callback = self.callback
+        self.question = self.callback = None
+        display_updater.update_all()
+        callback(answer)
+
+    def _set_layout(self):
+        """Place the question and the answers in a panel in the middle of
+        the screen, and make the overlay that darkens the screen behind it.
+        """
+        screen_rect = self.screen.get_rect()
+        question = text_cache.render(self.font, self.question, self.text_color)
+        answer_height = self.font.get_linesize() + 2 * TEXT_PADDING_Y
+
+        self.panel_rect = pygame.Rect(
+            0,
+            0,
+            question.get_width() + 2 * DIALOG_PADDING,
+            question.get_height() + answer_height + 3 * DIALOG_PADDING,
+        )
+        self.panel_rect.center = screen_rect.center
+        self.question_rect = question.get_rect(
+            midtop=(self.panel_rect.centerx, self.panel_rect.top + DIALOG_PADDING)
+        )
+
+        answers_y = self.panel_rect.bottom - DIALOG_PADDING - answer_height // 2
+        quarter_width = self.panel_rect.width // 4
+        for name, center_x in (
+            ("yes", self.panel_rect.centerx - quarter_width),
+            ("no", self.panel_rect.centerx + quarter_width),
+        ):
+            text = text_cache.render(self.font, name.capitalize(), self.text_color)
+            rect = text.get_rect().inflate(4 * TEXT_PADDING_X, 2 * TEXT_PADDING_Y)
+            rect.center = (center_x, answers_y)
+            setattr(self, f"{name}_rect", rect)
+
+        if self.overlay is None or self.overlay.get_size() != screen_rect.size:
+            self.overlay = pygame.Surface(screen_rect.size, pygame.SRCALPHA)
+            self.overlay.fill(DIALOG_OVERLAY_COLOR)
+        self.layout_size = screen_rect.size
+
+    def draw(self):
+        """Draw the dialog over the screen, if it's open."""
+        if not self.active:
+            return
+        if self.layout_size != self.screen.get_size():
+            self._set_layout()
+
+        self.screen.blit(self.overlay, (0, 0))
+        pygame.draw.rect(self.screen, DIALOG_BG_COLOR, self.panel_rect)
+        pygame.draw.rect(
+            self.screen, SELECTED_SLOT_COLOR, self.panel_rect, BORDER_WIDTH
+        )
+        self.screen.blit(
+            text_cache.render(self.font, self.question, self.text_color),
+            self.question_rect,
+        )
+
+        for name, rect in (("Yes", self.yes_rect), ("No", self.no_rect)):
+            text = text_cache.render(self.font, name, self.text_color)
+            self.screen.blit(text, text.get_rect(center=rect.center))
+        selected_rect = self.yes_rect if self.yes_selected else self.no_rect
+        pygame.draw.rect(self.screen, SELECTED_SLOT_COLOR, selected_rect, BORDER_WIDTH)
+
+        display_updater.add("confirm_dialog", self.panel_rect)
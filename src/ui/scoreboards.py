@@ -3,21 +3,26 @@ The 'scoreboards' module contains the ScoreBoard class for
 managing the score and the HUD of the game.
 """
 
-import pygame.font
+import pygame
 
 from pygame.sprite import Group
 from src.entities.player_entities.player_health import Heart
+from src.managers.asset_manager import assets
 
 from src.utils.game_utils import (
-    load_single_image,
     get_boss_rush_title,
     draw_image,
     render_bullet_num,
 )
+from src.utils.text_cache import text_cache
 
 
 class ScoreBoard:
-    """A class to report scoring information."""
+    """A class to report scoring information.
+    The HUD is composed on a layer that is drawn again only when one of its
+    images changes. Gameplay code marks the changed parts with 'mark_dirty',
+    so they are rendered at most once per frame, before the HUD is shown.
+    """
 
     def __init__(self, game):
         """Initialize scorekeeping attributes."""
@@ -32,10 +37,25 @@ class ScoreBoard:
         # Font settings
         self.text_color = (238, 75, 43)
         self.level_color = "blue"
-        self.font = pygame.font.SysFont("", 27)
-        self.bullets_num_font = pygame.font.SysFont("", 25)
-        self.missiles_icon = load_single_image("other/missile_icon.png")
-        self.phoenix_missiles_icon = load_single_image("other/phoenix_missile_icon.png")
+        self.font = text_cache.get_font("", 27)
+        self.bullets_num_font = text_cache.get_font("", 25)
+        self.missiles_icon = assets.get_image("other/missile_icon.png")
+        self.phoenix_missiles_icon = assets.get_image("other/phoenix_missile_icon.png")
+
+        # The HUD parts waiting to be rendered, mapped to their render methods.
+        # The order matters, the scores are positioned relative to the level.
+        self.render_methods = {
+            "level": self.prep_level,
+            "scores": self.render_scores,
+            "high_score": self.render_high_score,
+            "missiles": self.render_missiles_num,
+            "bullets": self.render_bullets_num,
+            "health": self.create_health,
+        }
+        self.dirty_parts = set()
+        self.hud_layer = None
+        self.hud_blits = []
+        self.hud_key = None
 
         # Prepare the initial score and player health images.
         self.prep_level()
@@ -53,7 +73,7 @@ class ScoreBoard:
         """Render the score for a ship and update the corresponding attributes."""
         rounded_score = round(score)
         score_str = f"{ship_name}: {rounded_score:,}"
-        score_img = self.font.render(score_str, True, self.text_color, None)
+        score_img = text_cache.render(self.font, score_str, self.text_color)
         score_rect = score_img.get_rect()
 
         score_rect.right = self.level_rect.centerx + offset_x
@@ -101,8 +121,8 @@ class ScoreBoard:
 
         for missile in ship_missiles:
             missiles_str = str(missile.missiles_num)
-            rend_missiles_num = self.font.render(
-                missiles_str, True, (71, 71, 71, 255), None
+            rend_missiles_num = text_cache.render(
+                self.font, missiles_str, (71, 71, 71, 255)
             )
             missiles_rect = rend_missiles_num.get_rect()
             missiles_img_rect = self.missiles_icon.get_rect()
@@ -125,8 +145,8 @@ class ScoreBoard:
         """
         high_score = round(self.stats.high_score)
         high_score_str = f"High Score: {high_score:,}"
-        self.high_score_image = self.font.render(
-            high_score_str, True, self.text_color, None
+        self.high_score_image = text_cache.render(
+            self.font, high_score_str, self.text_color
         )
 
         # Set the position of the high score image.
@@ -134,6 +154,20 @@ class ScoreBoard:
         self.high_score_rect.centerx = self.level_rect.centerx
         self.high_score_rect.top = self.thunderbird_score_rect.top
 
+    def update_scores(self):
+        """Update the high score and mark the scores to be rendered again.
+        Used when the scores change during gameplay, so that many kills
+        in the same frame render the scores only once.
+        """
+        self.stats.high_score = self.stats.thunderbird_score + self.stats.phoenix_score
+        self.mark_dirty("scores", "high_score")
+
+    def mark_dirty(self, *parts):
+        """Mark HUD parts to be rendered again before the HUD is shown.
+        The parts are the keys of 'render_methods'.
+        """
+        self.dirty_parts.update(parts)
+
     def update_high_score(self):
         """Updates the high score if the current score is higher and,
         renders the new high score on screen."""
@@ -158,7 +192,7 @@ class ScoreBoard:
         level_str = level_titles.get(
             self.settings.game_modes.game_mode, f"Level {str(self.stats.level)}"
         )
-        self.level_image = self.font.render(level_str, True, self.level_color, None)
+        self.level_image = text_cache.render(self.font, level_str, self.level_color)
         self._position_level_image(self.level_image)
 
     def _position_level_image(self, level_image):
@@ -216,64 +250,154 @@ class ScoreBoard:
         including player scores, remaining missiles and bullets,
         high score, current level, and remaining health of each player's ship.
         """
-        self.draw_player_scores()
-        self.draw_missiles_info()
-        self.draw_level()
-        self.draw_high_score()
-        self.draw_player_health()
-        self.draw_bullets_info()
-
-    def draw_player_scores(self):
-        """Draw player scores to the screen."""
-        draw_image(
-            self.screen, self.thunderbird_score_image, self.thunderbird_score_rect
+        self.update_hud()
+        self.screen.blits(self.hud_blits, doreturn=False)
+
+    def update_hud(self):
+        """Render the dirty parts and compose the HUD layer again
+        if any of the images or the visible elements changed.
+        """
+        for part, render_method in self.render_methods.items():
+            if part in self.dirty_parts:
+                render_method()
+        self.dirty_parts.clear()
+
+        hud_key = self._get_hud_key()
+        if hud_key != self.hud_key:
+            self.hud_key = hud_key
+            self._compose_hud()
+
+    def _get_hud_key(self):
+        """Return the images and the flags that change the composed HUD.
+        The images are compared by identity, since every render creates new ones.
+        """
+        return (
+            self.screen.get_size(),
+            self.game.singleplayer,
+            self.thunderbird_ship.state.alive,
+            self.phoenix_ship.state.alive,
+            self.settings.game_modes.last_bullet,
+            self.settings.game_modes.cosmic_conflict,
+            self.thunderbird_score_image,
+            self.phoenix_score_image,
+            self.high_score_image,
+            self.level_image,
+            self.thunderbird_rend_missiles_num,
+            getattr(self, "phoenix_rend_missiles_num", None),
+            getattr(self, "thunder_bullets_num_img", None),
+            getattr(self, "phoenix_bullets_num_img", None),
+            self.thunderbird_health,
+            self.phoenix_health,
         )
+
+    def _compose_hud(self):
+        """Draw the HUD elements on the layer and prepare the blits of the
+        top and bottom areas of the layer that contain them.
+        """
+        if (
+            self.hud_layer is None
+            or self.hud_layer.get_size() != self.screen.get_size()
+        ):
+            self.hud_layer = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        self.hud_layer.fill((0, 0, 0, 0))
+
+        self.draw_player_scores(self.hud_layer)
+        self.draw_missiles_info(self.hud_layer)
+        self.draw_level(self.hud_layer)
+        self.draw_high_score(self.hud_layer)
+        self.draw_player_health(self.hud_layer)
+        self.draw_bullets_info(self.hud_layer)
+
+        layer_rect = self.hud_layer.get_rect()
+        self.hud_blits = []
+        for area in self._get_hud_areas():
+            area = area.clip(layer_rect)
+            if area.width and area.height:
+                self.hud_blits.append((self.hud_layer.subsurface(area), area))
+
+    def _get_hud_areas(self):
+        """Return the areas of the screen covered by the HUD, one for
+        the elements at the top and one for the missiles at the bottom.
+        """
+        top_rects = [
+            self.thunderbird_score_rect,
+            self.phoenix_score_rect,
+            self.high_score_rect,
+            *(heart.rect for heart in self.thunderbird_health),
+            *(heart.rect for heart in self.phoenix_health),
+        ]
+        if self.settings.game_modes.last_bullet:
+            top_rects.extend(
+                (self.thunder_bullets_num_rect, self.phoenix_bullets_num_rect)
+            )
+        bottom_rects = [
+            self.thunderbird_missiles_rect,
+            self.thunderbird_missiles_img_rect,
+        ]
+        if hasattr(self, "phoenix_missiles_rect"):
+            bottom_rects.extend(
+                (self.phoenix_missiles_rect, self.phoenix_missiles_img_rect)
+            )
+        return [
+            self.level_rect.unionall(top_rects),
+            bottom_rects[0].unionall(bottom_rects[1:]),
+        ]
+
+    def draw_player_scores(self, surface=None):
+        """Draw player scores to the surface, the screen by default."""
+        surface = surface or self.screen
+        draw_image(surface, self.thunderbird_score_image, self.thunderbird_score_rect)
         if not self.game.singleplayer:
-            draw_image(self.screen, self.phoenix_score_image, self.phoenix_score_rect)
+            draw_image(surface, self.phoenix_score_image, self.phoenix_score_rect)
 
-    def draw_missiles_info(self):
-        """Draw player missiles info to the screen."""
+    def draw_missiles_info(self, surface=None):
+        """Draw player missiles info to the surface, the screen by default."""
+        surface = surface or self.screen
         draw_image(
-            self.screen,
+            surface,
             self.thunderbird_rend_missiles_num,
             self.thunderbird_missiles_rect,
         )
-        draw_image(self.screen, self.missiles_icon, self.thunderbird_missiles_img_rect)
+        draw_image(surface, self.missiles_icon, self.thunderbird_missiles_img_rect)
 
         if not self.game.singleplayer:
             draw_image(
-                self.screen, self.phoenix_rend_missiles_num, self.phoenix_missiles_rect
+                surface, self.phoenix_rend_missiles_num, self.phoenix_missiles_rect
             )
             draw_image(
-                self.screen, self.phoenix_missiles_icon, self.phoenix_missiles_img_rect
+                surface, self.phoenix_missiles_icon, self.phoenix_missiles_img_rect
             )
 
-    def draw_bullets_info(self):
+    def draw_bullets_info(self, surface=None):
         """Draw bullets info for the Last Bullet game mode."""
+        surface = surface or self.screen
         if self.settings.game_modes.last_bullet:
             draw_image(
-                self.screen, self.thunder_bullets_num_img, self.thunder_bullets_num_rect
+                surface, self.thunder_bullets_num_img, self.thunder_bullets_num_rect
             )
 
             if not self.game.singleplayer:
                 draw_image(
-                    self.screen,
+                    surface,
                     self.phoenix_bullets_num_img,
                     self.phoenix_bullets_num_rect,
                 )
 
-    def draw_level(self):
-        """Draw the current level to the screen."""
-        draw_image(self.screen, self.level_image, self.level_rect)
+    def draw_level(self, surface=None):
+        """Draw the current level to the surface, the screen by default."""
+        draw_image(surface or self.screen, self.level_image, self.level_rect)
 
-    def draw_high_score(self):
-        """Draw the high score to the screen, if applicable."""
+    def draw_high_score(self, surface=None):
+        """Draw the high score to the surface, if applicable."""
         if not self.settings.game_modes.cosmic_conflict:
-            draw_image(self.screen, self.high_score_image, self.high_score_rect)
+            draw_image(
+                surface or self.screen, self.high_score_image, self.high_score_rect
+            )
 
-    def draw_player_health(self):
-        """Draw the remaining health of each player's ship to the screen."""
+    def draw_player_health(self, surface=None):
+        """Draw the remaining health of each player's ship to the surface."""
+        surface = surface or self.screen
         if self.thunderbird_ship.state.alive:
-            self.thunderbird_health.draw(self.screen)
+            self.thunderbird_health.draw(surface)
         if self.phoenix_ship.state.alive and not self.game.singleplayer:
-            self.phoenix_health.draw(self.screen)
+            self.phoenix_health.draw(surface)
@@ -11,32 +11,67 @@ The constants include the following:
 - 'explosion_frames': a list of frames used for explosion animations.
 - 'asteroid_frames': a list of frames used for asteroid sprites.
 - 'empower_frames': a list of frames used for empower animations.
-"""
-
-from src.utils.game_utils import load_frames
-
-destroy_frames = load_frames("destroyed/destroyed-0{}.png", 15, start=1)
 
-ship_images = load_frames("ships/ship{}.png", 6, start=1)
-
-warp_frames = load_frames("warp/warp_{}.png", 9)
+The frames are not loaded when the module is imported. Each list is loaded
+the first time it is accessed, either as a module attribute or through
+'get_frames', and 'prefetch_frames' can load them ahead on a background thread.
+"""
 
-shield_frames = load_frames("shield/shield-0{}.png", 11)
+from src.managers.asset_manager import assets
 
-immune_frames = load_frames("immune/immune-0{}.png", 11, start=1)
+# Maps each animation name to the arguments used to load its frames:
+# (filename pattern, number of frames, start index, rotation).
+ANIMATION_FRAMES = {
+    "destroy_frames": ("destroyed/destroyed-0{}.png", 15, 1, None),
+    "ship_images": ("ships/ship{}.png", 6, 1, None),
+    "warp_frames": ("warp/warp_{}.png", 9, 0, None),
+    "shield_frames": ("shield/shield-0{}.png", 11, 0, None),
+    "immune_frames": ("immune/immune-0{}.png", 11, 1, None),
+    "immune_frames_cosmic": ("immune/immune-0{}.png", 11, 1, 90),
+    "explosion_frames": ("explosion/explosion1_{:04d}.png", 89, 2, None),
+    "asteroid_frames": ("asteroid/Asteroid-A-09-{:03d}.png", 120, 0, None),
+    "empower_frames": ("empower/empower-0{}.png", 6, 1, None),
+    "missile_frames": ("projectiles/missiles/missile-0{}.png", 9, 1, None),
+    "missile_ex_frames": ("missile_explosion/missile_ex-0{}.png", 9, 1, None),
+    "alien_immune_frames": ("alien_immune/immune-0{}.png", 20, 1, None),
+    "laser_frames": ("projectiles/laser/laser-0{}.png", 9, 1, None),
+}
 
-immune_frames_cosmic = load_frames("immune/immune-0{}.png", 11, start=1, rotate=90)
+# Animations used in every game mode.
+GAMEPLAY_FRAMES = (
+    "destroy_frames",
+    "explosion_frames",
+    "missile_frames",
+    "missile_ex_frames",
+    "alien_immune_frames",
+    "laser_frames",
+    "asteroid_frames",
+)
 
-explosion_frames = load_frames("explosion/explosion1_{:04d}.png", 89, start=2)
+# Extra animations that are needed only by some of the game modes.
+GAME_MODE_FRAMES = {
+    "cosmic_conflict": ("immune_frames_cosmic",),
+}
 
-asteroid_frames = load_frames("asteroid/Asteroid-A-09-{:03d}.png", 120)
 
-empower_frames = load_frames("empower/empower-0{}.png", 6, start=1)
+def get_frames(name):
+    """Return the frames for the given animation name, loading them
+    the first time they are requested.
+    """
+    return assets.get_frames(*ANIMATION_FRAMES[name])
 
-missile_frames = load_frames("projectiles/missiles/missile-0{}.png", 9, start=1)
 
-missile_ex_frames = load_frames("missile_explosion/missile_ex-0{}.png", 9, start=1)
+def prefetch_frames(game_mode=None):
+    """Start loading the frames used by the given game mode on a background
+    thread. This is only a hint, the frames are still loaded on first access
+    if the prefetch did not finish yet.
+    """
+    names = GAMEPLAY_FRAMES + GAME_MODE_FRAMES.get(game_mode, ())
+    return assets.prefetch(ANIMATION_FRAMES[name] for name in names)
 
-alien_immune_frames = load_frames("alien_immune/immune-0{}.png", 20, start=1)
 
-laser_frames = load_frames("projectiles/laser/laser-0{}.png", 9, start=1)
+def __getattr__(name):
+    """Load the frames when they are accessed as a module attribute."""
+    if name in ANIMATION_FRAMES:
+        return get_frames(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
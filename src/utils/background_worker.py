@@ -0,0 +1,81 @@
+"""
+The 'background_worker' module contains the BackgroundWorker class that runs
+the slow work, like writing and reading the save files, on a background
+thread, so the game loop keeps running while it's done.
+
+The module also creates the 'background_worker' instance which is shared by the whole game.
+"""
+
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BackgroundWorker:
+    """Runs tasks on background threads. With one thread, the tasks run one
+    at a time in the order they were submitted, so a file is never read
+    while an earlier task is still writing it.
+
+    The callbacks of the finished tasks are called on the main thread by
+    'poll', since pygame must only be used from the main thread.
+    """
+
+    def __init__(self, max_workers=1):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="background_worker"
+        )
+        self.pending = set()
+        self.finished = queue.SimpleQueue()
+
+    def submit(self, task, *args, callback=None):
+        """Run the task with the arguments on the background thread.
+        The callback is called by 'poll' with the future of the task,
+        after the task has finished. Returns the future of the task.
+        """
+        future = self.executor.submit(task, *args)
+        self.pending.add(future)
+        future.add_done_callback(lambda done: self.finished.put((done, callback)))
+        return future
+
+    def poll(self):
+        """Call the callbacks of the tasks that finished since the last poll."""
+        while True:
+            try:
+                finished = self.finished.get_nowait()
+            except queue.Empty:
+                return
+            self._finish(*finished)
+
+    def _finish(self, future, callback):
+        """Forget the finished task and call its callback."""
+        self.pending.discard(future)
+        if callback:
+            callback(future)
+
+    @property
+    def busy(self):
+        """True while a submitted task has not finished, or its callback
+        was not called yet.
+        """
+        return bool(self.pending)
+
+    def wait(self, timeout=None):
+        """Wait until the submitted tasks finish and call their callbacks,
+        also for the tasks submitted by these callbacks. A task is finished
+        once its future was queued, which happens after the future is done.
+        Returns False if the timeout passed before that.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.pending:
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.monotonic())
+            try:
+                finished = self.finished.get(timeout=remaining)
+            except queue.Empty:
+                break
+            self._finish(*finished)
+        return not self.pending
+
+
+background_worker = BackgroundWorker()
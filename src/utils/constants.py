@@ -347,6 +347,9 @@ METEOR_MADNESS_MUSIC = {range(1, 999): "meteor_madness/meteor_music.mp3"}
 
 MUSIC_LIST = ["menu", "game_over"]
 
+# The sound files are decoded by this number of background threads.
+SOUND_LOADER_THREADS = 4
+
 # Dict used to map alien images to game level.
 LEVEL_PREFIX = {
     1: "Alien1",
@@ -368,6 +371,55 @@ GAME_CONSTANTS = {
     "MAX_AS_FREQ": 200,
 }
 
+# Spatial hash settings used for the collision broadphase.
+# Groups with fewer sprites than the minimum are checked by brute force.
+SPATIAL_HASH_CELL_SIZE = 64
+SPATIAL_HASH_MIN_SPRITES = 16
+
+# The bullet groups are moved and collided as NumPy arrays, when NumPy is
+# installed, only from this size. Smaller groups are faster as sprites.
+PROJECTILE_ARRAYS_MIN_SPRITES = 32
+
+# Frame spike watchdog settings.
+# Frames longer than the budget are stored in a ring buffer of the given size,
+# which is written to the log file when F4 is pressed.
+FRAME_SPIKE_BUDGET_MS = 25
+FRAME_SPIKE_LOG_SIZE = 50
+FRAME_SPIKE_LOG_FILE = "frame_spikes.log"
+
+# The number of rendered text surfaces kept by the text cache.
+TEXT_CACHE_SIZE = 256
+
+# The number of free sprites kept for reuse by each sprite pool.
+SPRITE_POOL_MAX_SIZE = 256
+
+# The fleet is moved with NumPy arrays from this number of aliens.
+FLEET_ARRAYS_MIN_ALIENS = 32
+# The distance from the screen within which the alien sprites are kept up to
+# date every frame. It covers the missile explosions at the top of the screen.
+FLEET_VISIBLE_MARGIN = 120
+
+# The game clock advances by one tick each time the game logic runs, at 60
+# ticks per second. Each new game starts an hour of game time after the
+# previous one, so the times left from the previous game look long ago.
+GAME_TICK_MS = 1000 / 60
+GAME_CLOCK_GAP_TICKS = 60 * 60 * 60
+# The game logic runs at the tick rate whatever the frame rate is. When the
+# frames are too slow, at most this number of ticks run before the next frame
+# and the rest of the delay is dropped, so the game slows down instead.
+MAX_CATCH_UP_TICKS = 5
+# The frame rate the game screen is drawn at, 0 draws as fast as possible.
+TARGET_FPS = 60
+# The menus and the pause screen sleep while nothing on them moves, until
+# an event arrives, waking up at least this often for the timed messages.
+IDLE_WAKE_MS = 250
+# The idle percentage of the frame pacer is measured over windows this long.
+IDLE_STATS_WINDOW_MS = 1000
+
+# Replays are recorded in this folder, in the given version of the format.
+REPLAY_FOLDER = "replays"
+REPLAY_VERSION = 1
+
 
 DIFFICULTIES = {
     "EASY": 0.2,
@@ -400,6 +452,20 @@ GAME_MODE_DISPLAY_NAMES = {
 }
 
 # CONSTANTS FOR THE SAVE/LOAD FEATURE
+# The games are saved in the given version of the save format, the save
+# files of other versions are not loaded.
+SAVE_VERSION = 3
+# The save files are decompressed in chunks of this size, to show the progress.
+SAVE_READ_CHUNK_SIZE = 64 * 1024
+# How long the messages about the saved game are shown, in milliseconds.
+SAVE_NOTICE_TIME = 1000
+# The date of the saved games, as written in the save files.
+SAVE_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+# The summaries of the save files are kept in this file in the save folder.
+SAVE_INDEX_FILE = "save_index.json"
+SAVE_INDEX_VERSION = 2
+# The size of the screenshots saved with the games and shown in the load menu.
+SAVE_THUMBNAIL_SIZE = (64, 35)
 DATA_KEYS = [
     # Other Game Stats"level",
     "high_score",
@@ -509,10 +575,18 @@ TEXT_PADDING_Y = 5
 SELECTED_SLOT_COLOR = (173, 216, 230)
 BORDER_WIDTH = 2
 
+# Confirmation dialog settings.
+# The screen behind the dialog is darkened by an overlay of the given color.
+DIALOG_BG_COLOR = (2, 24, 49)
+DIALOG_OVERLAY_COLOR = (0, 0, 0, 150)
+DIALOG_PADDING = 20
+
 # HIGH SCORES related constants
 SINGLE_PLAYER_FILE = "single_high_score.json"
 MULTI_PLAYER_FILE = "high_score.json"
-DEFAULT_HIGH_SCORES = {"high_scores": [0] * 10}
+DEFAULT_HIGH_SCORES = {"high_scores": []}
+# The number of high scores kept for each game mode.
+HIGH_SCORES_LIMIT = 10
 RANK_POSITIONS = {1: "1st", 2: "2nd", 3: "3rd"}
 
 # Ships settings
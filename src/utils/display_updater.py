@@ -0,0 +1,69 @@
+"""
+The 'display_updater' module contains the DisplayUpdater class that pushes
+the drawn frames to the display. In the dirty rects mode only the parts of
+the screen that changed since the last frame are updated, which saves most
+of the pixel traffic on the static screens of the game.
+
+The module also creates the 'display_updater' instance which is shared by the whole game.
+"""
+
+import pygame
+
+
+class DisplayUpdater:
+    """Updates the display with the whole screen, or in the dirty rects mode
+    with the rects drawn in this frame and the previous one. The things that
+    move on a static screen, like the cursor, set the rects they are drawn at,
+    by a key that is unique to each of them.
+
+    The whole screen is updated when the background scrolls, on the input
+    events other than the mouse motion, since they can change anything on
+    the screen, and when the state of the screen changes.
+    """
+
+    def __init__(self, dirty_rects=False):
+        self.dirty_rects = dirty_rects
+        self.full_update = True
+        self.state = None
+        self.rects = {}
+        self.last_rects = {}
+
+    def add(self, key, *rects):
+        """Set the rects that the thing with the given key was drawn at in
+        this frame. A thing drawn more than once before the frame is pushed
+        to the display keeps only its last rects.
+        """
+        if self.dirty_rects and rects:
+            self.rects[key] = pygame.Rect(rects[0]).unionall(rects[1:])
+
+    def update_all(self):
+        """Update the whole screen with the next frame."""
+        self.full_update = True
+
+    def check_event(self, event):
+        """Update the whole screen after the events that can change it."""
+        if event.type != pygame.MOUSEMOTION:
+            self.full_update = True
+
+    def update(self, state=None):
+        """Push the frame to the display. 'state' describes what the screen
+        shows, the whole screen is updated when it changes.
+        """
+        if state != self.state:
+            self.state = state
+            self.full_update = True
+
+        if not self.dirty_rects or self.full_update:
+            pygame.display.flip()
+        elif self.rects or self.last_rects:
+            # The old rects are updated too, to erase what moved away.
+            pygame.display.update(
+                list(self.last_rects.values()) + list(self.rects.values())
+            )
+
+        self.last_rects = self.rects
+        self.rects = {}
+        self.full_update = False
+
+
+display_updater = DisplayUpdater()
@@ -0,0 +1,73 @@
+"""
+The 'frame_pacer' module contains the FramePacer class that paces the loops
+of the game, the menus and the other screens that wait for the player. It
+caps their frame rate and lets the idle screens sleep until the player does
+something, instead of drawing the same frame again and again.
+
+The module also creates the 'frame_pacer' instance which is shared by the whole game.
+"""
+
+import time
+
+import pygame
+
+from src.utils.constants import IDLE_STATS_WINDOW_MS, IDLE_WAKE_MS, TARGET_FPS
+
+
+class FramePacer:
+    """Waits between the frames of a loop. The loop draws at most 'fps'
+    frames per second, and when nothing on its screen is animating it blocks
+    until an event arrives, waking up at least every 'idle_wake_ms' for the
+    things that change with time.
+
+    The share of the time spent waiting is measured over windows of
+    'stats_window_ms' and kept in 'idle_percent'.
+    """
+
+    def __init__(
+        self,
+        fps=TARGET_FPS,
+        idle_wake_ms=IDLE_WAKE_MS,
+        stats_window_ms=IDLE_STATS_WINDOW_MS,
+    ):
+        self.fps = fps
+        self.idle_wake_ms = idle_wake_ms
+        self.stats_window_ms = stats_window_ms
+        self.clock = pygame.time.Clock()
+
+        self.last_time = None
+        self.busy_ms = 0.0
+        self.idle_ms = 0.0
+        self.idle_percent = 0.0
+
+    def wait(self, animating=False, fps=None):
+        """Wait before the next frame of the loop. Without 'animating' the
+        wait lasts until an event arrives, the event is left in the queue
+        for the loop to handle. 'fps' overrides the frame rate cap.
+        """
+        start = time.perf_counter()
+        if not animating and not pygame.event.peek():
+            event = pygame.event.wait(self.idle_wake_ms)
+            if event.type != pygame.NOEVENT:
+                pygame.event.post(event)
+        self.clock.tick(self.fps if fps is None else fps)
+
+        end = time.perf_counter()
+        if self.last_time is not None:
+            self._add_times((start - self.last_time) * 1000, (end - start) * 1000)
+        self.last_time = end
+
+    def _add_times(self, busy_ms, idle_ms):
+        """Add the time spent on a frame and waiting after it, and update
+        the idle percentage at the end of each window.
+        """
+        self.busy_ms += busy_ms
+        self.idle_ms += idle_ms
+        total_ms = self.busy_ms + self.idle_ms
+        if total_ms >= self.stats_window_ms:
+            self.idle_percent = 100 * self.idle_ms / total_ms
+            self.busy_ms = 0.0
+            self.idle_ms = 0.0
+
+
+frame_pacer = FramePacer()
@@ -0,0 +1,96 @@
+"""
+The 'game_clock' module contains the GameClock class that measures the game
+time in ticks of the game logic, instead of the wall clock. The game time
+doesn't pass while the game is paused or a menu is open, and a replayed
+game sees exactly the same times as the recorded one.
+
+The module also creates the 'game_clock' instance which is shared by the whole game.
+The FixedTimestep class decides how many ticks of the game logic to run
+before each rendered frame, to keep the tick rate constant.
+"""
+
+import time
+
+from src.utils.constants import (
+    GAME_CLOCK_GAP_TICKS,
+    GAME_TICK_MS,
+    MAX_CATCH_UP_TICKS,
+)
+
+
+class GameClock:
+    """A clock that advances by one tick each time the game logic runs.
+    'get_ticks' and 'time' replace pygame.time.get_ticks and time.time
+    for everything that happens in the game.
+    """
+
+    def __init__(self, tick_ms=GAME_TICK_MS):
+        self.tick_ms = tick_ms
+        self.ticks = 0
+
+    def tick(self):
+        """Advance the clock by one tick."""
+        self.ticks += 1
+
+    def start_game(self, start_tick=None):
+        """Move the clock far ahead before a new game, so the times left
+        from the previous game, and the times initialized to 0, look as
+        long ago as in a freshly started game. A replayed game starts at
+        the recorded tick instead. Returns the starting tick.
+        """
+        if start_tick is None:
+            start_tick = self.ticks + GAME_CLOCK_GAP_TICKS
+        self.ticks = start_tick
+        return start_tick
+
+    def get_ticks(self):
+        """Return the game time in milliseconds."""
+        return int(self.ticks * self.tick_ms)
+
+    def time(self):
+        """Return the game time in seconds."""
+        return self.ticks * self.tick_ms / 1000
+
+
+class FixedTimestep:
+    """Counts the wall time that passed between the frames and turns it into
+    ticks of the game logic, so the game runs at the same speed whatever the
+    frame rate is. The time left over is carried to the next frame. When the
+    game falls behind, no more than 'max_ticks' ticks run before a frame.
+    """
+
+    def __init__(self, tick_ms=GAME_TICK_MS, max_ticks=MAX_CATCH_UP_TICKS):
+        self.tick_ms = tick_ms
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def reset(self):
+        """Forget the time that passed, after a pause or when a game starts.
+        The first frame after a reset runs one tick.
+        """
+        self.last_time = None
+
+    def advance(self, now=None):
+        """Return the number of ticks to run before the next frame.
+        'now' is the current time in milliseconds.
+        """
+        if now is None:
+            now = time.perf_counter() * 1000
+        if self.last_time is None:
+            self.accumulator = self.tick_ms
+        else:
+            self.accumulator += now - self.last_time
+        self.last_time = now
+
+        ticks = int(self.accumulator // self.tick_ms)
+        if ticks > self.max_ticks:
+            # Too far behind to catch up, drop the rest of the delay.
+            ticks = self.max_ticks
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= ticks * self.tick_ms
+        return ticks
+
+
+game_clock = GameClock()
@@ -1,6 +1,6 @@
 """
-The 'game_dataclasses' module contains the UIOptions, GameModes and
-ShipStates data classes taht are used in different parts of the game."""
+The 'game_dataclasses' module contains the UIOptions, GameModes,
+ShipStates and ShipActions data classes taht are used in different parts of the game."""
 
 from dataclasses import dataclass
 
@@ -49,3 +49,18 @@ class ShipStates:
     scaled: bool = False
     scaled_weapon: bool = False
     firing: bool = False
+
+
+@dataclass
+class ShipActions:
+    """Represents the input of one player for a single game tick,
+    used to control the ships without keyboard events.
+    """
+
+    left: bool = False
+    right: bool = False
+    up: bool = False
+    down: bool = False
+    firing: bool = False
+    missile: bool = False
+    laser: bool = False
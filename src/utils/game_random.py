@@ -0,0 +1,29 @@
+"""
+The 'game_random' module contains the GameRandom class, the random number
+generator used for everything that happens in the game. Each game is seeded
+on its own, so it can be played again the same way from its seed.
+
+The module also creates the 'rng' instance which is shared by the whole game.
+"""
+
+import random
+
+
+class GameRandom(random.Random):
+    """A random.Random that remembers the seed it was last seeded with.
+    Seeding without a value picks a new random seed.
+    """
+
+    def __init__(self, seed=None):
+        self.seed_value = None
+        super().__init__(seed)
+
+    def seed(self, a=None, version=2):
+        """Seed with a new 32-bit seed if none is given, kept in 'seed_value'."""
+        if a is None:
+            a = random.SystemRandom().getrandbits(32)
+        self.seed_value = a
+        super().seed(a, version)
+
+
+rng = GameRandom()
@@ -2,7 +2,6 @@
 
 import os
 import sys
-import json
 import pygame
 
 from src.utils.constants import (
@@ -14,9 +13,12 @@ from src.utils.constants import (
     BOSS_BULLETS_IMG,
     SINGLE_PLAYER_FILE,
     MULTI_PLAYER_FILE,
-    DEFAULT_HIGH_SCORES,
     RANK_POSITIONS,
 )
+from src.utils.display_updater import display_updater
+from src.utils.frame_pacer import frame_pacer
+from src.utils.high_score_store import high_score_store
+from src.utils.text_cache import text_cache
 
 if hasattr(sys, "_MEIPASS"):
     # Running as a PyInstaller bundle
@@ -146,17 +148,11 @@ def load_boss_bullets():
 # SOUND RELATED FUNCTIONS:
 
 
-def load_sound_files(sounds_dict):
-    """A function that loads multiple sounds from a dict of the form:
-    key: sound name:
-    value: path to sound location."""
-    if not pygame.mixer.get_init():
-        pygame.mixer.init()
-
-    return {
-        key: pygame.mixer.Sound(os.path.join(SOUND_PATH, value))
-        for key, value in sounds_dict.items()
-    }
+def load_sound_file(sound_path):
+    """Load the sound from its path in the sounds folder. The mixer must be
+    initialized already, so the sound can also be loaded on another thread.
+    """
+    return pygame.mixer.Sound(os.path.join(SOUND_PATH, sound_path))
 
 
 def load_music_files(music_dict):
@@ -180,12 +176,6 @@ def play_music(music_files, music_name):
         pygame.mixer.music.play(-1)
 
 
-def set_sounds_volume(sounds, volume):
-    """Set the volume for all sounds in the passed sounds dict."""
-    for sound in sounds.values():
-        sound.set_volume(volume)
-
-
 def set_music_volume(music, volume):
     """Set the volume of all music."""
     for _ in music.values():
@@ -204,7 +194,13 @@ def get_available_channels():
 
 
 def play_sound(sounds_list, sound_name):
-    """Plays a certain sound located in the 'sounds_list' on an available sound channel."""
+    """Plays a certain sound located in the 'sounds_list' on an available sound channel.
+    Sounds that were not loaded are skipped.
+    """
+    sound = sounds_list.get(sound_name)
+    if sound is None:
+        return
+
     if sound_name == "bullet":
         channel = pygame.mixer.Channel(7)
     elif sound_name == "alien_exploding":
@@ -214,7 +210,7 @@ def play_sound(sounds_list, sound_name):
     else:
         channel = pygame.mixer.Channel(1)
 
-    channel.play(sounds_list[sound_name])
+    channel.play(sound)
 
 
 # MISC FUNCTIONS:
@@ -251,21 +247,22 @@ def get_boss_rush_title(level):
 def display_description(screen, description, text_x, text_y):
     """Render description on screen."""
     _, screen_height = screen.get_size()
-    font = pygame.font.SysFont("verdana", 15)
+    font = text_cache.get_font("verdana", 15)
     text_surfaces, text_rects = render_text(
         description, font, "white", (text_x, text_y), int(screen_height * 0.03)
     )
 
     for i, surface in enumerate(text_surfaces):
         screen.blit(surface, text_rects[i])
+    display_updater.add(("description", text_x, text_y), *text_rects)
 
 
 def render_bullet_num(bullets, x_pos, y_pos, right_aligned=False):
     """Renders the bullet number and returns the image and rect."""
-    font = pygame.font.SysFont("", 25)
+    font = text_cache.get_font("", 25)
     text_color = (238, 75, 43)
     bullets_str = f"Remaining bullets: {bullets}" if bullets else ""
-    bullets_num_img = font.render(bullets_str, True, text_color, None)
+    bullets_num_img = text_cache.render(font, bullets_str, text_color)
     bullets_num_rect = bullets_num_img.get_rect()
     bullets_num_rect.top = y_pos
 
@@ -279,8 +276,8 @@ def render_bullet_num(bullets, x_pos, y_pos, right_aligned=False):
 
 def display_message(screen, message, duration):
     """Display a message on the screen for a specified amount of time."""
-    font = pygame.font.SysFont("verdana", 14)
-    text = font.render(message, True, (255, 255, 255))
+    font = text_cache.get_font("verdana", 14)
+    text = text_cache.render(font, message, (255, 255, 255))
     rect = text.get_rect(center=(screen.get_width() / 2, screen.get_height() / 2 - 50))
     screen.blit(text, rect)
     pygame.display.flip()
@@ -290,11 +287,11 @@ def display_message(screen, message, duration):
 def display_custom_message(screen, message, ship, cosmic=False, powers=False):
     """Display a message to the right of the ship."""
     ship_rect = ship.rect
-    font = pygame.font.SysFont("verdana", 10)
+    font = text_cache.get_font("verdana", 10)
     if powers:
-        text = font.render(message, True, (173, 216, 230))
+        text = text_cache.render(font, message, (173, 216, 230))
     else:
-        text = font.render(message, True, (255, 0, 0))
+        text = text_cache.render(font, message, (255, 0, 0))
 
     if cosmic:
         text_rect = text.get_rect(top=ship_rect.top - 20, left=ship_rect.left + 5)
@@ -317,9 +314,9 @@ def render_text(text, font, color, start_pos, line_spacing, second_color=None):
         line = line.replace("\t", " " * tab_width)
 
         if i == 0 and second_color:
-            text_surface = font.render(line, True, second_color, None)
+            text_surface = text_cache.render(font, line, second_color)
         else:
-            text_surface = font.render(line, True, color, None)
+            text_surface = text_cache.render(font, line, color)
 
         text_rect = text_surface.get_rect(
             topleft=(start_pos[0], start_pos[1] + i * line_spacing)
@@ -341,7 +338,7 @@ def calculate_control_positions(center, x_offset):
 def display_controls(controls_surface, surface):
     """Display controls on screen."""
     center = surface.get_rect().center
-    font = pygame.font.SysFont("verdana", 16, bold=True)
+    font = text_cache.get_font("verdana", 16, bold=True)
     color = "white"
 
     p1_controls_img, p1_controls_img_rect = load_controls_image(
@@ -407,7 +404,7 @@ def display_controls(controls_surface, surface):
 
 def render_simple_text(text, font, color, x, y):
     """Render a simple text."""
-    text_surface = font.render(text, True, color)
+    text_surface = text_cache.render(font, text, color)
     text_rect = text_surface.get_rect()
     text_rect.center = (x, y)
     return text_surface, text_rect
@@ -425,7 +422,7 @@ def display_simple_message(screen, text, font, color, delay_time):
 
 def display_muted_state_message(screen, text):
     """Display a simple message on screen for the muted state of the game."""
-    font = pygame.font.SysFont("arial", 15)
+    font = text_cache.get_font("arial", 15)
     color = "lightblue"
 
     message_surface, message_rect = render_simple_text(
@@ -433,20 +430,17 @@ def display_muted_state_message(screen, text):
     )
 
     screen.blit(message_surface, message_rect)
+    display_updater.add("muted_message", message_rect)
 
 
 # HIGH SCORE RELATED FUNCTIONS:
 
 
 def load_high_scores(game):
-    """Load the high score data from the JSON file or create a new high score list."""
+    """Return the high scores of the single player or the multiplayer games,
+    from the high score store."""
     filename = SINGLE_PLAYER_FILE if game.singleplayer else MULTI_PLAYER_FILE
-    try:
-        with open(filename, "r", encoding="utf-8") as score_file:
-            high_scores = json.load(score_file)
-    except (FileNotFoundError, json.JSONDecodeError):
-        high_scores = DEFAULT_HIGH_SCORES
-    return high_scores
+    return high_score_store.get_high_scores(filename)
 
 
 def display_high_scores(game, screen, score_key, game_mode_name):
@@ -484,8 +478,8 @@ def display_high_scores(game, screen, score_key, game_mode_name):
     score_x = int(center_x - 270)
     score_y = rank_y
 
-    title_font = pygame.font.SysFont("impact", int(screen_height * 0.045))
-    scores_font = pygame.font.SysFont("impact", int(screen_height * 0.035))
+    title_font = text_cache.get_font("impact", int(screen_height * 0.045))
+    scores_font = text_cache.get_font("impact", int(screen_height * 0.035))
 
     text_surfaces, text_rects = render_text(
         f"{game_mode_name} HIGH SCORES",
@@ -518,7 +512,7 @@ def draw_buttons(screen, button_info, font, text_color):
         pygame.draw.rect(
             screen, (0, 0, 0, 0), button["rect"]
         )  # Set background color to transparent
-        text_surface = font.render(button["label"], True, text_color)
+        text_surface = text_cache.render(font, button["label"], text_color)
         text_x = button["rect"].centerx - text_surface.get_width() // 2
         text_y = button["rect"].centery - 13
         screen.blit(text_surface, (text_x, text_y))
@@ -526,7 +520,7 @@ def draw_buttons(screen, button_info, font, text_color):
 
 def render_label(screen, text, pos, text_font, text_color):
     """Render label on screen."""
-    text_surface = text_font.render(text, True, text_color)
+    text_surface = text_cache.render(text_font, text, text_color)
     text_x = pos[0] - text_surface.get_width() // 2
     text_y = pos[1] - 18
     screen.blit(text_surface, (text_x, text_y))
@@ -538,8 +532,8 @@ def get_player_name(
     """Get the player name for the high score."""
 
     # Set up fonts and colors
-    font = pygame.font.SysFont("verdana", 19)
-    text_font = pygame.font.SysFont("verdana", 23)
+    font = text_cache.get_font("verdana", 19)
+    text_font = text_cache.get_font("verdana", 23)
     text_color = pygame.Color("silver")
 
     # Set up input box and initial player name
@@ -592,13 +586,13 @@ def get_player_name(
         # Draw the input box and player name
         pygame.draw.rect(screen, text_color, input_box, 1)
         screen.blit(
-            font.render(player_name, True, pygame.Color(90, 90, 90)),
+            text_cache.render(font, player_name, pygame.Color(90, 90, 90)),
             (input_box.x + 5, input_box.y),
         )
 
         # Draw the high score
-        high_score_surface = text_font.render(
-            f"High Score: {high_score}", True, text_color
+        high_score_surface = text_cache.render(
+            text_font, f"High Score: {high_score}", text_color
         )
         screen.blit(
             high_score_surface,
@@ -619,3 +613,4 @@ def get_player_name(
         cursor()
 
         pygame.display.flip()
+        frame_pacer.wait()
@@ -0,0 +1,185 @@
+"""
+The 'high_score_store' module contains the HighScoreStore class that keeps
+the high scores in memory. Each high score file is read once, the first time
+its scores are needed, and every change is written back to it by a
+background thread, so the menus never wait for the disk.
+
+The module also creates the 'high_score_store' instance which is shared by the whole game.
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+
+from src.utils.constants import DEFAULT_HIGH_SCORES, HIGH_SCORES_LIMIT
+
+
+class HighScoreStore:
+    """The high scores of each file, by the score key of the game mode.
+    The scores of each game mode are kept sorted from the highest, at most
+    'max_scores' of them, as dicts with the name and the score.
+
+    A file is written by replacing it with a complete temporary file, so a
+    crash while saving never leaves it half written. When the scores change
+    again before the write starts, only the latest scores are written.
+    """
+
+    def __init__(self, max_scores=HIGH_SCORES_LIMIT):
+        self.max_scores = max_scores
+        self.files = {}
+        self.pending = {}
+        self.writing = False
+        self.condition = threading.Condition()
+        self.writer_thread = None
+
+    def get_high_scores(self, filename):
+        """Return a copy of the high scores of all the game modes in the file."""
+        with self.condition:
+            high_scores = self._load(filename)
+            return {
+                score_key: [dict(entry) for entry in scores]
+                for score_key, scores in high_scores.items()
+            }
+
+    def get_scores(self, filename, score_key):
+        """Return a copy of the high scores of the game mode, from the highest."""
+        with self.condition:
+            scores = self._load(filename).get(score_key, [])
+            return [dict(entry) for entry in scores]
+
+    def has_name(self, filename, score_key, name):
+        """Return True if the game mode has a high score with the name."""
+        return any(
+            entry["name"] == name for entry in self.get_scores(filename, score_key)
+        )
+
+    def insert(self, filename, score_key, name, score):
+        """Add the score to the high scores of the game mode and save them.
+        A high score with the same score is replaced by the new one.
+        Returns the rank of the score, or None if it's not high enough.
+        """
+        new_entry = {"name": name, "score": score}
+        with self.condition:
+            high_scores = self._load(filename)
+            scores = high_scores.get(score_key, [])
+            for i, entry in enumerate(scores):
+                if entry["score"] == score:
+                    scores[i] = new_entry
+                    break
+            else:
+                scores.append(new_entry)
+
+            high_scores[score_key] = self._sort_scores(scores)
+            self._save(filename)
+            for rank, entry in enumerate(high_scores[score_key], 1):
+                if entry is new_entry:
+                    return rank
+            return None
+
+    def delete(self, filename, score_key):
+        """Delete the high scores of the game mode and save the file."""
+        with self.condition:
+            high_scores = self._load(filename)
+            if score_key in high_scores:
+                del high_scores[score_key]
+                self._save(filename)
+
+    def flush(self, timeout=None):
+        """Wait until all the changes are written to the files.
+        Returns False if the timeout passed before that.
+        """
+        with self.condition:
+            return self.condition.wait_for(
+                lambda: not self.pending and not self.writing, timeout
+            )
+
+    def clear(self):
+        """Forget the loaded files, after writing the changes, so they are
+        read again the next time their scores are needed.
+        """
+        self.flush()
+        with self.condition:
+            self.files.clear()
+
+    def _load(self, filename):
+        """Return the high scores of the file, reading it the first time.
+        A missing or damaged file starts with the default high scores.
+        """
+        if filename not in self.files:
+            try:
+                with open(filename, "r", encoding="utf-8") as score_file:
+                    high_scores = json.load(score_file)
+            except (FileNotFoundError, json.JSONDecodeError):
+                high_scores = DEFAULT_HIGH_SCORES
+            self.files[filename] = {
+                score_key: self._sort_scores(scores)
+                for score_key, scores in high_scores.items()
+                if isinstance(scores, list)
+            }
+        return self.files[filename]
+
+    def _sort_scores(self, scores):
+        """Return the valid scores sorted from the highest, at most 'max_scores'."""
+        entries = [
+            entry
+            for entry in scores
+            if isinstance(entry, dict) and "name" in entry and "score" in entry
+        ]
+        entries.sort(key=lambda entry: entry["score"], reverse=True)
+        return entries[: self.max_scores]
+
+    def _save(self, filename):
+        """Queue a copy of the high scores of the file to be written."""
+        self.pending[filename] = {
+            score_key: [dict(entry) for entry in scores]
+            for score_key, scores in self.files[filename].items()
+        }
+        if self.writer_thread is None:
+            self.writer_thread = threading.Thread(
+                target=self._write_pending, daemon=True
+            )
+            self.writer_thread.start()
+            # Write the last changes before the game exits.
+            atexit.register(self.flush)
+        self.condition.notify_all()
+
+    def _write_pending(self):
+        """Write the queued high scores, one file at a time."""
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending)
+                filename, high_scores = self.pending.popitem()
+                self.writing = True
+            try:
+                write_file_atomically(filename, high_scores)
+            except OSError:
+                # The scores stay in memory and are written with the next change.
+                pass
+            finally:
+                with self.condition:
+                    self.writing = False
+                    self.condition.notify_all()
+
+
+def write_file_atomically(filename, data):
+    """Write the data as JSON to a temporary file next to the file,
+    then replace the file with it.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    file_descriptor, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(filename)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+            json.dump(data, temp_file)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, filename)
+    except OSError:
+        os.remove(temp_path)
+        raise
+
+
+high_score_store = HighScoreStore()
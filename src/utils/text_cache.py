@@ -0,0 +1,87 @@
+"""
+The 'text_cache' module contains the TextCache class that keeps the fonts
+and the most recently rendered text surfaces, so the UI text is not rendered
+again every frame.
+
+The module also creates the 'text_cache' instance which is shared by the whole game.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+from src.utils.constants import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """A registry of fonts keyed by (name, size, bold) and an LRU cache of
+    text surfaces keyed by (font, text, color, background).
+    Fonts can't be used after pygame quits, so everything is cleared then.
+    """
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, name, size, bold=False):
+        """Return the font with the given name, size and weight.
+        A name of None loads the default pygame font, any other name
+        is looked up in the system fonts.
+        """
+        key = (name, size, bold)
+        if key not in self.fonts:
+            if not self.fonts:
+                # Quit functions are called only once, so register again
+                # every time the registry is filled after being cleared.
+                pygame.register_quit(self.clear)
+            if name is None:
+                font = pygame.font.Font(None, size)
+            else:
+                font = pygame.font.SysFont(name, size, bold=bold)
+            self.fonts[key] = font
+        return self.fonts[key]
+
+    def render(self, font, text, color, background=None):
+        """Return the antialiased text rendered with the font.
+        The returned surface is shared, so it must not be modified.
+        """
+        key = (font, text, self._color_key(color), self._color_key(background))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def _color_key(color):
+        """Return a hashable key for the color, pygame.Color is not hashable."""
+        if isinstance(color, pygame.Color):
+            return tuple(color)
+        return color
+
+    def get_stats(self):
+        """Return the number of cached fonts and surfaces, and the hits and misses."""
+        return {
+            "fonts": len(self.fonts),
+            "surfaces": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self):
+        """Remove all the cached fonts and surfaces."""
+        self.fonts.clear()
+        self.surfaces.clear()
+
+
+text_cache = TextCache()
@@ -105,6 +105,9 @@ class TestAnimations(unittest.TestCase):
         # Mock the necessary objects and functions
         mock_surface = MagicMock(spec=pygame.Surface)
         mock_surface.get_rect.return_value = MagicMock()
+        self.addCleanup(
+            setattr, pygame.transform, "smoothscale", pygame.transform.smoothscale
+        )
         pygame.transform.smoothscale = MagicMock(return_value=mock_surface)
 
         self.animations.change_ship_size(scale_factor)
@@ -0,0 +1,24 @@
+"""
+This module tests the helpers used by the stress scenarios benchmark.
+"""
+
+import unittest
+
+from src.benchmarks.stress_scenarios import summarize
+
+
+class TestSummarize(unittest.TestCase):
+    """Test cases for the summarize function."""
+
+    def test_summarize(self):
+        """Test the statistics of the samples."""
+        summary = summarize([float(value) for value in range(1, 101)])
+
+        self.assertEqual(summary["mean"], 50.5)
+        self.assertEqual(summary["median"], 50.5)
+        self.assertEqual(summary["p95"], 96.0)
+        self.assertEqual(summary["max"], 100.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
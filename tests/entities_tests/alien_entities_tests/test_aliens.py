@@ -6,12 +6,12 @@ game.
 import unittest
 from unittest.mock import MagicMock, patch
 
-import time
 import random
 
 import pygame
 
 from src.entities.alien_entities.aliens import Alien
+from src.utils.game_clock import GameClock
 
 
 class TestAlien(unittest.TestCase):
@@ -23,6 +23,13 @@ class TestAlien(unittest.TestCase):
         self.screen = MagicMock(spec=pygame.Surface)
         self.screen.get_rect.return_value = pygame.Rect(0, 0, 800, 600)
         self.game.screen = self.screen
+        self.game_clock = GameClock()
+        self.game_clock.ticks = 600
+        patcher = patch(
+            "src.entities.alien_entities.aliens.game_clock", self.game_clock
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
         self.alien = Alien(self.game)
 
     def test_init(self):
@@ -119,7 +126,7 @@ class TestAlien(unittest.TestCase):
 
         # Test when the alien is in the frozen state
         self.alien.frozen_state = True
-        initial_time = time.time()
+        initial_time = self.game_clock.time()
         self.alien.frozen_start_time = (
             initial_time - self.alien.settings.frozen_time - 1
         )
@@ -131,7 +138,7 @@ class TestAlien(unittest.TestCase):
 
         # Test when the alien is in the immune state
         self.alien.immune_state = True
-        initial_time = time.time()
+        initial_time = self.game_clock.time()
         self.alien.immune_start_time = (
             initial_time - self.alien.settings.alien_immune_time - 1
         )
@@ -156,7 +163,9 @@ class TestAlien(unittest.TestCase):
             # Generate a random number of splits between 1 and 4
             actual_splits = random.randint(1, 4)
 
-            with patch("random.randint") as mock_randint:
+            with patch(
+                "src.entities.alien_entities.aliens.rng.randint"
+            ) as mock_randint:
                 mock_randint.return_value = actual_splits
                 self.alien.split_alien()
                 # Verify that the Alien class is called the expected number of times
@@ -4,11 +4,12 @@ alien bosses in the game.
 """
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pygame
 
 from src.entities.alien_entities.aliens import BossAlien
+from src.utils.game_clock import GameClock
 
 
 class TestBossAlien(unittest.TestCase):
@@ -18,6 +19,11 @@ class TestBossAlien(unittest.TestCase):
         """Set up the test environment."""
         self.game = MagicMock()
         self.game.screen = pygame.Surface((800, 600))
+        game_clock = GameClock()
+        game_clock.ticks = 600
+        patcher = patch("src.entities.alien_entities.aliens.game_clock", game_clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
         self.boss_alien = BossAlien(self.game)
         self.boss_alien.destroy = MagicMock()
 
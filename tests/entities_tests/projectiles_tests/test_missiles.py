@@ -100,6 +100,24 @@ class TestMissile(unittest.TestCase):
         self.assertEqual(self.missile.image, initial_image)
         mock_rotate.assert_not_called()
 
+    def test_reset(self):
+        """Test that a reused missile is the same as a new one."""
+        destroy_anim = self.missile.destroy_anim
+        self.missile.explode()
+        self.missile.destroy_delay = 0
+        destroy_anim.current_frame = 3
+        destroy_anim.frame_counter = 2
+        new_ship = MagicMock()
+
+        self.missile.reset(self.game, new_ship)
+
+        self.assertIs(self.missile.ship, new_ship)
+        self.assertFalse(self.missile.is_destroyed)
+        self.assertEqual(self.missile.destroy_delay, 50)
+        self.assertIs(self.missile.destroy_anim, destroy_anim)
+        self.assertEqual(destroy_anim.current_frame, 0)
+        self.assertEqual(destroy_anim.frame_counter, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
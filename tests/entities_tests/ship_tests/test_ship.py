@@ -75,13 +75,12 @@ class ShipTestCase(unittest.TestCase):
         self.assertEqual(self.ship.ship_speed, 7)
 
     @patch("src.entities.player_entities.ship.Ship.reset_ship_size")
-    @patch("pygame.time.get_ticks")
-    @patch("src.entities.player_entities.ship.time.time")
-    def test_update_state(self, mock_time, mock_get_ticks, mock_reset_ship_size):
+    @patch("src.entities.player_entities.ship.game_clock")
+    def test_update_state(self, mock_game_clock, mock_reset_ship_size):
         """Test case for the update_state method."""
         mock_image = MagicMock()
-        mock_time.return_value = 10
-        mock_get_ticks.return_value = 10
+        mock_game_clock.time.return_value = 10
+        mock_game_clock.get_ticks.return_value = 10
 
         # Set up initial state and values
         self.ship.state.immune = True
@@ -307,9 +306,14 @@ class ShipTestCase(unittest.TestCase):
 
     def test_start_warp(self):
         """Test the start_warp method."""
+        self.ship.anims.warp_index = 5
+        self.ship.anims.warp_counter = 3
+
         self.ship.start_warp()
 
         self.assertTrue(self.ship.state.warping)
+        self.assertEqual(self.ship.anims.warp_index, 0)
+        self.assertEqual(self.ship.anims.warp_counter, 0)
 
     def test_set_immune(self):
         """Test the set_immune method."""
@@ -381,6 +385,9 @@ class ShipTestCase(unittest.TestCase):
         self.ship.state.scaled_weapon = True
         self.ship.state.shielded = True
         self.ship.state.immune = True
+        self.ship.state.exploding = True
+        self.ship.state.empowered = True
+        self.ship.anims.current_explosion_frame = 4
         self.ship.aliens_killed = 10
         self.ship.last_laser_time = 100
         self.ship.laser_fired = True
@@ -399,6 +406,9 @@ class ShipTestCase(unittest.TestCase):
         self.assertFalse(self.ship.state.scaled_weapon)
         self.assertFalse(self.ship.state.shielded)
         self.assertFalse(self.ship.state.immune)
+        self.assertFalse(self.ship.state.exploding)
+        self.assertFalse(self.ship.state.empowered)
+        self.assertEqual(self.ship.anims.current_explosion_frame, 0)
         self.assertEqual(
             self.ship.aliens_killed, self.game.settings.required_kill_count
         )
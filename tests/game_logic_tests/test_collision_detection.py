@@ -11,6 +11,7 @@ import pygame
 from src.game_logic.collision_detection import CollisionManager
 from src.entities.projectiles.missile import Missile
 from src.entities.alien_entities.aliens import BossAlien
+from src.managers.pool_manager import PoolManager
 
 
 class TestCollisionManager(unittest.TestCase):
@@ -24,6 +25,7 @@ class TestCollisionManager(unittest.TestCase):
         self.game.thunderbird_ship = self.thunderbird_ship
         self.game.phoenix_ship = self.phoenix_ship
         self.game.ships = [self.thunderbird_ship, self.phoenix_ship]
+        self.game.projectile_arrays = {}
         self.collision_manager = CollisionManager(self.game)
 
     def test_init(self):
@@ -359,8 +361,7 @@ class TestCollisionManager(unittest.TestCase):
 
         self.assertEqual(self.game.stats.phoenix_score, score_increment)
         self.assertTrue(hit_function.called)
-        self.assertTrue(self.game.score_board.render_scores.called)
-        self.assertTrue(self.game.score_board.update_high_score.called)
+        self.assertTrue(self.game.score_board.update_scores.called)
 
         # Phoenix ship test case
         ship = self.phoenix_ship
@@ -371,8 +372,7 @@ class TestCollisionManager(unittest.TestCase):
 
         self.assertEqual(self.game.stats.thunderbird_score, score_increment)
         self.assertTrue(hit_function.called)
-        self.assertTrue(self.game.score_board.render_scores.called)
-        self.assertTrue(self.game.score_board.update_high_score.called)
+        self.assertTrue(self.game.score_board.update_scores.called)
 
     @patch("src.game_logic.collision_detection.play_sound")
     @patch("src.game_logic.collision_detection.get_colliding_sprites")
@@ -472,8 +472,7 @@ class TestCollisionManager(unittest.TestCase):
         alien.kill.assert_called_once()
         self.assertEqual(self.game.stats.thunderbird_score, 900)
         self.assertEqual(self.game.stats.phoenix_score, 900)
-        self.game.score_board.render_scores.assert_called_once()
-        self.game.score_board.update_high_score.assert_called_once()
+        self.game.score_board.update_scores.assert_called_once()
 
     def test_check_aliens_bottom_aliens_above_bottom(self):
         """Test the check_aliens_bottom when aliens have not
@@ -495,8 +494,7 @@ class TestCollisionManager(unittest.TestCase):
         self.assertEqual(self.game.stats.phoenix_score, 1000)
 
         alien.kill.assert_not_called()
-        self.game.score_board.render_scores.assert_not_called()
-        self.game.score_board.update_high_score.assert_not_called()
+        self.game.score_board.update_scores.assert_not_called()
 
     def test_check_missile_alien_collisions(self):
         """Test the check_missile_alien_collisions method."""
@@ -536,7 +534,7 @@ class TestCollisionManager(unittest.TestCase):
         )
         self.assertEqual(self.collision_manager._play_missile_sound.call_count, 2)
 
-    @patch("src.game_logic.collision_detection.time.time")
+    @patch("src.game_logic.collision_detection.game_clock.time")
     def test_check_laser_alien_collisions(self, mock_time):
         """Test the check_laser_alien_collisions method."""
         self.collision_manager._update_stats = MagicMock()
@@ -653,9 +651,9 @@ class TestCollisionManager(unittest.TestCase):
         self.thunderbird_ship.state.immune = True
         self.phoenix_ship.state.immune = False
 
-        alien_bullet = MagicMock(spec=pygame.sprite.Sprite)
-        alien_bullet.rect = MagicMock()
-        self.game.alien_bullet = [alien_bullet]
+        alien_bullet = pygame.sprite.Sprite()
+        alien_bullet.rect = pygame.Rect(0, 0, 10, 10)
+        self.game.alien_bullet = pygame.sprite.Group(alien_bullet)
 
         self.collision_manager.check_alien_bullets_collisions(
             thunderbird_hit, phoenix_hit
@@ -715,8 +713,7 @@ class TestCollisionManager(unittest.TestCase):
             self.game.stats.thunderbird_score, self.game.settings.boss_points
         )
         self.assertEqual(self.game.stats.phoenix_score, 0)
-        self.game.score_board.render_scores.assert_called_once()
-        self.game.score_board.update_high_score.assert_called_once()
+        self.game.score_board.update_scores.assert_called_once()
 
     def test_handle_alien_hits_boss_alien(self):
         """Test the handle_alien_hits with a boss."""
@@ -824,8 +821,7 @@ class TestCollisionManager(unittest.TestCase):
         self.game.aliens.remove.assert_called_once_with(alien)
 
         # Assert that the methods were called for each player one time.
-        self.assertEqual(self.game.score_board.render_scores.call_count, 2)
-        self.assertEqual(self.game.score_board.update_high_score.call_count, 2)
+        self.assertEqual(self.game.score_board.update_scores.call_count, 2)
 
     @patch("src.game_logic.collision_detection.play_sound")
     def test_check_missile_ex_collision_with_aliens(self, mock_play_sound):
@@ -891,11 +887,134 @@ class TestCollisionManager(unittest.TestCase):
             boss, player
         )
         self.assertEqual(
-            self.collision_manager.handled_collisions, {(missile, boss): True}
+            self.collision_manager.handled_collisions,
+            {(missile.launch_id, boss): True},
         )
 
         self.collision_manager._update_stats.assert_not_called()
 
+    @patch("src.game_logic.collision_detection.play_sound")
+    def test_reused_missile_hits_boss_again(self, mock_play_sound):
+        """Test that a missile reused from the sprite pool hits the same boss
+        again, once for each launch.
+        """
+        pools = PoolManager()
+        self.game.settings.game_modes.cosmic_conflict = False
+        ship = MagicMock()
+        ship.rect = pygame.Rect(100, 600, 50, 50)
+        boss = MagicMock(spec=BossAlien)
+        boss.hit_count = 0
+        self.collision_manager._handle_boss_alien_collision = MagicMock()
+
+        missile = pools.acquire(Missile, self.game, ship)
+        for _ in range(2):
+            self.collision_manager._hande_missile_explosion_with_bosses(
+                boss, "thunderbird", missile
+            )
+        self.assertEqual(boss.hit_count, 5)
+
+        pools.release(missile)
+        pools.recycle()
+        reused_missile = pools.acquire(Missile, self.game, ship)
+        self.collision_manager._hande_missile_explosion_with_bosses(
+            boss, "thunderbird", reused_missile
+        )
+
+        self.assertIs(reused_missile, missile)
+        self.assertEqual(boss.hit_count, 10)
+        self.assertEqual(mock_play_sound.call_count, 2)
+
+    def _create_fleet(self, num, size=40):
+        """Create a row of real sprites, large enough to use the spatial hash."""
+        fleet = []
+        for index in range(num):
+            sprite = pygame.sprite.Sprite()
+            sprite.rect = pygame.Rect(index * size * 2, 0, size, size)
+            fleet.append(sprite)
+        return pygame.sprite.Group(fleet), fleet
+
+    def test_get_nearby_sprites_small_group(self):
+        """Test that small groups are returned without using the spatial hash."""
+        group, _ = self._create_fleet(3)
+
+        result = self.collision_manager._get_nearby_sprites(
+            group, pygame.Rect(0, 0, 1, 1)
+        )
+
+        self.assertIs(result, group)
+        self.assertEqual(self.collision_manager.spatial_hashes, {})
+
+    def test_get_nearby_sprites_large_group(self):
+        """Test that large groups are filtered through the spatial hash."""
+        group, fleet = self._create_fleet(30)
+
+        result = self.collision_manager._get_nearby_sprites(
+            group, pygame.Rect(0, 0, 40, 40)
+        )
+
+        self.assertEqual(result, [fleet[0]])
+        self.assertIn(id(group), self.collision_manager.spatial_hashes)
+        self.assertIn(id(group), self.collision_manager.fresh_spatial_hashes)
+
+    def test_get_nearby_sprites_skips_removed_sprites(self):
+        """Test that sprites removed after the rebuild are not returned."""
+        group, fleet = self._create_fleet(30)
+        rect = pygame.Rect(0, 0, 40, 40)
+        self.collision_manager._get_nearby_sprites(group, rect)
+
+        fleet[0].kill()
+
+        self.assertEqual(self.collision_manager._get_nearby_sprites(group, rect), [])
+
+    def test_refresh_spatial_hash(self):
+        """Test that refreshing the spatial hash picks up moved sprites."""
+        group, fleet = self._create_fleet(30)
+        rect = pygame.Rect(1000, 500, 40, 40)
+        self.collision_manager._get_nearby_sprites(group, rect)
+        fleet[0].rect.topleft = rect.topleft
+
+        self.assertEqual(self.collision_manager._get_nearby_sprites(group, rect), [])
+
+        self.collision_manager.refresh_spatial_hash(group)
+        self.assertEqual(
+            self.collision_manager._get_nearby_sprites(group, rect), [fleet[0]]
+        )
+
+        self.collision_manager.refresh_spatial_hash()
+        self.assertEqual(self.collision_manager.fresh_spatial_hashes, set())
+
+    def test_groupcollide_matches_pygame(self):
+        """Test that _groupcollide gives the same results as groupcollide."""
+        aliens, fleet = self._create_fleet(30)
+        bullets = pygame.sprite.Group()
+        for alien in fleet[::3]:
+            bullet = pygame.sprite.Sprite()
+            bullet.rect = pygame.Rect(0, 0, 10, 10)
+            bullet.rect.center = alien.rect.bottomright
+            bullets.add(bullet)
+        missed_bullet = pygame.sprite.Sprite()
+        missed_bullet.rect = pygame.Rect(0, 600, 10, 10)
+        bullets.add(missed_bullet)
+
+        expected = pygame.sprite.groupcollide(bullets, aliens, False, False)
+        result = self.collision_manager._groupcollide(bullets, aliens, True)
+
+        self.assertEqual(result, expected)
+        self.assertEqual(bullets.sprites(), [missed_bullet])
+
+    def test_missile_explosion_candidates(self):
+        """Test that bosses are always candidates for the missile explosion."""
+        group, fleet = self._create_fleet(30)
+        boss = MagicMock(spec=BossAlien)
+        boss.rect = pygame.Rect(2000, 2000, 40, 40)
+        group.add(boss)
+
+        result = self.collision_manager._get_missile_explosion_candidates(
+            group, pygame.Rect(0, 0, 40, 40)
+        )
+
+        self.assertEqual(result, [boss, fleet[0]])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -355,7 +355,7 @@ class TestGameplayManager(unittest.TestCase):
 
         self.assertEqual(self.settings.alien_bullets_num, 6)
 
-    @patch("pygame.time.get_ticks")
+    @patch("src.game_logic.gameplay_handler.game_clock.get_ticks")
     def test_meteor_madness(self, mock_get_ticks):
         """Test the meteor_madness method."""
         # Case when the time has not yet passed and the level was not increased.
@@ -367,7 +367,6 @@ class TestGameplayManager(unittest.TestCase):
         self.gameplay_handler._prepare_asteroids_level = MagicMock()
         mock_get_ticks.return_value = 1000
 
-        self.game.pause_time = 0
         self.gameplay_handler.last_level_time = 0
         self.gameplay_handler.level_time = 1000
 
@@ -520,7 +519,7 @@ class TestGameplayManager(unittest.TestCase):
             bullets_manager
         )
 
-    @patch("time.time")
+    @patch("src.game_logic.gameplay_handler.game_clock.time")
     def test_endless_onslaught(self, mock_time):
         """Test the endless_onslaught method."""
         # Case when the time has passed and the alien stats got increased.
@@ -555,7 +554,7 @@ class TestGameplayManager(unittest.TestCase):
         self.assertEqual(self.gameplay_handler.settings.alien_bullet_speed, 2.0)
         self.assertEqual(self.gameplay_handler.last_increase_time, 100)
 
-    @patch("time.time")
+    @patch("src.game_logic.gameplay_handler.game_clock.time")
     def test_slow_burn(self, mock_time):
         """Test the slow_burn method."""
         asteroid_handler = MagicMock()
@@ -12,6 +12,7 @@ from src.game_logic.input_handling import PlayerInput
 from src.entities.projectiles.missile import Missile
 from src.entities.projectiles.laser import Laser
 from src.entities.projectiles.player_bullets import Thunderbolt
+from src.utils.game_dataclasses import ShipActions
 
 
 class TestPlayerInput(unittest.TestCase):
@@ -248,6 +249,17 @@ class TestPlayerInput(unittest.TestCase):
         )
         self.player_input._handle_phoenix_controls.assert_not_called()
 
+    def test_record_key(self):
+        """Test that only the ship control keys are recorded in the replay."""
+        recorder = self.game.replay_recorder
+
+        self.player_input._record_key(pygame.K_SPACE, True)
+        recorder.record_key.assert_called_once_with(pygame.K_SPACE, True)
+
+        recorder.reset_mock()
+        self.player_input._record_key(pygame.K_ESCAPE, True)
+        recorder.record_key.assert_not_called()
+
     def test_check_keyup_events_thunderbird_controls(self):
         """Test the keyup events for the thunderbird controls."""
         self.game.thunderbird_ship.moving_flags = {
@@ -333,7 +345,7 @@ class TestPlayerInput(unittest.TestCase):
             elif key == pygame.K_RSHIFT:
                 self.assertFalse(self.game.phoenix_ship.laser_fired)
 
-    @patch("src.game_logic.input_handling.pygame.time.get_ticks")
+    @patch("src.game_logic.input_handling.game_clock.get_ticks")
     def test_handle_ship_firing(self, mock_get_ticks):
         """Test the handle_ship_firing."""
         fire_bullet_method_mock = MagicMock()
@@ -482,6 +494,42 @@ class TestPlayerInput(unittest.TestCase):
 
         self.assertTrue(self.game.phoenix_ship.laser_fired)
 
+    def test_apply_actions(self):
+        """Test applying the actions of a game tick to the ships."""
+        self.game.thunderbird_ship.state.alive = True
+        self.game.thunderbird_ship.state.warping = False
+        self.game.thunderbird_ship.state.exploding = False
+        self.game.thunderbird_ship.moving_flags = {}
+        fire_missile_method = MagicMock()
+        fire_laser_method = MagicMock()
+        actions = {"thunderbird": ShipActions(left=True, firing=True, missile=True)}
+
+        self.player_input.apply_actions(actions, fire_missile_method, fire_laser_method)
+
+        self.assertEqual(
+            self.game.thunderbird_ship.moving_flags,
+            {"left": True, "right": False, "up": False, "down": False},
+        )
+        self.assertTrue(self.game.thunderbird_ship.state.firing)
+        fire_missile_method.assert_called_once_with(
+            self.game.thunderbird_missiles,
+            self.game.thunderbird_ship,
+            missile_class=Missile,
+        )
+        fire_laser_method.assert_not_called()
+
+    def test_apply_actions_dead_ship(self):
+        """Test that the actions are ignored for a ship that is not alive."""
+        self.game.phoenix_ship.state.alive = False
+        self.game.phoenix_ship.moving_flags = {}
+        fire_laser_method = MagicMock()
+        actions = {"phoenix": ShipActions(right=True, laser=True)}
+
+        self.player_input.apply_actions(actions, MagicMock(), fire_laser_method)
+
+        self.assertEqual(self.game.phoenix_ship.moving_flags, {})
+        fire_laser_method.assert_not_called()
+
     def test_reset_ship_flags(self):
         """Test the reset_ship_flags method."""
         self.game.thunderbird_ship.moving_flags = {
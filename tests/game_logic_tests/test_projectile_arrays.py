@@ -0,0 +1,214 @@
+"""
+This module tests the ProjectileArrays class which is used to move, cull
+and collide the bullets with NumPy arrays.
+"""
+
+import copy
+import random
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.entities.alien_entities.alien_bullets import AlienBullet, BossBullet
+from src.entities.projectiles.bullet import Bullet
+from src.game_logic.projectile_arrays import (
+    NUMPY_AVAILABLE,
+    ProjectileArrays,
+    create_projectile_arrays,
+)
+
+
+class TestCreateProjectileArrays(unittest.TestCase):
+    """Test cases for the create_projectile_arrays function."""
+
+    def test_without_numpy(self):
+        """Test that no arrays are created when NumPy is not installed."""
+        with patch("src.game_logic.projectile_arrays.NUMPY_AVAILABLE", False):
+            arrays = create_projectile_arrays(MagicMock(), [pygame.sprite.Group()])
+
+        self.assertEqual(arrays, {})
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy is not installed")
+class TestProjectileArrays(unittest.TestCase):
+    """Test cases for the ProjectileArrays class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.rng = random.Random(0)
+        self.game = MagicMock()
+        self.game.settings.game_modes.cosmic_conflict = False
+        self.game.settings.alien_bullet_speed = 2.7
+        self.game.thunderbird_ship = self._create_ship(300)
+        self.game.phoenix_ship = self._create_ship(900)
+        self.group = pygame.sprite.Group()
+        self.arrays = ProjectileArrays(self.game, self.group)
+
+    def _create_ship(self, x_pos):
+        """Create a ship with a rect at the bottom of the screen."""
+        ship = MagicMock()
+        ship.rect = pygame.Rect(x_pos, 600, 60, 60)
+        return ship
+
+    def _add_player_bullets(self, count):
+        """Add player bullets with random speeds for both ships."""
+        for i in range(count):
+            ship = self.game.thunderbird_ship if i % 2 else self.game.phoenix_ship
+            bullet = Bullet(
+                self.game,
+                pygame.Surface((8, 20)),
+                ship,
+                self.rng.uniform(1.0, 9.0),
+            )
+            bullet.rect.centerx += self.rng.randint(-30, 30)
+            self.group.add(bullet)
+
+    def _add_alien_bullets(self, count):
+        """Add alien and boss bullets at random positions."""
+        for i in range(count):
+            bullet_class = BossBullet if i % 2 else AlienBullet
+            bullet = bullet_class.__new__(bullet_class)
+            pygame.sprite.Sprite.__init__(bullet)
+            bullet.settings = self.game.settings
+            bullet.image = pygame.Surface((12, 12))
+            bullet.rect = bullet.image.get_rect(
+                topleft=(self.rng.randint(0, 1200), self.rng.randint(-50, 600))
+            )
+            bullet.y_pos = bullet.rect.y + self.rng.random()
+            if bullet_class is BossBullet:
+                bullet.x_vel = self.rng.uniform(-4, 4)
+            self.group.add(bullet)
+
+    def _assert_same_positions(self, bullets, expected_bullets):
+        """Assert the bullets are at the same positions as the expected ones."""
+        for bullet, expected in zip(bullets, expected_bullets):
+            self.assertEqual(bullet.rect, expected.rect)
+            self.assertEqual(bullet.y_pos, expected.y_pos)
+            if hasattr(expected, "x_pos"):
+                self.assertEqual(bullet.x_pos, expected.x_pos)
+
+    def _assert_move_matches_update(self, frames=20):
+        """Assert that moving the arrays gives the same result as updating
+        copies of the sprites one by one.
+        """
+        expected_bullets = [copy.copy(bullet) for bullet in self.group]
+        for bullet in expected_bullets:
+            bullet.rect = bullet.rect.copy()
+
+        for _ in range(frames):
+            self.arrays.move()
+            for bullet in expected_bullets:
+                bullet.update()
+
+        self._assert_same_positions(self.group.sprites(), expected_bullets)
+
+    def test_move_player_bullets(self):
+        """Test the movement of the player bullets."""
+        self._add_player_bullets(10)
+
+        self._assert_move_matches_update()
+
+    def test_move_player_bullets_cosmic_conflict(self):
+        """Test that the bullets move sideways in the Cosmic Conflict mode."""
+        self.game.settings.game_modes.cosmic_conflict = True
+        self._add_player_bullets(10)
+
+        self._assert_move_matches_update()
+
+    def test_move_alien_bullets(self):
+        """Test the movement of the alien and boss bullets."""
+        self._add_alien_bullets(10)
+
+        self._assert_move_matches_update()
+
+    def test_sync(self):
+        """Test that added bullets are read and removed bullets are dropped."""
+        self._add_player_bullets(4)
+        self.arrays.move()
+        removed = self.group.sprites()[1]
+        removed.kill()
+        self._add_player_bullets(2)
+
+        self.arrays.sync()
+
+        self.assertEqual(self.arrays.sprites, self.group.sprites())
+        self.assertEqual(len(self.arrays.rects), 5)
+        self.assertNotIn(removed, self.arrays.indexes)
+        for bullet, rect in zip(self.group, self.arrays.rects.tolist()):
+            self.assertEqual(list(bullet.rect), rect)
+            self.assertEqual(
+                self.arrays.y_pos[self.arrays.indexes[bullet]], bullet.y_pos
+            )
+
+    def test_active(self):
+        """Test that the arrays are used only for large groups."""
+        self._add_player_bullets(4)
+        self.arrays.sync()
+
+        with patch("src.game_logic.projectile_arrays.PROJECTILE_ARRAYS_MIN_SPRITES", 4):
+            self.assertTrue(self.arrays.active())
+        with patch("src.game_logic.projectile_arrays.PROJECTILE_ARRAYS_MIN_SPRITES", 5):
+            self.assertFalse(self.arrays.active())
+
+        # The arrays are read again from the sprites on the next sync.
+        self.assertEqual(self.arrays.sprites, [])
+        self.group.sprites()[0].rect.y = 50
+        self.arrays.sync()
+        self.assertEqual(self.arrays.rects[0, 1], 50)
+
+    def test_remove_outside(self):
+        """Test that the bullets outside the rect are removed."""
+        self._add_player_bullets(6)
+        outside = self.group.sprites()[:2]
+        outside[0].rect.bottom = 0
+        outside[1].rect.left = 1260
+
+        self.arrays.remove_outside(pygame.Rect(0, 0, 1260, 700))
+
+        self.assertEqual(len(self.group), 4)
+        for bullet in outside:
+            self.assertNotIn(bullet, self.group)
+
+    def test_remove_below(self):
+        """Test that the bullets below the screen are removed."""
+        self._add_alien_bullets(6)
+        below = [bullet for bullet in self.group if bullet.rect.y > 400]
+
+        self.arrays.remove_below(400)
+
+        self.assertEqual(len(self.group), 6 - len(below))
+        self.assertEqual(self.arrays.sprites, self.group.sprites())
+
+    def test_collide(self):
+        """Test that the collisions match pygame.sprite.groupcollide."""
+        self._add_alien_bullets(40)
+        targets = pygame.sprite.Group()
+        for _ in range(30):
+            target = pygame.sprite.Sprite()
+            target.rect = pygame.Rect(
+                self.rng.randint(0, 1200), self.rng.randint(0, 600), 50, 40
+            )
+            targets.add(target)
+
+        collisions = self.arrays.collide(targets.sprites())
+
+        self.assertTrue(collisions)
+        self.assertEqual(
+            collisions, pygame.sprite.groupcollide(self.group, targets, False, False)
+        )
+
+    def test_collide_any(self):
+        """Test finding the first bullet that collides with a rect."""
+        self._add_alien_bullets(10)
+        rect = self.group.sprites()[3].rect
+        expected = next(
+            bullet for bullet in self.group if bullet.rect.colliderect(rect)
+        )
+
+        self.assertIs(self.arrays.collide_any(rect), expected)
+        self.assertIsNone(self.arrays.collide_any(pygame.Rect(-100, -100, 1, 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
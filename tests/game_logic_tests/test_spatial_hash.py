@@ -0,0 +1,89 @@
+"""
+This module tests the SpatialHash class which is used as a broadphase
+for the collision checks.
+"""
+
+import unittest
+
+import pygame
+
+from src.game_logic.spatial_hash import SpatialHash
+
+
+class TestSpatialHash(unittest.TestCase):
+    """Test cases for the SpatialHash class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.spatial_hash = SpatialHash(64)
+
+    def _create_sprite(self, x, y, width=40, height=40):
+        """Create a sprite with a rect at the given position."""
+        sprite = pygame.sprite.Sprite()
+        sprite.rect = pygame.Rect(x, y, width, height)
+        return sprite
+
+    def test_init(self):
+        """Test the initialization of the class."""
+        self.assertEqual(self.spatial_hash.cell_size, 64)
+        self.assertEqual(self.spatial_hash.cells, {})
+        self.assertEqual(self.spatial_hash.order, {})
+
+    def test_insert(self):
+        """Test that a sprite is added to every cell its rect overlaps."""
+        sprite = self._create_sprite(50, 50)
+
+        self.spatial_hash.insert(sprite)
+        self.spatial_hash.insert(sprite)
+
+        self.assertEqual(set(self.spatial_hash.cells), {(0, 0), (1, 0), (0, 1), (1, 1)})
+        for bucket in self.spatial_hash.cells.values():
+            self.assertEqual(bucket, [sprite])
+
+    def test_query(self):
+        """Test that only the nearby sprites are returned."""
+        near = self._create_sprite(10, 10)
+        far = self._create_sprite(500, 500)
+        self.spatial_hash.rebuild([near, far])
+
+        self.assertEqual(self.spatial_hash.query(pygame.Rect(0, 0, 20, 20)), [near])
+        self.assertEqual(self.spatial_hash.query(pygame.Rect(480, 480, 30, 30)), [far])
+        self.assertEqual(self.spatial_hash.query(pygame.Rect(200, 200, 5, 5)), [])
+
+    def test_query_keeps_insertion_order(self):
+        """Test that the sprites are returned in the order they were inserted."""
+        sprites = [self._create_sprite(x, 0) for x in (120, 60, 0)]
+        self.spatial_hash.rebuild(sprites)
+
+        self.assertEqual(self.spatial_hash.query(pygame.Rect(0, 0, 200, 40)), sprites)
+
+    def test_query_negative_coordinates(self):
+        """Test that sprites partially outside the screen are found."""
+        sprite = self._create_sprite(-30, -30)
+        self.spatial_hash.rebuild([sprite])
+
+        self.assertEqual(self.spatial_hash.query(pygame.Rect(0, 0, 5, 5)), [sprite])
+
+    def test_rebuild(self):
+        """Test that rebuilding the grid removes the old sprites."""
+        old_sprite = self._create_sprite(0, 0)
+        new_sprite = self._create_sprite(300, 300)
+        self.spatial_hash.rebuild([old_sprite])
+
+        self.spatial_hash.rebuild([new_sprite])
+
+        self.assertNotIn(old_sprite, self.spatial_hash.order)
+        self.assertEqual(self.spatial_hash.query(pygame.Rect(0, 0, 10, 10)), [])
+
+    def test_clear(self):
+        """Test the clearing of the grid."""
+        self.spatial_hash.rebuild([self._create_sprite(0, 0)])
+
+        self.spatial_hash.clear()
+
+        self.assertEqual(self.spatial_hash.cells, {})
+        self.assertEqual(self.spatial_hash.order, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
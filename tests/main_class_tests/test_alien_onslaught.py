@@ -3,6 +3,7 @@ This module tests the AlienOnslaught main class that uses every module
 necessary to run the game.
 """
 
+import os
 import unittest
 from unittest import mock
 from unittest.mock import MagicMock, patch, call
@@ -21,7 +22,7 @@ from src.ui.scoreboards import ScoreBoard
 
 from src.managers.powers_manager import PowerEffectsManager
 from src.managers.asteroids_manager import AsteroidsManager
-from src.managers.sounds_manager import SoundManager
+from src.managers.sounds_manager import SoundManager, NullSoundManager
 from src.managers.game_over_manager import EndGameManager
 from src.managers.alien_managers.alien_bullets_manager import AlienBulletsManager
 from src.managers.alien_managers.aliens_manager import AliensManager
@@ -34,6 +35,9 @@ from src.managers.save_load_manager import SaveLoadSystem
 
 from src.entities.player_entities.player_ships import Thunderbird, Phoenix
 
+from src.utils.game_clock import FixedTimestep, game_clock
+from src.utils.game_random import rng
+
 
 class AlienOnslaughtTestCase(unittest.TestCase):
     """Test cases for the AlienOnslaught class."""
@@ -62,6 +66,9 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         self.game.ship_selection = MagicMock()
         self.game.save_load_manager = MagicMock()
         self.game.high_score_manager = MagicMock()
+        self.game.profiler = MagicMock()
+        self.game.frame_watchdog = MagicMock()
+        self.game.replay_recorder = MagicMock()
 
     def tearDown(self):
         pygame.quit()
@@ -76,7 +83,7 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         # Assertions
         self.assertFalse(game.singleplayer)
         self.assertIsInstance(game.settings, Settings)
-        self.assertIsNotNone(game.clock, pygame.time.Clock)
+        self.assertIsInstance(game.timestep, FixedTimestep)
         self.assertIsNotNone(game.screen, pygame.Surface)
         self.assertIsNotNone(game.bg_img, pygame.Surface)
         self.assertIsNotNone(game.bg_img_rect, pygame.Rect)
@@ -86,7 +93,8 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         self.assertIsNotNone(game.fourth_bg, pygame.Surface)
         self.assertEqual(game.ui_options, game.settings.ui_options)
         self.assertEqual(game.ships, [game.thunderbird_ship, game.phoenix_ship])
-        self.assertEqual(game.pause_time, 0)
+        self.assertIsNone(game.next_seed)
+        self.assertIsNone(game.next_start_tick)
         self.assertEqual(game.game_loaded, False)
         self.assertEqual(pygame.display.get_caption()[0], "Alien Onslaught")
         mock_set_icon.assert_called_once_with(game.settings.game_icon)
@@ -195,9 +203,12 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         self.assertEqual(self.game.game_over_manager.screen, self.game.screen)
 
     @mock.patch.object(AlienOnslaught, "MENU_RUNNING", new_callable=mock.PropertyMock)
+    @patch("src.alien_onslaught.frame_pacer")
     @patch("src.alien_onslaught.play_music")
     @patch("src.alien_onslaught.pygame.display.flip")
-    def test_run_menu(self, mock_flip, mock_play_music, mock_menu_running):
+    def test_run_menu(
+        self, mock_flip, mock_play_music, mock_frame_pacer, mock_menu_running
+    ):
         """Test the run_menu method."""
         mock_menu_running.side_effect = [True, False]
         self.game.handle_menu_events = MagicMock()
@@ -210,6 +221,9 @@ class AlienOnslaughtTestCase(unittest.TestCase):
             self.game.sound_manager.menu_music, "menu"
         )
         self.game.handle_menu_events.assert_called_once()
+        mock_frame_pacer.wait.assert_called_once_with(
+            self.game.sound_manager.draw_muted_message
+        )
         self.game.screen_manager.update_window_mode.assert_called_once()
         self.game.screen_manager.draw_menu_objects.assert_called_once_with(
             self.game.bg_img, self.game.bg_img_rect
@@ -387,6 +401,74 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         )
         self.game.run_game.assert_called_once()
 
+    @patch.dict(os.environ)
+    @patch("src.alien_onslaught.pygame.display.set_mode")
+    def test_init_headless(self, mock_display):
+        """Test the initialization of AlienOnslaught in headless mode."""
+        mock_display.return_value = pygame.Surface((1280, 700))
+        game = AlienOnslaught(singleplayer=True, headless=True)
+
+        self.assertTrue(game.headless)
+        self.assertEqual(os.environ["SDL_VIDEODRIVER"], "dummy")
+        self.assertEqual(os.environ["SDL_AUDIODRIVER"], "dummy")
+        self.assertIsInstance(game.sound_manager, NullSoundManager)
+        self.assertEqual(game.ticks, 0)
+
+    def test_start_headless_game(self):
+        """Test starting a game without the menus."""
+        self.game.singleplayer = True
+        self.game._set_singleplayer_variables = MagicMock()
+        self.game._reset_game = MagicMock()
+        self.game.run_game = MagicMock()
+        self.game.ticks = 5
+
+        self.game.start_headless_game()
+
+        self.game._set_singleplayer_variables.assert_called_once()
+        self.game._reset_game.assert_called_once()
+        self.game.run_game.assert_not_called()
+        self.assertFalse(self.game.ui_options.paused)
+        self.assertEqual(self.game.ticks, 0)
+
+    def test_step(self):
+        """Test advancing the game by one tick."""
+        self.game._handle_game_logic = MagicMock()
+        self.game.stats.game_active = True
+        self.game.game_over_manager.is_game_over.return_value = False
+        actions = {"thunderbird": MagicMock()}
+
+        self.assertTrue(self.game.step(actions))
+
+        self.game.player_input.apply_actions.assert_called_once_with(
+            actions,
+            self.game.weapons_manager.fire_missile,
+            self.game.weapons_manager.fire_laser,
+        )
+        self.game._handle_game_logic.assert_called_once()
+        self.game.ships_manager.update_ship_alive_states.assert_called_once()
+        self.assertEqual(self.game.ticks, 1)
+
+    def test_step_game_over(self):
+        """Test that the game stops when it reaches an ending."""
+        self.game._handle_game_logic = MagicMock()
+        self.game.stats.game_active = True
+        self.game.game_over_manager.is_game_over.return_value = True
+
+        self.assertFalse(self.game.step())
+
+        self.game.player_input.apply_actions.assert_not_called()
+        self.assertFalse(self.game.stats.game_active)
+
+    def test_step_game_not_active(self):
+        """Test that nothing is updated when the game is not active."""
+        self.game._handle_game_logic = MagicMock()
+        self.game.stats.game_active = False
+
+        self.assertFalse(self.game.step())
+
+        self.game._handle_game_logic.assert_not_called()
+        self.assertEqual(self.game.ticks, 0)
+
     def test__update_background(self):
         """Test the _update_background method."""
         i = 100
@@ -437,9 +519,35 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         self.game._handle_background_change.assert_called_once()
         self.assertEqual(updated_i, 1)
 
+    def test__update_background_ticks(self):
+        """Test that the background scrolls one pixel for each tick."""
+        self.game._handle_background_change = MagicMock()
+        self.game.screen = MagicMock()
+
+        self.assertEqual(self.game._update_background(100, 3), 103)
+        self.assertEqual(self.game._update_background(100, 0), 100)
+
+    def test_run_game_ticks(self):
+        """Test that the game logic runs once for each tick,
+        until the game ends.
+        """
+        self.game.stats.game_active = True
+        self.game._handle_game_logic = MagicMock()
+
+        self.game._run_game_ticks(3)
+        self.assertEqual(self.game._handle_game_logic.call_count, 3)
+
+        self.game._handle_game_logic.reset_mock()
+        self.game._handle_game_logic.side_effect = lambda: setattr(
+            self.game.stats, "game_active", False
+        )
+
+        self.game._run_game_ticks(3)
+        self.game._handle_game_logic.assert_called_once()
+
     @mock.patch.object(AlienOnslaught, "GAME_RUNNING", new_callable=mock.PropertyMock)
-    @patch("src.alien_onslaught.pygame.time.Clock")
-    def test_run_game_active(self, _, mock_game_running):
+    @patch("src.alien_onslaught.frame_pacer")
+    def test_run_game_active(self, mock_frame_pacer, mock_game_running):
         """Test the run_game method when the game is active."""
         mock_game_running.side_effect = [True, False]
         self.game.stats.game_active = True
@@ -463,10 +571,19 @@ class AlienOnslaughtTestCase(unittest.TestCase):
 
         self.game._update_screen.assert_called()
         self.game._check_for_pause.assert_called()
+        mock_frame_pacer.wait.assert_called_once_with(
+            animating=True, fps=self.game.settings.target_fps
+        )
+
+        self.game.frame_watchdog.start.assert_called_once()
+        self.game.frame_watchdog.start_frame.assert_called_once()
+        self.game.frame_watchdog.end_frame.assert_called_once_with(
+            self.game.profiler.end_frame.return_value
+        )
 
     @mock.patch.object(AlienOnslaught, "GAME_RUNNING", new_callable=mock.PropertyMock)
-    @patch("src.alien_onslaught.pygame.time.Clock")
-    def test_run_game_inactive(self, _, mock_game_running):
+    @patch("src.alien_onslaught.frame_pacer")
+    def test_run_game_inactive(self, mock_frame_pacer, mock_game_running):
         """Test the run_game method when the game is not active."""
         self.game.screen = MagicMock()
         self.game.screen.blit = MagicMock()
@@ -474,6 +591,7 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         mock_game_running.side_effect = [True, False]
         self.game.stats.game_active = False
         self.game.ui_options.paused = False
+        self.game.sound_manager.draw_muted_message = False
 
         self.game.check_events = MagicMock()
         self.game._update_background = MagicMock()
@@ -493,6 +611,10 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         self.game._update_background.assert_not_called()
         self.game._handle_game_logic.assert_not_called()
         self.game._check_for_pause.assert_not_called()
+        # The game menu sleeps until an event arrives.
+        mock_frame_pacer.wait.assert_called_once_with(
+            animating=False, fps=self.game.settings.target_fps
+        )
 
     def test_handle_game_logic(self):
         """Test the handle_game_logic method."""
@@ -512,7 +634,7 @@ class AlienOnslaughtTestCase(unittest.TestCase):
             self.game.powers_manager.weapon_power_up,
         )
         self.game.powers_manager.manage_power_downs.assert_called_once()
-        self.game.powers_manager.display_powers_effect.assert_called_once()
+        self.game.powers_manager.display_powers_effect.assert_not_called()
         self.game.gameplay_manager.create_normal_level_bullets.assert_called_once_with(
             self.game.alien_bullets_manager.create_alien_bullets
         )
@@ -535,7 +657,7 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         )
         self.game.ships_manager.update_ship_state.assert_called_once()
         self.game.weapons_manager.update_laser_status.assert_called_once()
-        self.game.weapons_manager.check_laser_availability.assert_called_once()
+        self.game.weapons_manager.check_laser_availability.assert_not_called()
         self.game.collision_handler.handle_shielded_ship_collisions.assert_called_once_with(
             self.game.ships,
             self.game.aliens,
@@ -573,6 +695,30 @@ class AlienOnslaughtTestCase(unittest.TestCase):
             self.game.weapons_manager.fire_laser,
         )
 
+    def test_check_events_profiler_toggle(self):
+        """Test that the F3 key toggles the profiler overlay."""
+        keydown_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3)
+        self.game.stats.game_active = False
+
+        with patch(
+            "src.alien_onslaught.pygame.event.get", return_value=[keydown_event]
+        ):
+            self.game.check_events()
+
+        self.game.profiler.toggle.assert_called_once()
+
+    def test_check_events_frame_spikes_dump(self):
+        """Test that the F4 key writes the frame spikes to the log file."""
+        keydown_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F4)
+        self.game.stats.game_active = False
+
+        with patch(
+            "src.alien_onslaught.pygame.event.get", return_value=[keydown_event]
+        ):
+            self.game.check_events()
+
+        self.game.frame_watchdog.dump.assert_called_once()
+
     def test_check_events_keyup(self):
         """Test the keyup events in the check_events method."""
         keyup_event = pygame.event.Event(pygame.KEYUP, key=pygame.K_a)
@@ -841,6 +987,7 @@ class AlienOnslaughtTestCase(unittest.TestCase):
 
         self.game.check_game_loaded()
 
+        self.game.save_load_manager.rebase_alien_timers.assert_called_once()
         self.game.save_load_manager.update_alien_states.assert_called_once()
         self.game.save_load_manager.update_player_ship_states.assert_called_once()
         self.game.save_load_manager.update_player_weapon.assert_called_once()
@@ -860,11 +1007,12 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         self.game.settings.dynamic_settings.assert_called_once()
         self.game.gameplay_manager.handle_alien_creation.assert_called_once()
 
+        self.game.save_load_manager.rebase_alien_timers.assert_not_called()
         self.game.save_load_manager.update_alien_states.assert_not_called()
         self.game.save_load_manager.update_player_ship_states.assert_not_called()
         self.game.save_load_manager.update_player_weapon.assert_not_called()
 
-    @patch("src.alien_onslaught.pygame.time.get_ticks")
+    @patch("src.alien_onslaught.game_clock.get_ticks")
     def test_reset_timed_variables(self, mock_get_ticks):
         """Test the reset_timed_variables method."""
         self.game.powers_manager.last_power_up_time = 10
@@ -922,6 +1070,9 @@ class AlienOnslaughtTestCase(unittest.TestCase):
         self.game._update_screen()
 
         self.game._draw_game_objects.assert_called_once()
+        self.game.powers_manager.display_powers_effect.assert_called_once()
+        self.game.weapons_manager.check_laser_availability.assert_called_once()
+        self.game.save_load_manager.update.assert_called_once()
         mock_display_flip.assert_called_once()
 
         self.game.screen_manager.display_pause.assert_not_called()
@@ -940,21 +1091,42 @@ class AlienOnslaughtTestCase(unittest.TestCase):
 
         self.game._update_screen()
 
-        self.game.buttons_manager.draw_buttons.assert_called_once()
+        self.game.screen_manager.draw_game_menu.assert_called_once()
         self.game.screen_manager.draw_cursor.assert_called_once()
-        self.game.ship_selection.draw.assert_called_once()
-
-        self.game.buttons_manager.draw_difficulty_buttons.assert_called_once()
-        self.game.screen_manager.display_high_scores_on_screen.assert_called_once()
-        self.game.buttons_manager.delete_scores.draw_button.assert_called_once()
-        self.game.buttons_manager.draw_game_mode_buttons.assert_called_once()
+        self.game._draw_game_objects.assert_not_called()
 
         mock_display_flip.assert_called_once()
 
-    @mock.patch("src.alien_onslaught.pygame.time.get_ticks")
-    def test_check_for_pause(self, mock_get_ticks):
+    def test_start_game_run(self):
+        """Test the _start_game_run method."""
+        self.game.game_loaded = False
+        self.game.next_seed = 5
+        self.game.next_start_tick = 100
+
+        self.game._start_game_run()
+
+        self.assertEqual(rng.seed_value, 5)
+        self.assertEqual(game_clock.ticks, 100)
+        self.assertIsNone(self.game.next_seed)
+        self.assertIsNone(self.game.next_start_tick)
+        self.game.replay_recorder.start.assert_called_once_with(5, 100)
+
+        # A loaded game gets a new seed and isn't recorded
+        self.game.replay_recorder.reset_mock()
+        self.game.game_loaded = True
+
+        self.game._start_game_run()
+
+        self.assertNotEqual(rng.seed_value, None)
+        self.assertGreater(game_clock.ticks, 100)
+        self.game.replay_recorder.start.assert_not_called()
+        self.game.replay_recorder.finish.assert_called_once()
+
+    @patch("src.alien_onslaught.frame_pacer")
+    def test_check_for_pause(self, mock_frame_pacer):
         """Test the check_for_pause method."""
-        mock_get_ticks.return_value = 10
+        start_ticks = game_clock.ticks
+        self.game.timestep = MagicMock()
 
         # Mocking self.ui_options.paused and self.check_events()
         with mock.patch.object(
@@ -971,15 +1143,11 @@ class AlienOnslaughtTestCase(unittest.TestCase):
 
             # Assertions
             mock_check_events.assert_called_once()
+            mock_frame_pacer.wait.assert_called_once_with()
+            self.game.frame_watchdog.skip_frame.assert_called_once()
             self.assertFalse(mock_ui_options.paused)
-            self.assertEqual(mock_get_ticks.call_count, 2)
-
-            # Calculate the expected value of pause_time
-            pause_start_time = 10
-            pause_end_time = mock_get_ticks.return_value
-            expected_pause_time = pause_end_time - pause_start_time
-
-            self.assertEqual(self.game.pause_time, expected_pause_time)
+            self.assertEqual(game_clock.ticks, start_ticks)
+            self.game.timestep.reset.assert_called_once()
 
 
 if __name__ == "__main__":
@@ -56,17 +56,28 @@ class AlienAnimationTestCase(unittest.TestCase):
         self.assertNotEqual(self.animation.frames, initial_frames)
         self.assertEqual(self.animation.scale, scale)
 
-    @patch("pygame.transform.scale")
-    def test_update_scale(self, mock_scale):
+    @patch("src.managers.alien_managers.aliens_behaviors.assets.get_alien_frames")
+    def test_update_scale(self, mock_get_alien_frames):
         """Test the update scale method."""
-        scale = 2.0
-        self.animation.scale = scale
+        scaled_frames = [MagicMock() for _ in range(6)]
+        mock_get_alien_frames.return_value = scaled_frames
+        self.animation.scale = 2.0
 
-        # Call the _update_scale() method
         self.animation._update_scale()
 
-        # Verify that the image and frames have been scaled
-        self.assertEqual(mock_scale.call_count, len(self.animation.frames) + 1)
+        # Verify that the shared frames for the new scale are used
+        mock_get_alien_frames.assert_called_once_with(self.animation.level_prefix, 2.0)
+        self.assertEqual(self.animation.frames, scaled_frames)
+        self.assertEqual(self.animation.image, scaled_frames[0])
+
+    def test_frames_are_shared(self):
+        """Test that the aliens share the same frames."""
+        other_animation = AlienAnimation(self.game, MagicMock())
+        self.assertIs(other_animation.frames, self.animation.frames)
+
+        self.animation.change_scale(0.5)
+        other_animation.change_scale(0.5)
+        self.assertIs(other_animation.frames, self.animation.frames)
 
     def test_get_current_image(self):
         """Test the get_current_image method."""
@@ -16,6 +16,7 @@ class AlienBulletsManagerTestCase(unittest.TestCase):
     def setUp(self):
         """Set up test environment."""
         self.game = MagicMock()
+        self.game.projectile_arrays = {}
         self.manager = AlienBulletsManager(self.game)
 
     def test_init(self):
@@ -70,8 +71,8 @@ class AlienBulletsManagerTestCase(unittest.TestCase):
             mock_alien_bullet_instance
         )
 
-    @patch("random.sample")
-    @patch("pygame.time.get_ticks")
+    @patch("src.managers.alien_managers.alien_bullets_manager.rng.sample")
+    @patch("src.managers.alien_managers.alien_bullets_manager.game_clock.get_ticks")
     def test_create_alien_bullets(self, mock_get_ticks, mock_sample):
         """Test the creation of multiple alien bullets."""
         num_bullets = 3
@@ -20,9 +20,13 @@ class AlienMovementTestCase(unittest.TestCase):
         self.alien = MagicMock()
 
         self.alien_movement = AlienMovement(self.alien, self.game)
+        self.alien_movement.last_direction_change = 0
 
-    @patch("pygame.time.get_ticks", return_value=15000)
-    @patch("random.randint", return_value=10)
+    @patch(
+        "src.managers.alien_managers.aliens_behaviors.game_clock.get_ticks",
+        return_value=15000,
+    )
+    @patch("src.managers.alien_managers.aliens_behaviors.rng.randint", return_value=10)
     def test_update_horizontal_position_direction_change(self, mock_random, mock_time):
         """Test case for when the alien is not at the edge of the screen."""
         self.alien_movement.direction_change_delay = 0
@@ -39,8 +43,11 @@ class AlienMovementTestCase(unittest.TestCase):
             self.alien_movement.direction_change_delay, mock_random.return_value
         )
 
-    @patch("pygame.time.get_ticks", return_value=10000)
-    @patch("random.randint", return_value=5)
+    @patch(
+        "src.managers.alien_managers.aliens_behaviors.game_clock.get_ticks",
+        return_value=10000,
+    )
+    @patch("src.managers.alien_managers.aliens_behaviors.rng.randint", return_value=5)
     def test_update_horizontal_position_edge_true(self, mock_random, mock_time):
         """Test case for when the alien is at the edge of the screen."""
         self.alien_movement.direction = 1
@@ -56,7 +63,10 @@ class AlienMovementTestCase(unittest.TestCase):
             self.alien_movement.direction_change_delay, mock_random.return_value
         )
 
-    @patch("pygame.time.get_ticks", return_value=3000)
+    @patch(
+        "src.managers.alien_managers.aliens_behaviors.game_clock.get_ticks",
+        return_value=3000,
+    )
     def test_update_vertical_position(self, _):
         """Test the update vertical position method."""
         self.alien_movement.sins = {
@@ -0,0 +1,150 @@
+"""
+This module tests the FleetController class which is used to move
+and animate the alien fleet with NumPy arrays.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.entities.alien_entities.aliens import BossAlien
+from src.managers.alien_managers.aliens_manager import AliensManager
+from src.managers.alien_managers.fleet_controller import (
+    NUMPY_AVAILABLE,
+    FleetController,
+    create_fleet_controller,
+)
+from src.utils.game_clock import game_clock
+from src.utils.game_random import rng
+
+
+class TestCreateFleetController(unittest.TestCase):
+    """Test cases for the create_fleet_controller function."""
+
+    def test_without_numpy(self):
+        """Test that no controller is created when NumPy is not installed."""
+        with patch(
+            "src.managers.alien_managers.fleet_controller.NUMPY_AVAILABLE", False
+        ):
+            self.assertIsNone(create_fleet_controller(MagicMock()))
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy is not installed")
+class TestFleetController(unittest.TestCase):
+    """Test cases for the FleetController class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.ticks = 0
+        self.wall_time = 1000.0
+        patchers = [
+            patch.object(game_clock, "get_ticks", side_effect=lambda: self.ticks),
+            patch.object(game_clock, "time", side_effect=lambda: self.wall_time),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _create_manager(self, seed, rows=6, use_fleet=True):
+        """Create an aliens manager with a fleet created from the seed."""
+        game = MagicMock()
+        game.screen = pygame.Surface((800, 600))
+        game.aliens = pygame.sprite.Group()
+        settings = game.settings
+        settings.screen_width = 800
+        settings.aliens_num = 8
+        settings.alien_speed = 1.4
+        settings.alien_direction = 1
+        settings.frozen_time = 2
+        settings.alien_immune_time = 3
+        game.stats.level = 1
+
+        manager = AliensManager(game, game.aliens, settings, game.screen)
+        if not use_fleet:
+            manager.fleet = None
+        rng.seed(seed)
+        self.ticks = 0
+        manager.create_fleet(rows)
+        return manager
+
+    def _run(self, manager, frames):
+        """Update the manager for a number of frames, freezing and upgrading
+        some aliens on the way. Returns the state of the random generator.
+        """
+        rng.seed(1)
+        self.wall_time = 1000.0
+        for frame in range(frames):
+            self.ticks += 17
+            self.wall_time += 0.017
+            if frame == 100:
+                for alien in manager.aliens.sprites()[::5]:
+                    alien.freeze()
+            if frame == 400:
+                for alien in manager.aliens.sprites()[::7]:
+                    alien.upgrade()
+            if frame == 700:
+                manager.aliens.sprites()[3].kill()
+            manager.update_aliens()
+        return rng.getstate()
+
+    def _get_state(self, alien):
+        """Return the state of the alien sprite."""
+        return (
+            tuple(alien.rect),
+            alien.x_pos,
+            alien.motion.direction,
+            alien.motion.last_direction_change,
+            alien.motion.direction_change_delay,
+            alien.animation.frame_counter,
+            alien.animation.current_frame,
+            alien.image,
+            alien.frozen_state,
+            alien.immune_state,
+        )
+
+    def test_update_matches_sprites(self):
+        """Test that the fleet moves the same as updating the sprites."""
+        expected = self._create_manager(seed=3, use_fleet=False)
+        expected_random = self._run(expected, 1200)
+
+        manager = self._create_manager(seed=3)
+        self.assertIsInstance(manager.fleet, FleetController)
+        random_state = self._run(manager, 1200)
+        manager.sync_alien_sprites()
+
+        self.assertEqual(random_state, expected_random)
+        self.assertEqual(
+            [self._get_state(alien) for alien in manager.aliens],
+            [self._get_state(alien) for alien in expected.aliens],
+        )
+
+    def test_write_visible(self):
+        """Test that only the aliens near the screen are written back."""
+        manager = self._create_manager(seed=0, rows=12)
+        far_alien = min(manager.aliens, key=lambda alien: alien.rect.y)
+        far_rect = far_alien.rect.copy()
+        self.ticks = 17
+
+        manager.update_aliens()
+
+        self.assertEqual(far_alien.rect, far_rect)
+        manager.sync_alien_sprites([far_alien])
+        self.assertNotEqual(far_alien.rect, far_rect)
+
+    def test_inactive(self):
+        """Test that small fleets and fleets with a boss use the sprites."""
+        manager = self._create_manager(seed=0, rows=1)
+        self.assertFalse(manager.fleet.active())
+
+        manager.create_fleet(6)
+        self.assertTrue(manager.fleet.active())
+
+        manager.create_boss_alien()
+        self.assertFalse(manager.fleet.active())
+        self.assertEqual(manager.fleet.sprites, [])
+        self.assertTrue(any(isinstance(alien, BossAlien) for alien in manager.aliens))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 import pygame
 
 from src.managers.player_managers.ship_selection_manager import ShipSelection
+from src.utils.constants import PHOENIX_SHIP_DESCRIPTIONS
 
 
 class ShipSelectionTest(unittest.TestCase):
@@ -70,12 +71,40 @@ class ShipSelectionTest(unittest.TestCase):
 
         # Assert the expected behavior
         self.assertEqual(len(self.ship_selection.clickable_regions), 3)
-        self.assertEqual(mock_display_description.call_count, 3)
+        self.assertEqual(self.game.screen.blit.call_count, 3)
 
         self.ship_selection.draw_ships(2, x_position, y_position)
 
         self.assertEqual(len(self.ship_selection.clickable_regions), 6)
-        self.assertEqual(mock_display_description.call_count, 6)
+        mock_display_description.assert_not_called()
+
+    def test_draw_on_surface(self):
+        """Test that the ships and the text are drawn on the given surface."""
+        surface = MagicMock()
+        self.game.singleplayer = False
+        self.game.screen.get_width.return_value = 1000
+
+        self.ship_selection.draw(surface)
+
+        self.assertEqual(surface.blit.call_count, 8)
+        self.game.screen.blit.assert_not_called()
+        self.assertEqual(len(self.ship_selection.clickable_regions), 6)
+
+    @patch("src.managers.player_managers.ship_selection_manager.pygame.mouse.get_pos")
+    @patch("src.managers.player_managers.ship_selection_manager.display_description")
+    def test_draw_descriptions(self, mock_display_description, mock_get_pos):
+        """Test that only the description of the hovered ship is drawn."""
+        mock_get_pos.return_value = (15, 15)
+        self.ship_selection.clickable_regions = [
+            (pygame.Rect(0, 0, 10, 10), 1, 0),
+            (pygame.Rect(10, 10, 10, 10), 2, 1),
+        ]
+
+        self.ship_selection.draw_descriptions()
+
+        mock_display_description.assert_called_once_with(
+            self.game.screen, PHOENIX_SHIP_DESCRIPTIONS[1], 60, 140
+        )
 
     @patch("src.managers.player_managers.ship_selection_manager.play_sound")
     @patch("src.managers.player_managers.ship_selection_manager.pygame.Rect")
@@ -3,14 +3,12 @@ This module tests the WeaponsManagers class which manages the
 player weapons in the game.
 """
 
-import time
 import unittest
 from unittest.mock import patch, MagicMock, call
 
-import pygame
-
 from src.utils.constants import WEAPONS
 from src.managers.player_managers.weapons_manager import WeaponsManager
+from src.managers.pool_manager import PoolManager
 
 
 class WeaponsManagerTest(unittest.TestCase):
@@ -19,6 +17,8 @@ class WeaponsManagerTest(unittest.TestCase):
     def setUp(self):
         """Set up test environment."""
         self.game = MagicMock()
+        self.game.projectile_arrays = {}
+        self.game.sprite_pools = PoolManager()
         self.thunderbird_ship = MagicMock()
         self.phoenix_ship = MagicMock()
 
@@ -31,7 +31,7 @@ class WeaponsManagerTest(unittest.TestCase):
             MagicMock(),
         ]
 
-    @patch("src.managers.player_managers.weapons_manager.load_single_image")
+    @patch("src.managers.player_managers.weapons_manager.assets.get_image")
     def test_init(self, mock_load_single_image):
         """Test the initialization of the weapons manager."""
         mock_weapon_image1 = MagicMock()
@@ -54,7 +54,7 @@ class WeaponsManagerTest(unittest.TestCase):
         )
         self.assertEqual(self.weapons_manager.phoenix_ship, self.game.phoenix_ship)
 
-        # Verify that the load_single_image function is called with the correct parameters
+        # Verify that the weapon images are requested with the correct parameters
         mock_load_single_image.assert_any_call(WEAPONS["thunderbolt"])
         mock_load_single_image.assert_any_call(WEAPONS["firebird"])
 
@@ -108,7 +108,7 @@ class WeaponsManagerTest(unittest.TestCase):
             "thunderbird"
         )
 
-    @patch("src.managers.player_managers.weapons_manager.load_single_image")
+    @patch("src.managers.player_managers.weapons_manager.assets.get_image")
     def test_set_weapon_new_weapon(self, mock_load_image):
         """Test the set_weapon method when assigning a new weapon."""
         self.weapons_manager.weapons["thunderbird"]["current"] = "laser"
@@ -121,7 +121,7 @@ class WeaponsManagerTest(unittest.TestCase):
             self.weapons_manager.weapons["thunderbird"]["current"], "blaster"
         )
 
-    @patch("src.managers.player_managers.weapons_manager.load_single_image")
+    @patch("src.managers.player_managers.weapons_manager.assets.get_image")
     def test_reset_weapons(self, mock_load_image):
         """Test the reset_weapons method."""
         self.weapons_manager.weapons["thunderbird"]["current"] = "blaster"
@@ -164,7 +164,7 @@ class WeaponsManagerTest(unittest.TestCase):
         self.game.singleplayer = True
         projectile_mock1 = MagicMock()
         projectile_mock2 = MagicMock()
-        self.weapons_manager.singleplayer_projectiles[0].copy.return_value = [
+        self.weapons_manager.singleplayer_projectiles[0].sprites.return_value = [
             projectile_mock1,
             projectile_mock2,
         ]
@@ -173,9 +173,9 @@ class WeaponsManagerTest(unittest.TestCase):
 
         self.weapons_manager.singleplayer_projectiles[0].update.assert_called()
 
-        self.assertTrue(self.weapons_manager.singleplayer_projectiles[0].copy.called)
+        self.assertTrue(self.weapons_manager.singleplayer_projectiles[0].sprites.called)
 
-        self.assertFalse(self.weapons_manager.multiplayer_projectiles[0].copy.called)
+        self.assertFalse(self.weapons_manager.multiplayer_projectiles[0].sprites.called)
         self.assertFalse(self.weapons_manager.multiplayer_projectiles[0].remove.called)
 
     def test_remove_out_of_screen_projectiles_multiplayer(self):
@@ -188,9 +188,11 @@ class WeaponsManagerTest(unittest.TestCase):
 
         self.weapons_manager.multiplayer_projectiles[0].update.assert_called()
 
-        self.assertTrue(self.weapons_manager.multiplayer_projectiles[0].copy.called)
+        self.assertTrue(self.weapons_manager.multiplayer_projectiles[0].sprites.called)
 
-        self.assertFalse(self.weapons_manager.singleplayer_projectiles[0].copy.called)
+        self.assertFalse(
+            self.weapons_manager.singleplayer_projectiles[0].sprites.called
+        )
         self.assertFalse(self.weapons_manager.singleplayer_projectiles[0].remove.called)
 
     def test_fire_bullet_ship_disarmed(self):
@@ -255,7 +257,7 @@ class WeaponsManagerTest(unittest.TestCase):
             bullets_mock, bullets_allowed, bullet_class_mock, num_bullets, ship_mock
         )
 
-        self.game.score_board.render_bullets_num.assert_not_called()
+        self.game.score_board.mark_dirty.assert_not_called()
         bullet_class_mock.assert_called_once_with(self.weapons_manager, ship_mock)
         bullets_mock.add.assert_called_once()
         mock_play_sound.assert_called_once_with(
@@ -270,7 +272,7 @@ class WeaponsManagerTest(unittest.TestCase):
         )
 
         self.assertEqual(ship_mock.remaining_bullets, 1)
-        self.game.score_board.render_bullets_num.assert_called_once()
+        self.game.score_board.mark_dirty.assert_called_once_with("bullets")
 
     @patch("src.managers.player_managers.weapons_manager.play_sound")
     def test_fire_missile_no_missiles(self, mock_play_sound):
@@ -305,17 +307,16 @@ class WeaponsManagerTest(unittest.TestCase):
             self.game.sound_manager.game_sounds, "missile_launch"
         )
         self.assertEqual(ship_mock.missiles_num, 1)
-        self.game.score_board.render_missiles_num.assert_called_once_with(ship_mock)
+        self.game.score_board.mark_dirty.assert_called_once_with("missiles")
 
     @patch("src.managers.player_managers.weapons_manager.play_sound")
-    @patch("src.managers.player_managers.weapons_manager.time.time")
+    @patch("src.managers.player_managers.weapons_manager.game_clock.time")
     def test_timed_laser(self, mock_time, mock_play_sound):
         """Test the timed_laser method."""
         # Laser ready (the player successfully fires the laser.)
         lasers_mock = MagicMock()
         ship_mock = MagicMock()
         laser_class_mock = MagicMock()
-        self.game.pause_time = pygame.time.get_ticks()
         self.game.settings.laser_cooldown = 5
         ship_mock.last_laser_time = 0
         mock_time.return_value = 5
@@ -325,7 +326,6 @@ class WeaponsManagerTest(unittest.TestCase):
         laser_class_mock.assert_called_once_with(self.weapons_manager, ship_mock)
         lasers_mock.add.assert_called_once()
         self.assertEqual(ship_mock.last_laser_time, mock_time.return_value)
-        self.assertEqual(self.game.pause_time, 0)
         self.assertFalse(ship_mock.laser_ready)
         self.assertFalse(self.weapons_manager.draw_laser_message)
         mock_play_sound.assert_called_once_with(
@@ -425,7 +425,7 @@ class WeaponsManagerTest(unittest.TestCase):
         self.weapons_manager._timed_laser.assert_not_called()
 
     @patch("src.managers.player_managers.weapons_manager.play_sound")
-    @patch("src.managers.player_managers.weapons_manager.time.time")
+    @patch("src.managers.player_managers.weapons_manager.game_clock.time")
     def test_update_normal_laser_status_laser_ready(self, mock_time, mock_play_sound):
         """Test the update of the laser status when the laser is available."""
         ship_mock = MagicMock()
@@ -440,7 +440,7 @@ class WeaponsManagerTest(unittest.TestCase):
 
         self.assertTrue(ship_mock.laser_ready)
         self.assertTrue(ship_mock.laser_ready_msg)
-        self.assertEqual(ship_mock.laser_ready_start_time, time.time())
+        self.assertEqual(ship_mock.laser_ready_start_time, mock_time.return_value)
         mock_play_sound.assert_called_once_with(
             self.game.sound_manager.game_sounds, "laser_ready"
         )
@@ -461,7 +461,7 @@ class WeaponsManagerTest(unittest.TestCase):
         self.assertFalse(ship_mock.laser_ready_msg)
 
     @patch("src.managers.player_managers.weapons_manager.play_sound")
-    @patch("src.managers.player_managers.weapons_manager.time.time")
+    @patch("src.managers.player_managers.weapons_manager.game_clock.time")
     def test_update_timed_laser_status_laser_ready(self, mock_time, mock_play_sound):
         """Test the update of the timed laser status when the laser is ready."""
         ship_mock = MagicMock()
@@ -474,12 +474,12 @@ class WeaponsManagerTest(unittest.TestCase):
         self.weapons_manager.update_timed_laser_status()
 
         self.assertTrue(ship_mock.laser_ready)
-        self.assertEqual(ship_mock.laser_ready_start_time, time.time())
+        self.assertEqual(ship_mock.laser_ready_start_time, mock_time.return_value)
         mock_play_sound.assert_called_once_with(
             self.game.sound_manager.game_sounds, "laser_ready"
         )
 
-    @patch("src.managers.player_managers.weapons_manager.time.time")
+    @patch("src.managers.player_managers.weapons_manager.game_clock.time")
     def test_update_timed_laser_status_laser_not_ready(self, mock_time):
         """Test the update of the timed laser status when the laser is not ready."""
         ship_mock = MagicMock()
@@ -521,7 +521,7 @@ class WeaponsManagerTest(unittest.TestCase):
         self.weapons_manager.update_timed_laser_status.assert_not_called()
         self.weapons_manager.update_normal_laser_status.assert_called_once()
 
-    @patch("pygame.time.get_ticks")
+    @patch("src.managers.player_managers.weapons_manager.game_clock.get_ticks")
     @patch("src.managers.player_managers.weapons_manager.display_custom_message")
     def test_check_laser_availability_laser_ready_cosmic_conflict(
         self, mock_display_laser, mock_get_ticks
@@ -545,7 +545,7 @@ class WeaponsManagerTest(unittest.TestCase):
         self.assertFalse(self.weapons_manager.draw_laser_message)
         self.assertEqual(self.weapons_manager.display_time, mock_get_ticks.return_value)
 
-    @patch("pygame.time.get_ticks")
+    @patch("src.managers.player_managers.weapons_manager.game_clock.get_ticks")
     @patch("src.managers.player_managers.weapons_manager.display_custom_message")
     def test_check_laser_availability_laser_not_ready(
         self, mock_display_laser, mock_get_ticks
@@ -569,7 +569,7 @@ class WeaponsManagerTest(unittest.TestCase):
         self.assertFalse(self.weapons_manager.draw_laser_message)
         self.assertEqual(self.weapons_manager.display_time, mock_get_ticks.return_value)
 
-    @patch("pygame.time.get_ticks")
+    @patch("src.managers.player_managers.weapons_manager.game_clock.get_ticks")
     @patch("src.managers.player_managers.weapons_manager.display_custom_message")
     def test_check_laser_availability_laser_not_ready_last_bullet(
         self, mock_display_laser, mock_get_ticks
@@ -595,7 +595,7 @@ class WeaponsManagerTest(unittest.TestCase):
         self.assertFalse(self.weapons_manager.draw_laser_message)
         self.assertEqual(self.weapons_manager.display_time, mock_get_ticks.return_value)
 
-    @patch("pygame.time.get_ticks")
+    @patch("src.managers.player_managers.weapons_manager.game_clock.get_ticks")
     @patch("src.managers.player_managers.weapons_manager.display_custom_message")
     def test_check_laser_availability_laser_not_ready_cosmic(
         self, mock_display_laser, mock_get_ticks
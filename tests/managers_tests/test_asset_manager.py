@@ -0,0 +1,171 @@
+"""
+This module tests the AssetManager class which is used to load, cache
+and convert the images used in the game.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.managers.asset_manager import AssetManager
+
+
+class TestAssetManager(unittest.TestCase):
+    """Test cases for the AssetManager class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.asset_manager = AssetManager()
+
+    def test_init(self):
+        """Test the initialization of the class."""
+        self.assertEqual(self.asset_manager.images, {})
+        self.assertEqual(self.asset_manager.image_sets, {})
+        self.assertEqual(self.asset_manager.frames, {})
+        self.assertEqual(self.asset_manager.alien_frames, {})
+
+    @patch("src.managers.asset_manager.pygame.image.load")
+    def test_get_image(self, mock_load):
+        """Test that an image is loaded only once."""
+        mock_load.return_value = pygame.Surface((10, 10))
+
+        image = self.asset_manager.get_image("other/heart.png")
+
+        self.assertIs(self.asset_manager.get_image("other/heart.png"), image)
+        mock_load.assert_called_once()
+        self.assertIn(("other/heart.png", True), self.asset_manager.images)
+
+    @patch("src.managers.asset_manager.pygame.image.load")
+    def test_get_images(self, mock_load):
+        """Test that the dict of images is shared."""
+        mock_load.side_effect = lambda path: pygame.Surface((10, 10))
+        image_dict = {"first": "first.png", "second": "second.png"}
+
+        images = self.asset_manager.get_images(image_dict, alpha=False)
+
+        self.assertIs(self.asset_manager.get_images(image_dict, alpha=False), images)
+        self.assertEqual(list(images), ["first", "second"])
+        self.assertEqual(mock_load.call_count, 2)
+
+    @patch("src.managers.asset_manager.pygame.image.load")
+    def test_get_frames(self, mock_load):
+        """Test loading and rotating the animation frames."""
+        mock_load.side_effect = lambda path: pygame.Surface((10, 20))
+
+        frames = self.asset_manager.get_frames("frame_{}.png", 3, start=1, rotate=90)
+
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(frames[0].get_size(), (20, 10))
+        self.assertIs(
+            self.asset_manager.get_frames("frame_{}.png", 3, start=1, rotate=90),
+            frames,
+        )
+        self.assertEqual(mock_load.call_count, 3)
+
+    @patch("src.managers.asset_manager.load_alien_images")
+    def test_get_alien_frames(self, mock_load_alien_images):
+        """Test that the alien frames are loaded once and shared."""
+        mock_load_alien_images.return_value = [pygame.Surface((40, 30))] * 6
+
+        frames = self.asset_manager.get_alien_frames("Alien1")
+        baby_frames = self.asset_manager.get_alien_frames("Alien1", 0.5)
+
+        self.assertIs(self.asset_manager.get_alien_frames("Alien1"), frames)
+        self.assertIs(self.asset_manager.get_alien_frames("Alien1", 0.5), baby_frames)
+        mock_load_alien_images.assert_called_once_with("Alien1")
+        self.assertEqual(len(baby_frames), 6)
+        self.assertEqual(baby_frames[0].get_size(), (20, 15))
+
+    @patch("src.managers.asset_manager.pygame.image.load")
+    def test_prefetch(self, mock_load):
+        """Test that the frames are loaded on a background thread."""
+        mock_load.side_effect = lambda path: pygame.Surface((10, 10))
+
+        with patch.object(AssetManager, "display_ready", return_value=True):
+            thread = self.asset_manager.prefetch([("frame_{}.png", 4, 0, None)])
+            thread.join()
+
+        self.assertEqual(
+            len(self.asset_manager.frames[("frame_{}.png", 4, 0, None)]), 4
+        )
+
+    def test_prefetch_without_display(self):
+        """Test that nothing is prefetched when there is no display."""
+        with patch.object(AssetManager, "display_ready", return_value=False):
+            thread = self.asset_manager.prefetch([("frame_{}.png", 4, 0, None)])
+
+        self.assertIsNone(thread)
+        self.assertEqual(self.asset_manager.frames, {})
+
+    def test_convert_image_without_display(self):
+        """Test that the image is not converted when there is no display."""
+        image = MagicMock()
+
+        with patch.object(AssetManager, "display_ready", return_value=False):
+            result = self.asset_manager.convert_image(image)
+
+        self.assertIs(result, image)
+        image.convert_alpha.assert_not_called()
+
+    def test_convert_image(self):
+        """Test the conversion of sprites and opaque images."""
+        image = MagicMock()
+
+        with patch.object(AssetManager, "display_ready", return_value=True):
+            sprite = self.asset_manager.convert_image(image)
+            background = self.asset_manager.convert_image(image, alpha=False)
+
+        self.assertEqual(sprite, image.convert_alpha.return_value)
+        self.assertEqual(background, image.convert.return_value)
+
+    def test_convert_image_error(self):
+        """Test that the image is returned as it is if the conversion fails."""
+        image = MagicMock()
+        image.convert_alpha.side_effect = pygame.error
+
+        with patch.object(AssetManager, "display_ready", return_value=True):
+            result = self.asset_manager.convert_image(image)
+
+        self.assertIs(result, image)
+
+    @patch("src.managers.asset_manager.pygame.image.load")
+    def test_convert_all(self, mock_load):
+        """Test that the shared dicts and lists are converted in place."""
+        mock_load.side_effect = lambda path: MagicMock()
+        images = self.asset_manager.get_images({"bg": "bg.png"}, alpha=False)
+        frames = self.asset_manager.get_frames("frame_{}.png", 2)
+        original_bg = images["bg"]
+        original_frame = frames[0]
+
+        with patch.object(AssetManager, "display_ready", return_value=True):
+            self.asset_manager.convert_all()
+
+        self.assertEqual(images["bg"], original_bg.convert.return_value)
+        self.assertEqual(self.asset_manager.images[("bg.png", False)], images["bg"])
+        self.assertEqual(frames[0], original_frame.convert_alpha.return_value)
+
+    def test_convert_all_without_display(self):
+        """Test that nothing is converted when there is no display."""
+        image = MagicMock()
+        self.asset_manager.images[("image.png", True)] = image
+
+        with patch.object(AssetManager, "display_ready", return_value=False):
+            self.asset_manager.convert_all()
+
+        self.assertIs(self.asset_manager.images[("image.png", True)], image)
+        image.convert_alpha.assert_not_called()
+
+    def test_clear(self):
+        """Test clearing the cached images."""
+        self.asset_manager.images[("image.png", True)] = MagicMock()
+        self.asset_manager.frames["key"] = [MagicMock()]
+
+        self.asset_manager.clear()
+
+        self.assertEqual(self.asset_manager.images, {})
+        self.assertEqual(self.asset_manager.frames, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,11 +4,10 @@ to handle the asteroids in the game.
 """
 
 import unittest
-from unittest.mock import MagicMock
-
-import pygame
+from unittest.mock import MagicMock, patch
 
 from src.managers.asteroids_manager import AsteroidsManager
+from src.managers.pool_manager import PoolManager, PooledGroup
 
 
 class TestAsteroidsManager(unittest.TestCase):
@@ -17,7 +16,8 @@ class TestAsteroidsManager(unittest.TestCase):
     def setUp(self):
         """Set up test environment."""
         self.game = MagicMock()
-        self.game.asteroids = pygame.sprite.Group()
+        self.game.sprite_pools = PoolManager()
+        self.game.asteroids = PooledGroup(self.game.sprite_pools)
         self.asteroids_manager = AsteroidsManager(self.game)
 
     def test_create_asteroids(self):
@@ -28,6 +28,23 @@ class TestAsteroidsManager(unittest.TestCase):
 
         self.assertEqual(len(self.game.asteroids), 3)
 
+    @patch("src.managers.asteroids_manager.rng.randint", return_value=4500)
+    @patch(
+        "src.managers.asteroids_manager.game_clock.get_ticks",
+        side_effect=[1000, 1000, 5000, 6000],
+    )
+    def test_create_asteroids_default_frequency(self, _, mock_randint):
+        """Test that the default frequency is picked with the first asteroid."""
+        self.asteroids_manager.create_asteroids()
+        self.asteroids_manager.create_asteroids()
+        self.assertEqual(len(self.game.asteroids), 0)
+
+        self.asteroids_manager.create_asteroids()
+
+        self.assertEqual(len(self.game.asteroids), 1)
+        self.assertEqual(self.asteroids_manager.default_frequency, 4500)
+        mock_randint.assert_any_call(4000, 10000)
+
     def test_update_asteroids(self):
         """Test the update of the asteroid."""
         asteroid = MagicMock()
@@ -36,7 +53,7 @@ class TestAsteroidsManager(unittest.TestCase):
 
         # Create a mock group that behaves like pygame.sprite.Group
         asteroids_group = MagicMock()
-        asteroids_group.copy.return_value = [asteroid]
+        asteroids_group.sprites.return_value = [asteroid]
 
         self.game.asteroids = asteroids_group
 
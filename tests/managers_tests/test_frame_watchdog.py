@@ -0,0 +1,169 @@
+"""
+This module tests the FrameWatchdog class which records the frames
+that take longer than the frame budget.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.managers.frame_watchdog import FrameWatchdog
+
+
+class TestFrameWatchdog(unittest.TestCase):
+    """Test cases for the FrameWatchdog class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.game = MagicMock()
+        self.game.stats.level = 7
+        self.game.settings.game_modes.game_mode = "meteor_madness"
+        self.game.singleplayer = True
+        self.profiler = MagicMock()
+        self.profiler.get_entity_counts.return_value = {"aliens": 12}
+        self.watchdog = FrameWatchdog(
+            self.game, self.profiler, budget_ms=25, log_size=2
+        )
+
+    def test_init(self):
+        """Test the initialization of the class."""
+        self.assertEqual(self.watchdog.game, self.game)
+        self.assertEqual(self.watchdog.profiler, self.profiler)
+        self.assertEqual(self.watchdog.budget_ms, 25)
+        self.assertEqual(self.watchdog.spikes.maxlen, 2)
+        self.assertIsNone(self.watchdog.frame_start)
+
+    @patch("src.managers.frame_watchdog.threading.Thread")
+    def test_start(self, mock_thread):
+        """Test that the profiler and the sampler thread are started once."""
+        self.watchdog.start()
+        self.watchdog.start()
+
+        self.assertTrue(self.profiler.keep_running)
+        self.assertEqual(self.profiler.start.call_count, 2)
+        mock_thread.return_value.start.assert_called_once()
+
+    def test_sampler_thread(self):
+        """Test that the stack is sampled for the frames still running after
+        the budget, and not for the shorter frames.
+        """
+        self.watchdog.start()
+
+        self.watchdog.start_frame()
+        self.watchdog.end_frame({})
+        time.sleep(0.05)
+        self.assertIsNone(self.watchdog.sampled_stack)
+
+        self.watchdog.start_frame()
+        frame_start = self.watchdog.frame_start
+        time.sleep(0.06)
+        spike = self.watchdog.end_frame({"draw": 60.0})
+
+        self.assertEqual(self.watchdog.sampled_stack[0], frame_start)
+        self.assertIn("test_sampler_thread", spike["stack"])
+
+    def test_sampler_thread_waits_for_frames(self):
+        """Test that the sampler thread blocks until a frame starts."""
+        self.watchdog.sample_stack = MagicMock()
+        self.watchdog.frame_start = time.perf_counter() - 1
+        self.watchdog.start()
+        time.sleep(0.03)
+
+        self.watchdog.sample_stack.assert_not_called()
+        self.assertFalse(self.watchdog.frame_started.is_set())
+
+    @patch("src.managers.frame_watchdog.time.perf_counter")
+    def test_frame_within_budget(self, mock_perf_counter):
+        """Test that frames within the budget are not recorded."""
+        mock_perf_counter.side_effect = [1.0, 1.010]
+
+        self.watchdog.start_frame()
+
+        self.assertIsNone(self.watchdog.end_frame({"draw": 9.0}))
+        self.assertEqual(len(self.watchdog.spikes), 0)
+
+    @patch("src.managers.frame_watchdog.time.perf_counter")
+    def test_frame_spike(self, mock_perf_counter):
+        """Test that a long frame is recorded with its culprit and state."""
+        mock_perf_counter.side_effect = [1.0, 1.040]
+        self.watchdog.start_frame()
+        self.watchdog.sampled_stack = (1.0, "stack")
+
+        spike = self.watchdog.end_frame({"draw": 5.0, "update_aliens": 30.0})
+
+        self.assertEqual(spike["frame_ms"], 40.0)
+        self.assertEqual(spike["culprit"], "update_aliens")
+        self.assertEqual(list(spike["subsystems_ms"]), ["update_aliens", "draw"])
+        self.assertEqual(
+            spike["state"],
+            {
+                "level": 7,
+                "game_mode": "meteor_madness",
+                "singleplayer": True,
+                "entities": {"aliens": 12},
+            },
+        )
+        self.assertEqual(spike["stack"], "stack")
+        self.assertEqual(list(self.watchdog.spikes), [spike])
+
+    @patch("src.managers.frame_watchdog.time.perf_counter")
+    def test_stack_of_another_frame_is_ignored(self, mock_perf_counter):
+        """Test that a stack sampled during a previous frame is not used."""
+        mock_perf_counter.side_effect = [2.0, 2.040]
+        self.watchdog.sampled_stack = (1.0, "old stack")
+        self.watchdog.start_frame()
+
+        spike = self.watchdog.end_frame({})
+
+        self.assertIsNone(spike["stack"])
+        self.assertIsNone(spike["culprit"])
+
+    def test_skip_frame(self):
+        """Test that a skipped frame is not recorded."""
+        self.watchdog.start_frame()
+        self.watchdog.skip_frame()
+
+        self.assertIsNone(self.watchdog.end_frame({}))
+
+    def test_ring_buffer(self):
+        """Test that only the most recent spikes are kept."""
+        for frame_ms in (30, 40, 50):
+            self.watchdog.spikes.append({"frame_ms": frame_ms})
+
+        self.assertEqual(
+            [spike["frame_ms"] for spike in self.watchdog.spikes], [40, 50]
+        )
+
+    def test_sample_stack(self):
+        """Test sampling the stack of the main thread."""
+        stack = self.watchdog.sample_stack()
+
+        self.assertIn("test_sample_stack", stack)
+
+    @patch("src.managers.frame_watchdog.time.perf_counter")
+    def test_dump(self, mock_perf_counter):
+        """Test writing the spikes to the log file."""
+        mock_perf_counter.side_effect = [1.0, 1.030]
+        self.watchdog.start_frame()
+        self.watchdog.sampled_stack = (1.0, "line one\nline two")
+        self.watchdog.end_frame({"events": 29.0})
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "spikes.log")
+            self.assertEqual(self.watchdog.dump(filename), 1)
+            self.assertEqual(self.watchdog.dump(filename), 0)
+
+            with open(filename, encoding="utf-8") as log_file:
+                content = log_file.read()
+
+        self.assertIn("frame took 30.00 ms, culprit: events", content)
+        self.assertIn("level 7, mode meteor_madness", content)
+        self.assertIn("aliens=12", content)
+        self.assertIn("    line two", content)
+        self.assertEqual(len(self.watchdog.spikes), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -103,6 +103,35 @@ class TestEndGameManager(unittest.TestCase):
 
             mock_display_endgame.assert_called_with("gameover")
 
+    def test_is_game_over_cosmic_conflict(self):
+        """Test that cosmic conflict ends when one of the ships is destroyed."""
+        self.settings.game_modes.cosmic_conflict = True
+        self.game.thunderbird_ship.state.alive = True
+        self.game.phoenix_ship.state.alive = False
+
+        self.assertTrue(self.end_game_manager.is_game_over())
+
+    def test_is_game_over_boss_rush_victory(self):
+        """Test that boss rush ends after the last boss is destroyed."""
+        self.settings.game_modes.cosmic_conflict = False
+        self.settings.game_modes.boss_rush = True
+        self.stats.level = 15
+
+        self.assertTrue(self.end_game_manager.is_game_over())
+
+    def test_is_game_over(self):
+        """Test that the game ends only when both players are dead."""
+        self.settings.game_modes.cosmic_conflict = False
+        self.settings.game_modes.boss_rush = False
+        self.game.thunderbird_ship.state.alive = True
+        self.game.phoenix_ship.state.alive = False
+
+        self.assertFalse(self.end_game_manager.is_game_over())
+
+        self.game.thunderbird_ship.state.alive = False
+
+        self.assertTrue(self.end_game_manager.is_game_over())
+
     @patch("src.managers.game_over_manager.EndGameManager.set_game_end_position")
     @patch("src.managers.game_over_manager.EndGameManager._play_game_over_sound")
     @patch("src.managers.game_over_manager.EndGameManager._check_high_score_saved")
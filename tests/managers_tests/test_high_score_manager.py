@@ -24,32 +24,16 @@ class HighScoreManagerTest(unittest.TestCase):
         self.assertEqual(self.hs_manager.screen, self.game.screen)
         self.assertEqual(self.hs_manager.high_scores_file, "high_score.json")
 
-    @patch("builtins.open")
-    @patch("json.load")
-    @patch("json.dump")
+    @patch("src.managers.high_score_manager.high_score_store")
     @patch("src.managers.high_score_manager.get_player_name")
-    def test_save_high_score(
-        self, mock_get_player_name, mock_json_dump, mock_json_load, mock_open
-    ):
+    def test_save_high_score(self, mock_get_player_name, mock_store):
         """Test the saving of the high score."""
         mock_get_player_name.return_value = "Ake"
-        mock_open.return_value.__enter__.return_value = (
-            mock_open  # Mock the file object
-        )
-
-        # Set up the necessary mock objects and values
-        high_scores = {"score_key": []}
-        mock_json_load.return_value = high_scores
+        mock_store.has_name.return_value = False
 
         self.game.stats.high_score = 100
         self.hs_manager.save_high_score("score_key")
 
-        # Verify that the file was opened and read
-        mock_open.has_any_call(self.hs_manager.high_scores_file, "r", encoding="utf-8")
-
-        # Verify that json.load was called with the opened file
-        mock_json_load.assert_called_once_with(mock_open)
-
         # Verify that get_player_name was called
         mock_get_player_name.assert_called_once_with(
             self.game.screen,
@@ -60,46 +44,60 @@ class HighScoreManagerTest(unittest.TestCase):
             self.game.settings.game_end_rect,
         )
 
-        # Verify that the high score entry was added or updated
-        expected_entry = {"name": "Ake", "score": 100}
-        self.assertIn(expected_entry, high_scores["score_key"])
-
-        # Verify that the file was opened for writing and the data was dumped
-        mock_open.assert_called_with(
-            self.hs_manager.high_scores_file, "w", encoding="utf-8"
+        # Verify that the high score entry was added to the store
+        mock_store.has_name.assert_called_once_with(
+            self.hs_manager.high_scores_file, "score_key", "Ake"
         )
-        mock_json_dump.assert_called_once_with(high_scores, mock_open)
-
-    @patch("builtins.open")
-    @patch("json.load")
-    @patch("json.dump")
-    def test_delete_high_scores(self, mock_json_dump, mock_json_load, mock_open):
-        """Test the delete_high_scores method."""
-        mock_open.return_value.__enter__.return_value = (
-            mock_open  # Mock the file object
+        mock_store.insert.assert_called_once_with(
+            self.hs_manager.high_scores_file, "score_key", "Ake", 100
         )
+        self.game.screen_manager.invalidate_menu_layers.assert_called_once()
 
-        # Set up the necessary mock objects
-        high_scores = {"score_key1": [], "score_key2": []}
-        mock_json_load.return_value = high_scores
+    @patch("src.managers.high_score_manager.high_score_store")
+    @patch("src.managers.high_score_manager.display_message")
+    @patch("src.managers.high_score_manager.get_player_name")
+    def test_save_high_score_existing_name(
+        self, mock_get_player_name, mock_display_message, mock_store
+    ):
+        """Test that the player is asked again for a name that already exists."""
+        mock_get_player_name.side_effect = ["Ake", ""]
+        mock_store.has_name.side_effect = [True, False]
 
-        # Delete the high scores for the "score_key1"
-        self.hs_manager.delete_high_scores("score_key1")
+        self.game.stats.high_score = 100
+        self.hs_manager.save_high_score("score_key")
 
-        # Verify that the file was opened and read
-        mock_open.has_any_call(self.hs_manager.high_scores_file, "r", encoding="utf-8")
+        mock_display_message.assert_called_once_with(
+            self.game.screen, "A high score with the name 'Ake' already exists.", 2
+        )
+        mock_store.insert.assert_called_once_with(
+            self.hs_manager.high_scores_file, "score_key", "Player", 100
+        )
 
-        # Verify that json.load was called with the opened file
-        mock_json_load.assert_called_once_with(mock_open)
+    @patch("src.managers.high_score_manager.high_score_store")
+    @patch("src.managers.high_score_manager.get_player_name")
+    def test_save_high_score_cancelled(self, mock_get_player_name, mock_store):
+        """Test that nothing is saved when the player closes the name prompt,
+        or when there is no high score."""
+        mock_get_player_name.return_value = None
 
-        # Verify that the high scores for "score_key1" were deleted
-        self.assertNotIn("score_key1", high_scores)
+        self.game.stats.high_score = 100
+        self.hs_manager.save_high_score("score_key")
+        self.game.stats.high_score = 0
+        self.hs_manager.save_high_score("score_key")
+
+        mock_get_player_name.assert_called_once()
+        mock_store.insert.assert_not_called()
+        self.game.screen_manager.invalidate_menu_layers.assert_not_called()
+
+    @patch("src.managers.high_score_manager.high_score_store")
+    def test_delete_high_scores(self, mock_store):
+        """Test the delete_high_scores method."""
+        self.hs_manager.delete_high_scores("score_key1")
 
-        # Verify that the file was opened for writing and the data was dumped
-        mock_open.assert_called_with(
-            self.hs_manager.high_scores_file, "w", encoding="utf-8"
+        mock_store.delete.assert_called_once_with(
+            self.hs_manager.high_scores_file, "score_key1"
         )
-        mock_json_dump.assert_called_once_with(high_scores, mock_open)
+        self.game.screen_manager.invalidate_menu_layers.assert_called_once()
 
     def test_update_high_score_filename(self):
         """Test the update_high_score_filename method."""
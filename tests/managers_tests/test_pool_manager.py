@@ -0,0 +1,117 @@
+"""
+This module tests the PoolManager and PooledGroup classes which are
+used to reuse the short-lived sprites of the game.
+"""
+
+import unittest
+
+import pygame
+
+from src.managers.pool_manager import PoolManager, PooledGroup
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """Sprite with a reset method, used to test the pools."""
+
+    def __init__(self, value):
+        super().__init__()
+        self.reset(value)
+
+    def reset(self, value):
+        """Set the value of the sprite."""
+        self.value = value
+
+
+class TestPoolManager(unittest.TestCase):
+    """Test cases for the PoolManager class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.pools = PoolManager(max_size=2)
+        self.group = PooledGroup(self.pools)
+
+    def test_acquire_new(self):
+        """Test that a new sprite is created when the pool is empty."""
+        sprite = self.pools.acquire(PooledSprite, 1)
+
+        self.assertIsInstance(sprite, PooledSprite)
+        self.assertEqual(sprite.value, 1)
+        self.assertEqual(self.pools.stats[PooledSprite]["created"], 1)
+
+    def test_acquire_reused(self):
+        """Test that a removed sprite is reset and reused after a recycle."""
+        sprite = self.pools.acquire(PooledSprite, 1)
+        self.group.add(sprite)
+        sprite.kill()
+
+        self.assertEqual(self.pools.pending, [sprite])
+        self.assertIsNot(self.pools.acquire(PooledSprite, 2), sprite)
+
+        self.pools.recycle()
+        reused = self.pools.acquire(PooledSprite, 3)
+
+        self.assertIs(reused, sprite)
+        self.assertEqual(reused.value, 3)
+        self.assertEqual(self.pools.stats[PooledSprite]["reused"], 1)
+
+    def test_release_on_remove_and_empty(self):
+        """Test that the sprites are released by remove and empty."""
+        sprites = [self.pools.acquire(PooledSprite, i) for i in range(3)]
+        self.group.add(sprites)
+
+        self.group.remove(sprites[0])
+        self.group.empty()
+
+        self.assertCountEqual(self.pools.pending, sprites)
+
+    def test_recycle(self):
+        """Test that sprites added back to a group are not reused
+        and that the pool keeps at most 'max_size' sprites.
+        """
+        sprites = [self.pools.acquire(PooledSprite, i) for i in range(4)]
+        self.group.add(sprites)
+        self.group.empty()
+        self.group.add(sprites[0])
+
+        self.pools.recycle()
+
+        self.assertEqual(self.pools.free[PooledSprite], sprites[1:3])
+        self.assertEqual(self.pools.pending, [])
+        self.assertEqual(self.pools.stats[PooledSprite]["dropped"], 1)
+
+    def test_copy(self):
+        """Test that the copy of a pooled group doesn't release the sprites."""
+        sprite = self.pools.acquire(PooledSprite, 1)
+        self.group.add(sprite)
+
+        group_copy = self.group.copy()
+        group_copy.remove(sprite)
+
+        self.assertNotIsInstance(group_copy, PooledGroup)
+        self.assertEqual(self.pools.pending, [])
+
+    def test_get_stats(self):
+        """Test the stats of the pools."""
+        sprite = self.pools.acquire(PooledSprite, 1)
+        self.group.add(sprite)
+        self.group.empty()
+        self.pools.recycle()
+
+        self.assertEqual(
+            self.pools.get_stats(),
+            {"PooledSprite": {"free": 1, "created": 1, "reused": 0, "dropped": 0}},
+        )
+
+    def test_clear(self):
+        """Test that the free and pending sprites are dropped."""
+        self.pools.free[PooledSprite].append(PooledSprite(1))
+        self.pools.pending.append(PooledSprite(2))
+
+        self.pools.clear()
+
+        self.assertEqual(self.pools.get_stats(), {})
+        self.assertEqual(self.pools.pending, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,6 @@ This module tests the PowerEffectsManager class that is used for
 creating powers in the game.
 """
 
-import time
 import unittest
 from unittest.mock import MagicMock, patch, call
 
@@ -48,8 +47,8 @@ class TestPowerEffectsManager(unittest.TestCase):
         self.assertEqual(self.power_effects_manager.power_down_time, 35)
         self.assertIsInstance(self.power_effects_manager.power_names, dict)
 
-    @patch("src.managers.powers_manager.time")
-    @patch("src.managers.powers_manager.random")
+    @patch("src.managers.powers_manager.game_clock")
+    @patch("src.managers.powers_manager.rng")
     def test_create_powers(self, mock_random, mock_time):
         """Test the creation of the powers."""
         mock_time.time.side_effect = [1, 16]
@@ -70,13 +69,13 @@ class TestPowerEffectsManager(unittest.TestCase):
         power1.rect.y = 50
         power2.rect.y = 2000
 
-        self.game.powers.copy.return_value = [power1, power2]
+        self.game.powers.sprites.return_value = [power1, power2]
 
         self.power_effects_manager.update_powers()
 
         self.game.powers.remove.assert_called_once_with(power2)
 
-    @patch("src.managers.powers_manager.random")
+    @patch("src.managers.powers_manager.rng")
     def test_create_power_up_or_penalty(self, mock_random):
         """Test the creation of powers."""
         self.power_effects_manager.create_power_up_or_penalty()
@@ -160,7 +159,7 @@ class TestPowerEffectsManager(unittest.TestCase):
         self.power_effects_manager.increase_ship_speed = MagicMock()
         player = "thunderbird"
 
-        with patch("random.choice") as mock_choice:
+        with patch("src.managers.powers_manager.rng.choice") as mock_choice:
             mock_choice.return_value = self.power_effects_manager.increase_ship_speed
             self.power_effects_manager.apply_powerup_or_penalty(player)
 
@@ -247,7 +246,7 @@ class TestPowerEffectsManager(unittest.TestCase):
         self.assertEqual(self.game.thunderbird_ship.power_name, "Unknown Power!")
         self.assertTrue(self.game.thunderbird_ship.display_power)
 
-    @patch("src.managers.powers_manager.time.time")
+    @patch("src.managers.powers_manager.game_clock.time")
     def test_display_powers_effect(self, mock_time):
         """Test the display_powers_effect method."""
         self.power_effects_manager.display_power_message = MagicMock()
@@ -325,11 +324,10 @@ class TestPowerEffectsManager(unittest.TestCase):
         mock_display_message.assert_not_called()
         self.assertFalse(ship.display_power)
 
-    def test_manage_power_downs(self):
+    @patch("src.managers.powers_manager.game_clock.time", return_value=100)
+    def test_manage_power_downs(self, _):
         """Test the manage power downs method when the power
         are turned off."""
-        self.game.pause_time = 5
-
         # Create ships with power down states and last power down times
         ship = MagicMock()
         ship.state.reverse = True
@@ -352,13 +350,10 @@ class TestPowerEffectsManager(unittest.TestCase):
         self.assertEqual(ship.last_disarmed_power_down_time, None)
         self.assertEqual(ship.last_scaled_weapon_power_down_time, None)
 
-        self.assertEqual(self.game.pause_time, 0)
-
     def test_manage_power_downs_still_active(self):
         """Test the manage power downs method when the power down
         is still active."""
-
-        self.game.pause_time = 0
+        current_time = 100
 
         # Create ships with power down states and last power down times
         ship = MagicMock()
@@ -366,15 +361,15 @@ class TestPowerEffectsManager(unittest.TestCase):
         ship.state.disarmed = True
         ship.state.scaled_weapon = True
 
-        ship.last_reverse_power_down_time = time.time() - 5
-        ship.last_disarmed_power_down_time = time.time() - 5
-        ship.last_scaled_weapon_power_down_time = time.time() - 5
+        ship.last_reverse_power_down_time = current_time - 5
+        ship.last_disarmed_power_down_time = current_time - 5
+        ship.last_scaled_weapon_power_down_time = current_time - 5
 
         self.game.ships = [ship]
 
-        # Mock the time to the current time
-        current_time = time.time() - (self.game.pause_time / 1000)
-        with patch("time.time", return_value=current_time):
+        with patch(
+            "src.managers.powers_manager.game_clock.time", return_value=current_time
+        ):
             self.power_effects_manager.manage_power_downs()
 
         # Assert that ship1's power down state is still True since it hasn't been 10 seconds yet
@@ -385,8 +380,6 @@ class TestPowerEffectsManager(unittest.TestCase):
         self.assertEqual(ship.last_disarmed_power_down_time, current_time - 5)
         self.assertEqual(ship.last_scaled_weapon_power_down_time, current_time - 5)
 
-        self.assertEqual(self.game.pause_time, 0)
-
     def test_decrease_ship_speed(self):
         """Test the decrease ship speed penalty."""
         player = "thunderbird"
@@ -482,8 +475,7 @@ class TestPowerEffectsManager(unittest.TestCase):
         self.power_effects_manager.bonus_points(player)
 
         self.assertEqual(self.game.stats.thunderbird_score, 1550)
-        self.game.score_board.render_scores.assert_called_once()
-        self.game.score_board.update_high_score.assert_called_once()
+        self.game.score_board.update_scores.assert_called_once()
 
     def test_change_ship_size(self):
         """Test the change ship size power up."""
@@ -0,0 +1,176 @@
+"""
+This module tests the FrameProfiler class which times the subsystems
+of the game loop and draws the profiler overlay.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.managers.pool_manager import PoolManager
+from src.managers.profiler_manager import FrameProfiler, SUBSYSTEMS, SPRITE_GROUPS
+
+
+class Worker:
+    """Object with methods that call each other, used to test the timing."""
+
+    def inner(self):
+        """Method called by the outer method."""
+        return "inner"
+
+    def outer(self):
+        """Method that calls the inner method."""
+        return self.inner()
+
+
+class TestFrameProfiler(unittest.TestCase):
+    """Test cases for the FrameProfiler class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        pygame.init()
+        self.game = MagicMock()
+        self.game.screen = pygame.Surface((400, 400))
+        self.game.sprite_pools = PoolManager()
+        for name in SPRITE_GROUPS:
+            setattr(self.game, name, pygame.sprite.Group())
+        self.profiler = FrameProfiler(self.game)
+        self.worker = Worker()
+
+    def test_init(self):
+        """Test the initialization of the class."""
+        self.assertEqual(self.profiler.game, self.game)
+        self.assertFalse(self.profiler.running)
+        self.assertFalse(self.profiler.show_overlay)
+        self.assertFalse(self.profiler.instrumented)
+        self.assertEqual(len(self.profiler.frame_history), 0)
+
+    @patch("src.managers.profiler_manager.time.perf_counter")
+    def test_nested_calls(self, mock_perf_counter):
+        """Test that the time of a nested call is counted only once."""
+        # outer starts at 0, inner runs from 1 to 3, outer ends at 4.
+        mock_perf_counter.side_effect = [0.0, 0.001, 0.003, 0.004]
+        self.profiler.instrument(self.worker, "inner_system", ("inner",))
+        self.profiler.instrument(self.worker, "outer_system", ("outer",))
+        self.profiler.running = True
+
+        self.assertEqual(self.worker.outer(), "inner")
+
+        frame_times = self.profiler.end_frame()
+        self.assertAlmostEqual(frame_times["inner_system"], 2.0)
+        self.assertAlmostEqual(frame_times["outer_system"], 2.0)
+        self.assertAlmostEqual(self.profiler.frame_history[-1], 4.0)
+
+    def test_not_running(self):
+        """Test that nothing is timed when the profiler is not running."""
+        self.profiler.instrument(self.worker, "outer_system", ("outer",))
+
+        self.assertEqual(self.worker.outer(), "inner")
+
+        self.assertEqual(self.profiler.end_frame(), {})
+        self.assertEqual(len(self.profiler.frame_history), 0)
+
+    def test_exception_is_propagated(self):
+        """Test that the timing stays consistent when the method raises."""
+
+        def failing():
+            raise ValueError
+
+        timed = self.profiler.wrap("system", failing)
+        self.profiler.running = True
+
+        with self.assertRaises(ValueError):
+            timed()
+
+        self.assertIn("system", self.profiler.end_frame())
+        self.assertEqual(self.profiler._child_times, [])
+
+    def test_start_instruments_once(self):
+        """Test that the game methods are wrapped only the first time."""
+        with patch.object(self.profiler, "instrument") as mock_instrument:
+            self.profiler.start()
+            self.profiler.stop()
+            self.profiler.start()
+
+        self.assertEqual(mock_instrument.call_count, len(SUBSYSTEMS))
+        mock_instrument.assert_any_call(self.game, "events", ("check_events",))
+        mock_instrument.assert_any_call(
+            self.game.aliens_manager, "update_aliens", ("update_aliens",)
+        )
+        self.assertTrue(self.profiler.running)
+
+    def test_toggle(self):
+        """Test showing and hiding the overlay."""
+        self.profiler.start = MagicMock()
+        self.profiler.stop = MagicMock()
+
+        self.profiler.toggle()
+
+        self.assertTrue(self.profiler.show_overlay)
+        self.profiler.start.assert_called_once()
+
+        self.profiler.toggle()
+
+        self.assertFalse(self.profiler.show_overlay)
+        self.profiler.stop.assert_called_once()
+
+    def test_toggle_keep_running(self):
+        """Test that hiding the overlay keeps the timing when requested."""
+        self.profiler.keep_running = True
+        self.profiler.show_overlay = True
+        self.profiler.stop = MagicMock()
+
+        self.profiler.toggle()
+
+        self.assertFalse(self.profiler.show_overlay)
+        self.profiler.stop.assert_not_called()
+
+    def test_get_report(self):
+        """Test the report of the collected timings."""
+        self.profiler.running = True
+        self.game.aliens.add(pygame.sprite.Sprite())
+        self.game.sprite_pools.acquire(pygame.sprite.Sprite)
+        for elapsed in (0.002, 0.004):
+            self.profiler.frame_times["draw"] = elapsed
+            self.profiler.end_frame()
+
+        with patch("src.managers.profiler_manager.frame_pacer") as mock_frame_pacer:
+            mock_frame_pacer.idle_percent = 75.0
+            report = self.profiler.get_report()
+
+        self.assertEqual(report["frames"], 2)
+        self.assertEqual(report["idle_percent"], 75.0)
+        self.assertAlmostEqual(report["last_frame_ms"], 4.0)
+        self.assertAlmostEqual(report["average_frame_ms"], 3.0)
+        self.assertAlmostEqual(report["max_frame_ms"], 4.0)
+        self.assertAlmostEqual(report["subsystems_ms"]["draw"], 3.0)
+        self.assertEqual(report["entities"]["aliens"], 1)
+        self.assertEqual(report["entities"]["asteroids"], 0)
+        self.assertEqual(report["pools"]["Sprite"]["created"], 1)
+
+    def test_draw_hidden(self):
+        """Test that nothing is drawn when the overlay is hidden."""
+        self.game.screen = MagicMock()
+
+        self.profiler.draw()
+
+        self.game.screen.blit.assert_not_called()
+
+    def test_draw(self):
+        """Test that the text lines are rendered and reused between frames."""
+        self.profiler.show_overlay = True
+        self.profiler.running = True
+        self.profiler.frame_times["draw"] = 0.030
+        self.profiler.end_frame()
+
+        self.profiler.draw()
+        text_surfaces = self.profiler.text_surfaces
+        self.profiler.draw()
+
+        self.assertTrue(text_surfaces)
+        self.assertIs(self.profiler.text_surfaces, text_surfaces)
+
+
+if __name__ == "__main__":
+    unittest.main()
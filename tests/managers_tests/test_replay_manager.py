@@ -0,0 +1,155 @@
+"""
+This module tests the ReplayRecorder class and the functions that are
+used to save, load and play the replays of the games.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.alien_onslaught import AlienOnslaught
+from src.managers.asset_manager import assets
+from src.managers.replay_manager import (
+    ReplayRecorder,
+    get_game_result,
+    load_replay,
+    play_replay,
+    save_replay,
+)
+from src.utils.constants import REPLAY_VERSION
+from src.utils.game_clock import game_clock
+
+
+class ReplayRecorderTests(unittest.TestCase):
+    """Test cases for the ReplayRecorder class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+        self.game = MagicMock()
+        self.game.stats.level = 3
+        self.game.stats.thunderbird_score = 100
+        self.game.stats.phoenix_score = 50
+        self.recorder = ReplayRecorder(self.game, enabled=True, folder=self.folder)
+
+    @patch("src.managers.replay_manager.get_game_options", return_value={})
+    def test_record(self, _):
+        """Test that the keys are recorded relative to the start of the game."""
+        with patch.object(game_clock, "ticks", 1000):
+            self.recorder.start(7, 1000)
+            self.recorder.record_key(pygame.K_SPACE, True)
+            game_clock.ticks = 1010
+            self.recorder.record_key(pygame.K_SPACE, False)
+            game_clock.ticks = 1020
+            path = self.recorder.finish()
+
+        replay = load_replay(path)
+        self.assertIsNone(self.recorder.replay)
+        self.assertEqual(replay["seed"], 7)
+        self.assertEqual(replay["ticks"], 20)
+        self.assertEqual(
+            replay["keys"], [[0, pygame.K_SPACE, 1], [10, pygame.K_SPACE, 0]]
+        )
+        self.assertEqual(replay["result"], {"level": 3, "scores": [100, 50]})
+
+    def test_disabled(self):
+        """Test that nothing is recorded when the recorder is disabled."""
+        self.recorder.enabled = False
+
+        self.recorder.start(7, 1000)
+        self.recorder.record_key(pygame.K_SPACE, True)
+
+        self.assertIsNone(self.recorder.replay)
+        self.assertIsNone(self.recorder.finish())
+        self.assertEqual(os.listdir(self.folder), [])
+
+    @patch("src.managers.replay_manager.get_game_options", return_value={})
+    def test_finish_empty_game(self, _):
+        """Test that a game that didn't run any tick is not saved."""
+        with patch.object(game_clock, "ticks", 1000):
+            self.recorder.start(7, 1000)
+            self.assertIsNone(self.recorder.finish())
+
+        self.assertEqual(os.listdir(self.folder), [])
+
+    def test_load_other_version(self):
+        """Test that replays of another version are rejected."""
+        path = os.path.join(self.folder, "old.replay")
+        save_replay({"version": REPLAY_VERSION + 1}, path)
+
+        with self.assertRaises(ValueError):
+            load_replay(path)
+
+
+class PlayReplayTests(unittest.TestCase):
+    """Test cases for playing the replays back."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+
+        # The other tests may have cached mocked images, while the
+        # game needs the real ones. The cache is restored afterwards.
+        caches = (assets.images, assets.image_sets, assets.frames, assets.alien_frames)
+        saved = [dict(cache) for cache in caches]
+        assets.clear()
+
+        def restore_caches():
+            for cache, items in zip(caches, saved):
+                cache.clear()
+                cache.update(items)
+
+        self.addCleanup(restore_caches)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _press(self, game, key, pressed):
+        """Press or release a key in the game."""
+        player_input = game.player_input
+        if pressed:
+            player_input.check_keydown_events(
+                pygame.event.Event(pygame.KEYDOWN, key=key),
+                None,
+                None,
+                None,
+                game.weapons_manager.fire_missile,
+                game.weapons_manager.fire_laser,
+            )
+        else:
+            player_input.check_keyup_events(pygame.event.Event(pygame.KEYUP, key=key))
+
+    def test_play_replay(self):
+        """Test that the replay plays the same game as the recorded one."""
+        game = AlienOnslaught(singleplayer=True, headless=True)
+        game.replay_recorder = ReplayRecorder(game, enabled=True, folder=self.folder)
+        game.next_seed = 11
+        game.start_headless_game()
+        keys = [pygame.K_SPACE, pygame.K_a, pygame.K_d, pygame.K_w]
+        for tick in range(600):
+            if tick % 15 == 0:
+                self._press(game, keys[tick // 15 % 4], tick % 30 == 0)
+            game.step()
+        result = get_game_result(game)
+        position = game.thunderbird_ship.rect.topleft
+        path = game.replay_recorder.finish()
+
+        replay = load_replay(path)
+        self.assertEqual(replay["ticks"], 600)
+        self.assertEqual(replay["result"], result)
+
+        replayed = AlienOnslaught(headless=True)
+        self.assertEqual(play_replay(replayed, replay), 600)
+        self.assertTrue(replayed.singleplayer)
+        self.assertEqual(get_game_result(replayed), result)
+        self.assertEqual(replayed.thunderbird_ship.rect.topleft, position)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,15 +5,27 @@ and load the game state.
 
 import os
 import datetime
+import threading
 import unittest
 from unittest.mock import MagicMock, patch, call
 
 import pygame
 
-from src.managers.save_load_manager import SaveLoadSystem
+from src.managers.save_load_manager import (
+    SaveLoadSystem,
+    SaveSlotIndex,
+    get_save_summary,
+    decode_thumbnail,
+    encode_thumbnail,
+    read_save_file,
+    write_save_file,
+    write_save_file_with_thumbnail,
+)
 from src.entities.alien_entities.aliens import Alien, BossAlien
 
-from src.utils.constants import ATTRIBUTE_MAPPING
+from src.utils.background_worker import background_worker
+from src.utils.constants import ATTRIBUTE_MAPPING, SAVE_VERSION, SAVE_INDEX_FILE
+from src.utils.game_clock import GameClock
 
 from src.game_logic.game_settings import Settings
 from src.game_logic.game_stats import GameStats
@@ -33,13 +45,20 @@ class TestSaveLoadSystem(unittest.TestCase):
         self.font = MagicMock()
         self.font.render.return_value = pygame.Surface((200, 50))
         with patch("src.managers.save_load_manager.create_save_dir"), patch(
-            "src.managers.save_load_manager.pygame.font.SysFont", return_value=self.font
+            "src.managers.save_load_manager.text_cache.get_font", return_value=self.font
         ):
             self.save_load_manager = SaveLoadSystem(self.game, "save", "save_data")
 
         os.makedirs(self.save_load_manager.save_folder, exist_ok=True)
 
+        self.game_clock = GameClock()
+        patcher = patch("src.managers.save_load_manager.game_clock", self.game_clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def tearDown(self):
+        # Wait for the files written by the background worker
+        background_worker.wait()
         # Remove the temporary folder and its contents after testing
         for root, _, files in os.walk(
             self.save_load_manager.save_folder, topdown=False
@@ -371,162 +390,419 @@ class TestSaveLoadSystem(unittest.TestCase):
             self.game.weapons_manager.set_weapon.call_args_list, expected_calls
         )
 
-    @patch("src.managers.save_load_manager.pygame.image.tostring")
-    def test_prepare_sprite_data_for_serialization(self, mock_tostring):
+    def test_prepare_sprite_data_for_serialization(self):
         """Test the prepare_sprite_data_for_serialization method."""
-        # Set up the mock data for the pygame.image.tostring call
-        mock_tostring.side_effect = lambda img, format: img
-        alien = MagicMock(spec=Alien)
-        alien.rect = MagicMock(x=100, y=200)
-        alien.image = MagicMock(
-            get_size=MagicMock(return_value=(30, 40)),
-            tostring=MagicMock(return_value=b"sample_image_data"),
-        )
-        alien.is_baby = False
+        alien = Alien(self.game)
+        alien.rect.topleft = (100, 200)
+        alien.x_pos = 100.5
         alien.hit_count = 3
         alien.last_bullet_time = 123
-        alien.immune_state = False
-        alien.frozen_state = True
+        alien.freeze()
+        alien.animation.current_frame = 2
 
-        boss_alien = MagicMock(spec=BossAlien)
-        boss_alien.rect = MagicMock(x=300, y=400)
-        boss_alien.image = MagicMock(
-            get_size=MagicMock(return_value=(50, 60)),
-            tostring=MagicMock(return_value=b"another_image_data"),
-        )
-        boss_alien.is_baby = True
+        boss_alien = BossAlien(self.game)
         boss_alien.hit_count = 1
         boss_alien.last_bullet_time = 2923
-        boss_alien.immune_state = False
-        boss_alien.frozen_state = False
+        boss_alien.last_hit_time = 4.5
 
-        sprite_data = {
-            "aliens": [
-                alien,
-                boss_alien,
-            ]
-        }
-
-        self.save_load_manager.data = sprite_data
+        self.save_load_manager.data = {"aliens": [alien, boss_alien]}
 
         result = self.save_load_manager.prepare_sprite_data_for_serialization()
 
-        # Assert the output of the method with the expected serialized data
-
-        expected_data = {
-            "alien_sprites": [
-                {
-                    "rect": alien.rect,
-                    "size": (30, 40),
-                    "image": alien.image,
-                    "is_baby": False,
-                    "type": "alien",
-                    "location": 100,
-                    "hit_count": 3,
-                    "last_bullet_time": 123,
-                    "immune_state": False,
-                    "frozen_state": True,
-                },
-                {
-                    "rect": boss_alien.rect,
-                    "size": (50, 60),
-                    "image": boss_alien.image,
-                    "is_baby": False,
-                    "type": "boss",
-                    "location": 300,
-                    "hit_count": 1,
-                    "last_bullet_time": 2923,
-                    "immune_state": None,
-                    "frozen_state": False,
-                },
+        self.game.aliens_manager.sync_alien_sprites.assert_called_once_with(
+            [alien, boss_alien]
+        )
+        alien_state, boss_state = result["alien_sprites"]
+        self.assertEqual(alien_state["type"], "alien")
+        self.assertEqual(alien_state["rect"], list(alien.rect))
+        self.assertEqual(alien_state["x_pos"], 100.5)
+        self.assertEqual(alien_state["hit_count"], 3)
+        self.assertEqual(alien_state["last_bullet_time"], 123)
+        self.assertTrue(alien_state["frozen_state"])
+        self.assertFalse(alien_state["is_baby"])
+        self.assertEqual(alien_state["level_prefix"], alien.animation.level_prefix)
+        self.assertEqual(alien_state["scale"], 1.0)
+        self.assertEqual(alien_state["current_frame"], 2)
+        self.assertNotIn("image", alien_state)
+
+        self.assertEqual(boss_state["type"], "boss")
+        self.assertEqual(boss_state["hit_count"], 1)
+        self.assertEqual(boss_state["last_bullet_time"], 2923)
+        self.assertEqual(boss_state["last_hit_time"], 4.5)
+        self.assertNotIn("level_prefix", boss_state)
+
+    @patch("src.managers.save_load_manager.background_worker")
+    def test_save_data(self, mock_worker):
+        """Test that save_data copies the game data and leaves
+        the writing to the background worker.
+        """
+        self.save_load_manager.prepare_sprite_data_for_serialization = MagicMock(
+            return_value={"alien_sprites": []}
+        )
+        self.save_load_manager.show_notice = MagicMock()
+        self.save_load_manager.get_current_game_stats()
+
+        self.save_load_manager.save_data("save1", "2023-01-01 12:00:00")
+
+        task, game_data, thumbnail, file_path = mock_worker.submit.call_args[0]
+        self.assertIs(task, write_save_file_with_thumbnail)
+        self.assertEqual(thumbnail.get_size(), (64, 35))
+        self.assertIn("callback", mock_worker.submit.call_args[1])
+        self.save_load_manager.show_notice.assert_called_once_with(
+            "Saving...", "lightblue"
+        )
+        self.assertEqual(
+            file_path, os.path.join(self.save_load_manager.save_folder, "save1.save")
+        )
+        self.assertEqual(game_data["version"], SAVE_VERSION)
+        self.assertEqual(game_data["sprite_data"], {"alien_sprites": []})
+        self.assertEqual(game_data["save_date"], "2023-01-01 12:00:00")
+        self.assertEqual(game_data["level"], self.game.stats.level)
+        self.assertEqual(game_data["summary"]["level"], self.game.stats.level)
+
+    def test_save_finished(self):
+        """Test the messages shown after the save file was written,
+        and that only the written saves are added to the slot index.
+        """
+        self.save_load_manager.show_notice = MagicMock()
+        slot_index = self.save_load_manager.slot_index
+        old_summary = {"save_date": "2022-01-01 12:00:00"}
+        summary = {"save_date": "2023-01-01 12:00:00"}
+        written_summary = {**summary, "thumbnail": "data"}
+        for save_file in ("save1.save", "save2.save", "save3.save"):
+            slot_index.set(save_file, summary)
+        future = MagicMock()
+        future.result.return_value = written_summary
+
+        future.exception.return_value = None
+        self.save_load_manager._save_finished(future, "save1.save", summary, None)
+        future.exception.return_value = OSError()
+        self.save_load_manager._save_finished(future, "save2.save", summary, None)
+        self.save_load_manager._save_finished(
+            future, "save3.save", summary, old_summary
+        )
+
+        self.assertEqual(
+            self.save_load_manager.show_notice.call_args_list,
+            [
+                call("Game Saved!", "lightblue"),
+                call("The game could not be saved!", "red"),
+                call("The game could not be saved!", "red"),
             ],
-        }
+        )
+        self.assertIs(slot_index.get("save1.save"), written_summary)
+        self.assertIsNone(slot_index.get("save2.save"))
+        self.assertIs(slot_index.get("save3.save"), old_summary)
+
+    def test_pending_save(self):
+        """Test that a save is in the slot index while it's being written,
+        so saving to its slot asks to overwrite it and loading it waits
+        for the write.
+        """
+        release = threading.Event()
+        background_worker.submit(release.wait, 5)
+        self.save_load_manager.get_current_game_stats()
+        self.save_load_manager.data["aliens"] = []
+        self.save_load_manager._show_confirmation_popup = MagicMock()
+
+        self.save_load_manager.save_data("save1", "2023-01-01 12:00:00")
+
+        self.assertEqual(self.save_load_manager._get_save_files(), ["save1.save"])
+        self.save_load_manager._handle_save_action(self.font, 0)
+        self.save_load_manager._show_confirmation_popup.assert_called_once()
+
+        order = []
+        self.save_load_manager.update_game_state_from_data = MagicMock()
+        self.save_load_manager.restore_sprites_from_data = MagicMock()
+        with patch("src.managers.save_load_manager.pygame.event.pump"), patch(
+            "src.managers.save_load_manager.write_save_file",
+            side_effect=lambda *_: order.append("write"),
+        ), patch(
+            "src.managers.save_load_manager.read_save_file",
+            side_effect=lambda *_: order.append("read") or {},
+        ):
+            release.set()
+            self.assertTrue(self.save_load_manager.load_data("save1"))
+
+        self.assertEqual(order, ["write", "read"])
+
+    @patch("src.managers.save_load_manager.write_save_file")
+    def test_delete_all_save_files_after_pending_save(self, mock_write_save_file):
+        """Test that the saves are deleted after the save being written,
+        so the deleted save doesn't come back.
+        """
 
-        self.assertEqual(result, expected_data)
+        def write_save_file(_, path):
+            with open(path, "w", encoding="utf-8") as save_file:
+                save_file.write("Sample data")
 
-    @patch("src.managers.save_load_manager.pickle.dump")
-    @patch("src.managers.save_load_manager.os.path.join")
-    def test_save_data(self, mock_join, mock_pickle_dump):
-        """Test the save_data method."""
-        self.save_load_manager.prepare_sprite_data_for_serialization = MagicMock()
+        mock_write_save_file.side_effect = write_save_file
+        release = threading.Event()
+        background_worker.submit(release.wait, 5)
         self.save_load_manager.get_current_game_stats()
+        self.save_load_manager.data["aliens"] = []
+
+        self.save_load_manager.save_data("save1", "2023-01-01 12:00:00")
+        self.save_load_manager._delete_all_save_files()
+        release.set()
+        background_worker.wait()
+
+        mock_write_save_file.assert_called_once()
 
-        mock_open_func = MagicMock()
+        self.assertEqual(
+            os.listdir(self.save_load_manager.save_folder), [SAVE_INDEX_FILE]
+        )
+        self.assertEqual(self.save_load_manager._get_save_files(), [])
 
-        with patch("builtins.open", mock_open_func):
-            self.save_load_manager.save_data("save1", MagicMock())
+    @patch("src.managers.save_load_manager.write_save_file")
+    def test_save_data_updates_slot_index(self, _):
+        """Test that a saved game is added to the slot index."""
+        self.game.stats.level = 4
+        self.game.stats.thunderbird_score = 300
+        self.save_load_manager.get_current_game_stats()
+        self.save_load_manager.data["aliens"] = []
+
+        self.save_load_manager.save_data("save1", "2023-01-01 12:00:00")
+        background_worker.wait()
+
+        summary = self.save_load_manager.slot_index.get("save1.save")
+        self.assertEqual(summary["save_date"], "2023-01-01 12:00:00")
+        self.assertEqual(summary["level"], 4)
+        self.assertEqual(summary["scores"], [300, 0])
+        self.assertEqual(decode_thumbnail(summary["thumbnail"]).get_size(), (64, 35))
+        self.assertEqual(self.save_load_manager._get_save_files(), ["save1.save"])
+
+    def test_get_save_summary(self):
+        """Test the summary of a saved game shown in the save menus."""
+        game_data = {
+            "save_date": "2023-01-01 12:00:00",
+            "level": 7,
+            "game_mode": "boss_rush",
+            "thunderbird_score": 1200,
+            "phoenix_score": 800,
+            "sprite_data": {"alien_sprites": []},
+        }
+
+        self.assertEqual(
+            get_save_summary(game_data),
+            {
+                "save_date": "2023-01-01 12:00:00",
+                "level": 7,
+                "game_mode": "boss_rush",
+                "scores": [1200, 800],
+            },
+        )
+
+    def test_thumbnail_encoding(self):
+        """Test that a thumbnail is decoded back the same."""
+        thumbnail = pygame.Surface((64, 35))
+        thumbnail.fill((10, 20, 30))
+        thumbnail.set_at((5, 6), (200, 100, 50))
+
+        decoded = decode_thumbnail(encode_thumbnail(thumbnail))
+
+        self.assertEqual(decoded.get_size(), (64, 35))
+        self.assertEqual(decoded.get_at((0, 0))[:3], (10, 20, 30))
+        self.assertEqual(decoded.get_at((5, 6))[:3], (200, 100, 50))
+
+    def test_get_save_status_text_with_summary(self):
+        """Test that the status text shows the summary of the save."""
+        self.save_load_manager.slot_index.summaries = {
+            "save1.save": {
+                "save_date": "2023-01-01 12:00:00",
+                "level": 3,
+                "game_mode": "boss_rush",
+                "scores": [1200, 800],
+            },
+            "save2.save": {
+                "save_date": "2023-01-01 12:00:00",
+                "level": 1,
+                "game_mode": "normal",
+                "scores": [0, 0],
+            },
+        }
 
-        mock_open_func.assert_called_once()
-        mock_join.assert_called_once_with(
-            self.save_load_manager.save_folder, "save1.save"
+        self.assertEqual(
+            self.save_load_manager._get_save_status_text(1),
+            "Saved On: 01 Jan 2023  12:00 PM | Level 3 | BOSS RUSH | 1200 / 800",
+        )
+        self.assertEqual(
+            self.save_load_manager._get_save_status_text(2),
+            "Saved On: 01 Jan 2023  12:00 PM | Level 1 | NORMAL | 0",
         )
-        mock_pickle_dump.assert_called_once()
 
-    @patch("src.managers.save_load_manager.pickle.load")
-    @patch("src.managers.save_load_manager.os.path.join")
-    def test_load_data(self, mock_join, mock_pickle_load):
+    @patch("src.managers.save_load_manager.pygame.draw.rect")
+    def test_draw_save_slots_thumbnails(self, _):
+        """Test that the thumbnails are decoded once, by the background
+        worker, and drawn next to their slots after that.
+        """
+        thumbnail = pygame.Surface((64, 35))
+        summary = {
+            "save_date": "2023-01-01 12:00:00",
+            "thumbnail": encode_thumbnail(thumbnail),
+        }
+        self.save_load_manager.slot_index.summaries = {"save2.save": summary}
+        self.save_load_manager.screen = MagicMock()
+
+        with patch(
+            "src.managers.save_load_manager.decode_thumbnail",
+            side_effect=decode_thumbnail,
+        ) as mock_decode:
+            self.save_load_manager._draw_save_slots(0)
+            background_worker.wait()
+            self.save_load_manager._draw_save_slots(0)
+            self.save_load_manager._render_save_slots()
+
+        mock_decode.assert_called_once_with(summary["thumbnail"])
+        decoded = self.save_load_manager.thumbnails[
+            ("save2.save", summary["save_date"])
+        ]
+        self.assertEqual(decoded.get_size(), (64, 35))
+        blitted = [
+            args[0][0] for args in self.save_load_manager.screen.blit.call_args_list
+        ]
+        self.assertEqual(blitted.count(decoded), 1)
+
+    def test_save_and_load_file(self):
+        """Test that a saved file is read back the same, with the progress."""
+        path = os.path.join(self.save_load_manager.save_folder, "save1.save")
+        game_data = {"version": SAVE_VERSION, "sprite_data": {"alien_sprites": []}}
+        progress = MagicMock()
+
+        write_save_file(game_data, path)
+
+        self.assertEqual(read_save_file(path, progress), game_data)
+        self.assertEqual(progress.call_args[0][0], 1.0)
+        self.assertEqual(os.listdir(self.save_load_manager.save_folder), ["save1.save"])
+
+    @patch("src.managers.save_load_manager.os.replace", side_effect=OSError)
+    def test_write_save_file_failed(self, _):
+        """Test that a failed write keeps the old save file."""
+        path = os.path.join(self.save_load_manager.save_folder, "save1.save")
+        with open(path, "wb") as file:
+            file.write(b"old save")
+
+        with self.assertRaises(OSError):
+            write_save_file({"version": SAVE_VERSION}, path)
+
+        self.assertEqual(os.listdir(self.save_load_manager.save_folder), ["save1.save"])
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), b"old save")
+
+    def test_read_save_file_unsupported_version(self):
+        """Test that the save files of other versions are not read."""
+        path = os.path.join(self.save_load_manager.save_folder, "save1.save")
+        write_save_file({"version": SAVE_VERSION - 1}, path)
+
+        with self.assertRaises(ValueError):
+            read_save_file(path)
+
+    @patch("src.managers.save_load_manager.frame_pacer")
+    @patch("src.managers.save_load_manager.pygame.event.pump")
+    @patch("src.managers.save_load_manager.read_save_file")
+    def test_load_data(self, mock_read_save_file, *_):
         """Test the load_data method."""
         self.save_load_manager.update_game_state_from_data = MagicMock()
         self.save_load_manager.restore_sprites_from_data = MagicMock()
 
-        mock_open_func = MagicMock()
-        with patch("builtins.open", mock_open_func):
-            self.save_load_manager.load_data("save1")
+        self.assertTrue(self.save_load_manager.load_data("save1"))
 
-        mock_open_func.assert_called_once()
-        mock_join.assert_called_once_with(
-            self.save_load_manager.save_folder, "save1.save"
+        mock_read_save_file.assert_called_once_with(
+            os.path.join(self.save_load_manager.save_folder, "save1.save"),
+            self.save_load_manager._set_load_progress,
+        )
+        self.save_load_manager.update_game_state_from_data.assert_called_once_with(
+            mock_read_save_file.return_value
         )
-        mock_pickle_load.assert_called_once()
+        self.save_load_manager.restore_sprites_from_data.assert_called_once_with(
+            mock_read_save_file.return_value
+        )
+
+    @patch("src.managers.save_load_manager.frame_pacer")
+    @patch("src.managers.save_load_manager.pygame.event.pump")
+    @patch("src.managers.save_load_manager.play_sound")
+    def test_load_data_invalid_file(self, mock_play_sound, *_):
+        """Test that the missing, old and corrupt save files are not loaded."""
+        self.save_load_manager.update_game_state_from_data = MagicMock()
+        self.save_load_manager.restore_sprites_from_data = MagicMock()
+        folder = self.save_load_manager.save_folder
+        with open(os.path.join(folder, "save2.save"), "wb") as file:
+            file.write(b"\x80\x04not a save file")
+        write_save_file({"version": 1}, os.path.join(folder, "save3.save"))
 
-        self.save_load_manager.update_game_state_from_data.assert_called_once()
-        self.save_load_manager.restore_sprites_from_data.assert_called_once()
+        for name in ("save1", "save2", "save3"):
+            self.assertFalse(self.save_load_manager.load_data(name))
 
-    @patch("src.managers.save_load_manager.pygame.image.fromstring")
-    def test_restore_sprites_from_data(self, mock_fromstring):
+        self.assertEqual(mock_play_sound.call_count, 3)
+        self.save_load_manager.update_game_state_from_data.assert_not_called()
+        self.save_load_manager.restore_sprites_from_data.assert_not_called()
+
+    def test_restore_sprites_from_data(self):
         """Test the restore_sprites_from_data method."""
-        # Set up loaded sprites data
+        alien = Alien(self.game)
+        alien.rect.topleft = (150, 120)
+        alien.x_pos = 150.25
+        alien.last_bullet_time = 128
+        alien.animation.change_scale(0.5)
+        alien.animation.current_frame = 1
+        alien.is_baby = True
+        self.save_load_manager.data = {"aliens": [alien]}
         loaded_data = {
-            "sprite_data": {
-                "alien_sprites": [
-                    {
-                        "type": "alien",
-                        "size": (32, 32),
-                        "rect": (100, 100, 32, 32),
-                        "image": b"MockImageString",
-                        "location": (200, 200),
-                        "frozen_state": False,
-                        "is_baby": False,
-                        "immune_state": False,
-                        "last_bullet_time": 128,
-                    },
-                ]
-            }
+            "sprite_data": self.save_load_manager.prepare_sprite_data_for_serialization()
         }
 
         self.save_load_manager.restore_sprites_from_data(loaded_data)
 
-        # Assertions
         self.assertEqual(self.game.aliens.empty.call_count, 1)
-        self.assertEqual(
-            mock_fromstring.call_count, len(loaded_data["sprite_data"]["alien_sprites"])
-        )
-
         restored_sprites = self.game.aliens.add.call_args_list
-        self.assertEqual(
-            len(restored_sprites), len(loaded_data["sprite_data"]["alien_sprites"])
-        )
+        self.assertEqual(len(restored_sprites), 1)
 
-        for i, call_args in enumerate(restored_sprites):
-            sprite = call_args[0][0]
-            sprite_state = loaded_data["sprite_data"]["alien_sprites"][i]
+        sprite = restored_sprites[0][0][0]
+        self.assertIsNot(sprite, alien)
+        self.assertEqual(sprite.rect, alien.rect)
+        self.assertEqual(sprite.x_pos, 150.25)
+        self.assertEqual(sprite.last_bullet_time, 128)
+        self.assertTrue(sprite.is_baby)
+        self.assertEqual(sprite.motion.sins, alien.motion.sins)
+        self.assertEqual(sprite.animation.scale, 0.5)
+        self.assertEqual(sprite.animation.current_frame, 1)
+        # The frames are the ones shared by all the aliens.
+        self.assertIs(sprite.animation.frames, alien.animation.frames)
+        self.assertIs(sprite.image, alien.animation.frames[1])
+
+    def test_sprite_timers_rebased_on_load(self):
+        """Test that the timers of a game saved late on the game clock
+        are moved onto the clock of the game that loads it.
+        """
+        self.game_clock.ticks = 432000
+        ticks, seconds = self.game_clock.get_ticks(), self.game_clock.time()
+        alien = Alien(self.game)
+        alien.last_bullet_time = ticks - 500
+        alien.motion.last_direction_change = ticks - 300
+        alien.frozen_start_time = seconds - 2
+        alien.immune_start_time = seconds - 1
+        boss_alien = BossAlien(self.game)
+        boss_alien.last_bullet_time = 0
+        boss_alien.last_hit_time = seconds - 0.1
+        self.save_load_manager.data = {"aliens": [alien, boss_alien]}
+        loaded_data = {
+            "sprite_data": self.save_load_manager.prepare_sprite_data_for_serialization()
+        }
 
-            self.assertEqual(sprite.size, sprite_state["size"])
-            self.assertEqual(sprite.rect, sprite_state["rect"])
-            self.assertEqual(sprite.x_pos, sprite_state["location"])
-            self.assertEqual(sprite.frozen_state, sprite_state["frozen_state"])
-            self.assertEqual(sprite.immune_state, sprite_state["immune_state"])
-            self.assertEqual(sprite.last_bullet_time, sprite_state["last_bullet_time"])
+        self.game_clock.ticks = 600
+        self.save_load_manager.restore_sprites_from_data(loaded_data)
+        sprites = [args[0][0] for args in self.game.aliens.add.call_args_list]
+        self.game.aliens = sprites
+        self.save_load_manager.rebase_alien_timers()
+
+        loaded_alien, loaded_boss = sprites
+        self.assertEqual(loaded_alien.last_bullet_time, 10000 - 500)
+        self.assertEqual(loaded_alien.motion.last_direction_change, 10000 - 300)
+        self.assertAlmostEqual(loaded_alien.frozen_start_time, 8.0)
+        self.assertAlmostEqual(loaded_alien.immune_start_time, 9.0)
+        # The boss never fired, so it can fire at once.
+        self.assertEqual(loaded_boss.last_bullet_time, 0)
+        self.assertAlmostEqual(loaded_boss.last_hit_time, 9.9)
 
     def test_create_regular_alien_sprite(self):
         """Test the create_alien_sprite method with a normal Alien."""
@@ -552,7 +828,7 @@ class TestSaveLoadSystem(unittest.TestCase):
     def test_create_baby_alien_sprite(self):
         """Test the create_alien_sprite method with a baby Alien."""
         sprite_type = "alien"
-        sprite_state = {"is_baby": True, "location": 100}
+        sprite_state = {"is_baby": True, "rect": [100, 50, 20, 20]}
 
         sprite = self.save_load_manager.create_alien_sprite(
             sprite_type, sprite_state, self.game
@@ -646,8 +922,44 @@ class TestSaveLoadSystem(unittest.TestCase):
         self.assertEqual(self.game.settings.alien_speed, 5)
         self.assertEqual(self.game.settings.alien_bullet_speed, 8)
 
+    @patch("src.managers.save_load_manager.frame_pacer")
+    def test_handle_save_load_menu_confirm_dialog(self, _):
+        """Test that the menu stays open while the confirmation dialog is
+        open, passes it the events and closes after the answer that saves.
+        """
+        dialog = self.game.confirm_dialog
+        dialog.active = False
+        dialog.handle_event.return_value = False
+        self.save_load_manager._draw_save_slots = MagicMock()
+        self.save_load_manager.display_screen_title = MagicMock()
+
+        def open_dialog(*_):
+            dialog.active = True
+            dialog.handle_event.side_effect = answer
+
+        def answer(_):
+            self.save_load_manager.menu_running = False
+            return True
+
+        self.save_load_manager._handle_save_slot_action = MagicMock(
+            side_effect=open_dialog
+        )
+        enter = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN)
+        events = [[enter], [enter]]
+
+        with patch(
+            "src.managers.save_load_manager.pygame.event.get",
+            side_effect=lambda: events.pop(0),
+        ), patch("src.managers.save_load_manager.pygame.display.flip"):
+            self.save_load_manager.handle_save_load_menu(save=True)
+
+        self.save_load_manager._handle_save_slot_action.assert_called_once()
+        self.assertEqual(dialog.handle_event.call_count, 2)
+        self.assertEqual(events, [])
+
+    @patch("src.managers.save_load_manager.frame_pacer")
     @patch("src.managers.save_load_manager.pygame")
-    def test_handle_save_load_menu(self, mock_pygame):
+    def test_handle_save_load_menu(self, mock_pygame, mock_frame_pacer):
         """Test the handle_save_load_menu method."""
         self.save_load_manager.display_screen_title = MagicMock()
         self.save_load_manager.screen = MagicMock()
@@ -657,6 +969,7 @@ class TestSaveLoadSystem(unittest.TestCase):
                 return_value=["save1.save", "save2.save", "save3.save"]
             )
             self.save_load_manager._draw_save_slots = MagicMock()
+            self.save_load_manager.slot_rects = [pygame.Rect(0, 0, 10, 10)] * 3
             mock_pygame.display.flip.side_effect = lambda: setattr(
                 self.save_load_manager, "menu_running", False
             )
@@ -665,9 +978,13 @@ class TestSaveLoadSystem(unittest.TestCase):
             self.save_load_manager.handle_save_load_menu(save=True)
 
             # Make assertions based on expected calls and interactions
-            self.save_load_manager._get_save_files.assert_called_once()
+            # The save files are listed only by the slot actions.
+            self.save_load_manager._get_save_files.assert_not_called()
             # self.game.screen.fill.assert_called_once_with((0, 0, 0))
-            self.save_load_manager._draw_save_slots.assert_called_once()
+            self.save_load_manager._draw_save_slots.assert_called_once_with(0)
+            self.assertEqual(len(self.save_load_manager.slot_rects), 3)
+            self.game.confirm_dialog.draw.assert_called_once()
+            mock_frame_pacer.wait.assert_called_once()
 
             expected_blit_calls = [
                 call(self.game.bg_img, [0, 0]),
@@ -715,14 +1032,18 @@ class TestSaveLoadSystem(unittest.TestCase):
         # Assertion
         self.assertListEqual(result, expected_result)
 
+        # The folder is read only once, the index file is used after that.
+        background_worker.wait()
+        with patch("src.managers.save_load_manager.os.listdir") as mock_listdir:
+            slot_index = SaveSlotIndex(self.save_load_manager.save_folder, "save")
+            self.assertListEqual(slot_index.get_save_files(), expected_result)
+            self.assertIn("save_date", slot_index.get("savegame1.save"))
+            mock_listdir.assert_not_called()
+
     def test_get_save_status_text_no_savefiles(self):
         """Test the get_save_status_text with no savefiles."""
-        save_files = []
-
         # Call the method
-        result = self.save_load_manager._get_save_status_text(
-            slot_number=1, save_files=save_files
-        )
+        result = self.save_load_manager._get_save_status_text(slot_number=1)
 
         expected_result = "Empty"
 
@@ -739,12 +1060,8 @@ class TestSaveLoadSystem(unittest.TestCase):
             encoding="utf-8",
         ).close()
 
-        save_files = [test_save_file]
-
         # Call the method
-        result = self.save_load_manager._get_save_status_text(
-            slot_number=1, save_files=save_files
-        )
+        result = self.save_load_manager._get_save_status_text(slot_number=1)
 
         # Get the current date and time in the required format
         current_time_str = datetime.datetime.now().strftime("%d %b %Y  %I:%M %p")
@@ -766,20 +1083,10 @@ class TestSaveLoadSystem(unittest.TestCase):
                 encoding="utf-8",
             ).close()
 
-        text_color = (255, 255, 255)
-        center_x = 400
         slot_selected = 0
-        slot_rects = []
 
         # Call the method
-        self.save_load_manager._draw_save_slots(
-            font=self.font,
-            text_color=text_color,
-            center_x=center_x,
-            save_files=test_save_files,
-            slot_selected=slot_selected,
-            slot_rects=slot_rects,
-        )
+        self.save_load_manager._draw_save_slots(slot_selected)
         current_time = datetime.datetime.now().strftime("%d %b %Y  %I:%M %p")
         expected_text_0 = f"Save File 1: Saved On: {current_time}"
         actual_text_0 = self.font.render.call_args_list[2][0][0]
@@ -790,7 +1097,23 @@ class TestSaveLoadSystem(unittest.TestCase):
         mock_draw_rect.assert_called_once()
         self.assertEqual(actual_text_0, expected_text_0)
         self.assertEqual(actual_text_1, expected_text_1)
-        self.assertEqual(len(slot_rects), 3)
+        self.assertEqual(len(self.save_load_manager.slot_rects), 3)
+
+        # The slots are drawn from the cache on the next frames.
+        for _ in range(5):
+            self.save_load_manager._draw_save_slots(slot_selected)
+        self.assertEqual(self.font.render.call_count, 5)
+        self.assertEqual(len(self.save_load_manager.slot_rects), 3)
+
+        # And rendered again after a save.
+        self.save_load_manager.slot_index.set(
+            "save3.save", {"save_date": "2023-01-01 12:00:00"}
+        )
+        self.save_load_manager._draw_save_slots(slot_selected)
+        self.assertEqual(
+            self.font.render.call_args_list[-1][0][0],
+            "Save File 3: Saved On: 01 Jan 2023  12:00 PM",
+        )
 
     def test_handle_save_slot_action(self):
         """Test the handle_save_slot_action method."""
@@ -833,10 +1156,18 @@ class TestSaveLoadSystem(unittest.TestCase):
 
         # Assertions
         self.save_load_manager._get_save_files.assert_called_once()
-        self.save_load_manager._show_confirmation_popup.assert_called_once_with(
-            delete_save_files=False
+        popup_call = self.save_load_manager._show_confirmation_popup.call_args
+        self.assertEqual(popup_call.kwargs, {"delete_save_files": False})
+        self.save_load_manager._save_game.assert_not_called()
+
+        # Confirm the overwrite
+        self.save_load_manager.menu_running = True
+        popup_call.args[0](True)
+
+        self.save_load_manager._save_game.assert_called_once_with(
+            self.font, slot_selected
         )
-        self.save_load_manager._save_game.assert_called_once()
+        self.assertFalse(self.save_load_manager.menu_running)
 
     @patch("src.managers.save_load_manager.play_sound")
     def test_handle_save_action_overwrite_not_accepting(self, mock_play_sound):
@@ -848,16 +1179,16 @@ class TestSaveLoadSystem(unittest.TestCase):
         self.save_load_manager._get_save_files = MagicMock(
             return_value=["save1.save", "save2.save"]
         )
-        self.save_load_manager._show_confirmation_popup = MagicMock(return_value=False)
+        self.save_load_manager._show_confirmation_popup = MagicMock()
         self.save_load_manager._save_game = MagicMock()
 
         self.save_load_manager._handle_save_action(self.font, slot_selected)
+        self.save_load_manager.menu_running = True
+        self.save_load_manager._show_confirmation_popup.call_args.args[0](False)
 
         # Assertions
         self.save_load_manager._get_save_files.assert_called_once()
-        self.save_load_manager._show_confirmation_popup.assert_called_once_with(
-            delete_save_files=False
-        )
+        self.assertTrue(self.save_load_manager.menu_running)
         mock_play_sound.assert_called_once_with(
             self.game.sound_manager.game_sounds, "click"
         )
@@ -910,6 +1241,20 @@ class TestSaveLoadSystem(unittest.TestCase):
             self.game.screen, "Game Loaded!", self.font, "lightblue", 1000
         )
 
+    @patch("src.managers.save_load_manager.display_simple_message")
+    def test_handle_load_action_incompatible_savefile(self, mock_display_message):
+        """Test the handle_load_action with a save file that can't be loaded."""
+        self.game.game_loaded = False
+        self.save_load_manager._get_save_files = MagicMock(return_value=["save1.save"])
+        self.save_load_manager.load_data = MagicMock(return_value=False)
+
+        self.save_load_manager._handle_load_action(self.font, 0)
+
+        self.assertFalse(self.game.game_loaded)
+        mock_display_message.assert_called_once_with(
+            self.game.screen, "Incompatible save file", self.font, "red", 1000
+        )
+
     @patch("src.managers.save_load_manager.play_sound")
     @patch("src.managers.save_load_manager.display_simple_message")
     def test_handle_load_action_non_existing_savefile(
@@ -952,9 +1297,25 @@ class TestSaveLoadSystem(unittest.TestCase):
         self.save_load_manager.save_data.assert_called_once_with(
             f"save{slot_selected + 1}", save_date=save_date
         )
-        mock_display_message.assert_called_once_with(
-            self.game.screen, "Game Saved!", self.font, "lightblue", 1000
-        )
+        # The game goes on while the file is written.
+        mock_display_message.assert_not_called()
+
+    @patch("src.managers.save_load_manager.pygame.time.get_ticks")
+    @patch("src.managers.save_load_manager.background_worker")
+    def test_update_notice(self, mock_worker, mock_get_ticks):
+        """Test that the notice is drawn until its time is over."""
+        self.save_load_manager.screen = MagicMock()
+        mock_get_ticks.return_value = 1000
+        self.save_load_manager.show_notice("Game Saved!", "lightblue")
+
+        mock_get_ticks.return_value = 1500
+        self.save_load_manager.update()
+        mock_get_ticks.return_value = 2500
+        self.save_load_manager.update()
+
+        self.assertEqual(mock_worker.poll.call_count, 2)
+        self.save_load_manager.screen.blit.assert_called_once()
+        self.assertIsNone(self.save_load_manager.notice)
 
     def test_delete_all_save_files(self):
         """Test the delete_all_save_files method."""
@@ -975,44 +1336,50 @@ class TestSaveLoadSystem(unittest.TestCase):
 
         # Call the method
         self.save_load_manager._delete_all_save_files()
+        background_worker.wait()
 
         # Check if the save files have been deleted
-        self.assertFalse(os.listdir(self.save_load_manager.save_folder))
+        self.assertEqual(
+            os.listdir(self.save_load_manager.save_folder), [SAVE_INDEX_FILE]
+        )
+        self.assertEqual(self.save_load_manager.slot_index.get_save_files(), [])
 
-    @patch("src.managers.save_load_manager.tk.Tk")
-    @patch("src.managers.save_load_manager.messagebox.askyesno")
-    def test_show_confirmation_popup_delete_save_files(self, mock_askyesno, mock_tk):
+    def test_show_confirmation_popup_delete_save_files(self):
         """Test the show_confirmation_popup with delete_save_files."""
-        mock_askyesno.return_value = True
+        callback = MagicMock()
 
-        # Call the _show_confirmation_popup method with delete_save_files=True
-        response = self.save_load_manager._show_confirmation_popup(
-            delete_save_files=True
+        self.save_load_manager._show_confirmation_popup(
+            callback, delete_save_files=True
         )
 
-        # Assertions
-        self.assertTrue(response)
-        mock_tk.assert_called_once()
-        mock_askyesno.assert_called_once_with("Confirmation", "Delete all save files?")
+        self.game.confirm_dialog.open.assert_called_once_with(
+            "Delete all save files?", callback
+        )
 
-    @patch("src.managers.save_load_manager.tk.Tk")
-    @patch("src.managers.save_load_manager.messagebox.askyesno")
-    def test_show_confirmation_popup_overwrite_save_file(self, mock_askyesno, mock_tk):
+    def test_show_confirmation_popup_overwrite_save_file(self):
         """Test the show_confirmation_popup with overwrite save_file."""
-        mock_askyesno.return_value = False
+        callback = MagicMock()
 
-        # Call the _show_confirmation_popup method with delete_save_files=False
-        response = self.save_load_manager._show_confirmation_popup(
-            delete_save_files=False
+        self.save_load_manager._show_confirmation_popup(
+            callback, delete_save_files=False
         )
 
-        # Assertions
-        self.assertFalse(response)
-        mock_tk.assert_called_once()
-        mock_askyesno.assert_called_once_with(
-            "Confirmation", "Overwrite this save file?"
+        self.game.confirm_dialog.open.assert_called_once_with(
+            "Overwrite this save file?", callback
         )
 
+    @patch("src.managers.save_load_manager.play_sound")
+    def test_confirm_delete(self, mock_play_sound):
+        """Test that the save files are deleted only when confirmed."""
+        self.save_load_manager._delete_all_save_files = MagicMock()
+
+        self.save_load_manager._confirm_delete(False)
+        self.save_load_manager._delete_all_save_files.assert_not_called()
+
+        self.save_load_manager._confirm_delete(True)
+        self.save_load_manager._delete_all_save_files.assert_called_once()
+        self.assertEqual(mock_play_sound.call_count, 2)
+
     def test_update_rect_positions(self):
         """Test the update_rect_positions method."""
         self.save_load_manager.update_rect_positions()
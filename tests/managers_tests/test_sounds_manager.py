@@ -4,11 +4,12 @@ in the game.
 """
 
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pygame
 
-from src.managers.sounds_manager import SoundManager
+from src.managers.sounds_manager import SoundManager, NullSoundManager
+from src.utils.constants import GAME_SOUNDS, MENU_SOUNDS
 
 
 class TestSoundManager(unittest.TestCase):
@@ -17,8 +18,12 @@ class TestSoundManager(unittest.TestCase):
     def setUp(self):
         """Set up the test environment."""
         self.game = MagicMock()
+        self.game.sfx_muted = False
         self.sound_manager = SoundManager(self.game)
 
+    def tearDown(self):
+        self.sound_manager.loader.executor.shutdown()
+
     def test_init(self):
         """Test the initialization of the class."""
         self.assertEqual(self.sound_manager.settings, self.game.settings)
@@ -38,19 +43,14 @@ class TestSoundManager(unittest.TestCase):
         """Test the loading of the gameplay sounds."""
         self.sound_manager._load_gameplay_sounds = MagicMock()
         self.sound_manager._set_multiple_music_volume = MagicMock()
-        self.sound_manager._prepare_gameplay_sounds_volume = MagicMock()
 
         self.sound_manager.load_sounds("gameplay_sounds")
 
         self.sound_manager._load_gameplay_sounds.assert_called_once()
         self.sound_manager._set_multiple_music_volume.assert_called_with(0.3)
-        self.sound_manager._prepare_gameplay_sounds_volume.assert_called_once()
 
     @patch("src.managers.sounds_manager.set_music_volume")
-    @patch("src.managers.sounds_manager.set_sounds_volume")
-    def test_load_sounds_menu_sounds(
-        self, mock_set_sounds_volume, mock_set_music_volume
-    ):
+    def test_load_sounds_menu_sounds(self, mock_set_music_volume):
         """Test the loading of the menu sounds."""
         self.sound_manager.load_menu_sounds = MagicMock()
 
@@ -58,36 +58,127 @@ class TestSoundManager(unittest.TestCase):
 
         self.sound_manager.load_menu_sounds.assert_called_once()
         mock_set_music_volume.assert_called_with(self.sound_manager.menu_music, 0.8)
-        mock_set_sounds_volume.assert_called_with(self.sound_manager.menu_sounds, 0.7)
+
+    @patch("src.managers.sounds_manager.pygame.mixer.get_init", return_value=True)
+    @patch("src.managers.sounds_manager.load_sound_file")
+    def test_preload_sounds(self, mock_load_sound_file, _):
+        """Test that the sounds are decoded in the background, and added
+        with their volume by update_loading.
+        """
+        sounds = {}
+        mock_load_sound_file.side_effect = lambda path: sounds.setdefault(
+            path, MagicMock()
+        )
+
+        self.sound_manager.preload_sounds("gameplay_sounds")
+        self.sound_manager.preload_sounds("gameplay_sounds")
+        self.sound_manager.loader.wait()
+
+        self.assertEqual(mock_load_sound_file.call_count, len(GAME_SOUNDS))
+        # The sounds are added in the order they finish decoding.
+        self.assertCountEqual(self.sound_manager.game_sounds, GAME_SOUNDS)
+        self.assertEqual(self.sound_manager.loading_sounds["gameplay_sounds"], set())
+        bullet = self.sound_manager.game_sounds["bullet"]
+        self.assertIs(bullet, sounds[GAME_SOUNDS["bullet"]])
+        bullet.set_volume.assert_called_once_with(0.1)
+        self.sound_manager.game_sounds["explode"].set_volume.assert_called_once_with(
+            1.0
+        )
+        self.assertEqual(self.sound_manager.menu_sounds, {})
+
+    @patch("src.managers.sounds_manager.pygame.mixer.get_init", return_value=True)
+    @patch("src.managers.sounds_manager.load_sound_file")
+    def test_preload_sounds_failed_sound(self, mock_load_sound_file, _):
+        """Test that a sound that can't be loaded is left out."""
+
+        def load_sound_file(path):
+            if path == MENU_SOUNDS["quit_effect"]:
+                raise FileNotFoundError(path)
+            return MagicMock()
+
+        mock_load_sound_file.side_effect = load_sound_file
+
+        self.sound_manager.preload_sounds("menu_sounds")
+        self.sound_manager.loader.wait()
+
+        self.assertNotIn("quit_effect", self.sound_manager.menu_sounds)
+        self.assertEqual(len(self.sound_manager.menu_sounds), len(MENU_SOUNDS) - 1)
+        self.sound_manager.menu_sounds["is_muted"].set_volume.assert_called_with(0.7)
+
+    def test_get_sound_volume(self):
+        """Test the volume the sounds are loaded with."""
+        self.assertEqual(
+            self.sound_manager._get_sound_volume("gameplay_sounds", "bullet"), 0.1
+        )
+        self.assertEqual(
+            self.sound_manager._get_sound_volume("gameplay_sounds", "alien_exploding"),
+            0.5,
+        )
+        self.assertEqual(
+            self.sound_manager._get_sound_volume("gameplay_sounds", "warp"), 1.0
+        )
+        self.assertEqual(
+            self.sound_manager._get_sound_volume("menu_sounds", "click_menu"), 0.7
+        )
+
+        self.game.sfx_muted = True
+        self.assertEqual(
+            self.sound_manager._get_sound_volume("gameplay_sounds", "warp"), 0.0
+        )
+
+    @patch("src.managers.sounds_manager.frame_pacer")
+    @patch("src.managers.sounds_manager.pygame.event.pump")
+    def test_wait_for_sounds(self, _, mock_frame_pacer):
+        """Test that the progress of the decoded sounds is shown while
+        waiting for them.
+        """
+        loading = set(list(MENU_SOUNDS)[:2])
+        self.sound_manager.loading_sounds["menu_sounds"] = loading
+        mock_frame_pacer.wait.side_effect = lambda **_: loading.pop()
+
+        self.sound_manager._wait_for_sounds("menu_sounds")
+
+        self.assertEqual(
+            self.sound_manager.loading_screen.update.call_args_list,
+            [call(50), call(75), call(100)],
+        )
+
+    def test_wait_for_loaded_sounds(self):
+        """Test that the loading screen is not shown for loaded sounds."""
+        self.sound_manager.loading_sounds["menu_sounds"] = set()
+
+        self.sound_manager._wait_for_sounds("menu_sounds")
+
+        self.sound_manager.loading_screen.update.assert_not_called()
 
     @patch("src.managers.sounds_manager.load_music_files")
-    @patch("src.managers.sounds_manager.load_sound_files")
-    def test__load_gameplay_sounds(self, mock_load_sound_files, mock_load_music_files):
+    def test__load_gameplay_sounds(self, mock_load_music_files):
         """Test the load_gameplay_sounds method."""
+        self.sound_manager.preload_sounds = MagicMock()
+        self.sound_manager._wait_for_sounds = MagicMock()
+
         self.sound_manager._load_gameplay_sounds()
 
         self.assertEqual(mock_load_music_files.call_count, 4)
-        self.assertEqual(mock_load_sound_files.call_count, 1)
-
         self.assertEqual(self.sound_manager.level_music, mock_load_music_files())
         self.assertEqual(self.sound_manager.boss_rush_levels, mock_load_music_files())
         self.assertEqual(self.sound_manager.endless_music, mock_load_music_files())
         self.assertEqual(self.sound_manager.meteor_music, mock_load_music_files())
-        self.assertEqual(self.sound_manager.game_sounds, mock_load_sound_files())
-        self.sound_manager.loading_screen.update.assert_called_with(100)
+        self.sound_manager.preload_sounds.assert_called_once_with("gameplay_sounds")
+        self.sound_manager._wait_for_sounds.assert_called_once_with("gameplay_sounds")
 
     @patch("src.managers.sounds_manager.load_music_files")
-    @patch("src.managers.sounds_manager.load_sound_files")
-    def test_load_menu_sounds(self, mock_load_sound_files, mock_load_music_files):
+    def test_load_menu_sounds(self, mock_load_music_files):
         """Test for the loading of the menu sounds."""
+        self.sound_manager.preload_sounds = MagicMock()
+        self.sound_manager._wait_for_sounds = MagicMock()
+
         self.sound_manager.load_menu_sounds()
 
         self.assertEqual(mock_load_music_files.call_count, 1)
-        self.assertEqual(mock_load_sound_files.call_count, 1)
-
-        self.assertEqual(self.sound_manager.menu_sounds, mock_load_sound_files())
         self.assertEqual(self.sound_manager.menu_music, mock_load_music_files())
-        self.sound_manager.loading_screen.update.assert_called_with(100)
+        self.sound_manager.preload_sounds.assert_called_once_with("menu_sounds")
+        self.sound_manager._wait_for_sounds.assert_called_once_with("menu_sounds")
 
     def test__set_level_music_boss_rush_mode(self):
         """Test the music dictionary assignment for the boss rush game mode."""
@@ -169,19 +260,6 @@ class TestSoundManager(unittest.TestCase):
         mock_play_music.assert_called_with(self.sound_manager.level_music, range(1, 8))
         self.assertEqual(self.sound_manager.current_sound, "path_to_sound_file")
 
-    def test__prepare_gameplay_sounds_volume(self):
-        """Test the preparation of the gameplay sound volume."""
-        self.sound_manager.game_sounds = {
-            "bullet": MagicMock(return_value=pygame.mixer.Sound),
-            "alien_exploding": MagicMock(return_value=pygame.mixer.Sound),
-        }
-        self.sound_manager._prepare_gameplay_sounds_volume()
-
-        self.sound_manager.game_sounds["bullet"].set_volume.assert_called_with(0.1)
-        self.sound_manager.game_sounds["alien_exploding"].set_volume.assert_called_with(
-            0.5
-        )
-
     def test__get_music_dicts(self):
         """Test the get music dicts method."""
         music_dicts = self.sound_manager._get_music_dicts()
@@ -212,5 +290,35 @@ class TestSoundManager(unittest.TestCase):
         self.assertEqual(pygame.mixer.music.set_volume.call_count, 4)
 
 
+class TestNullSoundManager(unittest.TestCase):
+    """Test cases for the NullSoundManager class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.game = MagicMock()
+        self.sound_manager = NullSoundManager(self.game)
+
+    @patch("src.managers.sounds_manager.load_sound_file")
+    @patch("src.managers.sounds_manager.load_music_files")
+    def test_load_sounds(self, mock_load_music_files, mock_load_sound_file):
+        """Test that no sounds are loaded."""
+        self.sound_manager.preload_sounds("gameplay_sounds")
+        self.sound_manager.load_sounds("gameplay_sounds")
+
+        mock_load_music_files.assert_not_called()
+        mock_load_sound_file.assert_not_called()
+        self.assertEqual(self.sound_manager.game_sounds, {})
+        self.game.loading_screen.update.assert_not_called()
+
+    @patch("src.managers.sounds_manager.pygame.mixer.music")
+    def test_music_is_not_played(self, mock_music):
+        """Test that no music is played or muted."""
+        self.sound_manager.prepare_level_music()
+        self.sound_manager.check_music_volume()
+
+        mock_music.load.assert_not_called()
+        mock_music.set_volume.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -270,7 +270,7 @@ class GameButtonsManagerTest(unittest.TestCase):
             button2.draw_button.assert_called_once()
             button3.draw_button.assert_called_once()
 
-            mock_display_description.assert_called_once()
+            mock_display_description.assert_not_called()
 
     def test_draw_buttons(self):
         """Test the draw_buttons method."""
@@ -328,16 +328,28 @@ class GameButtonsManagerTest(unittest.TestCase):
     @patch("src.managers.ui_managers.buttons_manager.sys")
     def test_handle_quit_button(self, mock_sys, mock_pygame):
         """Test the handle_quit_button mthod."""
-        sound_mock = MagicMock()
-        self.game.sound_manager.game_sounds = {"quit_effect": sound_mock}
+        with patch(
+            "src.managers.ui_managers.buttons_manager.play_sound"
+        ) as mock_play_sound:
+            self.manager.handle_quit_button()
 
-        self.manager.handle_quit_button()
-
-        sound_mock.play.assert_called_once()
+        mock_play_sound.assert_called_once_with(
+            self.game.sound_manager.game_sounds, "quit_effect"
+        )
         mock_pygame.quit.assert_called_once()
         mock_sys.exit.assert_called_once()
         mock_pygame.time.delay.assert_called_once_with(800)
 
+    @patch("src.managers.ui_managers.buttons_manager.pygame")
+    @patch("src.managers.ui_managers.buttons_manager.sys")
+    def test_handle_quit_button_without_sound(self, mock_sys, _):
+        """Test that the game quits when the quit sound was not loaded."""
+        self.game.sound_manager.game_sounds = {}
+
+        self.manager.handle_quit_button()
+
+        mock_sys.exit.assert_called_once()
+
     def test_handle_high_scores_button(self):
         """Test the handle_high_scores_button method."""
         # Toggle show_high_scores from False to True
@@ -550,6 +562,15 @@ class GameButtonsManagerTest(unittest.TestCase):
 
         self.manager.handle_delete_button()
 
+        # The high scores are deleted only once confirmed
+        question, callback = self.game.confirm_dialog.open.call_args.args
+        self.assertEqual(question, "Delete the high scores of this game mode?")
+        callback(False)
+        self.game.high_score_manager.delete_high_scores.assert_not_called()
+        self.assertTrue(self.game.ui_options.show_high_scores)
+
+        callback(True)
+
         # Assert updated state
         self.game.high_score_manager.delete_high_scores.assert_called_once_with(
             "endless_scores"
@@ -561,6 +582,7 @@ class GameButtonsManagerTest(unittest.TestCase):
         self.game.settings.game_modes.game_mode = "normal"
 
         self.manager.handle_delete_button()
+        self.game.confirm_dialog.open.call_args.args[1](True)
         self.game.high_score_manager.delete_high_scores.assert_called_once_with(
             "high_scores"
         )
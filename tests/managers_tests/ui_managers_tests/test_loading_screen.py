@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, patch
 import pygame
 
 from src.managers.ui_managers.loading_screen import LoadingScreen
+from src.utils.text_cache import text_cache
 
 
 class LoadingScreenTest(unittest.TestCase):
@@ -19,9 +20,13 @@ class LoadingScreenTest(unittest.TestCase):
         self.screen = MagicMock()
         self.screen.get_size.return_value = (800, 600)
 
+        text_cache.clear()
         with patch("pygame.font.Font"):
             self.loading_screen = LoadingScreen(self.screen)
 
+    def tearDown(self):
+        text_cache.clear()
+
     def test_init(self):
         """Test the initialization of the class."""
         self.assertEqual(self.loading_screen.screen, self.screen)
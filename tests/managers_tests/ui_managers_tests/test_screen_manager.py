@@ -23,6 +23,7 @@ class TestScreenManager(unittest.TestCase):
         ):
             self.game = MagicMock()
             self.settings = MagicMock()
+            self.settings.cursor_img = pygame.Surface((20, 30))
             self.score_board = MagicMock()
             self.buttons_manager = MagicMock()
             self.screen = MagicMock()
@@ -162,12 +163,13 @@ class TestScreenManager(unittest.TestCase):
     @patch("pygame.Surface", return_value=MagicMock())
     def test__initialize_cursor(self, mock_surface, mock_mouse):
         """Test the initialize_cursor method."""
-        self.screen.get_size.return_value = (100, 100)
-
         self.screen_manager._initialize_cursor()
 
         mock_mouse.set_visible.assert_called_once_with(False)
-        mock_surface.assert_called_once_with((100, 100), pygame.SRCALPHA)
+        mock_surface.assert_called_once_with((25, 40), pygame.SRCALPHA)
+        mock_surface.return_value.blit.assert_called_once_with(
+            self.settings.cursor_img, (5, 10)
+        )
 
     @patch("pygame.mouse")
     @patch("pygame.Surface", return_value=pygame.Surface((50, 100)))
@@ -182,9 +184,7 @@ class TestScreenManager(unittest.TestCase):
 
         self.assertTrue(self.screen.blit.called)
         mock_mouse.get_pos.assert_called_once()
-        self.screen_manager.cursor_surface.blit.assert_called_once_with(
-            self.settings.cursor_img, (5, 10)
-        )
+        self.screen_manager.cursor_surface.blit.assert_not_called()
         self.assertEqual(
             self.screen.blit.call_args[0],
             (self.screen_manager.cursor_surface, mock_cursor_rect),
@@ -238,8 +238,8 @@ class TestScreenManager(unittest.TestCase):
             self.screen_manager.game_controls_text_rects[0], MagicMock
         )
 
-    def test_draw_menu_objects(self):
-        """Test the draw_menu_objects method."""
+    def test_draw_menu_layer(self):
+        """Test the _draw_menu_layer method."""
         mock_bg_img = MagicMock()
         mock_bg_img_rect = MagicMock()
 
@@ -265,7 +265,7 @@ class TestScreenManager(unittest.TestCase):
         ):
             self.screen_manager.create_controls()
 
-        self.screen_manager.draw_menu_objects(mock_bg_img, mock_bg_img_rect)
+        self.screen_manager._draw_menu_layer(self.screen, mock_bg_img, mock_bg_img_rect)
 
         expected_calls = (
             [
@@ -315,6 +315,72 @@ class TestScreenManager(unittest.TestCase):
         self.assertTrue(self.screen.blit.called)
         self.assertEqual(self.screen.blit.call_count, 8)
 
+    @patch("pygame.Surface")
+    def test_draw_menu_objects(self, mock_surface):
+        """Test that the menu layer is drawn only when it changes."""
+        self.screen_manager._draw_menu_layer = MagicMock()
+        bg_img = MagicMock()
+        bg_img_rect = pygame.Rect(0, 0, 800, 600)
+
+        self.screen_manager.draw_menu_objects(bg_img, bg_img_rect)
+        self.screen_manager.draw_menu_objects(bg_img, bg_img_rect)
+
+        mock_surface.assert_called_once_with((800, 600))
+        self.screen_manager._draw_menu_layer.assert_called_once_with(
+            mock_surface.return_value, bg_img, bg_img_rect
+        )
+        self.screen.blit.assert_called_with(mock_surface.return_value, (0, 0))
+        self.assertEqual(self.screen.blit.call_count, 2)
+
+        # A new background, a resize or new data draw the layer again.
+        self.screen_manager.draw_menu_objects(MagicMock(), bg_img_rect)
+        self.screen.get_size.return_value = (1000, 700)
+        self.screen_manager.draw_menu_objects(bg_img, bg_img_rect)
+        self.screen_manager.invalidate_menu_layers()
+        self.screen_manager.draw_menu_objects(bg_img, bg_img_rect)
+
+        self.assertEqual(self.screen_manager._draw_menu_layer.call_count, 4)
+
+    @patch("src.managers.ui_managers.screen_manager.display_high_scores")
+    def test_draw_game_menu(self, mock_display_high_scores):
+        """Test that the game menu layer is composed only when it changes,
+        and that the descriptions are drawn every frame.
+        """
+        ui_options = self.game.ui_options
+        ui_options.show_difficulty = True
+        ui_options.show_high_scores = True
+        ui_options.show_game_modes = True
+        ui_options.ship_selection = True
+        self.settings.game_modes.game_mode = "normal"
+
+        self.screen_manager.draw_game_menu()
+        self.screen_manager.draw_game_menu()
+
+        layer = self.buttons_manager.draw_buttons.call_args[0][0]
+        self.assertEqual(layer.get_size(), (800, 600))
+        self.buttons_manager.draw_buttons.assert_called_once()
+        self.buttons_manager.draw_difficulty_buttons.assert_called_once_with(layer)
+        self.buttons_manager.delete_scores.draw_button.assert_called_once_with(layer)
+        self.buttons_manager.draw_game_mode_buttons.assert_called_once_with(layer)
+        self.game.ship_selection.draw.assert_called_once_with(layer)
+        mock_display_high_scores.assert_called_once_with(
+            self.screen_manager, layer, "high_scores", "NORMAL"
+        )
+
+        self.screen.blit.assert_called_with(
+            self.screen_manager.game_menu_layer,
+            self.screen_manager.game_menu_layer_pos,
+        )
+        self.assertEqual(self.buttons_manager.display_description.call_count, 2)
+        self.assertEqual(self.game.ship_selection.draw_descriptions.call_count, 2)
+
+        # Closing a panel composes the layer again, without the panel.
+        ui_options.show_high_scores = False
+        self.screen_manager.draw_game_menu()
+
+        self.assertEqual(self.buttons_manager.draw_buttons.call_count, 2)
+        mock_display_high_scores.assert_called_once()
+
     def test_display_high_scores_on_screen(self):
         """Test the display_high_scores method."""
         self.settings.game_modes.game_mode = "normal"
@@ -401,10 +467,10 @@ class TestScreenManager(unittest.TestCase):
         self.assertTrue(self.screen_manager.full_screen)
         self.assertTrue(self.screen_manager.game.ui_options.resizable)
 
+    @patch("pygame.display.set_mode")
     @patch("src.managers.ui_managers.screen_manager.resize_image")
-    def test_resize_screen(self, mock_resize):
+    def test_resize_screen(self, mock_resize, _):
         """Test the resize_screen method."""
-        pygame.display.set_mode = MagicMock()
         mock_ship = MagicMock()
         self.game.ships = [mock_ship]
         self.game.game_over_manager.set_game_end_position = MagicMock()
@@ -0,0 +1,118 @@
+"""
+This module tests the ConfirmDialog class that asks the yes or no
+questions of the game.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.ui.confirm_dialog import ConfirmDialog
+
+
+class ConfirmDialogTest(unittest.TestCase):
+    """Test cases for the ConfirmDialog class."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        """Set up test environment."""
+        self.screen = pygame.Surface((1280, 700))
+        self.dialog = ConfirmDialog(self.screen)
+        self.callback = MagicMock()
+
+    def key_event(self, key):
+        """Return a keydown event of the key."""
+        return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+    def test_closed_dialog(self):
+        """Test that a closed dialog ignores the events and draws nothing."""
+        self.assertFalse(self.dialog.active)
+        self.assertFalse(self.dialog.handle_event(self.key_event(pygame.K_y)))
+
+        self.dialog.draw()
+
+        self.assertEqual(self.screen.get_at((640, 350))[:3], (0, 0, 0))
+
+    def test_keyboard_answers(self):
+        """Test the answers given with the keyboard."""
+        for key, answer in (
+            (pygame.K_y, True),
+            (pygame.K_n, False),
+            (pygame.K_ESCAPE, False),
+            (pygame.K_RETURN, False),
+        ):
+            self.callback.reset_mock()
+            self.dialog.open("Delete all save files?", self.callback)
+
+            self.assertTrue(self.dialog.handle_event(self.key_event(key)))
+
+            self.callback.assert_called_once_with(answer)
+            self.assertFalse(self.dialog.active)
+
+    def test_select_with_arrows(self):
+        """Test that the arrows move the selection that Enter answers."""
+        self.dialog.open("Delete all save files?", self.callback)
+
+        self.dialog.handle_event(self.key_event(pygame.K_LEFT))
+        self.assertTrue(self.dialog.yes_selected)
+        self.dialog.handle_event(self.key_event(pygame.K_RETURN))
+
+        self.callback.assert_called_once_with(True)
+
+    def test_mouse_answers(self):
+        """Test that the answers are selected by hovering and given by clicking."""
+        self.dialog.open("Overwrite this save file?", self.callback)
+        self.dialog.draw()
+
+        motion = pygame.event.Event(pygame.MOUSEMOTION, pos=self.dialog.yes_rect.center)
+        self.assertTrue(self.dialog.handle_event(motion))
+        self.assertTrue(self.dialog.yes_selected)
+
+        outside = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0))
+        self.assertTrue(self.dialog.handle_event(outside))
+        self.callback.assert_not_called()
+
+        click = pygame.event.Event(
+            pygame.MOUSEBUTTONDOWN, button=1, pos=self.dialog.no_rect.center
+        )
+        self.dialog.handle_event(click)
+        self.callback.assert_called_once_with(False)
+
+    def test_quit_and_resize_are_not_used(self):
+        """Test that quitting and resizing are left to the screen."""
+        self.dialog.open("Delete all save files?", self.callback)
+
+        self.assertFalse(self.dialog.handle_event(pygame.event.Event(pygame.QUIT)))
+        resize = pygame.event.Event(pygame.VIDEORESIZE, size=(800, 600))
+        self.assertFalse(self.dialog.handle_event(resize))
+        self.assertTrue(self.dialog.active)
+
+    @patch("src.ui.confirm_dialog.display_updater")
+    def test_draw(self, mock_display_updater):
+        """Test that the dialog is drawn in the middle of the screen and
+        laid out again when the screen size changes.
+        """
+        self.dialog.open("Delete all save files?", self.callback)
+        self.dialog.draw()
+
+        self.assertEqual(self.dialog.panel_rect.center, (640, 350))
+        self.assertTrue(self.dialog.panel_rect.contains(self.dialog.yes_rect))
+        self.assertTrue(self.dialog.panel_rect.contains(self.dialog.no_rect))
+        self.assertLess(self.dialog.yes_rect.centerx, self.dialog.no_rect.centerx)
+        mock_display_updater.add.assert_called_once_with(
+            "confirm_dialog", self.dialog.panel_rect
+        )
+
+        self.dialog.screen = pygame.Surface((800, 600))
+        self.dialog.draw()
+
+        self.assertEqual(self.dialog.panel_rect.center, (400, 300))
+        self.assertEqual(self.dialog.overlay.get_size(), (800, 600))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -30,6 +30,8 @@ class ScoreBoardTest(unittest.TestCase):
             self.scoreboard.thunderbird_ship,
             self.scoreboard.phoenix_ship,
         ]
+        self.scoreboard.render_missiles_num()
+        self.scoreboard.render_bullets_num()
 
     def tearDown(self):
         pygame.quit()
@@ -208,13 +210,91 @@ class ScoreBoardTest(unittest.TestCase):
         self.scoreboard.draw_bullets_info = MagicMock()
 
         self.scoreboard.show_score()
+        self.scoreboard.show_score()
+
+        # The HUD layer is composed once and reused while nothing changes.
+        layer = self.scoreboard.hud_layer
+        self.scoreboard.draw_player_scores.assert_called_once_with(layer)
+        self.scoreboard.draw_missiles_info.assert_called_once_with(layer)
+        self.scoreboard.draw_level.assert_called_once_with(layer)
+        self.scoreboard.draw_high_score.assert_called_once_with(layer)
+        self.scoreboard.draw_player_health.assert_called_once_with(layer)
+        self.scoreboard.draw_bullets_info.assert_called_once_with(layer)
+        self.assertEqual(len(self.scoreboard.hud_blits), 2)
+
+    def test_show_score_blits_layer(self):
+        """Test that the composed HUD is drawn on the screen."""
+        self.game.screen = MagicMock()
+        self.game.screen.get_size.return_value = (1260, 700)
+        self.scoreboard.screen = self.game.screen
+
+        self.scoreboard.show_score()
+
+        self.game.screen.blits.assert_called_once_with(
+            self.scoreboard.hud_blits, doreturn=False
+        )
 
-        self.scoreboard.draw_player_scores.assert_called_once()
-        self.scoreboard.draw_missiles_info.assert_called_once()
-        self.scoreboard.draw_level.assert_called_once()
-        self.scoreboard.draw_high_score.assert_called_once()
-        self.scoreboard.draw_player_health.assert_called_once()
-        self.scoreboard.draw_bullets_info.assert_called_once()
+    def test_update_scores(self):
+        """Test the update_scores method."""
+        self.game.stats.thunderbird_score = 300
+        self.game.stats.phoenix_score = 200
+        self.scoreboard.render_scores = MagicMock()
+
+        self.scoreboard.update_scores()
+
+        self.assertEqual(self.game.stats.high_score, 500)
+        self.assertEqual(self.scoreboard.dirty_parts, {"scores", "high_score"})
+        self.scoreboard.render_scores.assert_not_called()
+
+    def test_update_hud_renders_dirty_parts(self):
+        """Test that the dirty parts are rendered once, then cleared."""
+        render_scores = MagicMock()
+        render_missiles_num = MagicMock()
+        self.scoreboard.render_methods["scores"] = render_scores
+        self.scoreboard.render_methods["missiles"] = render_missiles_num
+
+        self.scoreboard.mark_dirty("scores")
+        self.scoreboard.mark_dirty("scores")
+        self.scoreboard.update_hud()
+        self.scoreboard.update_hud()
+
+        render_scores.assert_called_once()
+        render_missiles_num.assert_not_called()
+        self.assertEqual(self.scoreboard.dirty_parts, set())
+
+    def test_update_hud_recomposes_on_change(self):
+        """Test that the layer is composed again only when the HUD changes."""
+        self.scoreboard.update_hud()
+        self.scoreboard._compose_hud = MagicMock()
+
+        self.scoreboard.update_hud()
+        self.scoreboard._compose_hud.assert_not_called()
+
+        # The same score gives the same cached image.
+        self.scoreboard.mark_dirty("scores")
+        self.scoreboard.update_hud()
+        self.scoreboard._compose_hud.assert_not_called()
+
+        self.game.stats.thunderbird_score = 100
+        self.scoreboard.mark_dirty("scores")
+        self.scoreboard.update_hud()
+        self.scoreboard._compose_hud.assert_called_once()
+
+        self.scoreboard._compose_hud.reset_mock()
+        self.game.singleplayer = True
+        self.scoreboard.update_hud()
+        self.scoreboard._compose_hud.assert_called_once()
+
+    @patch("src.ui.scoreboards.draw_image")
+    def test_draw_on_surface(self, mock_draw_img):
+        """Test that the draw methods use the given surface."""
+        surface = pygame.Surface((10, 10))
+
+        self.scoreboard.draw_level(surface)
+
+        mock_draw_img.assert_called_once_with(
+            surface, self.scoreboard.level_image, self.scoreboard.level_rect
+        )
 
     @patch("src.ui.scoreboards.draw_image")
     def test_draw_player_scores(self, mock_draw_img):
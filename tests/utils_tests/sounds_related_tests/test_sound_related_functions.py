@@ -5,6 +5,7 @@ that are related to sounds.
 
 import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, call
 
 import pygame
@@ -12,10 +13,9 @@ import pygame
 from src.utils.game_utils import (
     set_music_volume,
     play_music,
-    load_sound_files,
+    load_sound_file,
     load_music_files,
     get_available_channels,
-    set_sounds_volume,
     play_sound,
 )
 
@@ -34,16 +34,17 @@ class SoundUtilsTest(unittest.TestCase):
         self.music_dict = {"music1": "music1.mp3", "music2": "music2.mp3"}
 
     @patch("src.utils.game_utils.SOUND_PATH", SOUND_PATH)
-    def test_load_sound_files(self):
-        """Test loading sound files."""
-        sounds_files = load_sound_files(self.sounds_dict)
+    def test_load_sound_file_on_threads(self):
+        """Test loading sound files on other threads."""
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
 
-        self.assertIsNotNone(sounds_files)
-        self.assertEqual(len(sounds_files), len(self.sounds_dict))
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sounds = list(executor.map(load_sound_file, self.sounds_dict.values()))
 
-        # Assert that each sound file is an instance of pygame.mixer.Sound
-        for sound_file in sounds_files.values():
-            self.assertIsInstance(sound_file, pygame.mixer.Sound)
+        for sound in sounds:
+            self.assertIsInstance(sound, pygame.mixer.Sound)
+            self.assertGreater(sound.get_length(), 0)
 
     @patch("src.utils.game_utils.SOUND_PATH", SOUND_PATH)
     def test_load_music_files(self):
@@ -69,22 +70,6 @@ class SoundUtilsTest(unittest.TestCase):
         mock_music.load.assert_called_once_with(music_files[music_name])
         mock_music.play.assert_called_once_with(-1)
 
-    def test_set_sounds_volume(self):
-        """Test setting sounds volume."""
-        sounds = {
-            "sound1": pygame.mixer.Sound(os.path.join(SOUND_PATH, "sound1.wav")),
-            "sound2": pygame.mixer.Sound(os.path.join(SOUND_PATH, "sound2.wav")),
-        }
-        volume = 0.5
-
-        with patch("pygame.mixer.Sound") as mock_sound:
-            # Call the function being tested
-            set_sounds_volume(sounds, volume)
-
-        # Assert that the set_volume method was called for each sound
-        for sound in mock_sound.return_value:
-            sound.set_volume.assert_called_once_with(volume)
-
     def test_set_music_volume(self):
         """Test setting music volume."""
         music = {
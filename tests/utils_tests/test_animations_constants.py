@@ -4,8 +4,13 @@ that are present in the game.
 """
 
 import unittest
+from unittest.mock import patch
 
+from src.utils import animation_constants
 from src.utils.animation_constants import (
+    ANIMATION_FRAMES,
+    get_frames,
+    prefetch_frames,
     destroy_frames,
     ship_images,
     warp_frames,
@@ -188,6 +193,36 @@ class AnimationConstantsTests(unittest.TestCase):
             "Failed: Number of frames in laser_frames is not equal to 9",
         )
 
+    def test_get_frames_is_shared(self):
+        """
+        Test that the frames are loaded once and shared.
+        """
+        self.assertIs(get_frames("laser_frames"), laser_frames)
+        self.assertIs(animation_constants.laser_frames, laser_frames)
+
+    def test_unknown_attribute(self):
+        """
+        Test that unknown attributes still raise an AttributeError.
+        """
+        with self.assertRaises(AttributeError):
+            animation_constants.unknown_frames  # pylint: disable=W0104
+
+    @patch("src.utils.animation_constants.assets.prefetch")
+    def test_prefetch_frames(self, mock_prefetch):
+        """
+        Test that the frames of the game mode are prefetched.
+        """
+        prefetch_frames("cosmic_conflict")
+
+        specs = list(mock_prefetch.call_args.args[0])
+        self.assertIn(ANIMATION_FRAMES["immune_frames_cosmic"], specs)
+        self.assertIn(ANIMATION_FRAMES["asteroid_frames"], specs)
+
+        prefetch_frames("normal")
+
+        specs = list(mock_prefetch.call_args.args[0])
+        self.assertNotIn(ANIMATION_FRAMES["immune_frames_cosmic"], specs)
+
 
 if __name__ == "__main__":
     unittest.main()
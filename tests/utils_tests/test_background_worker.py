@@ -0,0 +1,108 @@
+"""
+This module tests the BackgroundWorker class which runs tasks
+on a background thread.
+"""
+
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from src.utils.background_worker import BackgroundWorker
+
+
+class BackgroundWorkerTests(unittest.TestCase):
+    """Test cases for the BackgroundWorker class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.worker = BackgroundWorker()
+
+    def tearDown(self):
+        self.worker.executor.shutdown()
+
+    def test_submit(self):
+        """Test that the task runs on another thread and returns its result."""
+        future = self.worker.submit(lambda a, b: (a + b, threading.get_ident()), 1, 2)
+
+        result, thread_id = future.result(timeout=5)
+
+        self.assertEqual(result, 3)
+        self.assertNotEqual(thread_id, threading.get_ident())
+
+    def test_tasks_run_in_order(self):
+        """Test that the tasks run one at a time, in the submitted order."""
+        order = []
+        for i in range(5):
+            self.worker.submit(order.append, i)
+
+        self.assertTrue(self.worker.wait(timeout=5))
+        self.assertEqual(order, [0, 1, 2, 3, 4])
+
+    def test_callback_called_by_poll(self):
+        """Test that the callback is called only by poll, on the main thread."""
+        started = threading.Event()
+        release = threading.Event()
+        callback = MagicMock()
+
+        def task():
+            started.set()
+            release.wait(5)
+            return "done"
+
+        future = self.worker.submit(task, callback=callback)
+        started.wait(5)
+        self.worker.poll()
+        self.assertTrue(self.worker.busy)
+        callback.assert_not_called()
+
+        release.set()
+        future.result(timeout=5)
+        self.worker.poll()
+
+        callback.assert_called_once_with(future)
+        self.assertFalse(self.worker.busy)
+
+    def test_wait_for_tasks_of_callbacks(self):
+        """Test that wait also waits for the tasks submitted by callbacks."""
+        order = []
+
+        def submit_second(_):
+            self.worker.submit(order.append, "second", callback=callback)
+
+        callback = MagicMock()
+        self.worker.submit(order.append, "first", callback=submit_second)
+
+        self.assertTrue(self.worker.wait())
+        self.assertEqual(order, ["first", "second"])
+        callback.assert_called_once()
+        self.assertFalse(self.worker.busy)
+
+    def test_wait_timeout(self):
+        """Test that wait returns False when the timeout passes first."""
+        release = threading.Event()
+        callback = MagicMock()
+        self.worker.submit(release.wait, 5, callback=callback)
+
+        self.assertFalse(self.worker.wait(timeout=0.05))
+        callback.assert_not_called()
+
+        release.set()
+        self.assertTrue(self.worker.wait(timeout=5))
+        callback.assert_called_once()
+
+    def test_failed_task(self):
+        """Test that the exception of a failed task is passed to the callback."""
+        callback = MagicMock()
+
+        def task():
+            raise OSError("disk full")
+
+        self.worker.submit(task, callback=callback)
+        self.worker.wait(timeout=5)
+
+        future = callback.call_args[0][0]
+        self.assertIsInstance(future.exception(), OSError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+This module tests the DisplayUpdater class which pushes the drawn
+frames to the display.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from src.utils.display_updater import DisplayUpdater
+
+
+@patch("pygame.display.update")
+@patch("pygame.display.flip")
+class DisplayUpdaterTests(unittest.TestCase):
+    """Test cases for the DisplayUpdater class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.display_updater = DisplayUpdater(dirty_rects=True)
+
+    def test_disabled(self, mock_flip, mock_update):
+        """Test that the whole screen is updated when the mode is off."""
+        self.display_updater.dirty_rects = False
+        self.display_updater.add("cursor", (0, 0, 10, 10))
+
+        self.display_updater.update()
+        self.display_updater.update()
+
+        self.assertEqual(mock_flip.call_count, 2)
+        mock_update.assert_not_called()
+        self.assertEqual(self.display_updater.last_rects, {})
+
+    def test_dirty_rects(self, mock_flip, mock_update):
+        """Test that the rects of this frame and the last frame are updated."""
+        self.display_updater.add("cursor", (0, 0, 10, 10))
+        self.display_updater.update()
+        mock_flip.assert_called_once()
+
+        self.display_updater.add("cursor", (5, 5, 10, 10))
+        self.display_updater.add("cursor", (20, 20, 10, 10))
+        self.display_updater.update()
+
+        mock_flip.assert_called_once()
+        mock_update.assert_called_once_with(
+            [pygame.Rect(0, 0, 10, 10), pygame.Rect(20, 20, 10, 10)]
+        )
+
+        # Nothing was drawn in the last two frames.
+        mock_update.reset_mock()
+        self.display_updater.update()
+        self.display_updater.update()
+        mock_update.assert_called_once_with([pygame.Rect(20, 20, 10, 10)])
+
+    def test_add_many_rects(self, *_):
+        """Test that the rects of a key are joined."""
+        self.display_updater.add("description", (0, 0, 10, 10), (0, 20, 30, 10))
+
+        self.assertEqual(
+            self.display_updater.rects["description"], pygame.Rect(0, 0, 30, 30)
+        )
+
+    def test_full_update(self, mock_flip, mock_update):
+        """Test the causes of the full updates."""
+        self.display_updater.update()
+
+        self.display_updater.check_event(pygame.event.Event(pygame.MOUSEMOTION))
+        self.display_updater.update()
+        self.assertEqual(mock_flip.call_count, 1)
+
+        self.display_updater.check_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN))
+        self.display_updater.update()
+        self.assertEqual(mock_flip.call_count, 2)
+
+        self.display_updater.update_all()
+        self.display_updater.update()
+        self.assertEqual(mock_flip.call_count, 3)
+
+        self.display_updater.update((True, False))
+        self.display_updater.update((True, False))
+        self.assertEqual(mock_flip.call_count, 4)
+        mock_update.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
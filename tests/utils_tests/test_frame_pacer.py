@@ -0,0 +1,77 @@
+"""
+This module tests the FramePacer class which paces the loops of the game.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.utils.frame_pacer import FramePacer
+
+
+@patch("src.utils.frame_pacer.pygame.event")
+class FramePacerTests(unittest.TestCase):
+    """Test cases for the FramePacer class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.frame_pacer = FramePacer(fps=60, idle_wake_ms=250, stats_window_ms=100)
+        self.frame_pacer.clock = MagicMock()
+
+    def test_wait_animating(self, mock_event):
+        """Test that an animating loop is only capped to the frame rate."""
+        self.frame_pacer.wait(animating=True)
+        self.frame_pacer.wait(animating=True, fps=30)
+
+        mock_event.wait.assert_not_called()
+        self.frame_pacer.clock.tick.assert_any_call(60)
+        self.frame_pacer.clock.tick.assert_called_with(30)
+
+    def test_wait_idle(self, mock_event):
+        """Test that an idle loop waits for an event and leaves it in the queue."""
+        mock_event.peek.return_value = False
+        event = MagicMock(type=pygame.KEYDOWN)
+        mock_event.wait.return_value = event
+
+        self.frame_pacer.wait()
+
+        mock_event.wait.assert_called_once_with(250)
+        mock_event.post.assert_called_once_with(event)
+        self.frame_pacer.clock.tick.assert_called_once_with(60)
+
+    def test_wait_idle_timeout(self, mock_event):
+        """Test that nothing is posted when the wait times out."""
+        mock_event.peek.return_value = False
+        mock_event.wait.return_value = MagicMock(type=pygame.NOEVENT)
+
+        self.frame_pacer.wait()
+
+        mock_event.post.assert_not_called()
+
+    def test_wait_idle_with_events(self, mock_event):
+        """Test that an idle loop doesn't wait when events are waiting."""
+        mock_event.peek.return_value = True
+
+        self.frame_pacer.wait()
+
+        mock_event.wait.assert_not_called()
+
+    @patch("src.utils.frame_pacer.time.perf_counter")
+    def test_idle_percent(self, mock_perf_counter, _):
+        """Test that the idle percentage is measured over each window."""
+        # Each frame takes 20 ms and waits 30 ms after it.
+        mock_perf_counter.side_effect = [0.0, 0.03, 0.05, 0.08, 0.10, 0.13]
+
+        self.frame_pacer.wait(animating=True)
+        self.frame_pacer.wait(animating=True)
+        self.assertEqual(self.frame_pacer.idle_percent, 0.0)
+
+        self.frame_pacer.wait(animating=True)
+        self.assertAlmostEqual(self.frame_pacer.idle_percent, 60.0)
+        self.assertEqual(self.frame_pacer.busy_ms, 0.0)
+        self.assertEqual(self.frame_pacer.idle_ms, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
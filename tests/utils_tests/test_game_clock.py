@@ -0,0 +1,75 @@
+"""
+This module tests the GameClock class which measures the game time
+in ticks of the game logic.
+"""
+
+import unittest
+
+from src.utils.constants import GAME_CLOCK_GAP_TICKS
+from src.utils.game_clock import FixedTimestep, GameClock
+
+
+class GameClockTests(unittest.TestCase):
+    """Test cases for the GameClock class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.game_clock = GameClock(tick_ms=20)
+
+    def test_tick(self):
+        """Test that the time advances only when the clock ticks."""
+        self.assertEqual(self.game_clock.get_ticks(), 0)
+
+        for _ in range(3):
+            self.game_clock.tick()
+
+        self.assertEqual(self.game_clock.ticks, 3)
+        self.assertEqual(self.game_clock.get_ticks(), 60)
+        self.assertAlmostEqual(self.game_clock.time(), 0.06)
+
+    def test_start_game(self):
+        """Test that a new game starts far ahead, or at the given tick."""
+        self.game_clock.tick()
+
+        start_tick = self.game_clock.start_game()
+
+        self.assertEqual(start_tick, 1 + GAME_CLOCK_GAP_TICKS)
+        self.assertEqual(self.game_clock.ticks, start_tick)
+
+        self.assertEqual(self.game_clock.start_game(500), 500)
+        self.assertEqual(self.game_clock.get_ticks(), 10000)
+
+
+class FixedTimestepTests(unittest.TestCase):
+    """Test cases for the FixedTimestep class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.timestep = FixedTimestep(tick_ms=10, max_ticks=5)
+
+    def test_advance(self):
+        """Test that the ticks follow the time, carrying the time left over."""
+        self.assertEqual(self.timestep.advance(1000), 1)
+        self.assertEqual(self.timestep.advance(1004), 0)
+        self.assertEqual(self.timestep.advance(1015), 1)
+        self.assertEqual(self.timestep.advance(1040), 3)
+        self.assertAlmostEqual(self.timestep.accumulator, 0)
+
+    def test_advance_bounded(self):
+        """Test that the ticks are bounded when the game falls behind."""
+        self.timestep.advance(1000)
+
+        self.assertEqual(self.timestep.advance(2000), 5)
+        self.assertEqual(self.timestep.advance(2010), 1)
+
+    def test_reset(self):
+        """Test that the time before a reset is not counted."""
+        self.timestep.advance(1000)
+        self.timestep.reset()
+
+        self.assertEqual(self.timestep.advance(5000), 1)
+        self.assertEqual(self.timestep.advance(5010), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+This module tests the GameRandom class which is the random number
+generator used in the game.
+"""
+
+import unittest
+
+from src.utils.game_random import GameRandom
+
+
+class GameRandomTests(unittest.TestCase):
+    """Test cases for the GameRandom class."""
+
+    def test_seed(self):
+        """Test that the same seed gives the same random numbers."""
+        rng = GameRandom()
+        rng.seed(42)
+        numbers = [rng.randint(0, 1000) for _ in range(10)]
+
+        rng.seed(42)
+
+        self.assertEqual(rng.seed_value, 42)
+        self.assertEqual([rng.randint(0, 1000) for _ in range(10)], numbers)
+
+    def test_seed_without_value(self):
+        """Test that a new seed is picked and remembered."""
+        rng = GameRandom()
+        rng.seed()
+        seed = rng.seed_value
+        numbers = [rng.random() for _ in range(5)]
+
+        replayed = GameRandom(seed)
+
+        self.assertIsInstance(seed, int)
+        self.assertEqual(replayed.seed_value, seed)
+        self.assertEqual([replayed.random() for _ in range(5)], numbers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,8 @@ from src.utils.game_utils import (
     draw_buttons,
 )
 from src.utils.constants import DEFAULT_HIGH_SCORES
+from src.utils.high_score_store import high_score_store
+from src.utils.text_cache import text_cache
 
 
 class HighScoreFunctionsTests(unittest.TestCase):
@@ -25,10 +27,13 @@ class HighScoreFunctionsTests(unittest.TestCase):
     def setUp(self):
         """Set up test_environment."""
         pygame.init()
+        text_cache.clear()
+        high_score_store.clear()
         self.screen = pygame.Surface((800, 600))
         self.game = MagicMock()
 
     def tearDown(self):
+        high_score_store.clear()
         pygame.quit()
 
     @patch("builtins.open")
@@ -37,11 +42,16 @@ class HighScoreFunctionsTests(unittest.TestCase):
         """Test loading high scores from an existing file."""
         mock_file = MagicMock()
         mock_open.return_value.__enter__.return_value = mock_file
-        expected_scores = {"score_key": [10, 20, 30]}
-
-        mock_json_load.return_value = expected_scores
+        mock_json_load.return_value = {
+            "score_key": [{"name": "A", "score": 10}, {"name": "B", "score": 30}]
+        }
+        expected_scores = {
+            "score_key": [{"name": "B", "score": 30}, {"name": "A", "score": 10}]
+        }
 
         scores = load_high_scores(self.game)
+        # The file is read only once.
+        load_high_scores(self.game)
 
         mock_open.assert_called_once_with(
             "single_high_score.json", "r", encoding="utf-8"
@@ -128,8 +138,9 @@ class HighScoreFunctionsTests(unittest.TestCase):
 
         mock_load_high_scores.assert_called_with(self.game)
 
+    @patch("src.utils.game_utils.frame_pacer")
     @patch("pygame.font.SysFont")
-    def test_get_player_name(self, mock_sysfont):
+    def test_get_player_name(self, mock_sysfont, mock_frame_pacer):
         """Test the get_player_name function."""
         # Set up mock objects and test data
         background_image = pygame.Surface((800, 600))
@@ -167,9 +178,10 @@ class HighScoreFunctionsTests(unittest.TestCase):
             self.assertEqual(player_name, "Ake")
             self.assertEqual(pygame.display.flip.call_count, 9)
             self.assertEqual(cursor.call_count, 9)
+            self.assertEqual(mock_frame_pacer.wait.call_count, 9)
 
-            mock_sysfont.assert_any_call("verdana", 19)
-            mock_sysfont.assert_any_call("verdana", 23)
+            mock_sysfont.assert_any_call("verdana", 19, bold=False)
+            mock_sysfont.assert_any_call("verdana", 23, bold=False)
 
             # Simulate the user clicking the Save button
             pygame.event.get.side_effect = [
@@ -0,0 +1,182 @@
+"""
+This module tests the HighScoreStore class which keeps the high scores
+in memory and writes them to the high score files.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.utils.high_score_store import HighScoreStore, write_file_atomically
+
+
+class HighScoreStoreTests(unittest.TestCase):
+    """Test cases for the HighScoreStore class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, "high_score.json")
+        self.store = HighScoreStore(max_scores=3)
+
+    def tearDown(self):
+        self.store.flush()
+        self.temp_dir.cleanup()
+
+    def write_scores(self, high_scores):
+        """Write the high scores to the test file."""
+        with open(self.filename, "w", encoding="utf-8") as score_file:
+            json.dump(high_scores, score_file)
+
+    def read_scores(self):
+        """Read the high scores from the test file."""
+        with open(self.filename, "r", encoding="utf-8") as score_file:
+            return json.load(score_file)
+
+    def test_load_once(self):
+        """Test that the file is read only once and the scores are sorted."""
+        self.write_scores(
+            {
+                "high_scores": [
+                    {"name": "A", "score": 10},
+                    0,
+                    {"name": "B", "score": 40},
+                    {"name": "C", "score": 20},
+                    {"name": "D", "score": 30},
+                ]
+            }
+        )
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            scores = self.store.get_scores(self.filename, "high_scores")
+            self.store.get_scores(self.filename, "high_scores")
+            self.store.get_high_scores(self.filename)
+
+        mock_open.assert_called_once()
+        self.assertEqual([entry["name"] for entry in scores], ["B", "D", "C"])
+
+    def test_load_missing_or_damaged_file(self):
+        """Test that a missing or damaged file starts with no scores."""
+        self.assertEqual(self.store.get_high_scores(self.filename), {"high_scores": []})
+
+        damaged_file = os.path.join(self.temp_dir.name, "damaged.json")
+        with open(damaged_file, "w", encoding="utf-8") as score_file:
+            score_file.write("{")
+        self.assertEqual(self.store.get_scores(damaged_file, "high_scores"), [])
+
+    def test_query_returns_copies(self):
+        """Test that changing the returned scores doesn't change the store."""
+        self.store.insert(self.filename, "high_scores", "A", 10)
+
+        self.store.get_scores(self.filename, "high_scores")[0]["score"] = 99
+        self.store.get_high_scores(self.filename)["high_scores"].clear()
+
+        self.assertEqual(
+            self.store.get_scores(self.filename, "high_scores"),
+            [{"name": "A", "score": 10}],
+        )
+
+    def test_insert(self):
+        """Test that the scores are kept sorted and limited, and written to the file."""
+        self.assertEqual(self.store.insert(self.filename, "boss_rush", "A", 10), 1)
+        self.assertEqual(self.store.insert(self.filename, "boss_rush", "B", 30), 1)
+        self.assertEqual(self.store.insert(self.filename, "boss_rush", "C", 20), 2)
+        self.assertEqual(self.store.insert(self.filename, "boss_rush", "D", 40), 1)
+        self.assertIsNone(self.store.insert(self.filename, "boss_rush", "E", 5))
+        # A score equal to a high score replaces it.
+        self.assertEqual(self.store.insert(self.filename, "boss_rush", "F", 30), 2)
+
+        expected_scores = [
+            {"name": "D", "score": 40},
+            {"name": "F", "score": 30},
+            {"name": "C", "score": 20},
+        ]
+        self.assertEqual(
+            self.store.get_scores(self.filename, "boss_rush"), expected_scores
+        )
+        self.assertTrue(self.store.has_name(self.filename, "boss_rush", "F"))
+        self.assertFalse(self.store.has_name(self.filename, "boss_rush", "B"))
+
+        self.assertTrue(self.store.flush(timeout=5))
+        self.assertEqual(
+            self.read_scores(), {"high_scores": [], "boss_rush": expected_scores}
+        )
+
+    def test_delete(self):
+        """Test that the scores of a game mode are deleted from the file."""
+        self.write_scores(
+            {
+                "high_scores": [{"name": "A", "score": 10}],
+                "boss_rush": [{"name": "B", "score": 20}],
+            }
+        )
+
+        self.store.delete(self.filename, "boss_rush")
+        self.store.delete(self.filename, "meteor_madness_scores")
+
+        self.assertTrue(self.store.flush(timeout=5))
+        self.assertEqual(
+            self.read_scores(), {"high_scores": [{"name": "A", "score": 10}]}
+        )
+
+    def test_clear(self):
+        """Test that the files are read again after clearing the store."""
+        self.store.insert(self.filename, "high_scores", "A", 10)
+        self.store.clear()
+        self.write_scores({"high_scores": [{"name": "B", "score": 20}]})
+
+        self.assertEqual(
+            self.store.get_scores(self.filename, "high_scores"),
+            [{"name": "B", "score": 20}],
+        )
+
+    @patch("src.utils.high_score_store.write_file_atomically")
+    def test_write_error(self, mock_write):
+        """Test that a failed write doesn't stop the writer thread."""
+        mock_write.side_effect = [OSError, None]
+
+        self.store.insert(self.filename, "high_scores", "A", 10)
+        self.assertTrue(self.store.flush(timeout=5))
+        self.store.insert(self.filename, "high_scores", "B", 20)
+        self.assertTrue(self.store.flush(timeout=5))
+
+        self.assertEqual(mock_write.call_count, 2)
+        self.assertEqual(
+            mock_write.call_args[0][1]["high_scores"][0], {"name": "B", "score": 20}
+        )
+
+
+class WriteFileAtomicallyTests(unittest.TestCase):
+    """Test cases for the write_file_atomically function."""
+
+    def test_write_file_atomically(self):
+        """Test that the file is replaced and no temporary file is left."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "scores.json")
+            write_file_atomically(filename, {"high_scores": []})
+            write_file_atomically(filename, {"high_scores": [1]})
+
+            with open(filename, "r", encoding="utf-8") as score_file:
+                self.assertEqual(json.load(score_file), {"high_scores": [1]})
+            self.assertEqual(os.listdir(temp_dir), ["scores.json"])
+
+    @patch("src.utils.high_score_store.os.replace", side_effect=OSError)
+    def test_write_file_atomically_error(self, _):
+        """Test that the old file is kept when the file can't be replaced."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "scores.json")
+            with open(filename, "w", encoding="utf-8") as score_file:
+                score_file.write("old")
+
+            with self.assertRaises(OSError):
+                write_file_atomically(filename, {"high_scores": []})
+
+            with open(filename, "r", encoding="utf-8") as score_file:
+                self.assertEqual(score_file.read(), "old")
+            self.assertEqual(os.listdir(temp_dir), ["scores.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
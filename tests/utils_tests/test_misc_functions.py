@@ -27,6 +27,7 @@ from src.utils.game_utils import (
 )
 
 from src.utils.constants import P1_CONTROLS, P2_CONTROLS, GAME_CONTROLS
+from src.utils.text_cache import text_cache
 
 
 class MiscFunctionsTests(unittest.TestCase):
@@ -35,6 +36,7 @@ class MiscFunctionsTests(unittest.TestCase):
     def setUp(self):
         """Set up test environment."""
         pygame.init()
+        text_cache.clear()
         self.screen = MagicMock()
 
     def tearDown(self):
@@ -132,7 +134,7 @@ class MiscFunctionsTests(unittest.TestCase):
         )
 
         # Assert that the necessary objects and functions were called with the correct arguments
-        mock_sysfont.assert_called_once_with("verdana", 15)
+        mock_sysfont.assert_called_once_with("verdana", 15, bold=False)
 
         mock_render_text.assert_called_once_with(
             description,
@@ -179,15 +181,14 @@ class MiscFunctionsTests(unittest.TestCase):
             bullets, x_pos, y_pos, right_aligned=True
         )
 
-        # Assert the returned image and rect
+        # Assert the returned image and rect, the text is rendered only once
         self.assertEqual(bullets_num_img, font.render.return_value)
         self.assertEqual(bullets_num_rect, bullets_num_img.get_rect.return_value)
         self.assertEqual(bullets_num_rect.top, y_pos)
         self.assertEqual(bullets_num_rect.right, x_pos)
 
-        font.render.assert_called_once_with(
-            f"Remaining bullets: {bullets}", True, (238, 75, 43), None
-        )
+        font.render.assert_not_called()
+        mock_sysfont.assert_called_once_with("", 25, bold=False)
         bullets_num_img.get_rect.assert_called_once()
 
     def test_display_message(self):
@@ -206,8 +207,8 @@ class MiscFunctionsTests(unittest.TestCase):
             display_message(self.screen, message, duration)
 
             # Assert that the necessary objects and functions were called with the correct arguments
-            pygame.font.SysFont.assert_called_once_with("verdana", 14)
-            render_mock.assert_called_once_with(message, True, (255, 255, 255))
+            pygame.font.SysFont.assert_called_once_with("verdana", 14, bold=False)
+            render_mock.assert_called_once_with(message, True, (255, 255, 255), None)
 
             rect_args, _ = self.screen.blit.call_args
             self.assertEqual(rect_args[0], render_mock.return_value)
@@ -234,8 +235,8 @@ class MiscFunctionsTests(unittest.TestCase):
         display_custom_message(self.screen, message, ship, cosmic=False)
 
         # Assert that the necessary objects and functions were called with the correct arguments
-        mock_sysfont.assert_called_once_with("verdana", 10)
-        font.render.assert_called_once_with(message, True, (255, 0, 0))
+        mock_sysfont.assert_called_once_with("verdana", 10, bold=False)
+        font.render.assert_called_once_with(message, True, (255, 0, 0), None)
         ship_rect = ship.rect
         text_surface.get_rect.assert_called_once_with(
             top=(ship_rect.top - 5), left=(ship_rect.right)
@@ -0,0 +1,96 @@
+"""
+This module tests the TextCache class which is used to share the fonts
+and the rendered text surfaces.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.utils.text_cache import TextCache
+
+
+class TextCacheTests(unittest.TestCase):
+    """Test cases for the TextCache class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        pygame.init()
+        self.text_cache = TextCache(max_size=2)
+
+    def tearDown(self):
+        pygame.quit()
+
+    @patch("pygame.font.SysFont")
+    def test_get_font(self, mock_sysfont):
+        """Test that each font is created only once."""
+        font = self.text_cache.get_font("verdana", 15)
+
+        self.assertIs(self.text_cache.get_font("verdana", 15), font)
+        self.text_cache.get_font("verdana", 15, bold=True)
+        self.assertEqual(mock_sysfont.call_count, 2)
+        mock_sysfont.assert_any_call("verdana", 15, bold=True)
+
+    @patch("pygame.font.Font")
+    def test_get_default_font(self, mock_font):
+        """Test that the None name loads the default pygame font."""
+        font = self.text_cache.get_font(None, 30)
+
+        self.assertEqual(font, mock_font.return_value)
+        mock_font.assert_called_once_with(None, 30)
+
+    def test_render(self):
+        """Test that the same text is rendered only once."""
+        font = MagicMock()
+        font.render.side_effect = lambda *args: MagicMock()
+
+        surface = self.text_cache.render(font, "Ready!", (255, 0, 0))
+
+        self.assertIs(self.text_cache.render(font, "Ready!", (255, 0, 0)), surface)
+        self.assertIsNot(self.text_cache.render(font, "Ready!", "white"), surface)
+        font.render.assert_any_call("Ready!", True, (255, 0, 0), None)
+        self.assertEqual(font.render.call_count, 2)
+        self.assertEqual(self.text_cache.hits, 1)
+        self.assertEqual(self.text_cache.misses, 2)
+
+    def test_render_color_objects(self):
+        """Test that pygame colors can be used as part of the key."""
+        font = MagicMock()
+
+        surface = self.text_cache.render(font, "Player", pygame.Color(90, 90, 90))
+
+        self.assertIs(
+            self.text_cache.render(font, "Player", pygame.Color(90, 90, 90)), surface
+        )
+        font.render.assert_called_once()
+
+    def test_render_evicts_least_recently_used(self):
+        """Test that the least recently used surface is removed when full."""
+        font = MagicMock()
+        self.text_cache.render(font, "first", "white")
+        self.text_cache.render(font, "second", "white")
+        self.text_cache.render(font, "first", "white")
+
+        self.text_cache.render(font, "third", "white")
+
+        texts = [key[1] for key in self.text_cache.surfaces]
+        self.assertEqual(texts, ["first", "third"])
+
+    @patch("pygame.font.SysFont")
+    def test_cleared_on_quit(self, mock_sysfont):
+        """Test that the cache is cleared when pygame quits."""
+        self.text_cache.get_font("verdana", 15)
+        self.text_cache.render(MagicMock(), "text", "white")
+
+        pygame.quit()
+
+        self.assertEqual(
+            self.text_cache.get_stats(),
+            {"fonts": 0, "surfaces": 0, "hits": 0, "misses": 1},
+        )
+        mock_sysfont.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()